@@ -1,4 +1,18 @@
 """Albatross Pi HUD runtime."""
-from .hud import HUDRenderer
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .hud import HUDRenderer
 
 __all__ = ["HUDRenderer"]
+
+
+def __getattr__(name: str) -> Any:
+    # Imported lazily so headless processes (the safety supervisor) do not load pygame.
+    if name == "HUDRenderer":
+        from .hud import HUDRenderer
+
+        return HUDRenderer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
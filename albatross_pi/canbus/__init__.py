@@ -1,7 +1,13 @@
 """CAN bus utilities for the Albatross HUD."""
 from .ids import ArduinoToEcuID, ECUToHudID, ArduinoToHudID, PiToArduinoID, PiToEcuID, SystemCommandID
 from .decode import CANStateAggregator
-from .iface import SocketCANInterface, python_can_available
+from .capture import CANCaptureRecorder, capture_files, read_capture
+from .history import CANFrameHistory, CANFrameRing
+from .stats import CANBusStats, CANIdStats
+from .signals import FRAME_CODECS, SIGNAL_TABLE, FrameCodec, decode_signals, encode_signals
+from .tx_scheduler import CANTransmitScheduler, TxPriority
+from .replay import CANReplayInterface
+from .iface import RawSocketCANInterface, SocketCANInterface, python_can_available, raw_socketcan_available
 from .encode import (
     build_boost_target_frame,
     build_air_shot_request_frame,
@@ -26,8 +32,25 @@ __all__ = [
     "PiToEcuID",
     "SystemCommandID",
     "CANStateAggregator",
+    "CANCaptureRecorder",
+    "capture_files",
+    "read_capture",
+    "CANFrameHistory",
+    "CANFrameRing",
+    "CANBusStats",
+    "CANIdStats",
+    "FRAME_CODECS",
+    "SIGNAL_TABLE",
+    "FrameCodec",
+    "decode_signals",
+    "encode_signals",
+    "CANTransmitScheduler",
+    "TxPriority",
     "SocketCANInterface",
+    "CANReplayInterface",
+    "RawSocketCANInterface",
     "python_can_available",
+    "raw_socketcan_available",
     "build_boost_target_frame",
     "build_air_shot_request_frame",
     "build_ecu_fuel_profile_frame",
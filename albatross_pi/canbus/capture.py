@@ -0,0 +1,239 @@
+"""Binary CAN capture files.
+
+Each file is a headerless array of fixed 24-byte little-endian records::
+
+    int64   monotonic_ns
+    uint32  arbitration_id
+    uint8   dlc
+    uint8   direction      (0 = RX, 1 = TX)
+    2 bytes padding
+    8 bytes data           (zero padded past dlc)
+
+so a capture loads directly with ``numpy.fromfile(path, dtype=capture_dtype())``.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import struct
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+CAPTURE_RECORD = struct.Struct("<qIBB2x8s")
+CAPTURE_RECORD_SIZE = CAPTURE_RECORD.size
+CAPTURE_SUFFIX = ".canlog"
+DIRECTION_RX = 0
+DIRECTION_TX = 1
+
+# (monotonic_ns, arbitration_id, data, direction) as read back from a capture.
+CaptureRecord = Tuple[int, int, bytes, str]
+
+
+def capture_dtype():
+    """Return the numpy dtype matching ``CAPTURE_RECORD`` (numpy is optional)."""
+    import numpy as np
+
+    return np.dtype(
+        [
+            ("monotonic_ns", "<i8"),
+            ("arbitration_id", "<u4"),
+            ("dlc", "u1"),
+            ("direction", "u1"),
+            ("_pad", "V2"),
+            ("data", "u1", (8,)),
+        ]
+    )
+
+
+def read_capture(path: Path | str) -> Iterator[CaptureRecord]:
+    """Yield ``(monotonic_ns, arbitration_id, data, direction)`` from one capture file."""
+    with open(path, "rb") as handle:
+        while True:
+            chunk = handle.read(CAPTURE_RECORD_SIZE * 4096)
+            if not chunk:
+                return
+            usable = len(chunk) - len(chunk) % CAPTURE_RECORD_SIZE
+            for timestamp_ns, arbitration_id, dlc, direction, data in CAPTURE_RECORD.iter_unpack(chunk[:usable]):
+                yield timestamp_ns, arbitration_id, data[: min(dlc, 8)], "TX" if direction else "RX"
+            if usable != len(chunk):
+                LOGGER.warning("Ignoring truncated trailing record in %s", path)
+                return
+
+
+def capture_files(path: Path | str) -> list[Path]:
+    """Return the capture files for ``path`` (a file, or a directory of rotated files) in order."""
+    path = Path(path)
+    if path.is_dir():
+        return sorted(path.glob(f"*{CAPTURE_SUFFIX}"))
+    return [path]
+
+
+class CANCaptureRecorder:
+    """Appends every frame to size-rotated binary capture files.
+
+    The RX/TX threads only pack records into a preallocated chunk under a short
+    lock. Full chunks are handed to a writer thread that does large buffered
+    writes, so SD card latency never reaches the CAN threads. If the writer
+    falls ``max_pending_chunks`` behind, new chunks are dropped and counted in
+    ``dropped_records`` rather than blocking the bus.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        *,
+        max_file_bytes: int = 64 * 1024 * 1024,
+        max_files: Optional[int] = None,
+        chunk_records: int = 4096,
+        max_pending_chunks: int = 64,
+        flush_interval_s: float = 1.0,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_file_bytes = max(CAPTURE_RECORD_SIZE, int(max_file_bytes))
+        self.max_files = max_files
+        self.chunk_records = max(1, int(chunk_records))
+        self.flush_interval_s = flush_interval_s
+        self.dropped_records = 0
+        self.recorded = 0
+        self._lock = threading.Lock()
+        self._chunk = bytearray(self.chunk_records * CAPTURE_RECORD_SIZE)
+        self._fill = 0
+        self._pending: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=max(1, int(max_pending_chunks)))
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._stopping = threading.Event()
+        self._file = None
+        self._file_bytes = 0
+        self._file_index = 0
+        self.current_path: Optional[Path] = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._running:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._running = True
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="can-capture", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        if not self._running:
+            return
+        with self._lock:
+            self._running = False
+            self._handoff_locked()
+        self._stopping.set()
+        try:
+            self._pending.put_nowait(None)
+        except queue.Full:
+            # The writer drains the backlog and exits on the first idle poll.
+            pass
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def record(self, arbitration_id: int, data: bytes, direction: str = "RX", timestamp_ns: Optional[int] = None) -> None:
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+        dir_code = DIRECTION_TX if direction == "TX" else DIRECTION_RX
+        with self._lock:
+            if self._running:
+                self._pack_locked(timestamp_ns, arbitration_id, data, dir_code)
+
+    def record_batch(self, frames: Iterable[Tuple[int, bytes, Optional[float]]]) -> None:
+        """Record received ``(arbitration_id, data, monotonic_s)`` frames under one lock."""
+        batch_ns = time.monotonic_ns()
+        with self._lock:
+            if not self._running:
+                return
+            for arbitration_id, data, received_at in frames:
+                timestamp_ns = batch_ns if received_at is None else int(received_at * 1e9)
+                self._pack_locked(timestamp_ns, arbitration_id, data, DIRECTION_RX)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _pack_locked(self, timestamp_ns: int, arbitration_id: int, data: bytes, dir_code: int) -> None:
+        length = min(len(data), 8)
+        CAPTURE_RECORD.pack_into(self._chunk, self._fill, timestamp_ns, arbitration_id, length, dir_code, bytes(data[:8]))
+        self._fill += CAPTURE_RECORD_SIZE
+        self.recorded += 1
+        if self._fill >= len(self._chunk):
+            self._handoff_locked()
+
+    def _handoff_locked(self) -> None:
+        if not self._fill:
+            return
+        chunk = bytes(self._chunk[: self._fill])
+        self._fill = 0
+        try:
+            self._pending.put_nowait(chunk)
+        except queue.Full:
+            self.dropped_records += len(chunk) // CAPTURE_RECORD_SIZE
+
+    def _run(self) -> None:
+        LOGGER.info("Recording CAN capture to %s", self.directory)
+        try:
+            while True:
+                try:
+                    chunk = self._pending.get(timeout=self.flush_interval_s)
+                except queue.Empty:
+                    if self._stopping.is_set():
+                        break
+                    # Quiet bus: push the partial chunk out so the file stays current.
+                    with self._lock:
+                        self._handoff_locked()
+                    continue
+                if chunk is None:
+                    break
+                self._write(chunk)
+        except OSError as exc:
+            LOGGER.error("CAN capture stopped: %s", exc)
+            with self._lock:
+                self._running = False
+        finally:
+            self._close_file()
+        LOGGER.info("CAN capture stopped (%d records, %d dropped)", self.recorded, self.dropped_records)
+
+    def _write(self, chunk: bytes) -> None:
+        if self._file is None or self._file_bytes + len(chunk) > self.max_file_bytes:
+            self._rotate()
+        assert self._file is not None
+        self._file.write(chunk)
+        self._file_bytes += len(chunk)
+        if self._pending.empty():
+            self._file.flush()
+
+    def _rotate(self) -> None:
+        self._close_file()
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self._file_index += 1
+        self.current_path = self.directory / f"can-{stamp}-{self._file_index:04d}{CAPTURE_SUFFIX}"
+        self._file = open(self.current_path, "ab", buffering=1024 * 1024)
+        self._file_bytes = 0
+        self._prune()
+
+    def _prune(self) -> None:
+        if not self.max_files:
+            return
+        files = capture_files(self.directory)
+        for stale in files[: max(0, len(files) - self.max_files)]:
+            try:
+                os.remove(stale)
+            except OSError as exc:
+                LOGGER.warning("Unable to remove old CAN capture %s: %s", stale, exc)
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+            self._file.close()
+            self._file = None
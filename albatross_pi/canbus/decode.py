@@ -1,13 +1,14 @@
 """Frame decoding and state aggregation for CAN telemetry."""
 from __future__ import annotations
 
-import struct
 import time
-from dataclasses import replace
 from datetime import datetime
 from threading import Condition, Lock
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Iterable, Optional, TypeVar
 
+from .history import DEFAULT_HISTORY_DEPTH, CANFrameRing
+from .signals import FRAME_CODECS
+from .stats import CANBusStats, CANStatsCollector
 from .ids import (
     ArduinoToHudID,
     ECUToHudID,
@@ -20,7 +21,6 @@ from .ids import (
 )
 from ..state.snapshot import (
     AirShotState,
-    CANFrameRecord,
     ClutchState,
     EngineState,
     EnvironmentState,
@@ -45,11 +45,6 @@ TRACTION_LEVEL_NAMES = {
 }
 
 
-_FRAME_NAMES: dict[int, str] = {}
-for _enum in (ECUToHudID, ArduinoToHudID, PiToArduinoID, PiToEcuID, SystemCommandID):
-    for _member in _enum:
-        _FRAME_NAMES[int(_member)] = f"{_enum.__name__}.{_member.name}"
-
 _FIRMWARE_DEVICE_NAMES = {
     0x01: "Arduino controller",
     0x02: "Pi HUD",
@@ -60,17 +55,36 @@ _FIRMWARE_DEVICE_NAMES = {
 _ECU_RX_IDS = {int(member) for member in ECUToHudID}
 _CONTROLLER_RX_IDS = {int(member) for member in ArduinoToHudID}
 
-
-def _c_to_f(celsius: float) -> float:
-    return celsius * 9.0 / 5.0 + 32.0
+# Compiled decoders from the shared signal table, for handlers that derive
+# values beyond a straight field assignment.
+_decode_boost = FRAME_CODECS[int(ECUToHudID.BOOST_PRESSURE)].decode
+_decode_boost_banks = FRAME_CODECS[int(ECUToHudID.BOOST_PRESSURE_BANKS)].decode
+_decode_knock = FRAME_CODECS[int(ECUToHudID.KNOCK_STATUS)].decode
+_decode_exhaust = FRAME_CODECS[int(ECUToHudID.EXHAUST_GAS_TEMP)].decode
+_decode_air_shot = FRAME_CODECS[int(ArduinoToHudID.AIR_SHOT_STATUS)].decode
+_decode_awc = FRAME_CODECS[int(ArduinoToHudID.AWC_STATE)].decode
+_decode_clutch_slip = FRAME_CODECS[int(ArduinoToHudID.CLUTCH_SLIP_STATUS)].decode
+_decode_traction = FRAME_CODECS[int(ArduinoToHudID.TRACTION_STATUS)].decode
+_decode_sensor_voltages = FRAME_CODECS[int(ArduinoToHudID.SERVICE_SENSOR_VOLTAGES)].decode
+_decode_firmware_version = FRAME_CODECS[int(ArduinoToHudID.SERVICE_FIRMWARE_VERSION)].decode
+_decode_wastegate = FRAME_CODECS[int(ArduinoToHudID.WASTEGATE_STATUS)].decode
+_decode_wheel_speed = FRAME_CODECS[int(ArduinoToHudID.WHEEL_SPEED)].decode
+_decode_wmi = FRAME_CODECS[int(ArduinoToHudID.WMI_STATUS)].decode
 
 
 class CANStateAggregator:
     """Maintains the latest HUD snapshot derived from CAN frames."""
 
-    def __init__(self, rpm_redline: int = 12000) -> None:
+    def __init__(
+        self,
+        rpm_redline: int = 12000,
+        history_depth: int = DEFAULT_HISTORY_DEPTH,
+        bitrate: Optional[int] = None,
+    ) -> None:
         self._lock = Lock()
         self._condition = Condition(self._lock)
+        self._can_history = CANFrameRing(history_depth, lock=self._lock)
+        self._can_stats = CANStatsCollector(bitrate, min_dlc=_MIN_PAYLOAD_LENGTHS)
         self._engine_data: Dict[str, float | int | str] = {
             "rpm": 0,
             "rpm_redline": rpm_redline,
@@ -104,10 +118,11 @@ class CANStateAggregator:
         self._traction = TractionState()
         self._clutch = ClutchState()
         self._lighting = LightingState()
-        self._environment = replace(EnvironmentState(), fuel_level_pct=-1.0)
+        self._environment = EnvironmentState().evolve(fuel_level_pct=-1.0)
         self._economy = EconomyState()
         self._service = ServiceStatus(
-            firmware_versions=(ServiceReading("Pi HUD", "local/dev"),)
+            recent_can_frames=self._can_history.view(),
+            firmware_versions=(ServiceReading("Pi HUD", "local/dev"),),
         )
         self._system = SystemStatus()
         self._faults: Dict[int, str] = {}
@@ -116,59 +131,53 @@ class CANStateAggregator:
         self._last_ecu_rx_monotonic: float | None = None
         self._last_controller_rx_monotonic: float | None = None
         self._last_snapshot = StateSnapshot(
-            engine=replace(EngineState(), rpm_redline=rpm_redline),
+            engine=EngineState().evolve(rpm_redline=rpm_redline),
             service=self._service,
         )
+        # Sections whose backing dicts changed since the last assembled
+        # snapshot. Dataclass-backed sections are swapped by the handlers
+        # themselves, so unchanged ones are reused by identity.
+        self._dirty_sections: set[str] = set()
+        self._snapshot_stale = False
         self._dirty = False
+        self._history_published = 0
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def apply_frame(self, arbitration_id: int, data: bytes, direction: str = "RX") -> None:
-        """Decode the provided frame and update internal state."""
-        handler = _FRAME_DISPATCH.get(arbitration_id)
+        """Decode the provided frame and update internal state.
+
+        Only the touched sections are marked dirty here; the snapshot itself
+        is assembled lazily on the next consumer read.
+        """
+        is_rx = direction.upper() == "RX"
         with self._condition:
-            if direction.upper() == "RX":
-                received_at = time.monotonic()
-                self._last_rx_monotonic = received_at
-                if arbitration_id in _ECU_RX_IDS:
-                    self._last_ecu_rx_monotonic = received_at
-                elif arbitration_id in _CONTROLLER_RX_IDS:
-                    self._last_controller_rx_monotonic = received_at
-            self._record_can_frame(arbitration_id, data, direction)
-            if handler is not None:
-                handler(self, data)
-            env_dict = self._environment.__dict__.copy()
-            env_dict["time"] = datetime.now()
-            self._environment = EnvironmentState(**env_dict)
-            self._shift_light = self._engine_data.get("rpm", 0) >= 10000
-            self._last_snapshot = StateSnapshot(
-                engine=EngineState(**self._engine_data),
-                temps=TemperaturesState(
-                    coolant_temp_f=self._temps_data.get("coolant_temp_f", -1.0),
-                    oil_temp_f=self._temps_data.get("oil_temp_f", -1.0),
-                    oil_pressure_psi=self._temps_data.get("oil_pressure_psi", 0.0),
-                    battery_voltage=self._temps_data.get("battery_voltage", -1.0),
-                    intake_temp_f=self._temps_data.get("intake_temp_f", 0.0),
-                    exhaust_temp_f=self._temps_data.get("exhaust_temp_f", 0.0),
-                    exhaust_left_temp_f=self._temps_data.get("exhaust_left_temp_f", -1.0),
-                    exhaust_right_temp_f=self._temps_data.get("exhaust_right_temp_f", -1.0),
-                    alternator_temp_f=self._temps_data.get("alternator_temp_f", 0.0),
-                ),
-                air_shot=self._airshot,
-                wmi=self._wmi,
-                traction=self._traction,
-                clutch=self._clutch,
-                lighting=self._lighting,
-                environment=self._environment,
-                economy=self._economy,
-                service=self._service,
-                system=self._system,
-                shift_light=self._shift_light,
-                faults=tuple(sorted(self._faults.values())),
-            )
+            self._apply_locked(arbitration_id, data, direction, time.monotonic() if is_rx else None)
+            self._snapshot_stale = True
             self._dirty = True
             self._condition.notify_all()
 
+    def apply_frames(self, frames: Iterable[tuple[int, bytes, Optional[float]]]) -> int:
+        """Decode a batch of received frames under a single lock acquisition.
+
+        Each item is ``(arbitration_id, data, timestamp)`` where ``timestamp``
+        is a ``time.monotonic()`` receive time, or ``None`` to use the batch
+        time. Consumers are woken once at the end of the batch. Returns the
+        number of frames applied.
+        """
+        count = 0
+        with self._condition:
+            batch_now = time.monotonic()
+            for arbitration_id, data, timestamp in frames:
+                self._apply_locked(arbitration_id, data, "RX", batch_now if timestamp is None else timestamp)
+                count += 1
+            if count:
+                self._snapshot_stale = True
+                self._dirty = True
+                self._condition.notify_all()
+        return count
+
     def mark_sent_frame(self, arbitration_id: int, data: bytes) -> None:
         """Apply locally transmitted frames to keep state in sync."""
         self.apply_frame(arbitration_id, data, direction="TX")
@@ -178,11 +187,20 @@ class CANStateAggregator:
             if not self._dirty:
                 self._condition.wait(timeout)
             self._dirty = False
-            return self._last_snapshot
+            return self._assemble_snapshot()
 
     def current_snapshot(self) -> StateSnapshot:
         with self._lock:
-            return self._last_snapshot
+            return self._assemble_snapshot()
+
+    def can_stats(self) -> CANBusStats:
+        """Return per-ID rate, jitter, inter-arrival and DLC counters plus bus load."""
+        with self._lock:
+            return self._can_stats.snapshot()
+
+    def reset_can_stats(self) -> None:
+        with self._lock:
+            self._can_stats.reset()
 
     def rx_age_s(self) -> float:
         """Return the worst required-source age without counting local TX echoes."""
@@ -211,223 +229,176 @@ class CANStateAggregator:
         if last_rx is None:
             return float("inf")
         return max(0.0, time.monotonic() - last_rx)
+
+    def _apply_locked(
+        self,
+        arbitration_id: int,
+        data: bytes,
+        direction: str,
+        received_at: float | None,
+    ) -> None:
+        if received_at is not None:
+            self._last_rx_monotonic = received_at
+            if arbitration_id in _ECU_RX_IDS:
+                self._last_ecu_rx_monotonic = received_at
+            elif arbitration_id in _CONTROLLER_RX_IDS:
+                self._last_controller_rx_monotonic = received_at
+            self._can_stats.record(arbitration_id, len(data), int(received_at * 1e9))
+        else:
+            self._can_stats.record(arbitration_id, len(data), time.monotonic_ns())
+        self._can_history.append(arbitration_id, data, direction)
+        handler = _FRAME_DISPATCH.get(arbitration_id)
+        if handler is not None:
+            handler(self, data)
+
     # ------------------------------------------------------------------
-    # Frame handlers
+    # Snapshot assembly
     # ------------------------------------------------------------------
-    def _record_can_frame(self, arbitration_id: int, data: bytes, direction: str) -> None:
-        record = CANFrameRecord(
-            arbitration_id=arbitration_id,
-            name=_FRAME_NAMES.get(arbitration_id, "UNKNOWN"),
-            data_hex=data.hex(" ").upper(),
-            direction=direction,
-            timestamp=datetime.now(),
-        )
-        frames = (record,) + self._service.recent_can_frames
-        self._service = replace(self._service, recent_can_frames=frames[:18])
+    def _set_engine(self, **values: float | int | str) -> None:
+        self._engine_data.update(values)
+        self._dirty_sections.add("engine")
 
-    def _update_engine_rpm(self, data: bytes) -> None:
-        if len(data) < 2:
-            return
-        (rpm,) = struct.unpack_from(">H", data)
-        self._engine_data["rpm"] = rpm
+    def _set_temps(self, **values: float) -> None:
+        self._temps_data.update(values)
+        self._dirty_sections.add("temps")
 
-    def _update_throttle(self, data: bytes) -> None:
-        if not data:
-            return
-        self._engine_data["throttle_pct"] = min(100.0, data[0])
+    def _assemble_snapshot(self) -> StateSnapshot:
+        """Return the latest snapshot, rebuilding only the dirty sections.
 
+        Must be called with the lock held.
+        """
+        if not self._snapshot_stale:
+            return self._last_snapshot
+        previous = self._last_snapshot
+        dirty = self._dirty_sections
+        engine = _settled(previous.engine, EngineState(**self._engine_data)) if "engine" in dirty else previous.engine
+        temps = _settled(previous.temps, TemperaturesState(**self._temps_data)) if "temps" in dirty else previous.temps
+        # The environment timestamp tracks "new frames since the last read";
+        # the renderer uses it as its telemetry freshness anchor.
+        self._environment = self._environment.evolve(time=datetime.now())
+        self._shift_light = engine.rpm >= 10000
+        if self._can_history.count != self._history_published:
+            # Only a cursor is published; rows are formatted when the service overlay reads them.
+            self._service = self._service.evolve(recent_can_frames=self._can_history.view())
+            self._history_published = self._can_history.count
+        # Handlers may rebuild a section with identical values; hand evolve() the
+        # previous object in that case so its change stamp does not move.
+        sections = {}
+        for name, attr in _SECTION_ATTRS:
+            value = _settled(getattr(previous, name), getattr(self, attr))
+            setattr(self, attr, value)
+            sections[name] = value
+        self._last_snapshot = previous.evolve(
+            engine=engine,
+            temps=temps,
+            **sections,
+            shift_light=self._shift_light,
+            faults=tuple(sorted(self._faults.values())) if self._faults else (),
+        )
+        dirty.clear()
+        self._snapshot_stale = False
+        return self._last_snapshot
+
+    # ------------------------------------------------------------------
+    # Frame handlers
+    # ------------------------------------------------------------------
     def _update_boost(self, data: bytes) -> None:
-        if len(data) < 2:
+        values = _decode_boost(data)
+        if values is None:
             return
-        (raw_boost,) = struct.unpack_from(">H", data)
-        boost = raw_boost / 10.0
-        self._engine_data["boost_psi"] = boost
-        self._engine_data["boost_left_psi"] = boost
-        self._engine_data["boost_right_psi"] = boost
+        (boost,) = values
+        self._set_engine(boost_psi=boost, boost_left_psi=boost, boost_right_psi=boost)
 
     def _update_boost_banks(self, data: bytes) -> None:
-        if len(data) < 4:
-            return
-        left_raw, right_raw = struct.unpack_from(">HH", data)
-        left = left_raw / 10.0
-        right = right_raw / 10.0
-        self._engine_data["boost_left_psi"] = left
-        self._engine_data["boost_right_psi"] = right
-        self._engine_data["boost_psi"] = (left + right) / 2.0
-
-    def _update_afr(self, data: bytes) -> None:
-        if len(data) < 4:
+        values = _decode_boost_banks(data)
+        if values is None:
             return
-        left, right = struct.unpack_from(">HH", data)
-        self._engine_data["afr_left"] = left / 100.0
-        self._engine_data["afr_right"] = right / 100.0
+        left, right = values
+        self._set_engine(boost_left_psi=left, boost_right_psi=right, boost_psi=(left + right) / 2.0)
 
     def _update_knock(self, data: bytes) -> None:
         if not data:
             return
-        flags = int.from_bytes(data[: min(len(data), 2)], "big")
-        self._engine_data["knock_events"] = int(bin(flags).count("1"))
-
-    def _update_oil(self, data: bytes) -> None:
-        if len(data) < 4:
-            return
-        pressure_raw, temp_raw = struct.unpack_from(">HH", data)
-        self._temps_data["oil_pressure_psi"] = pressure_raw / 10.0
-        self._temps_data["oil_temp_f"] = _c_to_f(temp_raw / 10.0)
-
-    def _update_arduino_oil_pressure(self, data: bytes) -> None:
-        if len(data) < 2:
-            return
-        (pressure_raw,) = struct.unpack_from(">H", data)
-        self._temps_data["oil_pressure_psi"] = pressure_raw / 10.0
-
-    def _update_coolant(self, data: bytes) -> None:
-        if len(data) < 2:
-            return
-        (temp_raw,) = struct.unpack_from(">H", data)
-        self._temps_data["coolant_temp_f"] = _c_to_f(temp_raw / 10.0)
-
-    def _update_fuel(self, data: bytes) -> None:
-        if not data:
-            return
-        level = data[0]
-        env_dict = self._environment.__dict__.copy()
-        env_dict["fuel_level_pct"] = level
-        self._environment = EnvironmentState(**env_dict)
-
-    def _update_arduino_fuel(self, data: bytes) -> None:
-        if not data:
-            return
-        level = max(0, min(100, data[0]))
-        env_dict = self._environment.__dict__.copy()
-        env_dict["fuel_level_pct"] = level
-        self._environment = EnvironmentState(**env_dict)
+        values = _decode_knock(data)
+        flags = values[0] if values is not None else data[0]
+        self._set_engine(knock_events=int(bin(flags).count("1")))
 
     def _update_gear(self, data: bytes) -> None:
         if not data:
             return
         gear_code = data[0]
         gear_map = {0: "N", 1: "1", 2: "2", 3: "3", 4: "4", 5: "5", 6: "6"}
-        self._engine_data["gear"] = gear_map.get(gear_code, "?")
-
-    def _update_engine_load(self, data: bytes) -> None:
-        if not data:
-            return
-        self._engine_data["engine_load_pct"] = min(100.0, data[0])
-
-    def _update_intake_temp(self, data: bytes) -> None:
-        if len(data) < 2:
-            return
-        (temp_raw,) = struct.unpack_from(">H", data)
-        self._temps_data["intake_temp_f"] = _c_to_f(temp_raw / 10.0)
+        self._set_engine(gear=gear_map.get(gear_code, "?"))
 
     def _update_exhaust_temp(self, data: bytes) -> None:
-        if len(data) < 4:
-            return
-        bank1, bank2 = struct.unpack_from(">HH", data[:4])
-        left_f = _c_to_f(bank1 / 10.0)
-        right_f = _c_to_f(bank2 / 10.0)
-        self._temps_data["exhaust_left_temp_f"] = left_f
-        self._temps_data["exhaust_right_temp_f"] = right_f
-        self._temps_data["exhaust_temp_f"] = (left_f + right_f) / 2.0
-
-
-    def _update_battery_voltage(self, data: bytes) -> None:
-        if len(data) < 2:
-            return
-        (raw_mv,) = struct.unpack_from(">H", data)
-        self._temps_data["battery_voltage"] = raw_mv / 1000.0
-
-    def _update_flex_fuel(self, data: bytes) -> None:
-        if not data:
-            return
-        ethanol_pct = max(0.0, min(100.0, float(data[0])))
-        env_dict = self._environment.__dict__.copy()
-        env_dict["ethanol_content_pct"] = ethanol_pct
-        self._environment = EnvironmentState(**env_dict)
-
-    def _update_injector_status(self, data: bytes) -> None:
-        if len(data) < 2:
-            return
-        (pulse_width_x100,) = struct.unpack_from(">H", data)
-        duty_x10 = 0
-        if len(data) >= 4:
-            (duty_x10,) = struct.unpack_from(">H", data, 2)
-        self._economy = replace(
-            self._economy,
-            injector_pulse_width_ms=max(0.0, pulse_width_x100 / 100.0),
-            injector_duty_pct=max(0.0, min(100.0, duty_x10 / 10.0)),
+        values = _decode_exhaust(data)
+        if values is None:
+            return
+        left_f, right_f = values
+        self._set_temps(
+            exhaust_left_temp_f=left_f,
+            exhaust_right_temp_f=right_f,
+            exhaust_temp_f=(left_f + right_f) / 2.0,
         )
 
     def _update_air_shot_status(self, data: bytes) -> None:
-        if not data:
+        values = _decode_air_shot(data)
+        if values is None:
             return
-        charges = data[0]
-        is_firing = False
-        if len(data) > 1:
-            is_firing = bool(data[1] & 0x01)
-        self._airshot = replace(
-            self._airshot,
+        charges, flags = values
+        self._airshot = self._airshot.evolve(
             charges_remaining=charges,
-            is_firing=is_firing,
+            is_firing=bool(flags & 0x01),
         )
 
     def _update_awc_state(self, data: bytes) -> None:
-        if not data:
+        values = _decode_awc(data)
+        if values is None:
             return
-        active = bool(data[0])
-        lean_deg = 0.0
-        if len(data) >= 2:
-            lean_raw = struct.unpack_from(">b", data, 1)[0]
-            lean_deg = float(lean_raw)
-        self._traction = replace(
-            self._traction,
+        active, lean_deg = values
+        self._traction = self._traction.evolve(
             intervention_level="ON" if active else "OFF",
-            wheelie_pitch_deg=lean_deg,
+            wheelie_pitch_deg=float(lean_deg),
             slip_pct=self._traction.slip_pct,
         )
 
     def _update_clutch_slip_status(self, data: bytes) -> None:
-        if len(data) < 2:
+        values = _decode_clutch_slip(data)
+        if values is None:
             return
-        slip_pct = float(max(0, min(100, data[0])))
-        severity_code = data[1]
+        slip_pct, severity_code = values
         severity_map = {0: "NONE", 1: "MILD", 2: "MODERATE", 3: "SEVERE"}
-        self._clutch = replace(
-            self._clutch,
-            slip_pct=slip_pct,
+        self._clutch = self._clutch.evolve(
+            slip_pct=float(slip_pct),
             severity=severity_map.get(severity_code, self._clutch.severity),
         )
 
     def _update_traction_status(self, data: bytes) -> None:
-        if len(data) < 4:
+        values = _decode_traction(data)
+        if values is None:
             return
-        slip_x10 = struct.unpack_from(">h", data)[0]
-        torque_cut = max(0, min(100, data[2]))
-        flags = data[3]
-        self._traction = replace(
-            self._traction,
-            slip_pct=max(0.0, slip_x10 / 10.0),
+        slip_pct, torque_cut, flags = values
+        self._traction = self._traction.evolve(
+            slip_pct=max(0.0, slip_pct),
             torque_cut_pct=float(torque_cut),
             active=bool(flags & 0x01),
             sensor_fault=bool(flags & 0x02),
         )
 
     def _update_service_sensor_voltages(self, data: bytes) -> None:
-        if len(data) < 4:
+        values = _decode_sensor_voltages(data)
+        if values is None:
             return
-        oil_mv, wmi_mv = struct.unpack_from(">HH", data[:4])
+        oil_v, wmi_v, supply_v, air_tank_v = values
         readings = [
-            ServiceReading("Oil pressure sensor", f"{oil_mv / 1000.0:.2f} V"),
-            ServiceReading("WMI tank sender", f"{wmi_mv / 1000.0:.2f} V"),
+            ServiceReading("Oil pressure sensor", f"{oil_v:.2f} V"),
+            ServiceReading("WMI tank sender", f"{wmi_v:.2f} V"),
         ]
-        if len(data) >= 6:
-            (supply_mv,) = struct.unpack_from(">H", data, 4)
-            readings.append(ServiceReading("Controller 3.3V rail", f"{supply_mv / 1000.0:.2f} V"))
-        if len(data) >= 8:
-            (air_tank_mv,) = struct.unpack_from(">H", data, 6)
-            readings.append(ServiceReading("Air tank pressure sender", f"{air_tank_mv / 1000.0:.2f} V"))
-        self._service = replace(self._service, sensor_voltages=tuple(readings))
+        if supply_v is not None:
+            readings.append(ServiceReading("Controller 3.3V rail", f"{supply_v:.2f} V"))
+        if air_tank_v is not None:
+            readings.append(ServiceReading("Air tank pressure sender", f"{air_tank_v:.2f} V"))
+        self._service = self._service.evolve(sensor_voltages=tuple(readings))
 
     def _update_service_digital_states(self, data: bytes) -> None:
         if len(data) < 4:
@@ -471,18 +442,18 @@ class CANStateAggregator:
         pins.extend(ServiceFlag(label, bool(command_bits & bit)) for label, bit in command_labels)
         pins.extend(ServiceFlag(label, bool(fault_bits & bit)) for label, bit in fault_labels)
         relays = tuple(ServiceFlag(label, bool(output_bits & bit)) for label, bit in relay_labels)
-        self._service = replace(self._service, pin_states=tuple(pins), relay_states=relays)
+        self._service = self._service.evolve(pin_states=tuple(pins), relay_states=relays)
 
     def _update_service_firmware_version(self, data: bytes) -> None:
-        if len(data) < 6:
+        values = _decode_firmware_version(data)
+        if values is None:
             return
-        device = _FIRMWARE_DEVICE_NAMES.get(data[0], f"Device 0x{data[0]:02X}")
-        build = (int(data[4]) << 8) | int(data[5])
-        version = f"{data[1]}.{data[2]}.{data[3]}+{build}"
+        device_code, major, minor, patch, build = values
+        device = _FIRMWARE_DEVICE_NAMES.get(device_code, f"Device 0x{device_code:02X}")
+        version = f"{major}.{minor}.{patch}+{build}"
         versions = {reading.label: reading.value for reading in self._service.firmware_versions}
         versions[device] = version
-        self._service = replace(
-            self._service,
+        self._service = self._service.evolve(
             firmware_versions=tuple(ServiceReading(label, value) for label, value in sorted(versions.items())),
         )
 
@@ -492,16 +463,7 @@ class CANStateAggregator:
         active = bool(data[0])
         reason_code = data[1] if len(data) > 1 else (0x01 if active else 0x00)
         reason = LIMP_REASON_NAMES.get(reason_code, f"CODE 0x{reason_code:02X}") if active else ""
-        self._system = replace(self._system, limp_mode_active=active, limp_mode_reason=reason)
-
-    def _update_tank_pressure(self, data: bytes) -> None:
-        if len(data) < 2:
-            return
-        (pressure_raw,) = struct.unpack_from(">H", data)
-        self._airshot = replace(
-            self._airshot,
-            pressure_psi=pressure_raw / 10.0,
-        )
+        self._system = self._system.evolve(limp_mode_active=active, limp_mode_reason=reason)
 
     def _update_twin_turbo(self, data: bytes) -> None:
         if len(data) < 4:
@@ -510,32 +472,25 @@ class CANStateAggregator:
         # sourced only from Pi BOOST_TARGET_COMMAND frames.
 
     def _update_wastegate_status(self, data: bytes) -> None:
-        if len(data) < 2:
+        values = _decode_wastegate(data)
+        if values is None:
             return
-        duty1, duty2 = data[0], data[1]
-        self._engine_data["wastegate_duty_pct"] = (duty1 + duty2) / 2.0
+        duty1, duty2 = values
+        self._set_engine(wastegate_duty_pct=(duty1 + duty2) / 2.0)
 
     def _update_wheel_speed(self, data: bytes) -> None:
-        if len(data) < 4:
+        values = _decode_wheel_speed(data)
+        if values is None:
             return
-        front_mps_raw, rear_mps_raw = struct.unpack_from(">HH", data[:4])
-        mps = max(front_mps_raw, rear_mps_raw) / 100.0
-        self._engine_data["speed_mph"] = mps * 2.236936
-
-    def _update_boost_command(self, data: bytes) -> None:
-        if len(data) < 2:
-            return
-        (raw_target,) = struct.unpack_from(">H", data)
-        self._engine_data["target_boost_psi"] = raw_target / 10.0
+        self._set_engine(speed_mph=max(values))
 
     def _update_wmi_status(self, data: bytes) -> None:
-        if len(data) < 6:
+        values = _decode_wmi(data)
+        if values is None:
             return
-        tank = data[0]
-        commanded, actual, fault = struct.unpack_from(">HHB", data, 1)
-        self._wmi = replace(
-            self._wmi,
-            tank_level_pct=float(max(0, min(100, tank))),
+        tank, commanded, actual, fault = values
+        self._wmi = self._wmi.evolve(
+            tank_level_pct=float(tank),
             commanded_flow_cc_min=float(commanded),
             actual_flow_cc_min=float(actual),
             fault_active=bool(fault),
@@ -545,9 +500,7 @@ class CANStateAggregator:
         if not data:
             return
         mode_code = data[0]
-        env_dict = self._environment.__dict__.copy()
-        env_dict["mode"] = MODE_NAMES.get(mode_code, env_dict.get("mode", "ECO"))
-        self._environment = EnvironmentState(**env_dict)
+        self._environment = self._environment.evolve(mode=MODE_NAMES.get(mode_code, self._environment.mode))
 
     def _update_traction_level(self, data: bytes) -> None:
         if not data:
@@ -555,8 +508,7 @@ class CANStateAggregator:
         level = TRACTION_LEVEL_NAMES.get(data[0])
         if level is None:
             return
-        self._traction = replace(
-            self._traction,
+        self._traction = self._traction.evolve(
             intervention_level=level,
         )
 
@@ -576,9 +528,7 @@ class CANStateAggregator:
     def _update_fuel_type(self, data: bytes) -> None:
         if not data:
             return
-        env_dict = self._environment.__dict__.copy()
-        env_dict["fuel_type"] = FUEL_NAMES.get(data[0], env_dict.get("fuel_type", "93"))
-        self._environment = EnvironmentState(**env_dict)
+        self._environment = self._environment.evolve(fuel_type=FUEL_NAMES.get(data[0], self._environment.fuel_type))
 
     def _update_ecu_fuel_profile(self, data: bytes) -> None:
         if not data:
@@ -589,80 +539,119 @@ class CANStateAggregator:
         if not data:
             return
         table = "PERF" if data[0] else "INITIAL"
-        env_dict = self._environment.__dict__.copy()
-        env_dict["message_line"] = f"SPARK {table}"
-        self._environment = EnvironmentState(**env_dict)
+        self._environment = self._environment.evolve(message_line=f"SPARK {table}")
 
     def _update_flame_mode(self, data: bytes) -> None:
         if not data:
             return
         enabled = bool(data[0])
-        env_dict = self._environment.__dict__.copy()
-        env_dict["flame_mode_enabled"] = enabled
-        env_dict["rev_limiter_strategy"] = "IGNITION CUT" if enabled else "FUEL CUT"
-        self._environment = EnvironmentState(**env_dict)
+        self._environment = self._environment.evolve(
+            flame_mode_enabled=enabled,
+            rev_limiter_strategy="IGNITION CUT" if enabled else "FUEL CUT",
+        )
 
     def _update_rev_limiter_strategy(self, data: bytes) -> None:
         if not data:
             return
-        env_dict = self._environment.__dict__.copy()
-        env_dict["rev_limiter_strategy"] = "IGNITION CUT" if data[0] else "FUEL CUT"
-        self._environment = EnvironmentState(**env_dict)
+        self._environment = self._environment.evolve(rev_limiter_strategy="IGNITION CUT" if data[0] else "FUEL CUT")
 
     def _update_nfc_auth(self, data: bytes) -> None:
         if not data:
             return
         status = data[0]
-        env_dict = self._environment.__dict__.copy()
-        env_dict["message_line"] = "NFC OK" if status else "NFC LOCKED"
-        self._environment = EnvironmentState(**env_dict)
+        self._environment = self._environment.evolve(message_line="NFC OK" if status else "NFC LOCKED")
 
     def _update_post_frame(self, data: bytes) -> None:
-        env_dict = self._environment.__dict__.copy()
-        if not data:
-            env_dict["message_line"] = "POST"
-        else:
-            env_dict["message_line"] = f"POST 0x{data[0]:02X}"
-        self._environment = EnvironmentState(**env_dict)
+        message_line = f"POST 0x{data[0]:02X}" if data else "POST"
+        self._environment = self._environment.evolve(message_line=message_line)
+
+_SECTION_ATTRS = (
+    ("air_shot", "_airshot"),
+    ("wmi", "_wmi"),
+    ("traction", "_traction"),
+    ("clutch", "_clutch"),
+    ("lighting", "_lighting"),
+    ("environment", "_environment"),
+    ("economy", "_economy"),
+    ("service", "_service"),
+    ("system", "_system"),
+)
+
+_S = TypeVar("_S")
+
+
+def _settled(previous: _S, current: _S) -> _S:
+    """Return ``previous`` when ``current`` is an equal copy of it."""
+    return previous if current is not previous and current == previous else current
+
+
+def _section_handler(arbitration_id: int) -> Callable[[CANStateAggregator, bytes], None]:
+    """Build a handler that writes a table frame's signals straight into its section."""
+    codec = FRAME_CODECS[int(arbitration_id)]
+    decode = codec.decode
+    names = codec.names
+    section = codec.spec.section
+    if section in ("engine", "temps"):
+        data_attr = f"_{section}_data"
+
+        def update_fields(self: CANStateAggregator, data: bytes) -> None:
+            values = decode(data)
+            if values is None:
+                return
+            getattr(self, data_attr).update(zip(names, values))
+            self._dirty_sections.add(section)
+
+        return update_fields
+
+    state_attr = f"_{section}"
+
+    def replace_fields(self: CANStateAggregator, data: bytes) -> None:
+        values = decode(data)
+        if values is None:
+            return
+        setattr(self, state_attr, getattr(self, state_attr).evolve(**dict(zip(names, values))))
+
+    return replace_fields
+
 
 # Mapping from arbitration ID to handler method.
 _FRAME_DISPATCH: Dict[int, Callable[[CANStateAggregator, bytes], None]] = {
-    int(ECUToHudID.ENGINE_RPM): CANStateAggregator._update_engine_rpm,
-    int(ECUToHudID.THROTTLE_POSITION): CANStateAggregator._update_throttle,
+    int(ECUToHudID.ENGINE_RPM): _section_handler(ECUToHudID.ENGINE_RPM),
+    int(ECUToHudID.THROTTLE_POSITION): _section_handler(ECUToHudID.THROTTLE_POSITION),
     int(ECUToHudID.BOOST_PRESSURE): CANStateAggregator._update_boost,
     int(ECUToHudID.BOOST_PRESSURE_BANKS): CANStateAggregator._update_boost_banks,
-    int(ECUToHudID.AFR_BANKS): CANStateAggregator._update_afr,
+    int(ECUToHudID.AFR_BANKS): _section_handler(ECUToHudID.AFR_BANKS),
     int(ECUToHudID.KNOCK_STATUS): CANStateAggregator._update_knock,
-    int(ECUToHudID.OIL_PRESSURE_TEMP): CANStateAggregator._update_oil,
-    int(ECUToHudID.COOLANT_TEMP): CANStateAggregator._update_coolant,
-    int(ECUToHudID.FUEL_LEVEL): CANStateAggregator._update_fuel,
+    int(ECUToHudID.OIL_PRESSURE_TEMP): _section_handler(ECUToHudID.OIL_PRESSURE_TEMP),
+    int(ECUToHudID.COOLANT_TEMP): _section_handler(ECUToHudID.COOLANT_TEMP),
+    int(ECUToHudID.FUEL_LEVEL): _section_handler(ECUToHudID.FUEL_LEVEL),
     int(ECUToHudID.GEAR_POSITION): CANStateAggregator._update_gear,
-    int(ECUToHudID.ENGINE_LOAD): CANStateAggregator._update_engine_load,
-    int(ECUToHudID.INTAKE_AIR_TEMP): CANStateAggregator._update_intake_temp,
+    int(ECUToHudID.ENGINE_LOAD): _section_handler(ECUToHudID.ENGINE_LOAD),
+    int(ECUToHudID.INTAKE_AIR_TEMP): _section_handler(ECUToHudID.INTAKE_AIR_TEMP),
     int(ECUToHudID.EXHAUST_GAS_TEMP): CANStateAggregator._update_exhaust_temp,
-    int(ECUToHudID.BATTERY_VOLTAGE): CANStateAggregator._update_battery_voltage,
-    int(ECUToHudID.FLEX_FUEL): CANStateAggregator._update_flex_fuel,
-    int(ECUToHudID.INJECTOR_STATUS): CANStateAggregator._update_injector_status,
+    int(ECUToHudID.BATTERY_VOLTAGE): _section_handler(ECUToHudID.BATTERY_VOLTAGE),
+    int(ECUToHudID.FLEX_FUEL): _section_handler(ECUToHudID.FLEX_FUEL),
+    int(ECUToHudID.INJECTOR_STATUS): _section_handler(ECUToHudID.INJECTOR_STATUS),
     int(ArduinoToHudID.AIR_SHOT_STATUS): CANStateAggregator._update_air_shot_status,
     int(ArduinoToHudID.AWC_STATE): CANStateAggregator._update_awc_state,
     int(ArduinoToHudID.RGB_LIGHTING): lambda self, data: None,
-    int(ArduinoToHudID.TANK_PRESSURE): CANStateAggregator._update_tank_pressure,
+    int(ArduinoToHudID.TANK_PRESSURE): _section_handler(ArduinoToHudID.TANK_PRESSURE),
     int(ArduinoToHudID.TWIN_TURBO_STATUS): CANStateAggregator._update_twin_turbo,
     int(ArduinoToHudID.WASTEGATE_STATUS): CANStateAggregator._update_wastegate_status,
     int(ArduinoToHudID.GEAR_POSITION): CANStateAggregator._update_gear,
     int(ArduinoToHudID.WHEEL_SPEED): CANStateAggregator._update_wheel_speed,
-    int(ArduinoToHudID.FUEL_LEVEL): CANStateAggregator._update_arduino_fuel,
+    int(ArduinoToHudID.FUEL_LEVEL): _section_handler(ArduinoToHudID.FUEL_LEVEL),
     int(ArduinoToHudID.WMI_STATUS): CANStateAggregator._update_wmi_status,
     int(ArduinoToHudID.CLUTCH_SLIP_STATUS): CANStateAggregator._update_clutch_slip_status,
     int(ArduinoToHudID.LIGHT_STATUS): CANStateAggregator._update_light_status,
-    int(ArduinoToHudID.OIL_PRESSURE_STATUS): CANStateAggregator._update_arduino_oil_pressure,
+    int(ArduinoToHudID.OIL_PRESSURE_STATUS): _section_handler(ArduinoToHudID.OIL_PRESSURE_STATUS),
     int(ArduinoToHudID.FUEL_TYPE_STATUS): CANStateAggregator._update_fuel_type,
     int(ArduinoToHudID.TRACTION_STATUS): CANStateAggregator._update_traction_status,
     int(ArduinoToHudID.SERVICE_SENSOR_VOLTAGES): CANStateAggregator._update_service_sensor_voltages,
     int(ArduinoToHudID.SERVICE_DIGITAL_STATES): CANStateAggregator._update_service_digital_states,
     int(ArduinoToHudID.SERVICE_FIRMWARE_VERSION): CANStateAggregator._update_service_firmware_version,
     int(ArduinoToHudID.LIMP_STATUS): CANStateAggregator._update_limp_status,
-    int(PiToArduinoID.BOOST_TARGET_COMMAND): CANStateAggregator._update_boost_command,
+    int(PiToArduinoID.BOOST_TARGET_COMMAND): _section_handler(PiToArduinoID.BOOST_TARGET_COMMAND),
     int(PiToArduinoID.MODE_SELECTION): CANStateAggregator._update_mode_selection,
     int(PiToArduinoID.FLAME_MODE): CANStateAggregator._update_flame_mode,
     int(PiToArduinoID.LIMP_MODE): CANStateAggregator._update_limp_status,
@@ -676,3 +665,16 @@ _FRAME_DISPATCH: Dict[int, Callable[[CANStateAggregator, bytes], None]] = {
     int(SystemCommandID.POST_REQUEST): CANStateAggregator._update_post_frame,
     int(SystemCommandID.POST_RESPONSE): CANStateAggregator._update_post_frame,
 }
+
+# Shortest payload each handler decodes; anything shorter is counted as a DLC error.
+_MIN_PAYLOAD_LENGTHS: Dict[int, int] = {
+    arbitration_id: FRAME_CODECS[arbitration_id].min_length
+    for arbitration_id in _FRAME_DISPATCH
+    if arbitration_id in FRAME_CODECS
+}
+_MIN_PAYLOAD_LENGTHS[int(ECUToHudID.KNOCK_STATUS)] = 1  # legacy single-byte knock mask
+
+
+def handled_arbitration_ids() -> tuple[int, ...]:
+    """Return every arbitration ID the aggregator decodes, for kernel RX filters."""
+    return tuple(sorted(_FRAME_DISPATCH))
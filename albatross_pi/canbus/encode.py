@@ -1,35 +1,45 @@
 """Frame builders for Pi-originated CAN commands."""
 from __future__ import annotations
 
-import struct
-
 from .calibration import fuel_profile_for_code, spark_table_for_mode
 from .ids import LIMP_REASON_CODES, PiToArduinoID, PiToEcuID
+from .signals import codec_for
+
+_BOOST_TARGET = codec_for(PiToArduinoID.BOOST_TARGET_COMMAND)
+_MODE_SELECTION = codec_for(PiToArduinoID.MODE_SELECTION)
+_NFC_AUTH = codec_for(PiToArduinoID.NFC_AUTH)
+_FLAME_MODE = codec_for(PiToArduinoID.FLAME_MODE)
+_LIMP_MODE = codec_for(PiToArduinoID.LIMP_MODE)
+_TRACTION_LEVEL = codec_for(PiToArduinoID.TRACTION_LEVEL)
+_AIR_SHOT_REQUEST = codec_for(PiToArduinoID.AIR_SHOT_REQUEST)
+_MEDIA_CONTROL = codec_for(PiToArduinoID.MEDIA_CONTROL)
+_PHONE_LINK = codec_for(PiToArduinoID.PHONE_LINK)
+_FUEL_TYPE_SELECT = codec_for(PiToArduinoID.FUEL_TYPE_SELECT)
+_ENGINE_RUN_SWITCH = codec_for(PiToArduinoID.ENGINE_RUN_SWITCH)
+_WMI_ENABLE = codec_for(PiToArduinoID.WMI_ENABLE)
+_FUEL_PROFILE = codec_for(PiToEcuID.FUEL_PROFILE_SELECT)
+_SPARK_TABLE = codec_for(PiToEcuID.SPARK_TABLE_SELECT)
+_REV_LIMITER = codec_for(PiToEcuID.REV_LIMITER_STRATEGY)
 
 
 def build_boost_target_frame(target_psi: float) -> tuple[int, bytes]:
     """Return the arbitration ID and payload for a boost target command."""
-    clamped = max(0.0, min(6553.5, float(target_psi)))
-    payload = struct.pack(">H", int(round(clamped * 10)))
-    return int(PiToArduinoID.BOOST_TARGET_COMMAND), payload
+    return _BOOST_TARGET.encode_frame(target_psi)
 
 
 def build_mode_selection_frame(mode_code: int) -> tuple[int, bytes]:
     """Return the frame announcing the requested riding mode."""
-    payload = bytes((mode_code & 0xFF,))
-    return int(PiToArduinoID.MODE_SELECTION), payload
+    return _MODE_SELECTION.encode_frame(mode_code & 0xFF)
 
 
 def build_nfc_auth_frame(success: bool) -> tuple[int, bytes]:
     """Return the NFC authentication acknowledgement frame."""
-    payload = bytes((0x01 if success else 0x00,))
-    return int(PiToArduinoID.NFC_AUTH), payload
+    return _NFC_AUTH.encode_frame(0x01 if success else 0x00)
 
 
 def build_flame_mode_frame(enabled: bool) -> tuple[int, bytes]:
     """Return the frame toggling flame mode (Pi is source of truth)."""
-    payload = bytes((0x01 if enabled else 0x00,))
-    return int(PiToArduinoID.FLAME_MODE), payload
+    return _FLAME_MODE.encode_frame(0x01 if enabled else 0x00)
 
 
 def build_limp_mode_frame(enabled: bool, reason: str = "") -> tuple[int, bytes]:
@@ -40,14 +50,12 @@ def build_limp_mode_frame(enabled: bool, reason: str = "") -> tuple[int, bytes]:
     Older Arduino firmware that only reads byte 0 will safely ignore byte 1.
     """
     reason_code = 0x00 if not enabled else LIMP_REASON_CODES.get(reason.upper(), LIMP_REASON_CODES["SAFETY SUPERVISOR"])
-    payload = bytes((0x01 if enabled else 0x00, reason_code & 0xFF))
-    return int(PiToArduinoID.LIMP_MODE), payload
+    return _LIMP_MODE.encode_frame(0x01 if enabled else 0x00, reason_code & 0xFF)
 
 
 def build_traction_level_frame(level_code: int) -> tuple[int, bytes]:
     """Return the frame selecting Arduino traction aggressiveness."""
-    payload = bytes((level_code & 0xFF,))
-    return int(PiToArduinoID.TRACTION_LEVEL), payload
+    return _TRACTION_LEVEL.encode_frame(level_code & 0xFF)
 
 
 def build_air_shot_request_frame() -> tuple[int, bytes]:
@@ -55,38 +63,33 @@ def build_air_shot_request_frame() -> tuple[int, bytes]:
 
     Arduino still owns all Air Shot safety gates and latching.
     """
-    return int(PiToArduinoID.AIR_SHOT_REQUEST), bytes((0x01,))
+    return _AIR_SHOT_REQUEST.encode_frame(0x01)
 
 
 def build_media_control_frame(command_code: int, value: int) -> tuple[int, bytes]:
     """Return a frame for phone/media navigation control events."""
-    payload = bytes((command_code & 0xFF, value & 0xFF))
-    return int(PiToArduinoID.MEDIA_CONTROL), payload
+    return _MEDIA_CONTROL.encode_frame(command_code & 0xFF, value & 0xFF)
 
 
 def build_phone_link_frame(enabled: bool) -> tuple[int, bytes]:
     """Return a frame to request phone link enable/disable."""
-    payload = bytes((0x01 if enabled else 0x00,))
-    return int(PiToArduinoID.PHONE_LINK), payload
+    return _PHONE_LINK.encode_frame(0x01 if enabled else 0x00)
 
 
 def build_fuel_type_frame(fuel_code: int) -> tuple[int, bytes]:
     """Return a frame selecting the active fuel table/type."""
-    payload = bytes((fuel_code & 0xFF,))
-    return int(PiToArduinoID.FUEL_TYPE_SELECT), payload
+    return _FUEL_TYPE_SELECT.encode_frame(fuel_code & 0xFF)
 
 
 def build_ecu_fuel_profile_frame(fuel_code: int) -> tuple[int, bytes]:
     """Return a frame selecting the ECU fuel table and stoich/AFR profile."""
     profile = fuel_profile_for_code(fuel_code)
-    payload = struct.pack(">BBH", profile.code & 0xFF, profile.fuel_table & 0xFF, int(round(profile.stoich_afr * 100)))
-    return int(PiToEcuID.FUEL_PROFILE_SELECT), payload
+    return _FUEL_PROFILE.encode_frame(profile.code & 0xFF, profile.fuel_table & 0xFF, profile.stoich_afr)
 
 
 def build_ecu_spark_table_frame(mode_code: int) -> tuple[int, bytes]:
     """Return a frame selecting initial or performance spark table by ride mode."""
-    payload = bytes((spark_table_for_mode(mode_code) & 0xFF,))
-    return int(PiToEcuID.SPARK_TABLE_SELECT), payload
+    return _SPARK_TABLE.encode_frame(spark_table_for_mode(mode_code) & 0xFF)
 
 
 def build_ecu_rev_limiter_strategy_frame(flame_mode_enabled: bool) -> tuple[int, bytes]:
@@ -96,8 +99,7 @@ def build_ecu_rev_limiter_strategy_frame(flame_mode_enabled: bool) -> tuple[int,
     this request to a real table/switch input; wasted-spark ignition mode itself
     is not treated as a live CAN-toggleable setting here.
     """
-    payload = bytes((0x01 if flame_mode_enabled else 0x00,))
-    return int(PiToEcuID.REV_LIMITER_STRATEGY), payload
+    return _REV_LIMITER.encode_frame(0x01 if flame_mode_enabled else 0x00)
 
 
 def build_engine_run_switch_frame(enabled: bool) -> tuple[int, bytes]:
@@ -106,11 +108,9 @@ def build_engine_run_switch_frame(enabled: bool) -> tuple[int, bytes]:
     True => engine may run.
     False => engine run switch OFF (cut ignition/fuel via ECU mapping).
     """
-    payload = bytes((0x01 if enabled else 0x00,))
-    return int(PiToArduinoID.ENGINE_RUN_SWITCH), payload
+    return _ENGINE_RUN_SWITCH.encode_frame(0x01 if enabled else 0x00)
 
 
 def build_wmi_enable_frame(enabled: bool) -> tuple[int, bytes]:
     """Return the frame arming/disarming Arduino-managed WMI strategy."""
-    payload = bytes((0x01 if enabled else 0x00,))
-    return int(PiToArduinoID.WMI_ENABLE), payload
+    return _WMI_ENABLE.encode_frame(0x01 if enabled else 0x00)
@@ -0,0 +1,130 @@
+"""Fixed-size recent CAN frame history for the service overlay."""
+from __future__ import annotations
+
+import time
+from array import array
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Optional, overload
+
+from .ids import ArduinoToHudID, ECUToHudID, PiToArduinoID, PiToEcuID, SystemCommandID
+from ..state.snapshot import CANFrameRecord
+
+DEFAULT_HISTORY_DEPTH = 4096
+
+FRAME_NAMES: dict[int, str] = {}
+for _enum in (ECUToHudID, ArduinoToHudID, PiToArduinoID, PiToEcuID, SystemCommandID):
+    for _member in _enum:
+        FRAME_NAMES[int(_member)] = f"{_enum.__name__}.{_member.name}"
+
+_DIRECTIONS = ("RX", "TX")
+
+
+class CANFrameRing:
+    """Preallocated ring of raw (id, monotonic_ns, length, payload, direction) entries.
+
+    ``append`` only stores integers and copies at most eight payload bytes, so
+    the RX path cost does not depend on whether anyone is looking. Hex text,
+    frame names and wall-clock timestamps are produced by ``CANFrameHistory``
+    when the service overlay asks for rows. Callers must hold ``lock`` around
+    ``append``; the history views take it while materializing rows.
+    """
+
+    def __init__(self, depth: int = DEFAULT_HISTORY_DEPTH, lock: Optional[Lock] = None) -> None:
+        self.depth = max(1, int(depth))
+        self.lock = lock if lock is not None else Lock()
+        self._ids = array("I", bytes(4 * self.depth))
+        self._timestamps_ns = array("q", bytes(8 * self.depth))
+        self._lengths = bytearray(self.depth)
+        self._directions = bytearray(self.depth)
+        self._payloads = bytearray(8 * self.depth)
+        self.count = 0
+
+    def append(self, arbitration_id: int, data: bytes, direction: str) -> None:
+        slot = self.count % self.depth
+        length = min(len(data), 8)
+        self._ids[slot] = arbitration_id
+        self._timestamps_ns[slot] = time.monotonic_ns()
+        self._lengths[slot] = length
+        self._directions[slot] = 1 if direction == "TX" else 0
+        offset = slot * 8
+        self._payloads[offset : offset + length] = data[:length]
+        self.count += 1
+
+    def view(self) -> "CANFrameHistory":
+        """Return a read-only newest-first view ending at the current frame."""
+        return CANFrameHistory(self, self.count)
+
+    def _materialize(self, end: int, start_index: int, stop_index: int) -> tuple[CANFrameRecord, ...]:
+        now_ns = time.monotonic_ns()
+        now = datetime.now()
+        records: list[CANFrameRecord] = []
+        with self.lock:
+            oldest = self.count - self.depth
+            for index in range(start_index, stop_index):
+                sequence = end - 1 - index
+                if sequence < 0 or sequence < oldest:
+                    break
+                slot = sequence % self.depth
+                offset = slot * 8
+                arbitration_id = self._ids[slot]
+                age_ns = max(0, now_ns - self._timestamps_ns[slot])
+                records.append(
+                    CANFrameRecord(
+                        arbitration_id=arbitration_id,
+                        name=FRAME_NAMES.get(arbitration_id, "UNKNOWN"),
+                        data_hex=self._payloads[offset : offset + self._lengths[slot]].hex(" ").upper(),
+                        direction=_DIRECTIONS[self._directions[slot]],
+                        timestamp=now - timedelta(microseconds=age_ns // 1000),
+                    )
+                )
+        return tuple(records)
+
+
+class CANFrameHistory(Sequence):
+    """Newest-first sequence of ``CANFrameRecord`` backed by a ``CANFrameRing``.
+
+    Records are formatted on access. Entries that the ring has overwritten since
+    the view was taken simply drop off the end.
+    """
+
+    __slots__ = ("_ring", "_end")
+
+    def __init__(self, ring: CANFrameRing, end: int) -> None:
+        self._ring = ring
+        self._end = end
+
+    def __len__(self) -> int:
+        return min(self._end, self._ring.depth)
+
+    @overload
+    def __getitem__(self, index: int) -> CANFrameRecord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[CANFrameRecord, ...]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return tuple(self)[index]
+            return self._ring._materialize(self._end, start, max(start, stop))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CAN history index out of range")
+        records = self._ring._materialize(self._end, index, index + 1)
+        if not records:
+            raise IndexError("CAN history entry was overwritten")
+        return records[0]
+
+    def __iter__(self):
+        return iter(self._ring._materialize(self._end, 0, len(self)))
+
+    def __deepcopy__(self, memo) -> tuple[CANFrameRecord, ...]:
+        # dataclasses.asdict() deep-copies unknown field types; export plain records.
+        return tuple(self)
+
+    def __repr__(self) -> str:
+        return f"CANFrameHistory(len={len(self)})"
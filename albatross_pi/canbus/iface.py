@@ -1,10 +1,17 @@
 """SocketCAN interface helpers."""
 from __future__ import annotations
 
+import errno
 import logging
+import select
+import socket
+import struct
 import threading
+import time
 from functools import wraps
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional, Tuple
+
+from .capture import CANCaptureRecorder
 
 try:
     import can
@@ -14,6 +21,51 @@ except ImportError:  # pragma: no cover - optional dependency
 
 LOGGER = logging.getLogger(__name__)
 _GS_USB_LIBUSB_PATCHED = False
+RX_BATCH_SIZE = 64
+
+# (arbitration_id, data, monotonic receive time) as consumed by
+# CANStateAggregator.apply_frames.
+RxFrame = Tuple[int, bytes, float]
+
+# Linux ``struct can_frame``: u32 can_id, u8 len, 3 pad/reserved bytes, 8 data bytes.
+_CAN_FRAME = struct.Struct("=IB3x8s")
+_CAN_FRAME_HEADER = struct.Struct("=IB")
+_CAN_FRAME_SIZE = _CAN_FRAME.size
+_CAN_FILTER = struct.Struct("=II")
+_CAN_EFF_FLAG = 0x80000000
+_CAN_RTR_FLAG = 0x40000000
+_CAN_ERR_FLAG = 0x20000000
+_CAN_SFF_MASK = 0x000007FF
+_CAN_EFF_MASK = 0x1FFFFFFF
+# SO_TIMESTAMP/SCM_TIMESTAMP is not exported by the socket module; 29 is the
+# asm-generic value used on both the Pi (arm/arm64) and x86 desktops.
+_SO_TIMESTAMP = getattr(socket, "SO_TIMESTAMP", 29)
+_TIMEVAL = struct.Struct("@ll")
+
+
+def can_filters_for_ids(arbitration_ids: Iterable[int]) -> list[tuple[int, int]]:
+    """Return compact standard-ID ``(can_id, can_mask)`` filters for ``arbitration_ids``.
+
+    Aligned power-of-two runs that are fully covered collapse into a single
+    masked filter (0x100-0x10F becomes ``(0x100, 0x7F0)``), keeping the kernel's
+    per-frame filter walk short.
+    """
+    wanted = {int(arbitration_id) & _CAN_SFF_MASK for arbitration_id in arbitration_ids}
+    filters: list[tuple[int, int]] = []
+    covered: set[int] = set()
+    for arbitration_id in sorted(wanted):
+        if arbitration_id in covered:
+            continue
+        block = 1
+        while (
+            block < 0x800
+            and arbitration_id % (block * 2) == 0
+            and all(candidate in wanted for candidate in range(arbitration_id, arbitration_id + block * 2))
+        ):
+            block *= 2
+        filters.append((arbitration_id, _CAN_SFF_MASK & ~(block - 1)))
+        covered.update(range(arbitration_id, arbitration_id + block))
+    return filters
 
 
 def python_can_available() -> bool:
@@ -21,6 +73,11 @@ def python_can_available() -> bool:
     return can is not None
 
 
+def raw_socketcan_available() -> bool:
+    """Return whether this Python build can open AF_CAN raw sockets."""
+    return hasattr(socket, "AF_CAN") and hasattr(socket, "CAN_RAW")
+
+
 class SocketCANInterface:
     """Thin wrapper around python-can for SocketCAN access."""
 
@@ -29,10 +86,19 @@ class SocketCANInterface:
         channel: str = "can0",
         bitrate: Optional[int] = None,
         rx_callback: Optional[Callable[[int, bytes], None]] = None,
+        rx_batch_callback: Optional[Callable[[list[RxFrame]], object]] = None,
+        rx_batch_size: int = RX_BATCH_SIZE,
+        rx_ids: Optional[Iterable[int]] = None,
+        capture: Optional[CANCaptureRecorder] = None,
     ) -> None:
         self.channel = channel
         self.bitrate = bitrate
         self.rx_callback = rx_callback
+        self.rx_batch_callback = rx_batch_callback
+        self.rx_batch_size = max(1, int(rx_batch_size))
+        self.rx_filters = can_filters_for_ids(rx_ids) if rx_ids is not None else None
+        self.service_mode = False
+        self.capture = capture
         self._bus: Optional["can.BusABC"] = None
         self._rx_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
@@ -50,15 +116,20 @@ class SocketCANInterface:
         except TypeError:
             self._bus = can.ThreadSafeBus(channel=self.channel, bustype="socketcan")
         if self.bitrate:
-            try:
-                self._bus.set_filters([])
-                LOGGER.debug("SocketCAN bitrate requested: %s", self.bitrate)
-            except NotImplementedError:
-                LOGGER.warning("Bitrate configuration not supported by backend; skipping.")
+            LOGGER.debug("SocketCAN bitrate requested: %s", self.bitrate)
+        self._install_filters()
         self._stop_event.clear()
         self._rx_thread = threading.Thread(target=self._rx_loop, name="can-rx", daemon=True)
         self._rx_thread.start()
 
+    def set_service_mode(self, enabled: bool) -> None:
+        """Widen the kernel RX filter to all traffic while the service overlay is open."""
+        if self.service_mode == bool(enabled):
+            return
+        self.service_mode = bool(enabled)
+        if self._bus is not None:
+            self._install_filters()
+
     def stop(self) -> None:
         self._stop_event.set()
         if self._rx_thread and self._rx_thread.is_alive():
@@ -75,6 +146,8 @@ class SocketCANInterface:
         message = can.Message(arbitration_id=arbitration_id, data=data, is_extended_id=False)
         LOGGER.debug("CAN TX 0x%03X %s", arbitration_id, data.hex())
         self._bus.send(message, timeout=timeout)
+        if self.capture is not None:
+            self.capture.record(arbitration_id, data, "TX")
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -84,17 +157,235 @@ class SocketCANInterface:
         LOGGER.info("Starting CAN RX loop")
         while not self._stop_event.is_set():
             try:
-                message = self._bus.recv(timeout=0.1)
+                batch = self._recv_batch()
             except can.CanError as exc:  # pragma: no cover - hardware specific
                 LOGGER.error("CAN receive error: %s", exc)
                 continue
-            if message is None:
+            if not batch:
                 continue
-            LOGGER.debug("CAN RX 0x%03X %s", message.arbitration_id, message.data.hex())
-            if self.rx_callback:
-                self.rx_callback(message.arbitration_id, bytes(message.data))
+            if self.capture is not None:
+                self.capture.record_batch(batch)
+            if self.rx_batch_callback:
+                self.rx_batch_callback(batch)
+            elif self.rx_callback:
+                for arbitration_id, data, _ in batch:
+                    self.rx_callback(arbitration_id, data)
         LOGGER.info("CAN RX loop stopped")
 
+    def _install_filters(self) -> None:
+        assert self._bus is not None
+        if self.rx_filters is None or self.service_mode:
+            filters = None
+        else:
+            filters = [{"can_id": can_id, "can_mask": can_mask, "extended": False} for can_id, can_mask in self.rx_filters]
+        try:
+            self._bus.set_filters(filters)
+        except NotImplementedError:
+            LOGGER.warning("CAN RX filters not supported by backend; receiving all traffic.")
+            return
+        LOGGER.info("CAN RX filter: %s", "all traffic" if filters is None else f"{len(filters)} kernel filters")
+
+    def _recv_batch(self) -> list[RxFrame]:
+        """Block for one frame, then drain whatever else is already queued."""
+        assert self._bus is not None
+        batch: list[RxFrame] = []
+        message = self._bus.recv(timeout=0.1)
+        # python-can stamps socketcan frames with the kernel SO_TIMESTAMP (wall
+        # clock); map it onto monotonic time so a drained backlog keeps its spacing.
+        clock_offset = time.monotonic() - time.time()
+        while message is not None:
+            LOGGER.debug("CAN RX 0x%03X %s", message.arbitration_id, message.data.hex())
+            received_at = message.timestamp + clock_offset if message.timestamp else time.monotonic()
+            batch.append((message.arbitration_id, bytes(message.data), received_at))
+            if len(batch) >= self.rx_batch_size:
+                break
+            message = self._bus.recv(timeout=0.0)
+        return batch
+
+
+class RawSocketCANInterface:
+    """SocketCAN access through a bare ``AF_CAN`` raw socket.
+
+    Drop-in alternative to ``SocketCANInterface`` that keeps python-can off the
+    RX hot path. Frames are read straight into a preallocated buffer, one
+    ``struct can_frame`` slot per ``recvmsg_into`` call, draining everything the
+    kernel has queued before handing the batch over. Payloads are passed as
+    memoryviews into that buffer together with the kernel SO_TIMESTAMP mapped
+    onto ``time.monotonic()``; they are only valid for the duration of the
+    callback, so consumers that keep payloads must copy them.
+    """
+
+    def __init__(
+        self,
+        channel: str = "can0",
+        bitrate: Optional[int] = None,
+        rx_callback: Optional[Callable[[int, bytes], None]] = None,
+        rx_batch_callback: Optional[Callable[[list[RxFrame]], object]] = None,
+        rx_batch_size: int = RX_BATCH_SIZE,
+        rx_ids: Optional[Iterable[int]] = None,
+        capture: Optional[CANCaptureRecorder] = None,
+    ) -> None:
+        self.channel = channel
+        self.bitrate = bitrate
+        self.rx_callback = rx_callback
+        self.rx_batch_callback = rx_batch_callback
+        self.rx_batch_size = max(1, int(rx_batch_size))
+        self.rx_filters = can_filters_for_ids(rx_ids) if rx_ids is not None else None
+        self.service_mode = False
+        self.capture = capture
+        self._socket: Optional[socket.socket] = None
+        self._poller: Optional["select.poll"] = None
+        self._rx_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._rx_buffer = bytearray(self.rx_batch_size * _CAN_FRAME_SIZE)
+        self._rx_view = memoryview(self._rx_buffer)
+        self._rx_slots = [
+            self._rx_view[offset : offset + _CAN_FRAME_SIZE]
+            for offset in range(0, len(self._rx_buffer), _CAN_FRAME_SIZE)
+        ]
+        self._rx_ancbufsize = socket.CMSG_SPACE(_TIMEVAL.size)
+
+    def start(self) -> None:
+        if not raw_socketcan_available():
+            raise RuntimeError("AF_CAN raw sockets are not available on this platform.")
+        if self._socket is not None:
+            return
+        LOGGER.info("Opening raw SocketCAN channel %s", self.channel)
+        sock = socket.socket(socket.AF_CAN, socket.SOCK_RAW, socket.CAN_RAW)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, _SO_TIMESTAMP, 1)
+        except OSError as exc:
+            LOGGER.warning("Kernel CAN RX timestamps unavailable (%s); using receive time.", exc)
+        self._socket = sock
+        try:
+            # Filter before bind so unwanted IDs never queue on the socket.
+            self._install_filters()
+            sock.bind((self.channel,))
+        except OSError as exc:
+            self._socket = None
+            sock.close()
+            raise RuntimeError(f"Unable to bind raw SocketCAN channel {self.channel}: {exc}") from exc
+        if self.bitrate:
+            LOGGER.debug("SocketCAN bitrate requested: %s (configure with ip link / can@.service)", self.bitrate)
+        sock.setblocking(False)
+        self._poller = select.poll()
+        self._poller.register(sock, select.POLLIN)
+        self._stop_event.clear()
+        self._rx_thread = threading.Thread(target=self._rx_loop, name="can-rx", daemon=True)
+        self._rx_thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._rx_thread and self._rx_thread.is_alive():
+            self._rx_thread.join(timeout=1.0)
+        self._rx_thread = None
+        if self._socket is not None:
+            LOGGER.info("Closing raw SocketCAN channel %s", self.channel)
+            self._socket.close()
+            self._socket = None
+            self._poller = None
+
+    def set_service_mode(self, enabled: bool) -> None:
+        """Widen the kernel RX filter to all traffic while the service overlay is open."""
+        if self.service_mode == bool(enabled):
+            return
+        self.service_mode = bool(enabled)
+        if self._socket is not None:
+            self._install_filters()
+
+    def send(self, arbitration_id: int, data: bytes, timeout: Optional[float] = None) -> None:
+        if self._socket is None:
+            raise RuntimeError("RawSocketCANInterface.start() must be called before send().")
+        if len(data) > 8:
+            raise ValueError(f"CAN payload for 0x{arbitration_id:03X} exceeds 8 bytes")
+        LOGGER.debug("CAN TX 0x%03X %s", arbitration_id, data.hex())
+        frame = _CAN_FRAME.pack(arbitration_id & _CAN_SFF_MASK, len(data), bytes(data))
+        try:
+            self._socket.send(frame)
+        except OSError as exc:
+            # The socket is non-blocking for the RX drain; a full TX queue shows
+            # up as EAGAIN/ENOBUFS, so wait for room once before giving up.
+            if exc.errno not in (errno.EAGAIN, errno.ENOBUFS):
+                raise
+            _, writable, _ = select.select([], [self._socket], [], 0.1 if timeout is None else timeout)
+            if not writable:
+                raise
+            self._socket.send(frame)
+        if self.capture is not None:
+            self.capture.record(arbitration_id, data, "TX")
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _rx_loop(self) -> None:
+        assert self._socket is not None
+        LOGGER.info("Starting raw CAN RX loop")
+        while not self._stop_event.is_set():
+            try:
+                batch = self._recv_batch()
+            except OSError as exc:  # pragma: no cover - hardware specific
+                if self._stop_event.is_set():
+                    break
+                LOGGER.error("CAN receive error: %s", exc)
+                continue
+            if not batch:
+                continue
+            if self.capture is not None:
+                self.capture.record_batch(batch)
+            if self.rx_batch_callback:
+                self.rx_batch_callback(batch)
+            elif self.rx_callback:
+                for arbitration_id, data, _ in batch:
+                    self.rx_callback(arbitration_id, bytes(data))
+        LOGGER.info("Raw CAN RX loop stopped")
+
+    def _install_filters(self) -> None:
+        assert self._socket is not None
+        if self.rx_filters is None or self.service_mode:
+            filters = [(0, 0)]
+        else:
+            # Match the EFF/RTR bits too, so extended or remote frames whose low
+            # 11 bits equal a handled ID are dropped in the kernel.
+            filters = [(can_id, can_mask | _CAN_EFF_FLAG | _CAN_RTR_FLAG) for can_id, can_mask in self.rx_filters]
+        packed = b"".join(_CAN_FILTER.pack(can_id, can_mask) for can_id, can_mask in filters)
+        self._socket.setsockopt(socket.SOL_CAN_RAW, socket.CAN_RAW_FILTER, packed)
+        LOGGER.info("CAN RX filter: %s", "all traffic" if filters == [(0, 0)] else f"{len(filters)} kernel filters")
+
+    def _recv_batch(self) -> list[RxFrame]:
+        """Wait up to 100 ms for traffic, then drain the socket queue without blocking."""
+        sock = self._socket
+        assert sock is not None and self._poller is not None
+        batch: list[RxFrame] = []
+        if not self._poller.poll(100):
+            return batch
+        buffer = self._rx_buffer
+        view = self._rx_view
+        # Offset between the kernel's wall-clock timestamps and monotonic time.
+        clock_offset = time.monotonic() - time.time()
+        for index, slot in enumerate(self._rx_slots):
+            try:
+                nbytes, ancdata, _, _ = sock.recvmsg_into([slot], self._rx_ancbufsize)
+            except BlockingIOError:
+                break
+            if nbytes < _CAN_FRAME_SIZE:
+                continue
+            offset = index * _CAN_FRAME_SIZE
+            can_id, length = _CAN_FRAME_HEADER.unpack_from(buffer, offset)
+            if can_id & (_CAN_ERR_FLAG | _CAN_RTR_FLAG):
+                continue
+            can_id &= _CAN_EFF_MASK if can_id & _CAN_EFF_FLAG else _CAN_SFF_MASK
+            received_at = _kernel_rx_monotonic(ancdata, clock_offset)
+            batch.append((can_id, view[offset + 8 : offset + 8 + min(length, 8)], received_at))
+        return batch
+
+
+def _kernel_rx_monotonic(ancdata: list[tuple[int, int, bytes]], clock_offset: float) -> float:
+    for level, kind, payload in ancdata:
+        if level == socket.SOL_SOCKET and kind == _SO_TIMESTAMP and len(payload) >= _TIMEVAL.size:
+            seconds, micros = _TIMEVAL.unpack_from(payload)
+            return seconds + micros / 1_000_000 + clock_offset
+    return time.monotonic()
+
 
 class PythonCANInterface:
     """Generic python-can TX/RX wrapper for bench adapters.
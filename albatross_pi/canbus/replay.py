@@ -0,0 +1,181 @@
+"""Replay recorded CAN captures through the normal RX callbacks."""
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+from .capture import CAPTURE_SUFFIX, CANCaptureRecorder, capture_files, read_capture
+from .iface import RX_BATCH_SIZE, RxFrame
+
+LOGGER = logging.getLogger(__name__)
+
+# Recorded gaps longer than this (or going backwards) restart the replay clock.
+REPLAY_MAX_GAP_NS = 1_000_000_000
+_CAPTURE_INDEX = re.compile(r"-(\d+)" + re.escape(CAPTURE_SUFFIX) + "$")
+
+
+class CANReplayInterface:
+    """Drop-in stand-in for ``SocketCANInterface`` that plays back a capture.
+
+    RX records are delivered on a ``can-rx`` thread through ``rx_batch_callback``
+    (or ``rx_callback``) exactly as the live interfaces do, with receive times
+    rebased onto the current ``time.monotonic()`` so RX ages and per-ID rate
+    statistics behave as they did on the road. ``speed`` scales the recorded
+    timing (``2.0`` plays twice as fast); ``speed <= 0`` delivers frames as
+    fast as the consumer accepts them. TX records in the capture are skipped
+    because the HUD regenerates its own transmits, and ``send`` only counts
+    them. ``rx_ids`` mimics the kernel filter unless service mode is on.
+
+    A directory may hold several recording sessions whose monotonic clocks are
+    unrelated, so playback timing is re-anchored at each session start (the
+    rotated file index resets) and wherever the recorded time runs backwards
+    or jumps by more than ``REPLAY_MAX_GAP_NS``.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        speed: float = 1.0,
+        loop: bool = False,
+        rx_callback: Optional[Callable[[int, bytes], None]] = None,
+        rx_batch_callback: Optional[Callable[[list[RxFrame]], object]] = None,
+        rx_batch_size: int = RX_BATCH_SIZE,
+        rx_ids: Optional[Iterable[int]] = None,
+        capture: Optional[CANCaptureRecorder] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.channel = f"replay:{self.path.name}"
+        self.speed = float(speed)
+        self.loop = loop
+        self.rx_callback = rx_callback
+        self.rx_batch_callback = rx_batch_callback
+        self.rx_batch_size = max(1, int(rx_batch_size))
+        self.rx_ids = frozenset(int(arbitration_id) for arbitration_id in rx_ids) if rx_ids is not None else None
+        self.service_mode = False
+        self.capture = capture
+        self.frames_replayed = 0
+        self.frames_sent = 0
+        self.finished = threading.Event()
+        self._files: list[Path] = []
+        self._rx_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def start(self) -> None:
+        if self._rx_thread is not None:
+            return
+        self._files = capture_files(self.path)
+        if not self._files or not all(path.is_file() for path in self._files):
+            raise RuntimeError(f"No CAN capture found at {self.path}")
+        LOGGER.info(
+            "Replaying %d CAN capture file(s) from %s at %s",
+            len(self._files),
+            self.path,
+            "max speed" if self.speed <= 0 else f"{self.speed:g}x",
+        )
+        self.finished.clear()
+        self._stop_event.clear()
+        self._rx_thread = threading.Thread(target=self._rx_loop, name="can-rx", daemon=True)
+        self._rx_thread.start()
+
+    def set_service_mode(self, enabled: bool) -> None:
+        """Pass all recorded traffic while the service overlay is open."""
+        self.service_mode = bool(enabled)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._rx_thread and self._rx_thread.is_alive():
+            self._rx_thread.join(timeout=1.0)
+        self._rx_thread = None
+
+    def send(self, arbitration_id: int, data: bytes, timeout: Optional[float] = None) -> None:
+        if self._rx_thread is None:
+            raise RuntimeError("CANReplayInterface.start() must be called before send().")
+        if len(data) > 8:
+            raise ValueError(f"CAN payload for 0x{arbitration_id:03X} exceeds 8 bytes")
+        LOGGER.debug("CAN TX (replay, dropped) 0x%03X %s", arbitration_id, data.hex())
+        self.frames_sent += 1
+        if self.capture is not None:
+            self.capture.record(arbitration_id, data, "TX")
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _records(self) -> Iterator[tuple[int, int, bytes, bool]]:
+        """Yield RX records, flagging the first record of each recording session."""
+        previous_index: Optional[int] = None
+        for path in self._files:
+            match = _CAPTURE_INDEX.search(path.name)
+            index = int(match.group(1)) if match else None
+            new_session = index is None or previous_index is None or index <= previous_index
+            previous_index = index
+            for timestamp_ns, arbitration_id, data, direction in read_capture(path):
+                if direction == "RX":
+                    yield timestamp_ns, arbitration_id, data, new_session
+                    new_session = False
+
+    def _rx_loop(self) -> None:
+        LOGGER.info("Starting CAN replay loop")
+        try:
+            while not self._stop_event.is_set():
+                self._play_once()
+                if not self.loop:
+                    break
+        finally:
+            self.finished.set()
+        LOGGER.info("CAN replay stopped after %d frames", self.frames_replayed)
+
+    def _play_once(self) -> None:
+        realtime = self.speed > 0
+        scale = 1e-9 / self.speed if realtime else 0.0
+        first_ns: Optional[int] = None
+        last_ns = 0
+        start = time.monotonic()
+        batch: list[RxFrame] = []
+        for timestamp_ns, arbitration_id, data, new_session in self._records():
+            if self._stop_event.is_set():
+                return
+            if (
+                first_ns is None
+                or new_session
+                or timestamp_ns < last_ns
+                or timestamp_ns - last_ns > REPLAY_MAX_GAP_NS
+            ):
+                if first_ns is not None:
+                    LOGGER.debug("CAN replay clock re-anchored at %d ns", timestamp_ns)
+                first_ns = timestamp_ns
+                start = time.monotonic()
+            last_ns = timestamp_ns
+            if self.rx_ids is not None and not self.service_mode and arbitration_id not in self.rx_ids:
+                continue
+            if realtime:
+                due = start + (timestamp_ns - first_ns) * scale
+                now = time.monotonic()
+                if due > now:
+                    # Hand over what is already due before sleeping until the next frame.
+                    self._deliver(batch)
+                    batch = []
+                    if self._stop_event.wait(due - now):
+                        return
+            else:
+                due = time.monotonic()
+            batch.append((arbitration_id, data, due))
+            if len(batch) >= self.rx_batch_size:
+                self._deliver(batch)
+                batch = []
+        self._deliver(batch)
+
+    def _deliver(self, batch: list[RxFrame]) -> None:
+        if not batch:
+            return
+        if self.capture is not None:
+            self.capture.record_batch(batch)
+        if self.rx_batch_callback:
+            self.rx_batch_callback(batch)
+        elif self.rx_callback:
+            for arbitration_id, data, _ in batch:
+                self.rx_callback(arbitration_id, data)
+        self.frames_replayed += len(batch)
@@ -0,0 +1,328 @@
+"""Declarative CAN signal layouts shared by the decoder, encoders and demo tools.
+
+Every fixed-layout payload on the bus is described once in ``SIGNAL_TABLE``.
+At import time each ``FrameSpec`` is compiled into a ``FrameCodec`` holding a
+precompiled ``struct.Struct`` and generated ``decode``/``encode`` functions with
+the scaling, offset and clamping folded in as constants, so the hot RX path
+does no format parsing or per-signal loops.
+
+Physical value = raw * scale + bias. ``lo``/``hi`` clamp the physical value on
+decode and before encoding; the encoded raw value is additionally clamped to the
+range of its struct format.
+"""
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence
+
+from .ids import ArduinoToEcuID, ArduinoToHudID, ECUToHudID, PiToArduinoID, PiToEcuID
+
+_C10_TO_F = 0.18  # tenths of a degree C -> degrees F, with bias 32
+
+_RAW_LIMITS = {
+    "B": (0, 0xFF),
+    "b": (-0x80, 0x7F),
+    "H": (0, 0xFFFF),
+    "h": (-0x8000, 0x7FFF),
+    "I": (0, 0xFFFFFFFF),
+    "i": (-0x80000000, 0x7FFFFFFF),
+}
+
+
+@dataclass(frozen=True)
+class Signal:
+    name: str
+    offset: int
+    fmt: str
+    scale: float = 1.0
+    bias: float = 0.0
+    lo: Optional[float] = None
+    hi: Optional[float] = None
+    optional: bool = False
+    default: Optional[float] = None
+
+    @property
+    def end(self) -> int:
+        return self.offset + struct.calcsize(">" + self.fmt)
+
+
+@dataclass(frozen=True)
+class FrameSpec:
+    """Payload layout for one arbitration ID.
+
+    ``section`` names the aggregator section whose fields the signals write
+    directly (signal names are then field names); frames that need derived
+    values leave it unset and are decoded by hand-written handlers.
+    """
+
+    arbitration_id: int
+    signals: tuple[Signal, ...]
+    section: Optional[str] = None
+
+
+def _sig(name: str, offset: int, fmt: str = "B", **kwargs) -> Signal:
+    return Signal(name, offset, fmt, **kwargs)
+
+
+def _c10_temp(name: str, offset: int) -> Signal:
+    return Signal(name, offset, "H", scale=_C10_TO_F, bias=32.0)
+
+
+SIGNAL_TABLE: tuple[FrameSpec, ...] = (
+    # MS3 ECU -> HUD
+    FrameSpec(ECUToHudID.ENGINE_RPM, (_sig("rpm", 0, "H"),), "engine"),
+    FrameSpec(ECUToHudID.THROTTLE_POSITION, (_sig("throttle_pct", 0, lo=0.0, hi=100.0),), "engine"),
+    FrameSpec(ECUToHudID.BOOST_PRESSURE, (_sig("boost_psi", 0, "H", scale=0.1),)),
+    FrameSpec(
+        ECUToHudID.BOOST_PRESSURE_BANKS,
+        (_sig("boost_left_psi", 0, "H", scale=0.1), _sig("boost_right_psi", 2, "H", scale=0.1)),
+    ),
+    FrameSpec(ECUToHudID.AFR_BANKS, (_sig("afr_left", 0, "H", scale=0.01), _sig("afr_right", 2, "H", scale=0.01)), "engine"),
+    FrameSpec(ECUToHudID.KNOCK_STATUS, (_sig("knock_mask", 0, "H"),)),
+    FrameSpec(
+        ECUToHudID.OIL_PRESSURE_TEMP,
+        (_sig("oil_pressure_psi", 0, "H", scale=0.1), _c10_temp("oil_temp_f", 2)),
+        "temps",
+    ),
+    FrameSpec(ECUToHudID.COOLANT_TEMP, (_c10_temp("coolant_temp_f", 0),), "temps"),
+    FrameSpec(ECUToHudID.FUEL_LEVEL, (_sig("fuel_level_pct", 0),), "environment"),
+    FrameSpec(ECUToHudID.GEAR_POSITION, (_sig("gear_code", 0),)),
+    FrameSpec(ECUToHudID.ENGINE_LOAD, (_sig("engine_load_pct", 0, lo=0.0, hi=100.0),), "engine"),
+    FrameSpec(ECUToHudID.INTAKE_AIR_TEMP, (_c10_temp("intake_temp_f", 0),), "temps"),
+    FrameSpec(ECUToHudID.EXHAUST_GAS_TEMP, (_c10_temp("exhaust_left_temp_f", 0), _c10_temp("exhaust_right_temp_f", 2))),
+    FrameSpec(ECUToHudID.BATTERY_VOLTAGE, (_sig("battery_voltage", 0, "H", scale=0.001),), "temps"),
+    FrameSpec(ECUToHudID.FLEX_FUEL, (_sig("ethanol_content_pct", 0, scale=1.0, lo=0.0, hi=100.0),), "environment"),
+    FrameSpec(
+        ECUToHudID.INJECTOR_STATUS,
+        (
+            _sig("injector_pulse_width_ms", 0, "H", scale=0.01, lo=0.0),
+            _sig("injector_duty_pct", 2, "H", scale=0.1, lo=0.0, hi=100.0, optional=True, default=0.0),
+        ),
+        "economy",
+    ),
+    # Arduino -> HUD
+    FrameSpec(ArduinoToHudID.AIR_SHOT_STATUS, (_sig("charges_remaining", 0), _sig("flags", 1, optional=True, default=0))),
+    FrameSpec(ArduinoToHudID.AWC_STATE, (_sig("active", 0), _sig("lean_deg", 1, "b", optional=True, default=0))),
+    FrameSpec(ArduinoToHudID.TANK_PRESSURE, (_sig("pressure_psi", 0, "H", scale=0.1),), "airshot"),
+    FrameSpec(
+        ArduinoToHudID.TWIN_TURBO_STATUS,
+        (_sig("turbo1_psi", 0, "H", scale=0.1, lo=0.0), _sig("turbo2_psi", 2, "H", scale=0.1, lo=0.0)),
+    ),
+    FrameSpec(
+        ArduinoToHudID.WASTEGATE_STATUS,
+        (_sig("wg1_duty_pct", 0), _sig("wg2_duty_pct", 1)),
+    ),
+    FrameSpec(ArduinoToHudID.GEAR_POSITION, (_sig("gear_code", 0),)),
+    FrameSpec(
+        ArduinoToHudID.WHEEL_SPEED,
+        # m/s x100 on the wire, mph in the HUD.
+        (_sig("front_mph", 0, "H", scale=0.02236936), _sig("rear_mph", 2, "H", scale=0.02236936)),
+    ),
+    FrameSpec(ArduinoToHudID.FUEL_LEVEL, (_sig("fuel_level_pct", 0, lo=0, hi=100),), "environment"),
+    FrameSpec(
+        ArduinoToHudID.WMI_STATUS,
+        (
+            _sig("tank_level_pct", 0, lo=0, hi=100),
+            _sig("commanded_flow_cc_min", 1, "H"),
+            _sig("actual_flow_cc_min", 3, "H"),
+            _sig("fault", 5),
+        ),
+    ),
+    FrameSpec(ArduinoToHudID.CLUTCH_SLIP_STATUS, (_sig("slip_pct", 0, lo=0, hi=100), _sig("severity_code", 1))),
+    FrameSpec(ArduinoToHudID.LIGHT_STATUS, (_sig("flags", 0),)),
+    FrameSpec(ArduinoToHudID.OIL_PRESSURE_STATUS, (_sig("oil_pressure_psi", 0, "H", scale=0.1),), "temps"),
+    FrameSpec(ArduinoToHudID.FUEL_TYPE_STATUS, (_sig("fuel_code", 0),)),
+    FrameSpec(
+        ArduinoToHudID.TRACTION_STATUS,
+        (_sig("slip_pct", 0, "h", scale=0.1), _sig("torque_cut_pct", 2, lo=0, hi=100), _sig("flags", 3)),
+    ),
+    FrameSpec(
+        ArduinoToHudID.SERVICE_SENSOR_VOLTAGES,
+        (
+            _sig("oil_sensor_v", 0, "H", scale=0.001),
+            _sig("wmi_tank_v", 2, "H", scale=0.001),
+            _sig("supply_v", 4, "H", scale=0.001, optional=True),
+            _sig("air_tank_v", 6, "H", scale=0.001, optional=True),
+        ),
+    ),
+    FrameSpec(
+        ArduinoToHudID.SERVICE_DIGITAL_STATES,
+        (_sig("input_bits", 0), _sig("output_bits", 1), _sig("command_bits", 2), _sig("fault_bits", 3)),
+    ),
+    FrameSpec(
+        ArduinoToHudID.SERVICE_FIRMWARE_VERSION,
+        (_sig("device", 0), _sig("major", 1), _sig("minor", 2), _sig("patch", 3), _sig("build", 4, "H")),
+    ),
+    FrameSpec(ArduinoToHudID.LIMP_STATUS, (_sig("active", 0), _sig("reason_code", 1, optional=True))),
+    # Arduino -> ECU
+    FrameSpec(ArduinoToEcuID.TORQUE_CUT_REQUEST, (_sig("torque_cut_pct", 0, lo=0, hi=100),)),
+    FrameSpec(ArduinoToEcuID.TRACTION_SLIP_REQUEST, (_sig("slip_pct", 0, "h", scale=0.1), _sig("flags", 2))),
+    # Pi -> Arduino
+    FrameSpec(PiToArduinoID.BOOST_TARGET_COMMAND, (_sig("target_boost_psi", 0, "H", scale=0.1, lo=0.0),), "engine"),
+    FrameSpec(PiToArduinoID.MODE_SELECTION, (_sig("mode_code", 0),)),
+    FrameSpec(PiToArduinoID.FLAME_MODE, (_sig("enabled", 0),)),
+    FrameSpec(PiToArduinoID.LIMP_MODE, (_sig("active", 0), _sig("reason_code", 1, optional=True))),
+    FrameSpec(PiToArduinoID.TRACTION_LEVEL, (_sig("level_code", 0),)),
+    FrameSpec(PiToArduinoID.AIR_SHOT_REQUEST, (_sig("request", 0),)),
+    FrameSpec(PiToArduinoID.MEDIA_CONTROL, (_sig("command_code", 0), _sig("value", 1))),
+    FrameSpec(PiToArduinoID.PHONE_LINK, (_sig("enabled", 0),)),
+    FrameSpec(PiToArduinoID.ENGINE_RUN_SWITCH, (_sig("enabled", 0),)),
+    FrameSpec(PiToArduinoID.WMI_ENABLE, (_sig("enabled", 0),)),
+    FrameSpec(PiToArduinoID.FUEL_TYPE_SELECT, (_sig("fuel_code", 0),)),
+    FrameSpec(PiToArduinoID.NFC_AUTH, (_sig("status", 0),)),
+    # Pi -> ECU
+    FrameSpec(
+        PiToEcuID.FUEL_PROFILE_SELECT,
+        (_sig("fuel_code", 0), _sig("fuel_table", 1), _sig("stoich_afr", 2, "H", scale=0.01)),
+    ),
+    FrameSpec(PiToEcuID.SPARK_TABLE_SELECT, (_sig("table", 0),)),
+    FrameSpec(PiToEcuID.REV_LIMITER_STRATEGY, (_sig("ignition_cut", 0),)),
+)
+
+
+class FrameCodec:
+    """Compiled form of a ``FrameSpec``.
+
+    ``decode(data)`` returns the physical values in signal order, or ``None``
+    when the payload is shorter than the required signals; absent optional
+    signals decode to their ``default``. ``encode(*values)`` packs physical
+    values into a full-length payload.
+    """
+
+    __slots__ = ("spec", "struct", "names", "size", "min_length", "decode", "encode")
+
+    def __init__(self, spec: FrameSpec) -> None:
+        self.spec = spec
+        self.names = tuple(signal.name for signal in spec.signals)
+        self.struct = struct.Struct(_struct_format(spec.signals))
+        self.size = self.struct.size
+        self.min_length = max((s.end for s in spec.signals if not s.optional), default=0)
+        self.decode: Callable[[bytes], Optional[tuple]] = _compile_decoder(spec, self.struct)
+        self.encode: Callable[..., bytes] = _compile_encoder(spec, self.struct)
+
+    @property
+    def arbitration_id(self) -> int:
+        return int(self.spec.arbitration_id)
+
+    def decode_dict(self, data: bytes) -> Optional[dict[str, float]]:
+        values = self.decode(data)
+        return None if values is None else dict(zip(self.names, values))
+
+    def encode_frame(self, *values: float) -> tuple[int, bytes]:
+        return self.arbitration_id, self.encode(*values)
+
+
+def _struct_format(signals: Sequence[Signal]) -> str:
+    parts = [">"]
+    position = 0
+    for signal in sorted(signals, key=lambda s: s.offset):
+        if signal.offset < position:
+            raise ValueError(f"Overlapping CAN signal {signal.name!r}")
+        if signal.offset > position:
+            parts.append(f"{signal.offset - position}x")
+        parts.append(signal.fmt)
+        position = signal.end
+    return "".join(parts)
+
+
+def _decode_expr(signal: Signal, raw: str) -> str:
+    expr = raw
+    if signal.scale != 1.0:
+        divisor = 1.0 / signal.scale
+        if abs(divisor - round(divisor)) < 1e-9:
+            # Divide by the exact decade so 0.1/0.01 scales round like hand-written code.
+            expr = f"{expr} / {float(round(divisor))!r}"
+        else:
+            expr = f"{expr} * {signal.scale!r}"
+    if signal.bias:
+        expr = f"{expr} + {signal.bias!r}"
+    if signal.lo is not None:
+        expr = f"max({signal.lo!r}, {expr})"
+    if signal.hi is not None:
+        expr = f"min({signal.hi!r}, {expr})"
+    return expr
+
+
+def _encode_expr(signal: Signal, value: str) -> str:
+    expr = f"float({value})"
+    if signal.lo is not None:
+        expr = f"max({signal.lo!r}, {expr})"
+    if signal.hi is not None:
+        expr = f"min({signal.hi!r}, {expr})"
+    if signal.bias:
+        expr = f"({expr} - {signal.bias!r})"
+    if signal.scale != 1.0:
+        divisor = 1.0 / signal.scale
+        if abs(divisor - round(divisor)) < 1e-9:
+            expr = f"{expr} * {float(round(divisor))!r}"
+        else:
+            expr = f"{expr} / {signal.scale!r}"
+    raw_lo, raw_hi = _RAW_LIMITS[signal.fmt]
+    return f"min({raw_hi}, max({raw_lo}, int(round({expr}))))"
+
+
+def _compile_decoder(spec: FrameSpec, compiled: struct.Struct) -> Callable[[bytes], Optional[tuple]]:
+    ordered = sorted(spec.signals, key=lambda s: s.offset)
+    index = {signal.name: position for position, signal in enumerate(ordered)}
+    raws = [f"r{index[signal.name]}" for signal in spec.signals]
+    full = ", ".join(_decode_expr(signal, raw) for signal, raw in zip(spec.signals, raws))
+    lines = [
+        "def decode(data):",
+        f"    if len(data) >= {compiled.size}:",
+        f"        {', '.join(f'r{i}' for i in range(len(ordered)))}, = unpack_from(data)",
+        f"        return ({full},)",
+    ]
+    optional = [signal for signal in spec.signals if signal.optional]
+    required_len = max((s.end for s in spec.signals if not s.optional), default=0)
+    if optional:
+        # Older firmware sends short payloads; decode what is present.
+        lines.append(f"    if len(data) < {required_len}:")
+        lines.append("        return None")
+        partial = []
+        for signal in spec.signals:
+            one = f"struct.unpack_from('>{signal.fmt}', data, {signal.offset})[0]"
+            expr = _decode_expr(signal, one)
+            if signal.optional:
+                expr = f"({expr} if len(data) >= {signal.end} else {signal.default!r})"
+            partial.append(expr)
+        lines.append(f"    return ({', '.join(partial)},)")
+    else:
+        lines.append("    return None")
+    namespace: Dict[str, object] = {"unpack_from": compiled.unpack_from, "struct": struct}
+    exec("\n".join(lines), namespace)
+    return namespace["decode"]  # type: ignore[return-value]
+
+
+def _compile_encoder(spec: FrameSpec, compiled: struct.Struct) -> Callable[..., bytes]:
+    ordered = sorted(spec.signals, key=lambda s: s.offset)
+    args = [f"v{position}" for position in range(len(spec.signals))]
+    by_name = {signal.name: arg for signal, arg in zip(spec.signals, args)}
+    params = []
+    for signal, arg in zip(spec.signals, args):
+        if signal.optional:
+            params.append(f"{arg}={signal.default if signal.default is not None else 0!r}")
+        else:
+            params.append(arg)
+    packed = ", ".join(_encode_expr(signal, by_name[signal.name]) for signal in ordered)
+    source = f"def encode({', '.join(params)}):\n    return pack({packed})"
+    namespace: Dict[str, object] = {"pack": compiled.pack}
+    exec(source, namespace)
+    return namespace["encode"]  # type: ignore[return-value]
+
+
+FRAME_CODECS: Dict[int, FrameCodec] = {int(spec.arbitration_id): FrameCodec(spec) for spec in SIGNAL_TABLE}
+
+
+def codec_for(arbitration_id: int) -> FrameCodec:
+    return FRAME_CODECS[int(arbitration_id)]
+
+
+def encode_signals(arbitration_id: int, *values: float) -> bytes:
+    """Pack physical values for ``arbitration_id`` using the shared table."""
+    return FRAME_CODECS[int(arbitration_id)].encode(*values)
+
+
+def decode_signals(arbitration_id: int, data: bytes) -> Optional[tuple]:
+    """Return physical values for ``arbitration_id`` or ``None`` if too short."""
+    return FRAME_CODECS[int(arbitration_id)].decode(data)
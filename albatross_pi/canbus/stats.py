@@ -0,0 +1,152 @@
+"""Per-ID CAN receive statistics and bus load estimation."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+from .history import FRAME_NAMES
+
+DEFAULT_BITRATE = 500_000
+
+
+def _frame_bits(length: int) -> int:
+    """Worst-case bits on the wire for a standard 11-bit data frame.
+
+    44 overhead bits plus payload, stuffing over the 34 + 8n stuffable bits,
+    and the 3-bit interframe space.
+    """
+    return 44 + 8 * length + (34 + 8 * length - 1) // 4 + 3
+
+
+_FRAME_BITS = tuple(_frame_bits(length) for length in range(9))
+
+
+@dataclass(frozen=True)
+class CANIdStats:
+    arbitration_id: int
+    name: str = "UNKNOWN"
+    frames: int = 0
+    rate_hz: float = 0.0
+    jitter_ms: float = 0.0
+    min_interval_ms: float = 0.0
+    max_interval_ms: float = 0.0
+    dlc_errors: int = 0
+    last_seen_age_s: float = float("inf")
+
+
+@dataclass(frozen=True)
+class CANBusStats:
+    bitrate: int = DEFAULT_BITRATE
+    bus_load_pct: float = 0.0
+    frames_per_s: float = 0.0
+    ids: tuple[CANIdStats, ...] = ()
+
+
+class _IdCounters:
+    __slots__ = ("count", "last_ns", "interval_ns", "jitter_ns", "min_ns", "max_ns", "dlc_errors")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.last_ns = 0
+        self.interval_ns = 0
+        self.jitter_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.dlc_errors = 0
+
+
+class CANStatsCollector:
+    """Integer counters updated once per frame; ``snapshot`` does the float math.
+
+    Rate and jitter are exponentially smoothed with a 1/16 gain (the RFC 3550
+    interarrival jitter estimator) using integer shifts, so recording a frame is
+    a handful of integer operations. Inter-arrival min/max are since the last
+    ``reset``. Bus load is the wire-bit total of the last complete window over
+    the bitrate. Callers serialize ``record`` (the aggregator holds its lock).
+    """
+
+    def __init__(
+        self,
+        bitrate: Optional[int] = None,
+        min_dlc: Optional[Mapping[int, int]] = None,
+        window_s: float = 1.0,
+    ) -> None:
+        self.bitrate = int(bitrate or DEFAULT_BITRATE)
+        self._min_dlc = dict(min_dlc or {})
+        self._window_ns = int(window_s * 1e9)
+        self._ids: Dict[int, _IdCounters] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        self._ids.clear()
+        self._window_end_ns = 0
+        self._window_bits = 0
+        self._window_frames = 0
+        self._last_window_bits = 0
+        self._last_window_frames = 0
+
+    def record(self, arbitration_id: int, length: int, timestamp_ns: int) -> None:
+        counters = self._ids.get(arbitration_id)
+        if counters is None:
+            counters = self._ids[arbitration_id] = _IdCounters()
+        if counters.count:
+            delta = timestamp_ns - counters.last_ns
+            if delta >= 0:
+                if counters.count == 1:
+                    counters.interval_ns = delta
+                    counters.min_ns = delta
+                    counters.max_ns = delta
+                else:
+                    counters.jitter_ns += (abs(delta - counters.interval_ns) - counters.jitter_ns) >> 4
+                    counters.interval_ns += (delta - counters.interval_ns) >> 4
+                    if delta < counters.min_ns:
+                        counters.min_ns = delta
+                    if delta > counters.max_ns:
+                        counters.max_ns = delta
+        counters.last_ns = timestamp_ns
+        counters.count += 1
+        if length < self._min_dlc.get(arbitration_id, 0):
+            counters.dlc_errors += 1
+
+        if timestamp_ns >= self._window_end_ns:
+            idle = timestamp_ns >= self._window_end_ns + self._window_ns
+            self._last_window_bits = 0 if idle else self._window_bits
+            self._last_window_frames = 0 if idle else self._window_frames
+            self._window_bits = 0
+            self._window_frames = 0
+            self._window_end_ns = timestamp_ns + self._window_ns
+        self._window_bits += _FRAME_BITS[length if length < 8 else 8]
+        self._window_frames += 1
+
+    def snapshot(self, now_ns: Optional[int] = None) -> CANBusStats:
+        now_ns = time.monotonic_ns() if now_ns is None else now_ns
+        ids = []
+        for arbitration_id in sorted(self._ids):
+            counters = self._ids[arbitration_id]
+            age_s = max(0.0, (now_ns - counters.last_ns) / 1e9)
+            interval_ns = counters.interval_ns if counters.count > 1 else 0
+            ids.append(
+                CANIdStats(
+                    arbitration_id=arbitration_id,
+                    name=FRAME_NAMES.get(arbitration_id, "UNKNOWN"),
+                    frames=counters.count,
+                    rate_hz=1e9 / interval_ns if interval_ns > 0 else 0.0,
+                    jitter_ms=counters.jitter_ns / 1e6,
+                    min_interval_ms=counters.min_ns / 1e6,
+                    max_interval_ms=counters.max_ns / 1e6,
+                    dlc_errors=counters.dlc_errors,
+                    last_seen_age_s=age_s,
+                )
+            )
+        # A window that ended more than one window ago means the bus went quiet.
+        current = now_ns < self._window_end_ns + self._window_ns
+        window_s = self._window_ns / 1e9
+        bits = self._last_window_bits if current else 0
+        frames = self._last_window_frames if current else 0
+        return CANBusStats(
+            bitrate=self.bitrate,
+            bus_load_pct=min(100.0, bits / window_s / self.bitrate * 100.0),
+            frames_per_s=frames / window_s,
+            ids=tuple(ids),
+        )
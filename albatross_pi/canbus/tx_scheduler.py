@@ -0,0 +1,286 @@
+"""Prioritized, coalescing CAN transmit queue."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Callable, Dict, Iterable, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+Frame = tuple[int, bytes]
+
+
+class TxPriority(IntEnum):
+    """Transmit classes, lowest value is sent first."""
+
+    SAFETY = 0
+    PERIODIC = 1
+    UI = 2
+
+
+@dataclass(frozen=True)
+class TxClassStats:
+    depth: int = 0
+    sent: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    last_latency_ms: float = 0.0
+    avg_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+
+class _ClassCounters:
+    __slots__ = ("sent", "coalesced", "errors", "latency_total_s", "last_latency_s", "max_latency_s")
+
+    def __init__(self) -> None:
+        self.sent = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.latency_total_s = 0.0
+        self.last_latency_s = 0.0
+        self.max_latency_s = 0.0
+
+
+@dataclass
+class _PeriodicJob:
+    period_s: float
+    next_due: float
+    build: Callable[[], Iterable[Frame]]
+    priority: TxPriority
+
+
+class CANTransmitScheduler:
+    """Single TX thread draining per-priority queues onto a CAN interface.
+
+    ``submit`` never blocks the caller. Each class keeps at most one pending
+    frame per arbitration ID: a newer frame replaces the queued payload in place
+    and also supersedes the same ID waiting in lower-priority classes, so a
+    burst of UI changes collapses to the latest request and can never be sent
+    after a newer safety command. Queue length is therefore bounded by the
+    number of distinct IDs. Periodic heartbeats are paced by deadline rather
+    than by sleeping in their own threads, and UI frames are rate limited.
+    A failed send is retried with exponential backoff from ``retry_backoff_s``
+    up to ``retry_backoff_max_s``; the failure and the recovery are logged
+    once each and individual attempts only count towards the class ``errors``.
+    """
+
+    def __init__(
+        self,
+        send: Callable[..., None],
+        *,
+        on_sent: Optional[Callable[[int, bytes], None]] = None,
+        send_timeout_s: float = 0.01,
+        retry_backoff_s: float = 0.005,
+        retry_backoff_max_s: float = 0.25,
+        ui_rate_hz: float = 100.0,
+    ) -> None:
+        self._send = send
+        self._on_sent = on_sent
+        self._send_timeout_s = send_timeout_s
+        self._retry_backoff_s = retry_backoff_s
+        self._retry_backoff_max_s = max(retry_backoff_s, retry_backoff_max_s)
+        self._retry_delay_s = retry_backoff_s
+        self._retry_at = 0.0
+        self._failing_since: Optional[float] = None
+        self._failed_attempts = 0
+        self._ui_interval_s = 1.0 / ui_rate_hz if ui_rate_hz > 0 else 0.0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._queues: Dict[TxPriority, "OrderedDict[int, tuple[bytes, float]]"] = {
+            priority: OrderedDict() for priority in TxPriority
+        }
+        self._counters = {priority: _ClassCounters() for priority in TxPriority}
+        self._periodic: Dict[str, _PeriodicJob] = {}
+        self._next_ui_send = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="can-tx", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        with self._wakeup:
+            self._running = False
+            self._wakeup.notify_all()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def submit(self, arbitration_id: int, data: bytes, priority: TxPriority = TxPriority.UI) -> None:
+        """Queue one frame; replaces any not-yet-sent frame with the same ID."""
+        with self._wakeup:
+            self._enqueue_locked(int(arbitration_id), bytes(data), TxPriority(priority), time.monotonic())
+            self._wakeup.notify()
+
+    def submit_frames(self, frames: Iterable[Frame], priority: TxPriority = TxPriority.UI) -> None:
+        """Queue several frames in order under one lock acquisition."""
+        with self._wakeup:
+            now = time.monotonic()
+            for arbitration_id, data in frames:
+                self._enqueue_locked(int(arbitration_id), bytes(data), TxPriority(priority), now)
+            self._wakeup.notify()
+
+    def set_periodic(
+        self,
+        key: str,
+        period_s: float,
+        build: Callable[[], Iterable[Frame]],
+        priority: TxPriority = TxPriority.PERIODIC,
+    ) -> None:
+        """Emit ``build()`` frames every ``period_s``, starting immediately."""
+        with self._wakeup:
+            self._periodic[key] = _PeriodicJob(float(period_s), time.monotonic(), build, TxPriority(priority))
+            self._wakeup.notify()
+
+    def cancel_periodic(self, key: str) -> None:
+        with self._lock:
+            self._periodic.pop(key, None)
+
+    def stats(self) -> dict[str, TxClassStats]:
+        """Return per-class queue depth, counters and send latency."""
+        with self._lock:
+            result: dict[str, TxClassStats] = {}
+            for priority in TxPriority:
+                counters = self._counters[priority]
+                result[priority.name] = TxClassStats(
+                    depth=len(self._queues[priority]),
+                    sent=counters.sent,
+                    coalesced=counters.coalesced,
+                    errors=counters.errors,
+                    last_latency_ms=counters.last_latency_s * 1000.0,
+                    avg_latency_ms=counters.latency_total_s / counters.sent * 1000.0 if counters.sent else 0.0,
+                    max_latency_ms=counters.max_latency_s * 1000.0,
+                )
+            return result
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _enqueue_locked(self, arbitration_id: int, data: bytes, priority: TxPriority, now: float) -> None:
+        queue = self._queues[priority]
+        pending = queue.get(arbitration_id)
+        if pending is not None:
+            # Keep the original queue position and enqueue time; only the payload is stale.
+            queue[arbitration_id] = (data, pending[1])
+            self._counters[priority].coalesced += 1
+        else:
+            queue[arbitration_id] = (data, now)
+        for lower in TxPriority:
+            if lower > priority and self._queues[lower].pop(arbitration_id, None) is not None:
+                self._counters[lower].coalesced += 1
+
+    def _run_due_periodic_locked(self, now: float) -> float:
+        """Queue due periodic frames and return the next periodic deadline."""
+        next_deadline = float("inf")
+        for key, job in list(self._periodic.items()):
+            if now >= job.next_due:
+                try:
+                    frames = tuple(job.build())
+                except Exception:
+                    LOGGER.exception("Periodic CAN frame builder %s failed", key)
+                    frames = ()
+                for arbitration_id, data in frames:
+                    self._enqueue_locked(int(arbitration_id), bytes(data), job.priority, now)
+                job.next_due += job.period_s
+                if job.next_due <= now:
+                    # Fell behind (bus off, long stall): resume pacing without a catch-up burst.
+                    job.next_due = now + job.period_s
+            next_deadline = min(next_deadline, job.next_due)
+        return next_deadline
+
+    def _pop_next_locked(self, now: float) -> tuple[TxPriority, int, bytes, float] | None:
+        for priority in TxPriority:
+            queue = self._queues[priority]
+            if not queue:
+                continue
+            if priority is TxPriority.UI and now < self._next_ui_send:
+                continue
+            arbitration_id, (data, enqueued_at) = queue.popitem(last=False)
+            return priority, arbitration_id, data, enqueued_at
+        return None
+
+    def _requeue_front_locked(self, priority: TxPriority, arbitration_id: int, data: bytes, enqueued_at: float) -> None:
+        queue = self._queues[priority]
+        if arbitration_id in queue:
+            return  # A newer payload arrived while this one was on the wire.
+        if any(arbitration_id in self._queues[higher] for higher in TxPriority if higher < priority):
+            return
+        queue[arbitration_id] = (data, enqueued_at)
+        queue.move_to_end(arbitration_id, last=False)
+
+    def _run(self) -> None:
+        LOGGER.info("Starting CAN TX scheduler")
+        while True:
+            with self._wakeup:
+                if not self._running:
+                    break
+                now = time.monotonic()
+                next_deadline = self._run_due_periodic_locked(now)
+                if now < self._retry_at:
+                    # Backing off after a failed send; new submits only coalesce meanwhile.
+                    self._wakeup.wait(self._retry_at - now)
+                    continue
+                item = self._pop_next_locked(now)
+                if item is None:
+                    if self._queues[TxPriority.UI]:
+                        next_deadline = min(next_deadline, self._next_ui_send)
+                    wait_s = None if next_deadline == float("inf") else max(0.0, next_deadline - now)
+                    self._wakeup.wait(wait_s)
+                    continue
+            priority, arbitration_id, data, enqueued_at = item
+            try:
+                self._send(arbitration_id, data, timeout=self._send_timeout_s)
+            except Exception as exc:
+                failed_at = time.monotonic()
+                if self._failing_since is None:
+                    LOGGER.warning(
+                        "CAN TX 0x%03X failed (%s); retrying with backoff up to %.2f s",
+                        arbitration_id,
+                        exc,
+                        self._retry_backoff_max_s,
+                    )
+                    self._failing_since = failed_at
+                self._failed_attempts += 1
+                with self._wakeup:
+                    self._counters[priority].errors += 1
+                    self._requeue_front_locked(priority, arbitration_id, data, enqueued_at)
+                    self._retry_at = failed_at + self._retry_delay_s
+                self._retry_delay_s = min(self._retry_delay_s * 2.0, self._retry_backoff_max_s)
+                continue
+            sent_at = time.monotonic()
+            if self._failing_since is not None:
+                LOGGER.info(
+                    "CAN TX recovered after %.1f s (%d failed attempts)",
+                    sent_at - self._failing_since,
+                    self._failed_attempts,
+                )
+                self._failing_since = None
+                self._failed_attempts = 0
+                self._retry_delay_s = self._retry_backoff_s
+            with self._lock:
+                counters = self._counters[priority]
+                latency_s = sent_at - enqueued_at
+                counters.sent += 1
+                counters.latency_total_s += latency_s
+                counters.last_latency_s = latency_s
+                counters.max_latency_s = max(counters.max_latency_s, latency_s)
+                if priority is TxPriority.UI:
+                    self._next_ui_send = sent_at + self._ui_interval_s
+            if self._on_sent is not None:
+                try:
+                    self._on_sent(arbitration_id, data)
+                except Exception:
+                    LOGGER.exception("CAN TX callback failed for 0x%03X", arbitration_id)
+        LOGGER.info("CAN TX scheduler stopped")
@@ -21,6 +21,8 @@ FAULT_NAME_TO_CODE = {name: code for code, name in FAULT_CODE_MAP.items()}
 DRIVE_REMOVABLE = 2
 PRE_FAULT_SECONDS = 30.0
 PRE_FAULT_SAMPLE_INTERVAL_S = 0.1
+# Newest CAN frames kept in a fault event's snapshot; the full ring is not logged.
+FAULT_EVENT_CAN_FRAMES = 32
 
 
 def _safe_float(value: float) -> float:
@@ -45,6 +47,9 @@ def _json_safe(value: Any) -> Any:
 
 def _snapshot_dict(snapshot: StateSnapshot) -> dict[str, Any]:
     if is_dataclass(snapshot):
+        service = snapshot.service
+        frames = tuple(service.recent_can_frames[:FAULT_EVENT_CAN_FRAMES])
+        snapshot = snapshot.evolve(service=service.evolve(recent_can_frames=frames))
         data = _json_safe(asdict(snapshot))
     else:
         data = {}
@@ -91,6 +96,7 @@ def fault_reason(fault: str, snapshot: StateSnapshot) -> str:
         "SENSOR RANGE FAULT": "One or more critical sensor values were out of plausible range.",
         "ENGINE RUN SWITCH OFF": "Safety supervisor commanded engine run switch OFF.",
         "ENGINE SHUTDOWN REQUEST": "Safety supervisor requested engine shutdown after escalation criteria persisted.",
+        "SAFETY LINK STALE": "No decision arrived from the safety supervisor process within its reporting interval.",
         "SLOW TURBO SPOOL": f"Target {_safe_float(engine.target_boost_psi)} psi was requested but boost reached only {_safe_float(engine.boost_psi)} psi under load.",
     }
     if fault == "KNOCK":
@@ -132,6 +138,7 @@ def fault_action(fault: str, snapshot: StateSnapshot) -> str:
         "SENSOR RANGE FAULT": "Critical sensor values are treated as untrusted; conservative defaults apply.",
         "ENGINE RUN SWITCH OFF": "Engine-run output was commanded off by the safety supervisor.",
         "ENGINE SHUTDOWN REQUEST": "Shutdown escalation was issued after critical criteria persisted.",
+        "SAFETY LINK STALE": "HUD keeps the last run-switch decision; check the albatross-safety service and its watchdog restarts.",
         "SLOW TURBO SPOOL": "Fault is logged; boost system should be checked for leaks, duty, or turbo response.",
     }
     return actions.get(fault, "Fault is logged with the current engine snapshot for diagnosis.")
@@ -4,7 +4,6 @@ from __future__ import annotations
 import math
 import time
 from collections import deque
-from dataclasses import replace
 
 from .state.snapshot import EconomyState, StateSnapshot
 
@@ -112,8 +111,7 @@ class EconomyTracker:
             remaining_gal = self.tank_capacity_gal * max(0.0, min(100.0, snapshot.environment.fuel_level_pct)) / 100.0
             miles_to_empty = remaining_gal * average_mpg
 
-        economy = replace(
-            snapshot.economy,
+        economy = snapshot.economy.evolve(
             injector_duty_pct=duty_pct,
             fuel_flow_cc_min=flow_cc_min,
             instant_mpg=instant_mpg if math.isfinite(instant_mpg) else -1.0,
@@ -123,4 +121,4 @@ class EconomyTracker:
             fuel_used_gal=self._fuel_used_gal,
             source=source,
         )
-        return replace(snapshot, economy=economy)
+        return snapshot.evolve(economy=economy)
@@ -0,0 +1,237 @@
+"""Fixed-rate fault, advisory and economy evaluation for the HUD."""
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from ..economy import EconomyTracker
+from ..safety.ipc import SAFETY_LINK_STALE
+from ..safety.rules import FaultRuleEngine, display_only_rules
+from ..safety.supervisor import SafetyDecision
+from ..state.snapshot import EconomyState, StateSnapshot
+from .frame_profiler import FrameProfiler
+
+LOGGER = logging.getLogger(__name__)
+
+FAULT_EVALUATOR_RATE_HZ = 50.0
+ADVISORY_LATCH_S = 3.5
+
+
+@dataclass(frozen=True, slots=True)
+class FaultEvaluation:
+    """Outcome of one evaluator tick, applied by the renderer to the frame it draws."""
+
+    faults: tuple[str, ...] = ()
+    advisories: tuple[str, ...] = ()
+    economy: Optional[EconomyState] = None
+    limp_active: bool = False
+    limp_reason: str = ""
+    evaluated_s: float = 0.0
+
+    def apply(self, state: StateSnapshot) -> StateSnapshot:
+        system = state.system
+        if self.limp_active:
+            system = system.evolve(limp_mode_active=True, limp_mode_reason=self.limp_reason)
+        return state.evolve(
+            faults=self.faults,
+            advisories=self.advisories,
+            economy=state.economy if self.economy is None else self.economy,
+            system=system,
+        )
+
+
+class FaultEvaluator:
+    """Evaluate runtime faults and predictive advisories on a fixed monotonic schedule.
+
+    Hold timers, advisory latches and the economy integration advance with the
+    evaluator's own clock, so their timing does not depend on render FPS. The
+    renderer reads the newest ``FaultEvaluation`` through ``current``. While
+    ``safety`` returns a live supervisor decision its faults are shown plus
+    the HUD's ``display_only`` triggers, and its limp decision is used as-is;
+    otherwise (no supervisor, startup grace, stale link) the whole rule table
+    is evaluated locally and the stale marker stays visible.
+    """
+
+    def __init__(
+        self,
+        source: Callable[[], StateSnapshot],
+        *,
+        ecu_age_s: Callable[[float], float],
+        controller_age_s: Callable[[float], float],
+        safety: Optional[Callable[[], Optional[SafetyDecision]]] = None,
+        rate_hz: float = FAULT_EVALUATOR_RATE_HZ,
+    ) -> None:
+        self.source = source
+        self.ecu_age_s = ecu_age_s
+        self.controller_age_s = controller_age_s
+        self.safety = safety
+        # Optional; receives rule, economy and advisory timings per tick.
+        self.profiler: Optional[FrameProfiler] = None
+        self.period_s = 1.0 / max(1.0, float(rate_hz))
+        self.ticks = 0
+        self.overruns = 0
+        self._rules = FaultRuleEngine(display=True)
+        self._display_rules = FaultRuleEngine(display_only_rules(), display=True)
+        self._economy_tracker = EconomyTracker()
+        self._advisory_latch_until: dict[str, float] = {}
+        self._last_iat_sample: tuple[float, float] | None = None
+        self._evaluation: Optional[FaultEvaluation] = None
+        self._tick_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def current(self) -> Optional[FaultEvaluation]:
+        """Latest evaluation, or ``None`` before the first tick."""
+        return self._evaluation
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="hud-faults", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def tick(self, now_s: float | None = None, state: StateSnapshot | None = None) -> FaultEvaluation:
+        """Evaluate once and publish the result; ``state`` overrides the source (e.g. frame capture)."""
+        now = time.monotonic() if now_s is None else now_s
+        profiler = self.profiler
+        with self._tick_lock:
+            started = time.perf_counter()
+            snapshot = self.source() if state is None else state
+            decision = None
+            if self.safety is not None:
+                try:
+                    decision = self.safety()
+                except Exception:
+                    LOGGER.exception("Safety decision callback failed")
+            if decision is None or SAFETY_LINK_STALE in decision.faults:
+                faults = self._rules.evaluate(
+                    snapshot,
+                    now,
+                    ecu_age_s=self.ecu_age_s(now),
+                    controller_age_s=self.controller_age_s(now),
+                )
+                if decision is not None:
+                    faults = tuple(sorted(set(faults).union(decision.faults)))
+                decision = None
+            else:
+                if self._rules.pending:
+                    # Hold timers restart from scratch if the link goes stale again.
+                    self._rules.reset()
+                display_faults = self._display_rules.evaluate(
+                    snapshot,
+                    now,
+                    ecu_age_s=self.ecu_age_s(now),
+                    controller_age_s=self.controller_age_s(now),
+                )
+                faults = tuple(sorted(set(decision.faults).union(display_faults))) if display_faults else decision.faults
+            rules_done = time.perf_counter()
+            snapshot = self._economy_tracker.update(snapshot.evolve(faults=faults), now)
+            economy_done = time.perf_counter()
+            advisories = self._predictive_advisories(snapshot, now)
+            if profiler is not None:
+                profiler.record("eval.rules", rules_done - started)
+                profiler.record("eval.economy", economy_done - rules_done)
+                profiler.record("eval.advisories", time.perf_counter() - economy_done)
+            evaluation = FaultEvaluation(
+                faults=faults,
+                advisories=advisories,
+                economy=snapshot.economy,
+                limp_active=decision is not None and decision.limp_active,
+                limp_reason=decision.limp_reason if decision is not None else "",
+                evaluated_s=now,
+            )
+            self._evaluation = evaluation
+            self.ticks += 1
+            return evaluation
+
+    def _run(self) -> None:
+        deadline = time.monotonic()
+        while not self._stop_event.is_set():
+            try:
+                self.tick()
+            except Exception:
+                LOGGER.exception("Fault evaluation failed")
+            deadline += self.period_s
+            delay = deadline - time.monotonic()
+            if delay <= 0:
+                self.overruns += 1
+                deadline = time.monotonic()
+                continue
+            self._stop_event.wait(delay)
+
+    def _predictive_advisories(self, state: StateSnapshot, now_s: float) -> tuple[str, ...]:
+        active: set[str] = set()
+        faults = set(state.faults)
+        temps = state.temps
+        engine = state.engine
+        fuel_level = state.environment.fuel_level_pct
+
+        previous_iat = self._last_iat_sample
+        if math.isfinite(float(temps.intake_temp_f)):
+            if previous_iat is not None:
+                prev_t, prev_iat = previous_iat
+                dt = max(0.001, now_s - prev_t)
+                rate_f_per_min = (temps.intake_temp_f - prev_iat) / dt * 60.0
+                if (
+                    "INTAKE AIR HOT" not in faults
+                    and temps.intake_temp_f < 150.0
+                    and temps.intake_temp_f > 110.0
+                    and (rate_f_per_min > 8.0 or temps.intake_temp_f > 135.0)
+                ):
+                    active.add("IAT RISING")
+            self._last_iat_sample = (now_s, temps.intake_temp_f)
+
+        if "LOW FUEL" not in faults:
+            range_critical = 0.0 <= state.economy.miles_to_empty <= 15.0
+            level_near_reserve = 5.0 < fuel_level <= 10.0
+            if range_critical or level_near_reserve:
+                active.add("FUEL RANGE CRITICAL")
+
+        if "BATTERY LOW" not in faults and "BATTERY HIGH" not in faults:
+            if engine.rpm > 1600 and 12.0 <= temps.battery_voltage < 13.0:
+                active.add("BATTERY NOT CHARGING")
+
+        if "COOLANT HOT" not in faults and 225.0 < temps.coolant_temp_f <= 240.0:
+            active.add("COOLANT TEMP CLIMBING")
+        if "EGT HIGH" not in faults and 1550.0 < temps.exhaust_temp_f <= 1650.0:
+            active.add("EGT NEAR LIMIT")
+        if "LOW OIL PRESS" not in faults and engine.rpm > 1800 and 12.0 <= temps.oil_pressure_psi < 18.0:
+            active.add("OIL PRESSURE MARGINAL")
+        if temps.oil_temp_f > 260.0 and "COOLANT HOT" not in faults:
+            active.add("OIL TEMP HIGH")
+        if "KNOCK" not in faults and "KNOCK ESCALATE" not in faults and 0 < engine.knock_events < 3:
+            active.add("KNOCK ACTIVITY")
+        if "WMI TANK EMPTY" not in faults and 3.0 <= state.wmi.tank_level_pct < 12.0:
+            active.add("WMI TANK LOW")
+        if (
+            "WMI FLOW LOW" not in faults
+            and state.wmi.commanded_flow_cc_min > 0
+            and state.wmi.actual_flow_cc_min < state.wmi.commanded_flow_cc_min * 0.85
+        ):
+            active.add("WMI FLOW TREND")
+        if (
+            "BOOST CONTROL ERROR" not in faults
+            and "SLOW TURBO SPOOL" not in faults
+            and engine.target_boost_psi >= 8.0
+            and engine.throttle_pct > 35.0
+            and engine.boost_psi < engine.target_boost_psi - 3.0
+        ):
+            active.add("BOOST LAG WATCH")
+
+        for advisory in active:
+            self._advisory_latch_until[advisory] = now_s + ADVISORY_LATCH_S
+        self._advisory_latch_until = {
+            advisory: until for advisory, until in self._advisory_latch_until.items() if until > now_s
+        }
+        return tuple(sorted(self._advisory_latch_until))
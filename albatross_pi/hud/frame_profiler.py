@@ -0,0 +1,157 @@
+"""Opt-in per-stage frame timing for the HUD render loop."""
+from __future__ import annotations
+
+import json
+import logging
+import platform
+import time
+from array import array
+from pathlib import Path
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+FRAME_BUDGET_MS = 12.0
+PROFILE_WINDOW_FRAMES = 600
+SUMMARY_REFRESH_S = 0.5
+
+
+class StageTimes:
+    """Fixed-size ring of the most recent samples for one stage, in milliseconds."""
+
+    __slots__ = ("samples", "count", "over_budget", "_index")
+
+    def __init__(self, window: int) -> None:
+        self.samples = array("d", [0.0]) * max(1, window)
+        self.count = 0
+        # Over-budget frames in which this stage was the slowest one.
+        self.over_budget = 0
+        self._index = 0
+
+    def add(self, ms: float) -> None:
+        self.samples[self._index] = ms
+        self._index = (self._index + 1) % len(self.samples)
+        self.count += 1
+
+    def summary(self) -> dict[str, float | int]:
+        window = sorted(self.samples[: min(self.count, len(self.samples))])
+        if not window:
+            return {"count": 0, "over_budget": self.over_budget}
+        return {
+            "count": self.count,
+            "p50_ms": _percentile(window, 50),
+            "p95_ms": _percentile(window, 95),
+            "p99_ms": _percentile(window, 99),
+            "max_ms": window[-1],
+            "over_budget": self.over_budget,
+        }
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+class FrameProfiler:
+    """Record how long each stage of a HUD frame takes.
+
+    The render loop brackets a frame with ``begin_frame``/``end_frame`` and
+    calls ``lap(stage)`` after each stage; a lap is the time since the
+    previous lap. Work on other threads (the fault evaluator) reports
+    durations directly through ``record``. When a frame exceeds
+    ``budget_ms`` its slowest stage is charged with the overrun, so the
+    summary names which stage blew the budget. A disabled profiler makes
+    every call a no-op.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        budget_ms: float = FRAME_BUDGET_MS,
+        window: int = PROFILE_WINDOW_FRAMES,
+        dump_path: Path | str | None = None,
+    ) -> None:
+        self.enabled = enabled
+        self.budget_ms = float(budget_ms)
+        self.window = max(1, int(window))
+        self.dump_path = Path(dump_path) if dump_path is not None else None
+        self.overlay_visible = False
+        self._stages: dict[str, StageTimes] = {}
+        self._frame = StageTimes(self.window)
+        self._frame_started = 0.0
+        self._last_lap = 0.0
+        self._slowest_stage = ""
+        self._slowest_ms = 0.0
+        self._summary: dict[str, Any] | None = None
+        self._summary_at = 0.0
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        self._frame_started = self._last_lap = time.perf_counter()
+        self._slowest_stage = ""
+        self._slowest_ms = 0.0
+
+    def lap(self, stage: str) -> None:
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        ms = (now - self._last_lap) * 1e3
+        self._last_lap = now
+        self._stage(stage).add(ms)
+        if ms > self._slowest_ms:
+            self._slowest_stage, self._slowest_ms = stage, ms
+
+    def end_frame(self) -> None:
+        if not self.enabled:
+            return
+        ms = (time.perf_counter() - self._frame_started) * 1e3
+        self._frame.add(ms)
+        if ms > self.budget_ms:
+            self._frame.over_budget += 1
+            if self._slowest_stage:
+                self._stages[self._slowest_stage].over_budget += 1
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Add one sample measured elsewhere, e.g. on another thread."""
+        if self.enabled:
+            self._stage(stage).add(seconds * 1e3)
+
+    def _stage(self, stage: str) -> StageTimes:
+        times = self._stages.get(stage)
+        if times is None:
+            times = self._stages[stage] = StageTimes(self.window)
+        return times
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "budget_ms": self.budget_ms,
+            "window_frames": self.window,
+            "frame": self._frame.summary(),
+            "stages": {stage: times.summary() for stage, times in list(self._stages.items())},
+        }
+
+    def cached_summary(self) -> dict[str, Any]:
+        """``summary`` recomputed at most every ``SUMMARY_REFRESH_S``, for the on-screen overlay."""
+        now = time.monotonic()
+        if self._summary is None or now - self._summary_at >= SUMMARY_REFRESH_S:
+            self._summary = self.summary()
+            self._summary_at = now
+        return self._summary
+
+    def dump(self, path: Path | str | None = None) -> Path | None:
+        """Write the summary as JSON to ``path`` (default ``dump_path``); return where it went."""
+        target = Path(path) if path is not None else self.dump_path
+        if not self.enabled or target is None:
+            return None
+        report = {"python": platform.python_version(), "machine": platform.machine(), **self.summary()}
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        except OSError as exc:
+            LOGGER.warning("Frame profile could not be written to %s: %s", target, exc)
+            return None
+        LOGGER.info("Frame profile written to %s", target)
+        return target
@@ -2,13 +2,11 @@
 from __future__ import annotations
 
 import logging
-import math
 import os
 import threading
 import time
 import urllib.request
 import wave
-from dataclasses import replace
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Callable, Iterable, List
@@ -25,8 +23,8 @@ try:
 except ModuleNotFoundError:  # Python 3.13 removed sunau.
     sunau = None
 
+from ..canbus.stats import CANBusStats
 from ..diagnostics.fault_logger import engine_status, fault_action, fault_reason
-from ..economy import EconomyTracker
 from ..navigation import NavigationManager
 from ..networking import PiNetworkManager
 from .widgets.airshot_panel import AirShotPanel
@@ -41,14 +39,23 @@ from .widgets.rpm_bar import RpmBar
 from .widgets.speed_gear import SpeedGear
 from .widgets.temps_grid import TempsGrid
 from .widgets.traction_panel import TractionPanel
-from .widgets.ui_utils import apply_theme, fit_font_size, font
+from .widgets.ui_utils import apply_theme, fit_font_size, font, render_text
+from .fault_evaluator import FaultEvaluator
+from .frame_profiler import FrameProfiler
 from .preferences import HUDPreferences
+from ..safety.rules import FAULT_AUDIO_CUES, RETRO_ERROR_BEEP
+from ..safety.supervisor import SafetyDecision
 from ..state.snapshot import StateSnapshot
 
 SCREEN_SIZE = (1920, 720)
 TARGET_FPS = 60
 LOGGER = logging.getLogger(__name__)
-RETRO_ERROR_BEEP = "__retro_error_beep__"
+# Full-screen tint blended under the menus for each non-default theme.
+THEME_TINTS = {
+    "NIGHT": (22, 26, 40, 70),
+    "NIGHT OPS": (0, 20, 18, 105),
+    "HIGH-CON": (0, 0, 0, 80),
+}
 AUDIO_ASSET_DIR = Path(__file__).resolve().parent / "assets" / "audio"
 RETRO_ERROR_BEEP_PATH = AUDIO_ASSET_DIR / "new_error_sound.wav"
 
@@ -64,37 +71,9 @@ class EvaAlertAudio:
         self._played_faults: set[str] = set()
         self._pending_faults: list[str] = []
         self._mapping = {
-            "CRITICAL OIL PRESS": "your_engine_oil_pressure_is_critical_engine_damage_may_occur.wav",
-            "LOW OIL PRESS": "LOW-OIL-PRESS.wav",
-            "COOLANT HOT": "your_engine_is_overheating_prompt_service_is_required.wav",
-            "EGT HIGH": "EGT-HIGH.wav",
-            "LOW FUEL": "please_check_your_fuel_level.wav",
+            **FAULT_AUDIO_CUES,
             "CAN TIMEOUT": "CAN-TIMEOUT.wav",
             "IMU FAULT": "IMU-FAULT.wav",
-            "AIR SHOT LOW": "AIR-SHOT-LOW.wav",
-            "KNOCK": RETRO_ERROR_BEEP,
-            "KNOCK ESCALATE": "KNOCK-ESCALATE.wav",
-            "WMI FLOW LOW": "WMI-FLOW-LOW.wav",
-            "WMI TANK EMPTY": "WMI-TANK-EMPTY.wav",
-            "WMI PUMP FAULT": "WMI-PUMP-FAULT.wav",
-            "WMI PRESSURE LOW": "WMI-PRESSURE-LOW.wav",
-            "CAN STALE": "CAN-STALE.wav",
-            "ECU STALE": "ECU-STALE.wav",
-            "CLUTCH SLIP": "CLUTCH-SLIP.wav",
-            "CYL EGT BOOST MISMATCH": "CYL-EGT-BOOST-MISMATCH.wav",
-            "CYL BOOST MISMATCH": "CYL-EGT-BOOST-MISMATCH.wav",
-            "CYL EGT MISMATCH": "CYL-EGT-BOOST-MISMATCH.wav",
-            "CYL AFR MISMATCH": "CYL-EGT-BOOST-MISMATCH.wav",
-            "OVERBOOST": "OVERBOOST.wav",
-            "BOOST CONTROL ERROR": "BOOST-CONTROL-ERROR.wav",
-            "SLOW TURBO SPOOL": "SLOW-TURBO-SPOOL.wav",
-            "WASTEGATE STUCK": "WASTEGATE-STUCK.wav",
-            "SPEED SENSOR": "SPEED-SENSOR.wav",
-            "GEAR SENSOR": "GEAR-SENSOR.wav",
-            "INTAKE AIR HOT": "INTAKE-AIR-HOT.wav",
-            "BATTERY LOW": "BATTERY-LOW.wav",
-            "BATTERY HIGH": "BATTERY-HIGH.wav",
-            "SENSOR RANGE FAULT": "SENSOR-RANGE-FAULT.wav",
         }
         if not self._init_mixer():
             return
@@ -229,6 +208,14 @@ class HUDRenderer:
         self.state = StateSnapshot()
         self.state_lock = threading.Lock()
         self.widgets: List = []
+        # Widget draw_static output, keyed by (theme, screen size); reset whenever widgets are rebuilt.
+        self._static_layer: pygame.Surface | None = None
+        self._static_layer_key: tuple | None = None
+        # Last frame_inputs per widget and the whole-screen state of the last present.
+        self._widget_inputs: dict[object, object] = {}
+        self._presented_key: tuple | None = None
+        # Translucent overlay fills keyed by (size, rgba); cleared on resize.
+        self._overlay_pool: dict[tuple[tuple[int, int], tuple[int, int, int, int]], pygame.Surface] = {}
         self._post_lines: list[tuple[str, bool]] = []
         self._post_started_at = 0.0
         self._post_fault_active = False
@@ -276,6 +263,11 @@ class HUDRenderer:
         self._log_export_callback: Callable[[], str] | None = None
         self._update_install_callback: Callable[[StateSnapshot], str] | None = None
         self._online_update_callback: Callable[[StateSnapshot, Callable[[str, int, int], None]], str] | None = None
+        self._service_mode_callback: Callable[[bool], None] | None = None
+        self._service_mode_active = False
+        self._service_can_scroll = 0
+        self._service_can_page_rows = 1
+        self._can_stats_callback: Callable[[], CANBusStats] | None = None
         self._last_logged_faults: set[str] = set()
         self._fault_log_lock = threading.Lock()
         self._log_export_status = "READY"
@@ -333,12 +325,14 @@ class HUDRenderer:
         self._available_devices: tuple[tuple[str, str], ...] = ()
         self._last_snapshot_time = self.state.environment.time
         self._last_can_fresh_monotonic = time.monotonic()
-        self._fault_condition_since: dict[str, float] = {}
-        self._advisory_latch_until: dict[str, float] = {}
-        self._last_iat_sample: tuple[float, float] | None = None
         self._display_time_anchor = self.state.environment.time
         self._display_time_anchor_monotonic = self._last_can_fresh_monotonic
-        self._economy_tracker = EconomyTracker()
+        self._fault_evaluator = FaultEvaluator(
+            self._current_state,
+            ecu_age_s=self._ecu_can_age_s,
+            controller_age_s=self._controller_can_age_s,
+        )
+        self._profiler = FrameProfiler(enabled=False)
         self._audio = EvaAlertAudio()
         self._create_widgets()
 
@@ -364,243 +358,6 @@ class HUDRenderer:
                 errors.append(f"{driver or 'auto'}: {exc}")
         raise pygame.error("No usable SDL display backend (" + "; ".join(errors) + ")")
 
-    def _persistent_fault(self, name: str, condition: bool, now_s: float, hold_s: float) -> bool:
-        if not condition:
-            self._fault_condition_since.pop(name, None)
-            return False
-        started_at = self._fault_condition_since.setdefault(name, now_s)
-        return now_s - started_at >= hold_s
-
-    @staticmethod
-    def _finite(value: float | int) -> bool:
-        return math.isfinite(float(value))
-
-    def _runtime_faults(self, state: StateSnapshot, now_s: float) -> tuple[str, ...]:
-        active: set[str] = set()
-        engine = state.engine
-        temps = state.temps
-        wmi = state.wmi
-        air = state.air_shot
-        gear = str(engine.gear).upper()
-        in_drive = gear not in {"N", "?", ""}
-        high_load = engine.throttle_pct > 55 or engine.engine_load_pct > 60
-
-        if self._controller_can_age_s(now_s) > 1.5:
-            active.add("CAN STALE")
-        if self._ecu_can_age_s(now_s) > 1.5:
-            active.add("ECU STALE")
-        if temps.oil_pressure_psi < 5 and engine.rpm > 1200:
-            active.add("CRITICAL OIL PRESS")
-        elif temps.oil_pressure_psi < 12 and engine.rpm > 1800:
-            active.add("LOW OIL PRESS")
-        if temps.coolant_temp_f > 235:
-            active.add("COOLANT HOT")
-        if temps.exhaust_temp_f > 1600:
-            active.add("EGT HIGH")
-        if temps.intake_temp_f > 155:
-            active.add("INTAKE AIR HOT")
-        if 0.0 < temps.battery_voltage < 11.8 and engine.rpm > 900:
-            active.add("BATTERY LOW")
-        if temps.battery_voltage > 15.2:
-            active.add("BATTERY HIGH")
-        if engine.boost_psi > max(1.0, engine.target_boost_psi + 3.0):
-            active.add("OVERBOOST")
-        if engine.knock_events >= 2:
-            active.add("KNOCK ESCALATE")
-        if 0.0 <= state.environment.fuel_level_pct <= 12:
-            active.add("LOW FUEL")
-        if wmi.fault_active:
-            active.add("WMI FLOW LOW")
-        if wmi.tank_level_pct <= 5 and (wmi.commanded_flow_cc_min > 0 or engine.target_boost_psi > 6):
-            active.add("WMI TANK EMPTY")
-        if wmi.commanded_flow_cc_min >= 100 and wmi.actual_flow_cc_min < wmi.commanded_flow_cc_min * 0.6:
-            if self._persistent_fault("WMI FLOW LOW", True, now_s, 0.25):
-                active.add("WMI FLOW LOW")
-        else:
-            self._persistent_fault("WMI FLOW LOW", False, now_s, 0.25)
-        if engine.gear == "?":
-            active.add("GEAR SENSOR")
-        if air.pressure_psi < 35 and (air.is_firing or engine.target_boost_psi > 6):
-            active.add("AIR SHOT LOW")
-        if state.clutch.severity in {"MODERATE", "SEVERE"} or state.clutch.slip_pct >= 25:
-            active.add("CLUTCH SLIP")
-        if state.traction.sensor_fault:
-            active.add("SPEED SENSOR")
-
-        slow_spool = (
-            engine.target_boost_psi >= 6.0
-            and high_load
-            and engine.rpm >= 3500
-            and in_drive
-            and engine.wastegate_duty_pct >= 50
-            and engine.boost_psi < max(engine.target_boost_psi * 0.55, engine.target_boost_psi - 5.0)
-        )
-        if self._persistent_fault("SLOW TURBO SPOOL", slow_spool, now_s, 2.0):
-            active.add("SLOW TURBO SPOOL")
-
-        boost_error = (
-            engine.target_boost_psi >= 4.0
-            and high_load
-            and engine.rpm >= 3000
-            and abs(engine.boost_psi - engine.target_boost_psi) > 4.0
-        )
-        if self._persistent_fault("BOOST CONTROL ERROR", boost_error, now_s, 1.5):
-            active.add("BOOST CONTROL ERROR")
-
-        wastegate_stuck = (engine.target_boost_psi <= 2.0 or engine.throttle_pct < 20) and engine.boost_psi > 5.0
-        if self._persistent_fault("WASTEGATE STUCK", wastegate_stuck, now_s, 1.0):
-            active.add("WASTEGATE STUCK")
-
-        speed_sensor_fault = engine.rpm > 2800 and engine.throttle_pct > 25 and in_drive and engine.speed_mph < 2.0
-        if self._persistent_fault("SPEED SENSOR", speed_sensor_fault, now_s, 1.0):
-            active.add("SPEED SENSOR")
-
-        egt_boost_mismatch = (
-            high_load
-            and engine.rpm > 4000
-            and temps.exhaust_temp_f > 1500
-            and engine.target_boost_psi > 6.0
-            and engine.boost_psi < 2.0
-        )
-        if self._persistent_fault("CYL EGT BOOST MISMATCH", egt_boost_mismatch, now_s, 1.0):
-            active.add("CYL EGT BOOST MISMATCH")
-
-        boost_mismatch = (
-            engine.boost_left_psi >= 0.0
-            and engine.boost_right_psi >= 0.0
-            and high_load
-            and engine.rpm > 3000
-            and (engine.target_boost_psi > 4.0 or engine.boost_psi > 4.0)
-            and abs(engine.boost_left_psi - engine.boost_right_psi) >= 3.0
-        )
-        if self._persistent_fault("CYL BOOST MISMATCH", boost_mismatch, now_s, 0.6):
-            active.add("CYL BOOST MISMATCH")
-
-        egt_mismatch = (
-            temps.exhaust_left_temp_f >= 0.0
-            and temps.exhaust_right_temp_f >= 0.0
-            and high_load
-            and engine.rpm > 3000
-            and abs(temps.exhaust_left_temp_f - temps.exhaust_right_temp_f) >= 150.0
-        )
-        if self._persistent_fault("CYL EGT MISMATCH", egt_mismatch, now_s, 0.8):
-            active.add("CYL EGT MISMATCH")
-
-        afr_mismatch = (
-            engine.afr_left > 0.0
-            and engine.afr_right > 0.0
-            and high_load
-            and engine.rpm > 2500
-            and abs(engine.afr_left - engine.afr_right) >= 0.8
-        )
-        if self._persistent_fault("CYL AFR MISMATCH", afr_mismatch, now_s, 0.8):
-            active.add("CYL AFR MISMATCH")
-
-        sensor_values = (
-            engine.boost_psi,
-            engine.boost_left_psi,
-            engine.boost_right_psi,
-            engine.target_boost_psi,
-            engine.throttle_pct,
-            engine.engine_load_pct,
-            temps.coolant_temp_f,
-            temps.oil_temp_f,
-            temps.oil_pressure_psi,
-            temps.battery_voltage,
-            temps.intake_temp_f,
-            temps.exhaust_temp_f,
-            temps.exhaust_left_temp_f,
-            temps.exhaust_right_temp_f,
-            wmi.tank_level_pct,
-            wmi.commanded_flow_cc_min,
-            wmi.actual_flow_cc_min,
-        )
-        sensor_range_fault = (
-            not all(self._finite(value) for value in sensor_values)
-            or engine.throttle_pct < 0
-            or engine.throttle_pct > 100
-            or engine.engine_load_pct < 0
-            or engine.engine_load_pct > 100
-            or temps.battery_voltage > 18
-            or (temps.battery_voltage < -0.1 and temps.battery_voltage != -1)
-            or temps.oil_pressure_psi < -1
-            or wmi.tank_level_pct < 0
-            or wmi.tank_level_pct > 100
-            or wmi.actual_flow_cc_min < 0
-            or wmi.commanded_flow_cc_min < 0
-        )
-        if sensor_range_fault:
-            active.add("SENSOR RANGE FAULT")
-
-        # Return only currently active faults; AlertPanel handles post-clear hold timing.
-        return tuple(sorted(active))
-
-    def _predictive_advisories(self, state: StateSnapshot, now_s: float) -> tuple[str, ...]:
-        active: set[str] = set()
-        faults = set(state.faults)
-        temps = state.temps
-        engine = state.engine
-        fuel_level = state.environment.fuel_level_pct
-
-        previous_iat = self._last_iat_sample
-        if math.isfinite(float(temps.intake_temp_f)):
-            if previous_iat is not None:
-                prev_t, prev_iat = previous_iat
-                dt = max(0.001, now_s - prev_t)
-                rate_f_per_min = (temps.intake_temp_f - prev_iat) / dt * 60.0
-                if (
-                    "INTAKE AIR HOT" not in faults
-                    and temps.intake_temp_f < 150.0
-                    and temps.intake_temp_f > 110.0
-                    and (rate_f_per_min > 8.0 or temps.intake_temp_f > 135.0)
-                ):
-                    active.add("IAT RISING")
-            self._last_iat_sample = (now_s, temps.intake_temp_f)
-
-        if "LOW FUEL" not in faults:
-            range_critical = 0.0 <= state.economy.miles_to_empty <= 15.0
-            level_near_reserve = 5.0 < fuel_level <= 10.0
-            if range_critical or level_near_reserve:
-                active.add("FUEL RANGE CRITICAL")
-
-        if "BATTERY LOW" not in faults and "BATTERY HIGH" not in faults:
-            if engine.rpm > 1600 and 12.0 <= temps.battery_voltage < 13.0:
-                active.add("BATTERY NOT CHARGING")
-
-        if "COOLANT HOT" not in faults and 225.0 < temps.coolant_temp_f <= 240.0:
-            active.add("COOLANT TEMP CLIMBING")
-        if "EGT HIGH" not in faults and 1550.0 < temps.exhaust_temp_f <= 1650.0:
-            active.add("EGT NEAR LIMIT")
-        if "LOW OIL PRESS" not in faults and engine.rpm > 1800 and 12.0 <= temps.oil_pressure_psi < 18.0:
-            active.add("OIL PRESSURE MARGINAL")
-        if temps.oil_temp_f > 260.0 and "COOLANT HOT" not in faults:
-            active.add("OIL TEMP HIGH")
-        if "KNOCK" not in faults and "KNOCK ESCALATE" not in faults and 0 < engine.knock_events < 3:
-            active.add("KNOCK ACTIVITY")
-        if "WMI TANK EMPTY" not in faults and 3.0 <= state.wmi.tank_level_pct < 12.0:
-            active.add("WMI TANK LOW")
-        if (
-            "WMI FLOW LOW" not in faults
-            and state.wmi.commanded_flow_cc_min > 0
-            and state.wmi.actual_flow_cc_min < state.wmi.commanded_flow_cc_min * 0.85
-        ):
-            active.add("WMI FLOW TREND")
-        if (
-            "BOOST CONTROL ERROR" not in faults
-            and "SLOW TURBO SPOOL" not in faults
-            and engine.target_boost_psi >= 8.0
-            and engine.throttle_pct > 35.0
-            and engine.boost_psi < engine.target_boost_psi - 3.0
-        ):
-            active.add("BOOST LAG WATCH")
-
-        for advisory in active:
-            self._advisory_latch_until[advisory] = now_s + 3.5
-        self._advisory_latch_until = {
-            advisory: until for advisory, until in self._advisory_latch_until.items() if until > now_s
-        }
-        return tuple(sorted(self._advisory_latch_until))
-
     def configure_traction_callback(self, callback) -> None:
         self._traction_callback = callback
 
@@ -645,17 +402,15 @@ class HUDRenderer:
         mode = self._modes[self._mode_index]
         fuel_type = self._fuel_types[self._fuel_type_index]
         traction_level = self._traction_levels[self._traction_index]
-        self.state = replace(
-            self.state,
-            environment=replace(
-                self.state.environment,
+        self.state = self.state.evolve(
+            environment=self.state.environment.evolve(
                 mode=mode,
                 fuel_type=fuel_type,
                 flame_mode_enabled=self._effective_flame_mode_enabled(),
                 rev_limiter_strategy="IGNITION CUT" if self._effective_flame_mode_enabled() else "FUEL CUT",
                 brightness_pct=float(self._brightness_levels[self._brightness_index]),
             ),
-            traction=replace(self.state.traction, intervention_level=traction_level),
+            traction=self.state.traction.evolve(intervention_level=traction_level),
         )
 
     def _save_preferences(self) -> None:
@@ -694,10 +449,8 @@ class HUDRenderer:
     def _notify_flame_mode(self) -> None:
         enabled = self._effective_flame_mode_enabled()
         with self.state_lock:
-            self.state = replace(
-                self.state,
-                environment=replace(
-                    self.state.environment,
+            self.state = self.state.evolve(
+                environment=self.state.environment.evolve(
                     flame_mode_enabled=enabled,
                     rev_limiter_strategy="IGNITION CUT" if enabled else "FUEL CUT",
                 ),
@@ -711,9 +464,8 @@ class HUDRenderer:
         self._mode_selection_index = self._mode_index
         mode = self._modes[self._mode_index]
         with self.state_lock:
-            self.state = replace(
-                self.state,
-                environment=replace(self.state.environment, mode=mode),
+            self.state = self.state.evolve(
+                environment=self.state.environment.evolve(mode=mode),
             )
         if notify:
             self._invoke_control_callback("Mode", self._mode_callback, self._mode_index + 1)
@@ -739,6 +491,11 @@ class HUDRenderer:
     def configure_fault_log_callback(self, callback: Callable[[tuple[str, ...], StateSnapshot], None]) -> None:
         self._fault_log_callback = callback
 
+    def configure_frame_profiler(self, profiler: FrameProfiler) -> None:
+        """Time each render-loop stage with ``profiler``; F3 toggles its on-screen summary."""
+        self._profiler = profiler
+        self._fault_evaluator.profiler = profiler
+
     def configure_snapshot_log_callback(self, callback: Callable[[StateSnapshot], None]) -> None:
         self._snapshot_log_callback = callback
 
@@ -759,6 +516,26 @@ class HUDRenderer:
     def configure_runtime_health_callback(self, callback: Callable[[], None]) -> None:
         self._runtime_health_callback = callback
 
+    def configure_safety_callback(self, callback: Callable[[], SafetyDecision | None]) -> None:
+        """Latest safety supervisor decision, merged into every rendered frame."""
+        self._fault_evaluator.safety = callback
+
+    def configure_fault_source(self, callback: Callable[[], StateSnapshot]) -> None:
+        """Evaluate faults on ``callback()`` (e.g. the CAN aggregator) instead of the last rendered state.
+
+        HUD-owned controls are applied to each snapshot, as ``update_state``
+        does. Without a source the simulator/demo state fed to the renderer is used.
+        """
+
+        def source() -> StateSnapshot:
+            return self._with_hud_owned_controls(callback())
+
+        self._fault_evaluator.source = source
+
+    def _current_state(self) -> StateSnapshot:
+        with self.state_lock:
+            return self.state
+
     def _can_age_s(self, now_s: float | None = None) -> float:
         if self._can_freshness_callback is not None:
             try:
@@ -796,6 +573,22 @@ class HUDRenderer:
     def configure_online_update_callback(self, callback: Callable[[StateSnapshot, Callable[[str, int, int], None]], str]) -> None:
         self._online_update_callback = callback
 
+    def configure_service_mode_callback(self, callback: Callable[[bool], None]) -> None:
+        """Called with True/False as the service overlay opens and closes."""
+        self._service_mode_callback = callback
+
+    def configure_can_stats_callback(self, callback: Callable[[], CANBusStats]) -> None:
+        """Polled only while the service overlay is open."""
+        self._can_stats_callback = callback
+
+    def _sync_service_mode(self) -> None:
+        service_open = self._active_menu == "service"
+        if service_open == self._service_mode_active:
+            return
+        self._service_mode_active = service_open
+        self._service_can_scroll = 0
+        self._invoke_control_callback("Service mode", self._service_mode_callback, service_open)
+
     def _log_new_faults(self, state: StateSnapshot, *, clear_missing: bool = True) -> None:
         current = set(state.faults)
         with self._fault_log_lock:
@@ -1060,6 +853,7 @@ class HUDRenderer:
         else:
             widgets.insert(7, NavigationPanel(navigation_rect, self._navigation))
         self.widgets = widgets
+        self._widget_inputs = {}
         for widget in self.widgets:
             if isinstance(widget, AlertPanel):
                 widget._fault_latch_until = prior_fault_latch_until
@@ -1118,19 +912,17 @@ class HUDRenderer:
 
     def _with_hud_owned_controls(self, snapshot: StateSnapshot) -> StateSnapshot:
         flame_enabled = self._effective_flame_mode_enabled()
-        environment = replace(
-            snapshot.environment,
+        environment = snapshot.environment.evolve(
             mode=self._modes[self._mode_index],
             fuel_type=self._fuel_types[self._fuel_type_index],
             flame_mode_enabled=flame_enabled,
             rev_limiter_strategy="IGNITION CUT" if flame_enabled else "FUEL CUT",
             brightness_pct=float(self._brightness_levels[self._brightness_index]),
         )
-        traction = replace(
-            snapshot.traction,
+        traction = snapshot.traction.evolve(
             intervention_level=self._traction_levels[self._traction_index],
         )
-        return replace(snapshot, environment=environment, traction=traction)
+        return snapshot.evolve(environment=environment, traction=traction)
 
     def update_state(self, snapshot: StateSnapshot) -> None:
         snapshot = self._with_hud_owned_controls(snapshot)
@@ -1147,136 +939,153 @@ class HUDRenderer:
         last_tick = time.perf_counter()
 
         state_iter = iter(state_source) if state_source else None
-        if self._use_display:
-            pygame.joystick.init()
-
-        while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                elif event.type == pygame.VIDEORESIZE and self._use_display:
-                    self.screen = pygame.display.set_mode(event.size, pygame.RESIZABLE)
-                    self._create_widgets()
-                elif event.type == pygame.KEYDOWN:
-                    if (not self._post_complete) or self._post_fault_active:
-                        continue
-                    if event.key == self._air_shot_key:
-                        self._request_air_shot()
-                    elif event.key in (pygame.K_TAB, pygame.K_m):
-                        self._apply_mode_selection((self._mode_index + 1) % len(self._modes))
-                    elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_SPACE):
-                        self._handle_select()
-                    elif event.key in (pygame.K_BACKSPACE, pygame.K_ESCAPE):
-                        self._handle_back()
-                    elif event.key == pygame.K_UP:
-                        self._handle_up()
-                    elif event.key == pygame.K_DOWN:
-                        self._handle_down()
-                    elif event.key == pygame.K_RIGHT:
-                        self._handle_dpad_right()
-                    elif event.key == pygame.K_LEFT:
-                        self._handle_dpad_left()
-                    elif event.key in (pygame.K_LEFTBRACKET, pygame.K_COMMA):
-                        self._traction_index = (self._traction_index - 1) % len(self._traction_levels)
-                        self._invoke_control_callback(
-                            "Traction",
-                            self._traction_callback,
-                            self._traction_index + 1,
-                        )
-                        self._save_preferences()
-                    elif event.key in (pygame.K_RIGHTBRACKET, pygame.K_PERIOD):
-                        self._traction_index = (self._traction_index + 1) % len(self._traction_levels)
-                        self._invoke_control_callback(
-                            "Traction",
-                            self._traction_callback,
-                            self._traction_index + 1,
-                        )
-                        self._save_preferences()
-                elif event.type == pygame.JOYBUTTONDOWN:
-                    if (not self._post_complete) or self._post_fault_active:
-                        continue
-                    if event.button == self._joy_select_button:
-                        self._handle_select()
-                    elif event.button == self._joy_back_button:
-                        self._handle_back()
-                    elif event.button == self._joy_air_shot_button:
-                        self._request_air_shot()
-                elif event.type == pygame.JOYHATMOTION:
-                    if (not self._post_complete) or self._post_fault_active:
-                        continue
-                    x, y = event.value
-                    if y > 0:
-                        self._handle_up()
-                    elif y < 0:
-                        self._handle_down()
-                    if x > 0:
-                        self._handle_dpad_right()
-                    elif x < 0:
-                        self._handle_dpad_left()
-
-            if state_iter is not None:
-                try:
-                    snapshot = next(state_iter)
-                    self.update_state(snapshot)
-                except StopIteration:
-                    state_iter = None
-
-            with self.state_lock:
-                state = self.state
-            now_s = time.monotonic()
-            if state.environment.time != self._last_snapshot_time:
-                self._last_snapshot_time = state.environment.time
-                self._last_can_fresh_monotonic = now_s
-                self._display_time_anchor = state.environment.time
-                self._display_time_anchor_monotonic = now_s
-            state = replace(state, faults=self._runtime_faults(state, now_s))
-            state = self._economy_tracker.update(state, now_s)
-            state = replace(state, advisories=self._predictive_advisories(state, now_s))
-            if self._snapshot_log_callback:
-                try:
-                    self._snapshot_log_callback(state)
-                except Exception:
-                    LOGGER.exception("Snapshot logging callback failed")
-            # Keep the HUD clock moving even when telemetry timestamps stop updating.
-            display_time = self._display_time_anchor + timedelta(
-                seconds=max(0.0, now_s - self._display_time_anchor_monotonic)
-            )
-            state = replace(state, environment=replace(state.environment, time=display_time))
-
-            if now_s < self._mode_layout_anim_until:
-                self._create_widgets()
-
-            if not self._post_complete:
-                self._run_post(state)
-
-            if self._post_complete and self._post_fault_active:
-                pressed = pygame.key.get_pressed()
-                if pressed[self._ack_key]:
-                    self._post_fault_active = False
-            self._log_new_faults(state)
-            self._audio.update(
-                state.faults,
-                allow_playback=self._post_complete and not self._post_fault_active,
-            )
-            self._render_frame(state)
-            if self._runtime_heartbeat_callback:
-                self._runtime_heartbeat_callback()
-            if (
-                not self._runtime_health_confirmed
-                and self._runtime_health_callback
-                and self._post_complete
-                and (now_s - self._runtime_started_monotonic) >= 15.0
-            ):
-                self._runtime_health_callback()
-                self._runtime_health_confirmed = True
-            self.clock.tick(TARGET_FPS)
+        self._fault_evaluator.start()
+        profiler = self._profiler
+        try:
+            if self._use_display:
+                pygame.joystick.init()
+
+            while self.running:
+                profiler.begin_frame()
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                    elif event.type == pygame.VIDEORESIZE and self._use_display:
+                        self.screen = pygame.display.set_mode(event.size, pygame.RESIZABLE)
+                        self._overlay_pool.clear()
+                        self._create_widgets()
+                    elif event.type == pygame.KEYDOWN:
+                        if (not self._post_complete) or self._post_fault_active:
+                            continue
+                        if event.key == self._air_shot_key:
+                            self._request_air_shot()
+                        elif event.key == pygame.K_F3 and profiler.enabled:
+                            profiler.overlay_visible = not profiler.overlay_visible
+                        elif event.key in (pygame.K_TAB, pygame.K_m):
+                            self._apply_mode_selection((self._mode_index + 1) % len(self._modes))
+                        elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_SPACE):
+                            self._handle_select()
+                        elif event.key in (pygame.K_BACKSPACE, pygame.K_ESCAPE):
+                            self._handle_back()
+                        elif event.key == pygame.K_UP:
+                            self._handle_up()
+                        elif event.key == pygame.K_DOWN:
+                            self._handle_down()
+                        elif event.key == pygame.K_RIGHT:
+                            self._handle_dpad_right()
+                        elif event.key == pygame.K_LEFT:
+                            self._handle_dpad_left()
+                        elif event.key in (pygame.K_LEFTBRACKET, pygame.K_COMMA):
+                            self._traction_index = (self._traction_index - 1) % len(self._traction_levels)
+                            self._invoke_control_callback(
+                                "Traction",
+                                self._traction_callback,
+                                self._traction_index + 1,
+                            )
+                            self._save_preferences()
+                        elif event.key in (pygame.K_RIGHTBRACKET, pygame.K_PERIOD):
+                            self._traction_index = (self._traction_index + 1) % len(self._traction_levels)
+                            self._invoke_control_callback(
+                                "Traction",
+                                self._traction_callback,
+                                self._traction_index + 1,
+                            )
+                            self._save_preferences()
+                    elif event.type == pygame.JOYBUTTONDOWN:
+                        if (not self._post_complete) or self._post_fault_active:
+                            continue
+                        if event.button == self._joy_select_button:
+                            self._handle_select()
+                        elif event.button == self._joy_back_button:
+                            self._handle_back()
+                        elif event.button == self._joy_air_shot_button:
+                            self._request_air_shot()
+                    elif event.type == pygame.JOYHATMOTION:
+                        if (not self._post_complete) or self._post_fault_active:
+                            continue
+                        x, y = event.value
+                        if y > 0:
+                            self._handle_up()
+                        elif y < 0:
+                            self._handle_down()
+                        if x > 0:
+                            self._handle_dpad_right()
+                        elif x < 0:
+                            self._handle_dpad_left()
+
+                profiler.lap("events")
+                self._sync_service_mode()
+                if state_iter is not None:
+                    try:
+                        snapshot = next(state_iter)
+                        self.update_state(snapshot)
+                    except StopIteration:
+                        state_iter = None
+
+                with self.state_lock:
+                    state = self.state
+                now_s = time.monotonic()
+                if state.environment.time != self._last_snapshot_time:
+                    self._last_snapshot_time = state.environment.time
+                    self._last_can_fresh_monotonic = now_s
+                    self._display_time_anchor = state.environment.time
+                    self._display_time_anchor_monotonic = now_s
+                profiler.lap("state")
+                # Faults, advisories and economy come from the fixed-rate evaluator, not this frame's timing.
+                evaluation = self._fault_evaluator.current() or self._fault_evaluator.tick(now_s)
+                state = evaluation.apply(state)
+                profiler.lap("faults")
+                if self._snapshot_log_callback:
+                    try:
+                        self._snapshot_log_callback(state)
+                    except Exception:
+                        LOGGER.exception("Snapshot logging callback failed")
+                    profiler.lap("snapshot_log")
+                # Keep the HUD clock moving even when telemetry timestamps stop updating.
+                display_time = self._display_time_anchor + timedelta(
+                    seconds=max(0.0, now_s - self._display_time_anchor_monotonic)
+                )
+                state = state.evolve(environment=state.environment.evolve(time=display_time))
 
-            now = time.perf_counter()
-            if now - last_tick < frame_duration:
-                time.sleep(max(0.0, frame_duration - (now - last_tick)))
-            last_tick = now
+                if now_s < self._mode_layout_anim_until:
+                    self._create_widgets()
 
-        pygame.quit()
+                if not self._post_complete:
+                    self._run_post(state)
+
+                if self._post_complete and self._post_fault_active:
+                    pressed = pygame.key.get_pressed()
+                    if pressed[self._ack_key]:
+                        self._post_fault_active = False
+                self._log_new_faults(state)
+                self._audio.update(
+                    state.faults,
+                    allow_playback=self._post_complete and not self._post_fault_active,
+                )
+                profiler.lap("housekeeping")
+                self._render_frame(state)
+                if self._runtime_heartbeat_callback:
+                    self._runtime_heartbeat_callback()
+                profiler.end_frame()
+                if (
+                    not self._runtime_health_confirmed
+                    and self._runtime_health_callback
+                    and self._post_complete
+                    and (now_s - self._runtime_started_monotonic) >= 15.0
+                ):
+                    self._runtime_health_callback()
+                    self._runtime_health_confirmed = True
+                self.clock.tick(TARGET_FPS)
+
+                now = time.perf_counter()
+                if now - last_tick < frame_duration:
+                    time.sleep(max(0.0, frame_duration - (now - last_tick)))
+                last_tick = now
+        finally:
+            # Also on SIGINT/SIGTERM (SystemExit) or an error in the loop.
+            self._fault_evaluator.stop()
+            profiler.dump()
+            pygame.quit()
 
     def capture_frame(self, state: StateSnapshot | None = None) -> pygame.Surface:
         """Render a single frame and return the surface copy."""
@@ -1286,11 +1095,42 @@ class HUDRenderer:
         else:
             with self.state_lock:
                 self.state = state
-        state = self._economy_tracker.update(state)
-        state = replace(state, advisories=self._predictive_advisories(state, time.monotonic()))
+        state = self._fault_evaluator.tick(state=state).apply(state)
         self._render_frame(state, present=False)
         return self.screen.copy()
 
+    def _static_background(self) -> pygame.Surface | None:
+        """Black screen plus every widget's ``draw_static`` content, redrawn only on layout, theme or size change.
+
+        Returns ``None`` while the mode layout animation is still moving
+        widgets, so the layer is rebuilt once when it settles instead of on
+        every animation frame.
+        """
+        key = (
+            self._themes[self._theme_index],
+            self.screen.get_size(),
+            tuple(
+                (type(widget), tuple(widget.rect), getattr(widget, "split", False))
+                for widget in self.widgets
+                if hasattr(widget, "draw_static")
+            ),
+        )
+        if self._static_layer is None or self._static_layer_key != key:
+            if time.monotonic() < self._mode_layout_anim_until:
+                return None
+            layer = pygame.Surface(self.screen.get_size(), 0, self.screen)
+            self._draw_static(layer)
+            self._static_layer = layer
+            self._static_layer_key = key
+        return self._static_layer
+
+    def _draw_static(self, surface: pygame.Surface) -> None:
+        surface.fill((0, 0, 0))
+        for widget in self.widgets:
+            draw_static = getattr(widget, "draw_static", None)
+            if draw_static is not None:
+                draw_static(surface)
+
     def _render_frame(self, state: StateSnapshot, *, present: bool = True) -> None:
         self._navigation.update_position(state.environment.gps_latitude, state.environment.gps_longitude)
         if self._navigation.arrival_prompt_pending and self._active_menu == "home":
@@ -1301,14 +1141,29 @@ class HUDRenderer:
         self._visible_faults = tuple(state.faults)
         self._normalize_home_focus(previous_focus_target, previous_had_faults)
         apply_theme(self._themes[self._theme_index])
-        self.screen.fill((0, 0, 0))
+        profiler = self._profiler
+        static_layer = self._static_background()
+        if static_layer is None:
+            self._draw_static(self.screen)
+        else:
+            self.screen.blit(static_layer, (0, 0))
+        profiler.lap("static_layer")
+        dirty: list[pygame.Rect] = []
         for widget in self.widgets:
+            inputs = widget.frame_inputs(state)
+            if inputs is None or self._widget_inputs.get(widget) != inputs:
+                dirty.append(widget.rect)
+            self._widget_inputs[widget] = inputs
             widget.draw(self.screen, state)
+            profiler.lap(type(widget).__name__)
         self._render_home_mode_hover_underline(state)
         self._render_home_fault_focus_outline(state)
         self._render_home_navigation_focus_outline()
+        profiler.lap("focus_outlines")
         self._apply_theme_overlay_pre_ui()
+        profiler.lap("theme_tint")
         self._render_top_right_media_tile()
+        profiler.lap("media_tile")
         if self._active_menu == "settings":
             self._render_modal_dimmer()
             self._render_settings_overlay()
@@ -1344,24 +1199,95 @@ class HUDRenderer:
         elif self._active_menu == "network_password":
             self._render_modal_dimmer()
             self._render_network_password_overlay()
+        if self._active_menu != "home":
+            profiler.lap("menu." + self._active_menu)
         self._render_global_hints()
         self._apply_brightness_overlay(state)
+        profiler.lap("hints_brightness")
         if (not self._post_complete) or self._post_fault_active:
             self._render_post_overlay()
+            profiler.lap("post")
+        if profiler.overlay_visible:
+            self._render_profiler_overlay()
+            profiler.lap("profiler_overlay")
         if present and self._use_display:
-            pygame.display.flip()
+            # Anything that touches the whole screen (menus and their dimmer,
+            # focus outlines, theme tint, brightness shade, POST, a rebuilt
+            # static layer or the mode layout animation) forces a full flip;
+            # otherwise only changed widgets and the media tile are pushed.
+            presented_key = (
+                static_layer,
+                self._active_menu,
+                self._home_focus_target() if self._active_menu == "home" else "",
+                bool(state.faults),
+                state.environment.mode,
+                self._brightness_alpha(state),
+                (not self._post_complete) or self._post_fault_active,
+            )
+            if (
+                presented_key != self._presented_key
+                or self._active_menu != "home"
+                or presented_key[-1]
+                or static_layer is None
+                or profiler.overlay_visible
+            ):
+                pygame.display.flip()
+            else:
+                screen_rect = self.screen.get_rect()
+                dirty.extend(rect.clip(screen_rect) for rect in self._top_right_tile_rects())
+                pygame.display.update(dirty)
+            self._presented_key = presented_key
+            profiler.lap("present")
+
+    def _render_profiler_overlay(self) -> None:
+        _bg, bright, glow, fault = self._theme_colors()
+        summary = self._profiler.cached_summary()
+        budget_ms = summary["budget_ms"]
+        frame = summary["frame"]
+        # Slowest stages first, by p95.
+        stages = sorted(
+            ((name, times) for name, times in summary["stages"].items() if times["count"]),
+            key=lambda item: item[1]["p95_ms"],
+            reverse=True,
+        )[:12]
+        panel = pygame.Rect(12, 60, 430, 48 + 16 * len(stages))
+        self.screen.blit(self._overlay(panel.size, (0, 0, 0, 210)), panel.topleft)
+        pygame.draw.rect(self.screen, glow, panel, width=1, border_radius=4)
+        if frame["count"]:
+            over = frame["p95_ms"] > budget_ms
+            header = (
+                f"FRAME p50 {frame['p50_ms']:.1f}  p95 {frame['p95_ms']:.1f}  p99 {frame['p99_ms']:.1f} ms"
+                f"  >{budget_ms:.0f}ms {frame['over_budget']}/{frame['count']}"
+            )
+        else:
+            over = False
+            header = "FRAME --"
+        self.screen.blit(render_text(header, 12, fault if over else bright, bold=True), (panel.x + 8, panel.y + 6))
+        # Right edges of the numeric columns.
+        columns = (("p50", 250), ("p95", 310), ("p99", 370), ("OVER", 420))
+        self.screen.blit(render_text("STAGE", 11, glow, bold=True), (panel.x + 8, panel.y + 26))
+        for label, right in columns:
+            label_surface = render_text(label, 11, glow, bold=True)
+            self.screen.blit(label_surface, (panel.x + right - label_surface.get_width(), panel.y + 26))
+        y = panel.y + 42
+        for name, times in stages:
+            color = fault if times["over_budget"] else glow
+            self.screen.blit(render_text(name, 11, color), (panel.x + 8, y))
+            values = (f"{times['p50_ms']:.2f}", f"{times['p95_ms']:.2f}", f"{times['p99_ms']:.2f}", str(times["over_budget"]))
+            for value, (_, right) in zip(values, columns):
+                value_surface = render_text(value, 11, color)
+                self.screen.blit(value_surface, (panel.x + right - value_surface.get_width(), y))
+            y += 16
 
     def _render_post_overlay(self) -> None:
         _bg, bright, glow, fault = self._theme_colors()
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 255))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.fill((0, 0, 0))
         x = 24
         y = 24
         elapsed = max(0.0, time.monotonic() - self._post_started_at)
         title_full = "POWER ON SELF TEST"
         title_chars = min(len(title_full), int(elapsed / 0.045))
-        title = font(18, bold=True).render(title_full[:title_chars], True, bright)
+        title = render_text(title_full[:title_chars], 18, bright, bold=True)
         self.screen.blit(title, (x, y))
         y += 28
         t = elapsed - 1.0
@@ -1379,7 +1305,7 @@ class HUDRenderer:
                 out = f"{prefix} {result}"
                 color = glow if ok else fault
             sz = fit_font_size(out, self.screen.get_width() - 48, 20, start_size=16)
-            surf = font(sz).render(out, True, color)
+            surf = render_text(out, sz, color)
             self.screen.blit(surf, (x, y))
             y += 20
         # Hold 1s after last line before allow ack prompt
@@ -1387,7 +1313,7 @@ class HUDRenderer:
         if elapsed < done_time:
             return
         ack = f"FAULT ACK REQUIRED: PRESS {pygame.key.name(self._ack_key).upper()}"
-        ack_s = font(16, bold=True).render(ack, True, fault)
+        ack_s = render_text(ack, 16, fault, bold=True)
         self.screen.blit(ack_s, (x, self.screen.get_height() - 40))
 
     def _active_faults_for_detail(self, state: StateSnapshot) -> list[str]:
@@ -1566,6 +1492,8 @@ class HUDRenderer:
             self._move_network_password_keyboard(-1, 0)
         elif self._active_menu == "settings":
             self._settings_cursor = (self._settings_cursor - 1) % len(self._setting_items)
+        elif self._active_menu == "service":
+            self._service_can_scroll = max(0, self._service_can_scroll - self._service_can_page_rows)
         elif self._active_menu == "media":
             if self._media_device_menu_open and self._available_devices:
                 self._media_device_cursor = (self._media_device_cursor - 1) % len(self._available_devices)
@@ -1593,6 +1521,8 @@ class HUDRenderer:
             self._move_network_password_keyboard(1, 0)
         elif self._active_menu == "settings":
             self._settings_cursor = (self._settings_cursor + 1) % len(self._setting_items)
+        elif self._active_menu == "service":
+            self._service_can_scroll += self._service_can_page_rows
         elif self._active_menu == "media":
             if self._media_device_menu_open and self._available_devices:
                 self._media_device_cursor = (self._media_device_cursor + 1) % len(self._available_devices)
@@ -1998,16 +1928,14 @@ class HUDRenderer:
         sw, sh = self.screen.get_size()
         panel = pygame.Rect(0, 0, min(920, sw - 80), min(540, sh - 70))
         panel.center = (sw // 2, sh // 2)
-        overlay = pygame.Surface((panel.width, panel.height), pygame.SRCALPHA)
-        overlay.fill((12, 8, 0, 238))
-        self.screen.blit(overlay, panel.topleft)
+        self.screen.blit(self._overlay(panel.size, (12, 8, 0, 238)), panel.topleft)
         pygame.draw.rect(self.screen, fault_color, panel, width=2, border_radius=8)
 
         faults = self._active_faults_for_detail(state)
         if not faults:
-            title = font(22, bold=True).render("EVA FAULT DETAIL", True, bright)
+            title = render_text("EVA FAULT DETAIL", 22, bright, bold=True)
             self.screen.blit(title, (panel.x + 18, panel.y + 14))
-            msg = font(18, bold=True).render("NO ACTIVE FAULT", True, glow)
+            msg = render_text("NO ACTIVE FAULT", 18, glow, bold=True)
             self.screen.blit(msg, (panel.x + 18, panel.y + 58))
             return
 
@@ -2015,8 +1943,8 @@ class HUDRenderer:
         name = faults[self._fault_detail_index]
         status = engine_status(state)
         title = f"EVA FAULT DETAIL {self._fault_detail_index + 1}/{len(faults)}"
-        self.screen.blit(font(22, bold=True).render(title, True, bright), (panel.x + 18, panel.y + 12))
-        self.screen.blit(font(24, bold=True).render(name, True, fault_color), (panel.x + 18, panel.y + 48))
+        self.screen.blit(render_text(title, 22, bright, bold=True), (panel.x + 18, panel.y + 12))
+        self.screen.blit(render_text(name, 24, fault_color, bold=True), (panel.x + 18, panel.y + 48))
 
         text_x = panel.x + 18
         grid_x = panel.x + int(panel.width * 0.62)
@@ -2026,12 +1954,12 @@ class HUDRenderer:
             ("WHY", fault_reason(name, state)),
             ("ACTION", fault_action(name, state)),
         ):
-            self.screen.blit(font(15, bold=True).render(heading, True, bright), (text_x, y))
+            self.screen.blit(render_text(heading, 15, bright, bold=True), (text_x, y))
             y += 18
             for line in self._wrap_words(body, text_max_w - 10, 14):
                 if y > panel.bottom - 42:
                     break
-                self.screen.blit(font(14).render(line, True, glow), (text_x + 10, y))
+                self.screen.blit(render_text(line, 14, glow), (text_x + 10, y))
                 y += 17
             y += 6
 
@@ -2055,15 +1983,15 @@ class HUDRenderer:
         label_w = max(70, int(panel.width * 0.12))
         value_max_w = max(90, panel.right - grid_x - label_w - 24)
         row_h = max(18, min(25, (panel.bottom - grid_y - 42) // len(rows)))
-        self.screen.blit(font(15, bold=True).render("CURRENT VALUES", True, bright), (grid_x, panel.y + 64))
+        self.screen.blit(render_text("CURRENT VALUES", 15, bright, bold=True), (grid_x, panel.y + 64))
         for idx, (label, value) in enumerate(rows):
             row_y = grid_y + idx * row_h
-            self.screen.blit(font(13, bold=True).render(label, True, glow), (grid_x, row_y))
+            self.screen.blit(render_text(label, 13, glow, bold=True), (grid_x, row_y))
             value_size = fit_font_size(value, value_max_w, row_h, start_size=14, bold=True)
-            self.screen.blit(font(value_size, bold=True).render(value, True, bright), (grid_x + label_w, row_y))
+            self.screen.blit(render_text(value, value_size, bright, bold=True), (grid_x + label_w, row_y))
 
         hint = "ARROWS: NEXT FAULT  |  ENTER: NEXT  |  ESC: BACK"
-        hint_surface = font(12, bold=True).render(hint, True, glow)
+        hint_surface = render_text(hint, 12, glow, bold=True)
         self.screen.blit(hint_surface, (panel.right - hint_surface.get_width() - 18, panel.bottom - 24))
 
     def _render_navigation_waypoint_overlay(self) -> None:
@@ -2074,7 +2002,7 @@ class HUDRenderer:
         self._draw_navigation_panel_shell(panel, "NAVIGATION / WAYPOINTS")
         location = self._navigation.current_location
         gps_text = f"GPS {location[0]:.5f}, {location[1]:.5f}" if location else "GPS LOCK REQUIRED"
-        self.screen.blit(font(12, bold=True).render(gps_text, True, glow if location else fault), (panel.x + 18, panel.y + 42))
+        self.screen.blit(render_text(gps_text, 12, glow if location else fault, bold=True), (panel.x + 18, panel.y + 42))
         items = self._navigation_menu_items()
         self._nav_cursor %= max(1, len(items))
         row_h = 30
@@ -2090,13 +2018,13 @@ class HUDRenderer:
             if waypoint_id == self._navigation.active_waypoint_id:
                 suffix = "  [ACTIVE]"
             text = f"{prefix} {label}{suffix}"
-            self.screen.blit(font(15, bold=active).render(text[:56], True, color), (panel.x + 18, start_y + row * row_h))
+            self.screen.blit(render_text(text[:56], 15, color, bold=active), (panel.x + 18, start_y + row * row_h))
             if active:
                 pygame.draw.line(self.screen, color, (panel.x + 18, start_y + row * row_h + 23), (panel.right - 18, start_y + row * row_h + 23), 1)
         status = self._navigation.route_status
-        status_surface = font(12, bold=True).render(status[:48], True, bright)
+        status_surface = render_text(status[:48], 12, bright, bold=True)
         self.screen.blit(status_surface, (panel.x + 18, panel.bottom - 50))
-        hint = font(12).render("ARROWS: MOVE  |  ENTER: SELECT  |  ESC: BACK", True, glow)
+        hint = render_text("ARROWS: MOVE  |  ENTER: SELECT  |  ESC: BACK", 12, glow)
         self.screen.blit(hint, (panel.right - hint.get_width() - 18, panel.bottom - 28))
 
     def _render_navigation_action_overlay(self) -> None:
@@ -2107,13 +2035,13 @@ class HUDRenderer:
         waypoint = next((row for row in self._navigation.waypoints if row.waypoint_id == self._nav_selected_waypoint_id), None)
         self._draw_navigation_panel_shell(panel, "WAYPOINT ACTION")
         title = waypoint.name if waypoint else "WAYPOINT MISSING"
-        self.screen.blit(font(18, bold=True).render(title[:28], True, bright), (panel.x + 18, panel.y + 50))
+        self.screen.blit(render_text(title[:28], 18, bright, bold=True), (panel.x + 18, panel.y + 50))
         for idx, action in enumerate(self._navigation_action_items()):
             active = idx == self._nav_action_cursor
             color = bright if active else glow
             prefix = ">" if active else " "
-            self.screen.blit(font(15, bold=active).render(f"{prefix} {action}", True, color), (panel.x + 20, panel.y + 92 + idx * 30))
-        hint = font(12).render("ARROWS: MOVE  |  ENTER: SELECT  |  ESC: BACK", True, glow)
+            self.screen.blit(render_text(f"{prefix} {action}", 15, color, bold=active), (panel.x + 20, panel.y + 92 + idx * 30))
+        hint = render_text("ARROWS: MOVE  |  ENTER: SELECT  |  ESC: BACK", 12, glow)
         self.screen.blit(hint, (panel.right - hint.get_width() - 18, panel.bottom - 24))
 
     def _render_navigation_keyboard_overlay(self) -> None:
@@ -2128,7 +2056,7 @@ class HUDRenderer:
         pygame.draw.rect(self.screen, glow, entry_rect, 1)
         entry_text = self._nav_keyboard_text or "_"
         entry_size = fit_font_size(entry_text, entry_rect.width - 20, entry_rect.height - 12, start_size=20, bold=True)
-        self.screen.blit(font(entry_size, bold=True).render(entry_text, True, bright), (entry_rect.x + 10, entry_rect.y + 8))
+        self.screen.blit(render_text(entry_text, entry_size, bright, bold=True), (entry_rect.x + 10, entry_rect.y + 8))
         rows = self._navigation_keyboard_rows()
         top = panel.y + 104
         gap = 6
@@ -2144,9 +2072,9 @@ class HUDRenderer:
                 pygame.draw.rect(self.screen, (22, 14, 0), key_rect)
                 pygame.draw.rect(self.screen, bright if active else glow, key_rect, 2 if active else 1)
                 label_size = fit_font_size(key, key_rect.width - 10, key_rect.height - 8, start_size=15, bold=active)
-                label = font(label_size, bold=active).render(key, True, bright if active else glow)
+                label = render_text(key, label_size, bright if active else glow, bold=active)
                 self.screen.blit(label, (key_rect.centerx - label.get_width() // 2, key_rect.centery - label.get_height() // 2))
-        hint = font(12).render("ARROWS: MOVE  |  ENTER: TYPE  |  ESC: DELETE/BACK", True, glow)
+        hint = render_text("ARROWS: MOVE  |  ENTER: TYPE  |  ESC: DELETE/BACK", 12, glow)
         self.screen.blit(hint, (panel.right - hint.get_width() - 18, panel.bottom - 22))
 
     def _render_navigation_search_results_overlay(self) -> None:
@@ -2155,7 +2083,7 @@ class HUDRenderer:
         panel = pygame.Rect(0, 0, min(920, sw - 72), min(500, sh - 64))
         panel.center = (sw // 2, sh // 2)
         self._draw_navigation_panel_shell(panel, "ADDRESS SEARCH")
-        self.screen.blit(font(13, bold=True).render(self._navigation.search_status[:56], True, glow), (panel.x + 18, panel.y + 46))
+        self.screen.blit(render_text(self._navigation.search_status[:56], 13, glow, bold=True), (panel.x + 18, panel.y + 46))
         items = self._navigation_search_items()
         self._nav_search_cursor %= len(items)
         start_y = panel.y + 84
@@ -2167,10 +2095,10 @@ class HUDRenderer:
             clipped = label
             while font(14, bold=active).size(clipped)[0] > panel.width - 62 and len(clipped) > 4:
                 clipped = f"{clipped[:-4]}..."
-            self.screen.blit(font(14, bold=active).render(f"{'>' if active else ' '} {clipped}", True, color), (panel.x + 18, row_y))
+            self.screen.blit(render_text(f"{'>' if active else ' '} {clipped}", 14, color, bold=active), (panel.x + 18, row_y))
             if active:
                 pygame.draw.line(self.screen, color, (panel.x + 18, row_y + 22), (panel.right - 18, row_y + 22), 1)
-        hint = font(12).render("ARROWS: MOVE  |  ENTER: ROUTE  |  ESC: BACK", True, glow)
+        hint = render_text("ARROWS: MOVE  |  ENTER: ROUTE  |  ESC: BACK", 12, glow)
         self.screen.blit(hint, (panel.right - hint.get_width() - 18, panel.bottom - 24))
 
     def _render_navigation_arrival_overlay(self) -> None:
@@ -2181,8 +2109,8 @@ class HUDRenderer:
         self._draw_navigation_panel_shell(panel, "DESTINATION REACHED")
         destination = self._navigation.arrival_prompt_destination
         name = destination.name if destination else "CURRENT LOCATION"
-        self.screen.blit(font(17, bold=True).render(name[:32], True, bright), (panel.x + 18, panel.y + 62))
-        self.screen.blit(font(15, bold=True).render("SAVE THIS LOCATION AS A WAYPOINT?", True, glow), (panel.x + 18, panel.y + 102))
+        self.screen.blit(render_text(name[:32], 17, bright, bold=True), (panel.x + 18, panel.y + 62))
+        self.screen.blit(render_text("SAVE THIS LOCATION AS A WAYPOINT?", 15, glow, bold=True), (panel.x + 18, panel.y + 102))
         choices = ("YES", "NO")
         button_w = 128
         gap = 18
@@ -2192,9 +2120,9 @@ class HUDRenderer:
             rect = pygame.Rect(left + index * (button_w + gap), panel.y + 150, button_w, 42)
             pygame.draw.rect(self.screen, (22, 14, 0), rect)
             pygame.draw.rect(self.screen, bright if active else glow, rect, 2 if active else 1)
-            text = font(16, bold=active).render(label, True, bright if active else glow)
+            text = render_text(label, 16, bright if active else glow, bold=active)
             self.screen.blit(text, (rect.centerx - text.get_width() // 2, rect.centery - text.get_height() // 2))
-        hint = font(12).render("ARROWS: CHOOSE  |  ENTER: SELECT  |  ESC: DISMISS", True, glow)
+        hint = render_text("ARROWS: CHOOSE  |  ENTER: SELECT  |  ESC: DISMISS", 12, glow)
         self.screen.blit(hint, (panel.right - hint.get_width() - 18, panel.bottom - 22))
 
     def _render_network_overlay(self) -> None:
@@ -2205,7 +2133,7 @@ class HUDRenderer:
         self._draw_navigation_panel_shell(panel, "NETWORK SETTINGS")
         status_color = glow if self._network.available else fault
         status = f"{self._network.status}  {self._network.active_ssid}".strip()
-        self.screen.blit(font(13, bold=True).render(status[:64], True, status_color), (panel.x + 18, panel.y + 44))
+        self.screen.blit(render_text(status[:64], 13, status_color, bold=True), (panel.x + 18, panel.y + 44))
         items = self._network_menu_items()
         self._network_cursor %= max(1, len(items))
         row_h = 30
@@ -2223,10 +2151,10 @@ class HUDRenderer:
                 suffix = f"  {network.signal:>3}%  {network.security[:18]}"
                 if network.active:
                     suffix += "  [ACTIVE]"
-            self.screen.blit(font(14, bold=active).render(f"{'>' if active else ' '} {label[:34]}{suffix}", True, color), (panel.x + 18, start_y + row * row_h))
+            self.screen.blit(render_text(f"{'>' if active else ' '} {label[:34]}{suffix}", 14, color, bold=active), (panel.x + 18, start_y + row * row_h))
             if active:
                 pygame.draw.line(self.screen, color, (panel.x + 18, start_y + row * row_h + 22), (panel.right - 18, start_y + row * row_h + 22), 1)
-        hint = font(12).render("ARROWS: MOVE  |  ENTER: SELECT  |  ESC: BACK", True, glow)
+        hint = render_text("ARROWS: MOVE  |  ENTER: SELECT  |  ESC: BACK", 12, glow)
         self.screen.blit(hint, (panel.right - hint.get_width() - 18, panel.bottom - 22))
 
     def _render_network_password_overlay(self) -> None:
@@ -2240,7 +2168,7 @@ class HUDRenderer:
         pygame.draw.rect(self.screen, glow, entry_rect, 1)
         hidden = "*" * len(self._network_password_text) or "BLANK USES SAVED OR OPEN NETWORK"
         hidden_size = fit_font_size(hidden, entry_rect.width - 20, entry_rect.height - 12, start_size=18, bold=True)
-        self.screen.blit(font(hidden_size, bold=True).render(hidden, True, bright), (entry_rect.x + 10, entry_rect.y + 9))
+        self.screen.blit(render_text(hidden, hidden_size, bright, bold=True), (entry_rect.x + 10, entry_rect.y + 9))
         rows = self._network_password_keyboard_rows()
         top = panel.y + 104
         gap = 6
@@ -2256,29 +2184,25 @@ class HUDRenderer:
                 pygame.draw.rect(self.screen, (22, 14, 0), key_rect)
                 pygame.draw.rect(self.screen, bright if active else glow, key_rect, 2 if active else 1)
                 label_size = fit_font_size(key, key_rect.width - 10, key_rect.height - 8, start_size=14, bold=active)
-                label = font(label_size, bold=active).render(key, True, bright if active else glow)
+                label = render_text(key, label_size, bright if active else glow, bold=active)
                 self.screen.blit(label, (key_rect.centerx - label.get_width() // 2, key_rect.centery - label.get_height() // 2))
-        hint = font(12).render("ARROWS: MOVE  |  ENTER: TYPE  |  ESC: DELETE/BACK", True, glow)
+        hint = render_text("ARROWS: MOVE  |  ENTER: TYPE  |  ESC: DELETE/BACK", 12, glow)
         self.screen.blit(hint, (panel.right - hint.get_width() - 18, panel.bottom - 22))
 
     def _draw_navigation_panel_shell(self, panel: pygame.Rect, title: str) -> None:
         _bg, bright, glow, _fault = self._theme_colors()
-        overlay = pygame.Surface(panel.size, pygame.SRCALPHA)
-        overlay.fill((8, 6, 0, 242))
-        self.screen.blit(overlay, panel.topleft)
+        self.screen.blit(self._overlay(panel.size, (8, 6, 0, 242)), panel.topleft)
         pygame.draw.rect(self.screen, glow, panel, width=2, border_radius=8)
-        self.screen.blit(font(20, bold=True).render(title, True, bright), (panel.x + 16, panel.y + 12))
+        self.screen.blit(render_text(title, 20, bright, bold=True), (panel.x + 16, panel.y + 12))
 
     def _render_settings_overlay(self) -> None:
         bg, bright, glow, _fault = self._theme_colors()
         sw, sh = self.screen.get_size()
         panel = pygame.Rect(0, 0, min(760, sw - 80), min(520, sh - 80))
         panel.center = (sw // 2, sh // 2)
-        overlay = pygame.Surface((panel.width, panel.height), pygame.SRCALPHA)
-        overlay.fill((12, 8, 0, 230))
-        self.screen.blit(overlay, panel.topleft)
+        self.screen.blit(self._overlay(panel.size, (12, 8, 0, 230)), panel.topleft)
         pygame.draw.rect(self.screen, glow, panel, width=2, border_radius=8)
-        title = font(20, bold=True).render("SETTINGS", True, bright)
+        title = render_text("SETTINGS", 20, bright, bold=True)
         self.screen.blit(title, (panel.x + 16, panel.y + 10))
         row_h = 34
         first_row_y = panel.y + 52
@@ -2293,15 +2217,15 @@ class HUDRenderer:
             )
         visible_items = self._setting_items[first_idx:first_idx + visible_rows]
         if first_idx > 0:
-            self.screen.blit(font(11, bold=True).render("MORE", True, glow), (panel.right - 54, first_row_y - 20))
+            self.screen.blit(render_text("MORE", 11, glow, bold=True), (panel.right - 54, first_row_y - 20))
         if first_idx + visible_rows < len(self._setting_items):
-            self.screen.blit(font(11, bold=True).render("MORE", True, glow), (panel.right - 54, panel.bottom - footer_h + 4))
+            self.screen.blit(render_text("MORE", 11, glow, bold=True), (panel.right - 54, panel.bottom - footer_h + 4))
         for row, item in enumerate(visible_items):
             idx = first_idx + row
             active = idx == self._settings_cursor
             color = bright if active else glow
             value = self._settings_value(item)
-            text = font(17, bold=active).render(f"{item:<12} {value}", True, color)
+            text = render_text(f"{item:<12} {value}", 17, color, bold=active)
             row_y = first_row_y + row * row_h
             self.screen.blit(text, (panel.x + 16, row_y))
             if active:
@@ -2314,11 +2238,11 @@ class HUDRenderer:
             if item == "MODE" and active:
                 self._render_mode_picker(panel, row_y + 28)
         y = panel.bottom - 26
-        dev_title = font(12, bold=True).render("BT DEVICES", True, glow)
+        dev_title = render_text("BT DEVICES", 12, glow, bold=True)
         self.screen.blit(dev_title, (panel.x + 16, y))
         if self._available_devices:
             devs = ", ".join(self._available_devices[:3])
-            self.screen.blit(font(12).render(devs[:44], True, bright), (panel.x + 100, y))
+            self.screen.blit(render_text(devs[:44], 12, bright), (panel.x + 100, y))
 
     def _draw_service_group(self, title: str, rows: list[tuple[str, str, bool | None]], rect: pygame.Rect) -> None:
         _bg, bright, glow, fault = self._theme_colors()
@@ -2328,12 +2252,12 @@ class HUDRenderer:
             clipped = text
             while font(size, bold=bold).size(clipped)[0] > max_w and len(clipped) > 4:
                 clipped = f"{clipped[:-4]}..."
-            return font(size, bold=bold).render(clipped, True, color)
+            return render_text(clipped, size, color, bold=bold)
 
         pygame.draw.rect(self.screen, (28, 18, 0), rect, width=1, border_radius=5)
-        self.screen.blit(font(13, bold=True).render(title, True, bright), (rect.x + 10, rect.y + 8))
+        self.screen.blit(render_text(title, 13, bright, bold=True), (rect.x + 10, rect.y + 8))
         if not rows:
-            self.screen.blit(font(12).render("NO DATA", True, glow), (rect.x + 10, rect.y + 34))
+            self.screen.blit(render_text("NO DATA", 12, glow), (rect.x + 10, rect.y + 34))
             return
         y = rect.y + 30
         row_h = 16
@@ -2349,16 +2273,22 @@ class HUDRenderer:
             self.screen.blit(value_surface, (value_x, y))
             y += row_h
 
-    def _draw_can_frame_group(self, title: str, frames, rect: pygame.Rect, now) -> None:
+    def _draw_can_frame_group(self, title: str, frames, rect: pygame.Rect, now, offset: int = 0) -> None:
         _bg, bright, glow, _fault = self._theme_colors()
         pygame.draw.rect(self.screen, (28, 18, 0), rect, width=1, border_radius=5)
-        self.screen.blit(font(13, bold=True).render(title, True, bright), (rect.x + 10, rect.y + 8))
-        if not frames:
-            self.screen.blit(font(12).render("NO DATA", True, glow), (rect.x + 10, rect.y + 34))
-            return
         y = rect.y + 30
         row_h = 16
         max_rows = max(1, (rect.bottom - y - 6) // row_h)
+        # Only the visible slice is formatted; the history may hold thousands of frames.
+        total = len(frames)
+        offset = min(max(0, offset), max(0, total - max_rows))
+        visible = frames[offset : offset + max_rows]
+        if offset:
+            title = f"{title}  {offset + 1}-{offset + len(visible)}/{total}"
+        self.screen.blit(render_text(title, 13, bright, bold=True), (rect.x + 10, rect.y + 8))
+        if not visible:
+            self.screen.blit(render_text("NO DATA", 12, glow), (rect.x + 10, rect.y + 34))
+            return
         id_x = rect.x + 10
         name_x = rect.x + 92
         age_w = 58
@@ -2367,17 +2297,62 @@ class HUDRenderer:
         data_w = max(48, age_x - data_x - 8)
         name_w = max(80, data_x - name_x - 8)
 
-        for frame in frames[:max_rows]:
+        for frame in visible:
             age_ms = max(0, int((now - frame.timestamp).total_seconds() * 1000))
             id_text = f"{frame.direction:<2} {frame.arbitration_id:03X}"
             name = frame.name.rsplit(".", 1)[-1]
             name_size = fit_font_size(name, name_w, row_h, start_size=12)
             data_size = fit_font_size(frame.data_hex, data_w, row_h, start_size=12)
             age_text = f"{age_ms:>4}ms" if age_ms < 10000 else "9999ms"
-            self.screen.blit(font(12, bold=True).render(id_text, True, bright), (id_x, y))
-            self.screen.blit(font(name_size).render(name, True, glow), (name_x, y))
-            self.screen.blit(font(data_size).render(frame.data_hex, True, glow), (data_x, y))
-            self.screen.blit(font(12).render(age_text, True, glow), (age_x, y))
+            self.screen.blit(render_text(id_text, 12, bright, bold=True), (id_x, y))
+            self.screen.blit(render_text(name, name_size, glow), (name_x, y))
+            self.screen.blit(render_text(frame.data_hex, data_size, glow), (data_x, y))
+            self.screen.blit(render_text(age_text, 12, glow), (age_x, y))
+            y += row_h
+
+    def _draw_can_stats_group(self, stats: CANBusStats, rect: pygame.Rect) -> None:
+        _bg, bright, glow, fault = self._theme_colors()
+        pygame.draw.rect(self.screen, (28, 18, 0), rect, width=1, border_radius=5)
+        title = f"CAN BUS  LOAD {stats.bus_load_pct:4.1f}%  {stats.frames_per_s:5.0f} fps @ {stats.bitrate // 1000}k"
+        self.screen.blit(render_text(title, 13, bright, bold=True), (rect.x + 10, rect.y + 8))
+        if not stats.ids:
+            self.screen.blit(render_text("NO DATA", 12, glow), (rect.x + 10, rect.y + 34))
+            return
+        y = rect.y + 30
+        row_h = 16
+        max_rows = max(1, (rect.bottom - y - 6) // row_h)
+        columns = (
+            ("ID", 0.0),
+            ("NAME", 0.08),
+            ("RATE Hz", 0.40),
+            ("JITTER", 0.52),
+            ("MIN/MAX ms", 0.64),
+            ("DLC ERR", 0.80),
+            ("AGE", 0.90),
+        )
+        inner_w = rect.width - 20
+        xs = [rect.x + 10 + int(inner_w * fraction) for _label, fraction in columns]
+        name_w = xs[2] - xs[1] - 6
+        for (label, _fraction), x in zip(columns, xs):
+            self.screen.blit(render_text(label, 11, glow, bold=True), (x, y))
+        y += row_h
+        for entry in stats.ids[: max_rows - 1]:
+            age_ms = min(9999, int(entry.last_seen_age_s * 1000))
+            name = entry.name.rsplit(".", 1)[-1]
+            cells = (
+                f"{entry.arbitration_id:03X}",
+                name,
+                f"{entry.rate_hz:.1f}",
+                f"{entry.jitter_ms:.2f}",
+                f"{entry.min_interval_ms:.1f}/{entry.max_interval_ms:.1f}",
+                str(entry.dlc_errors),
+                f"{age_ms}ms",
+            )
+            # Stale (ECU STALE trips at 0.5 s) or malformed streams stand out.
+            color = fault if entry.dlc_errors or entry.last_seen_age_s > 0.5 else bright
+            for index, (text, x) in enumerate(zip(cells, xs)):
+                size = fit_font_size(text, name_w, row_h, start_size=12) if index == 1 else 12
+                self.screen.blit(render_text(text, size, color), (x, y))
             y += row_h
 
     def _render_service_overlay(self, state: StateSnapshot) -> None:
@@ -2385,13 +2360,11 @@ class HUDRenderer:
         sw, sh = self.screen.get_size()
         panel = pygame.Rect(0, 0, min(1120, sw - 56), min(610, sh - 48))
         panel.center = (sw // 2, sh // 2)
-        overlay = pygame.Surface((panel.width, panel.height), pygame.SRCALPHA)
-        overlay.fill((8, 6, 0, 238))
-        self.screen.blit(overlay, panel.topleft)
+        self.screen.blit(self._overlay(panel.size, (8, 6, 0, 238)), panel.topleft)
         pygame.draw.rect(self.screen, glow, panel, width=2, border_radius=8)
-        self.screen.blit(font(20, bold=True).render("SERVICE MODE", True, bright), (panel.x + 16, panel.y + 10))
+        self.screen.blit(render_text("SERVICE MODE", 20, bright, bold=True), (panel.x + 16, panel.y + 10))
         subtitle = "LIVE CAN / SENSORS / PINS / RELAYS / FIRMWARE"
-        self.screen.blit(font(12, bold=True).render(subtitle, True, glow), (panel.x + 210, panel.y + 16))
+        self.screen.blit(render_text(subtitle, 12, glow, bold=True), (panel.x + 210, panel.y + 16))
 
         content_top = panel.y + 44
         content_bottom = panel.bottom - 32
@@ -2401,8 +2374,23 @@ class HUDRenderer:
         right_x = left.right + gap
         right_w = panel.right - right_x - 14
 
+        can_stats = None
+        if self._can_stats_callback is not None:
+            try:
+                can_stats = self._can_stats_callback()
+            except Exception:
+                LOGGER.exception("CAN stats callback failed")
+        if can_stats is not None:
+            stats_h = max(120, int(left.height * 0.45))
+            stats_rect = pygame.Rect(left.x, left.bottom - stats_h, left.width, stats_h)
+            left = pygame.Rect(left.x, left.y, left.width, left.height - stats_h - gap)
+            self._draw_can_stats_group(can_stats, stats_rect)
+
         now = state.environment.time
-        self._draw_can_frame_group("RAW CAN FRAMES", state.service.recent_can_frames, left, now)
+        frames = state.service.recent_can_frames
+        self._service_can_page_rows = max(1, (left.height - 36) // 16)
+        self._service_can_scroll = min(self._service_can_scroll, max(0, len(frames) - self._service_can_page_rows))
+        self._draw_can_frame_group("RAW CAN FRAMES", frames, left, now, self._service_can_scroll)
 
         sensor_rows = [(reading.label, reading.value, None) for reading in state.service.sensor_voltages]
         sensor_rows.extend([
@@ -2454,7 +2442,7 @@ class HUDRenderer:
         self._draw_service_group("FIRMWARE / CONTROL", firmware_rows, bottom_right)
 
         hint = "ESC: BACK"
-        hint_surface = font(12, bold=True).render(hint, True, glow)
+        hint_surface = render_text(hint, 12, glow, bold=True)
         self.screen.blit(hint_surface, (panel.right - hint_surface.get_width() - 16, panel.bottom - 22))
 
     def _sensor_confidence_rows(self, state: StateSnapshot) -> list[tuple[str, str, str]]:
@@ -2500,11 +2488,9 @@ class HUDRenderer:
         sw, sh = self.screen.get_size()
         panel = pygame.Rect(0, 0, min(920, sw - 64), min(560, sh - 52))
         panel.center = (sw // 2, sh // 2)
-        overlay = pygame.Surface((panel.width, panel.height), pygame.SRCALPHA)
-        overlay.fill((8, 10, 8, 238))
-        self.screen.blit(overlay, panel.topleft)
+        self.screen.blit(self._overlay(panel.size, (8, 10, 8, 238)), panel.topleft)
         pygame.draw.rect(self.screen, glow, panel, width=2, border_radius=8)
-        self.screen.blit(font(20, bold=True).render("SENSOR CONFIDENCE", True, bright), (panel.x + 16, panel.y + 12))
+        self.screen.blit(render_text("SENSOR CONFIDENCE", 20, bright, bold=True), (panel.x + 16, panel.y + 12))
 
         rows = self._sensor_confidence_rows(state)
         cols = 2 if panel.width >= 620 else 1
@@ -2520,27 +2506,25 @@ class HUDRenderer:
             y = start_y + row * row_h
             color = colors.get(status, glow)
             pygame.draw.circle(self.screen, color, (x + 8, y + 9), 5)
-            self.screen.blit(font(12, bold=True).render(status, True, color), (x + 20, y))
-            self.screen.blit(font(13).render(name, True, glow), (x + 98, y))
-            value_surface = font(13, bold=True).render(value, True, bright)
+            self.screen.blit(render_text(status, 12, color, bold=True), (x + 20, y))
+            self.screen.blit(render_text(name, 13, glow), (x + 98, y))
+            value_surface = render_text(value, 13, bright, bold=True)
             self.screen.blit(value_surface, (x + col_w - value_surface.get_width() - 4, y))
             pygame.draw.line(self.screen, (28, 42, 34), (x, y + row_h - 5), (x + col_w, y + row_h - 5), 1)
 
         hint = "ESC: BACK"
-        hint_surface = font(12, bold=True).render(hint, True, glow)
+        hint_surface = render_text(hint, 12, glow, bold=True)
         self.screen.blit(hint_surface, (panel.right - hint_surface.get_width() - 16, panel.bottom - 22))
 
     def _render_media_overlay(self) -> None:
         _bg, bright, glow, _fault = self._theme_colors()
         panel = pygame.Rect(self.screen.get_width() - 520, 90, 460, 210)
-        overlay = pygame.Surface((panel.width, panel.height), pygame.SRCALPHA)
-        overlay.fill((12, 8, 0, 230))
-        self.screen.blit(overlay, panel.topleft)
+        self.screen.blit(self._overlay(panel.size, (12, 8, 0, 230)), panel.topleft)
         pygame.draw.rect(self.screen, glow, panel, width=2, border_radius=8)
-        title = font(20, bold=True).render("MEDIA", True, bright)
+        title = render_text("MEDIA", 20, bright, bold=True)
         self.screen.blit(title, (panel.x + 16, panel.y + 10))
         title_line = f"{self._phone_artist} - {self._phone_track}".strip(" -") or "NO TRACK"
-        self.screen.blit(font(14).render(title_line[:48], True, glow), (panel.x + 16, panel.y + 40))
+        self.screen.blit(render_text(title_line[:48], 14, glow), (panel.x + 16, panel.y + 40))
         bar = pygame.Rect(panel.x + 16, panel.y + 66, panel.width - 32, 16)
         pygame.draw.rect(self.screen, (45, 30, 0), bar, border_radius=4)
         ratio = (self._phone_position_s / self._phone_length_s) if self._phone_length_s > 0 else 0.0
@@ -2567,26 +2551,24 @@ class HUDRenderer:
                 pygame.draw.polygon(self.screen, c, [(cx + 10, y), (cx + 34, y + 16), (cx + 10, y + 32)])
                 pygame.draw.polygon(self.screen, c, [(cx + 32, y), (cx + 56, y + 16), (cx + 32, y + 32)])
             else:
-                label = font(11, bold=True).render("BT", True, c)
+                label = render_text("BT", 11, c, bold=True)
                 self.screen.blit(label, (cx + 20, y + 10))
 
     def _render_device_submenu(self, parent_panel: pygame.Rect) -> None:
         _bg, bright, glow, _fault = self._theme_colors()
         menu = pygame.Rect(parent_panel.x + 40, parent_panel.bottom + 6, parent_panel.width - 80, 140)
-        overlay = pygame.Surface((menu.width, menu.height), pygame.SRCALPHA)
-        overlay.fill((12, 8, 0, 230))
-        self.screen.blit(overlay, menu.topleft)
+        self.screen.blit(self._overlay(menu.size, (12, 8, 0, 230)), menu.topleft)
         pygame.draw.rect(self.screen, glow, menu, width=2, border_radius=8)
-        self.screen.blit(font(14, bold=True).render("BLUETOOTH DEVICES", True, bright), (menu.x + 10, menu.y + 8))
+        self.screen.blit(render_text("BLUETOOTH DEVICES", 14, bright, bold=True), (menu.x + 10, menu.y + 8))
         rows = self._available_devices[:4]
         if not rows:
-            self.screen.blit(font(12).render("No paired devices found.", True, glow), (menu.x + 10, menu.y + 40))
+            self.screen.blit(render_text("No paired devices found.", 12, glow), (menu.x + 10, menu.y + 40))
             return
         for idx, (_mac, name) in enumerate(rows):
             active = idx == self._media_device_cursor
             color = bright if active else glow
             prefix = ">" if active else " "
-            self.screen.blit(font(12, bold=active).render(f"{prefix} {name[:36]}", True, color), (menu.x + 10, menu.y + 36 + idx * 22))
+            self.screen.blit(render_text(f"{prefix} {name[:36]}", 12, color, bold=active), (menu.x + 10, menu.y + 36 + idx * 22))
 
     def _settings_value(self, item: str) -> str:
         if item == "TRACTION":
@@ -2631,9 +2613,8 @@ class HUDRenderer:
         self._fuel_type_index = max(0, min(fuel_type_index, len(self._fuel_types) - 1))
         fuel_type = self._fuel_types[self._fuel_type_index]
         with self.state_lock:
-            self.state = replace(
-                self.state,
-                environment=replace(self.state.environment, fuel_type=fuel_type),
+            self.state = self.state.evolve(
+                environment=self.state.environment.evolve(fuel_type=fuel_type),
             )
         if notify:
             self._invoke_control_callback(
@@ -2651,7 +2632,7 @@ class HUDRenderer:
             selected = idx == self._mode_selection_index
             applied = idx == self._mode_index
             color = bright if selected or applied else glow
-            label = font(13, bold=selected).render(mode, True, color)
+            label = render_text(mode, 13, color, bold=selected)
             self.screen.blit(label, (x, y))
             if selected:
                 uy = y + label.get_height() + 1
@@ -2661,7 +2642,7 @@ class HUDRenderer:
     def _render_global_hints(self) -> None:
         _bg, _bright, glow, _fault = self._theme_colors()
         hint = "ARROWS: CYCLE SETTINGS/MEDIA/MODES  |  ENTER: SELECT  |  ESC: BACK"
-        s = font(12).render(hint, True, glow)
+        s = render_text(hint, 12, glow)
         self.screen.blit(s, (self.screen.get_width() - s.get_width() - 24, self.screen.get_height() - 20))
 
     def _home_focus_target(self) -> str:
@@ -2709,7 +2690,7 @@ class HUDRenderer:
         color = fault if state.faults else bright
         pygame.draw.rect(self.screen, color, alert_rect.inflate(6, 6), width=2, border_radius=6)
         label = "SELECT FAULT" if state.faults else "NO FAULT"
-        surface = font(11, bold=True).render(label, True, color if state.faults else glow)
+        surface = render_text(label, 11, color if state.faults else glow, bold=True)
         self.screen.blit(surface, (alert_rect.x + 8, max(0, alert_rect.y - surface.get_height() - 2)))
 
     def _render_home_navigation_focus_outline(self) -> None:
@@ -2720,7 +2701,7 @@ class HUDRenderer:
             return
         _bg, bright, _glow, _fault = self._theme_colors()
         pygame.draw.rect(self.screen, bright, nav_rect.inflate(6, 6), width=2, border_radius=6)
-        label = font(11, bold=True).render("SELECT NAV", True, bright)
+        label = render_text("SELECT NAV", 11, bright, bold=True)
         self.screen.blit(label, (nav_rect.x + 8, max(0, nav_rect.y - label.get_height() - 2)))
 
     def _render_home_mode_hover_underline(self, state: StateSnapshot) -> None:
@@ -2741,7 +2722,7 @@ class HUDRenderer:
         for idx, mode in enumerate(self._modes):
             active = mode == state.environment.mode
             size = fit_font_size(mode, int(header_rect.width * 0.1), line_height, start_size=line_height + (5 if active else 0), bold=active)
-            mode_surface = font(size, bold=active).render(mode, True, (0, 0, 0))
+            mode_surface = render_text(mode, size, (0, 0, 0), bold=active)
             if idx == hover_idx:
                 uy = my + (0 if active else 3) + mode_surface.get_height() + 1
                 if header_rect.y <= uy <= header_rect.bottom + 2:
@@ -2749,33 +2730,38 @@ class HUDRenderer:
                 return
             mx += mode_surface.get_width() + 8
 
-    def _apply_brightness_overlay(self, state: StateSnapshot) -> None:
+    def _brightness_alpha(self, state: StateSnapshot) -> int:
         level = float(self._brightness_levels[self._brightness_index])
         if self._auto_dim_enabled:
             hour = state.environment.time.hour
             if hour >= 20 or hour < 6:
                 level = min(level, 55.0)
-        alpha = int(max(0.0, min(200.0, (100.0 - level) * 1.8)))
+        return int(max(0.0, min(200.0, (100.0 - level) * 1.8)))
+
+    def _apply_brightness_overlay(self, state: StateSnapshot) -> None:
+        alpha = self._brightness_alpha(state)
         if alpha > 0:
-            shade = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-            shade.fill((0, 0, 0, alpha))
-            self.screen.blit(shade, (0, 0))
+            self.screen.blit(self._overlay(self.screen.get_size(), (0, 0, 0, alpha)), (0, 0))
 
-    def _render_top_right_media_tile(self) -> None:
-        bg, bright, glow, fault = self._theme_colors()
-        width = self.screen.get_width()
-        # Right-side anchored cluster: settings then media.
+    def _top_right_tile_rects(self) -> tuple[pygame.Rect, pygame.Rect]:
+        """Media tile and settings tile, right-anchored in the header."""
         # Leave margin so ambient/GPS readouts at far-right stay visible.
-        cluster_right = width - 150
+        cluster_right = self.screen.get_width() - 150
         tile = pygame.Rect(cluster_right - 280, -2, 280, 54)
         settings_rect = pygame.Rect(tile.x - 8 - 128, -2, 128, 54)
+        return tile, settings_rect
+
+    def _render_top_right_media_tile(self) -> None:
+        bg, bright, glow, fault = self._theme_colors()
+        # Right-side anchored cluster: settings then media.
+        tile, settings_rect = self._top_right_tile_rects()
         pygame.draw.rect(self.screen, bg, tile, border_radius=6)
         focused = self._active_menu == "home" and self._home_focus_target() == "MEDIA"
         pygame.draw.rect(self.screen, bright if focused else glow, tile, width=2 if focused else 1, border_radius=6)
         label = "BT LINK" if self._phone_link_enabled else "BT OFF"
-        left = font(14, bold=True).render(label, True, bright if self._phone_link_enabled else fault)
+        left = render_text(label, 14, bright if self._phone_link_enabled else fault, bold=True)
         title_line = f"{self._phone_artist} - {self._phone_track}".strip(" -") or "NO TRACK"
-        right = font(13).render(title_line[:32], True, glow)
+        right = render_text(title_line[:32], 13, glow)
         self.screen.blit(left, (tile.x + 10, tile.y + 8))
         self.screen.blit(right, (tile.x + 86, tile.y + 8))
         bar = pygame.Rect(tile.x + 10, tile.y + 34, 180, 10)
@@ -2787,21 +2773,31 @@ class HUDRenderer:
             remaining = max(0.0, self._phone_length_s - self._phone_position_s)
             mm = int(remaining // 60)
             ss = int(remaining % 60)
-            rem_text = font(13, bold=True).render(f"-{mm}:{ss:02d}", True, glow)
+            rem_text = render_text(f"-{mm}:{ss:02d}", 13, glow, bold=True)
             self.screen.blit(rem_text, (tile.x + 214, tile.y + 32))
 
         pygame.draw.rect(self.screen, bg, settings_rect, border_radius=6)
         s_focused = self._active_menu == "home" and self._home_focus_target() == "SETTINGS"
         pygame.draw.rect(self.screen, bright if s_focused else glow, settings_rect, width=2 if s_focused else 1, border_radius=6)
-        s_label = font(15, bold=True).render("SETTINGS", True, glow)
-        s_hint = font(12).render("SELECT", True, glow)
+        s_label = render_text("SETTINGS", 15, glow, bold=True)
+        s_hint = render_text("SELECT", 12, glow)
         self.screen.blit(s_label, (settings_rect.x + 12, settings_rect.y + 10))
         self.screen.blit(s_hint, (settings_rect.x + 30, settings_rect.y + 32))
 
+    def _overlay(self, size: tuple[int, int], color: tuple[int, int, int, int]) -> pygame.Surface:
+        """Pooled translucent fill of ``size``, created on first use and reused every frame."""
+        key = (tuple(size), color)
+        surface = self._overlay_pool.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(color)
+            if self._use_display:
+                surface = surface.convert_alpha()
+            self._overlay_pool[key] = surface
+        return surface
+
     def _render_modal_dimmer(self) -> None:
-        dim = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        dim.fill((0, 0, 0, 150))
-        self.screen.blit(dim, (0, 0))
+        self.screen.blit(self._overlay(self.screen.get_size(), (0, 0, 0, 150)), (0, 0))
 
     def _theme_colors(self) -> tuple[tuple[int, int, int], tuple[int, int, int], tuple[int, int, int], tuple[int, int, int]]:
         theme = self._themes[self._theme_index]
@@ -2814,16 +2810,6 @@ class HUDRenderer:
         return (24, 14, 0), (255, 198, 64), (185, 134, 39), (255, 72, 36)
 
     def _apply_theme_overlay_pre_ui(self) -> None:
-        theme = self._themes[self._theme_index]
-        if theme == "NIGHT":
-            tint = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-            tint.fill((22, 26, 40, 70))
-            self.screen.blit(tint, (0, 0))
-        elif theme == "NIGHT OPS":
-            tint = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-            tint.fill((0, 20, 18, 105))
-            self.screen.blit(tint, (0, 0))
-        elif theme == "HIGH-CON":
-            tint = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-            tint.fill((0, 0, 0, 80))
-            self.screen.blit(tint, (0, 0))
+        tint = THEME_TINTS.get(self._themes[self._theme_index])
+        if tint is not None:
+            self.screen.blit(self._overlay(self.screen.get_size(), tint), (0, 0))
@@ -4,7 +4,7 @@ from __future__ import annotations
 import pygame
 
 from .base import Widget
-from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, font
+from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, render_text
 from ...state.snapshot import StateSnapshot
 
 
@@ -14,6 +14,13 @@ class AirShotPanel(Widget):
         self.max_pressure = max_pressure
         self.max_shots = max(1, max_shots)
 
+    @staticmethod
+    def _flash_on(state: StateSnapshot) -> bool:
+        return state.air_shot.is_firing and (pygame.time.get_ticks() // 180) % 2 == 0
+
+    def frame_inputs(self, state: StateSnapshot) -> tuple[int, bool]:
+        return state.versions.air_shot, self._flash_on(state)
+
     def draw(self, surface: pygame.Surface, state: StateSnapshot) -> None:
         previous_clip = surface.get_clip()
         surface.set_clip(self.rect)
@@ -23,7 +30,7 @@ class AirShotPanel(Widget):
         pressure = state.air_shot.pressure_psi
         charges = max(0, min(self.max_shots, state.air_shot.charges_remaining))
         inner = self.rect.inflate(-2 * padding, -2 * padding)
-        flash_on = state.air_shot.is_firing and (pygame.time.get_ticks() // 180) % 2 == 0
+        flash_on = self._flash_on(state)
 
         if inner.height < 56:
             self._draw_compact(surface, inner, pressure, charges, state.air_shot.is_firing, flash_on)
@@ -36,7 +43,7 @@ class AirShotPanel(Widget):
         pressure_h = max(12, inner.height - header_h - charge_h - firing_h - 6)
 
         label_size = fit_font_size("AIR SHOT", inner.width, header_h, start_size=22, bold=True)
-        label = font(label_size, bold=True).render("AIR SHOT", True, AMBER_GLOW)
+        label = render_text("AIR SHOT", label_size, AMBER_GLOW, bold=True)
         surface.blit(label, (inner.centerx - label.get_width() // 2, inner.y))
 
         charge_y = inner.y + header_h + 2
@@ -52,7 +59,7 @@ class AirShotPanel(Widget):
         psi_text = "EMPTY" if charges == 0 else f"{pressure:.0f} PSI"
         psi_color = FAULT_AMBER if charges == 0 else AMBER_GLOW
         psi_size = fit_font_size(psi_text, inner.width, pressure_h, start_size=26, bold=True)
-        psi = font(psi_size, bold=True).render(psi_text, True, psi_color)
+        psi = render_text(psi_text, psi_size, psi_color, bold=True)
         surface.blit(psi, (inner.centerx - psi.get_width() // 2, pressure_y + max(0, (pressure_h - psi.get_height()) // 2)))
 
         firing_text = "FIRING!!"
@@ -60,7 +67,7 @@ class AirShotPanel(Widget):
         if state.air_shot.is_firing and not flash_on:
             firing_color = FAULT_AMBER
         firing_size = fit_font_size(firing_text, inner.width, firing_h, start_size=22, bold=True)
-        firing = font(firing_size, bold=True).render(firing_text, True, firing_color)
+        firing = render_text(firing_text, firing_size, firing_color, bold=True)
         firing_y = inner.bottom - firing_h + max(0, (firing_h - firing.get_height()) // 2)
         surface.blit(firing, (inner.centerx - firing.get_width() // 2, firing_y))
         surface.set_clip(previous_clip)
@@ -87,9 +94,9 @@ class AirShotPanel(Widget):
         psi_size = fit_font_size(psi, psi_w, rect.height, start_size=18, bold=True)
         status_size = fit_font_size(status, status_w, rect.height, start_size=15, bold=True)
         y_center = rect.centery
-        label_s = font(label_size, bold=True).render(label, True, AMBER_GLOW)
-        psi_s = font(psi_size, bold=True).render(psi, True, FAULT_AMBER if charges == 0 else AMBER_BRIGHT)
-        status_s = font(status_size, bold=True).render(status, True, status_color)
+        label_s = render_text(label, label_size, AMBER_GLOW, bold=True)
+        psi_s = render_text(psi, psi_size, FAULT_AMBER if charges == 0 else AMBER_BRIGHT, bold=True)
+        status_s = render_text(status, status_size, status_color, bold=True)
         x = rect.x
         surface.blit(label_s, (x, y_center - label_s.get_height() // 2))
         x += label_w + gap
@@ -5,7 +5,7 @@ import pygame
 import time
 
 from .base import Widget
-from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, font
+from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, render_text
 from ...state.snapshot import StateSnapshot
 
 
@@ -47,7 +47,7 @@ class AlertPanel(Widget):
         # Reserve space for the GL500 heritage label at the top
         header_height = int(self.rect.height * 0.2)
         header_size = fit_font_size("GL500 ALERT", self.rect.width - 10, header_height - 4, start_size=max(12, int(header_height * 0.6)), bold=True)
-        header_surface = font(header_size, bold=True).render("GL500 ALERT", True, AMBER_BRIGHT)
+        header_surface = render_text("GL500 ALERT", header_size, AMBER_BRIGHT, bold=True)
         surface.blit(
             header_surface,
             (
@@ -68,9 +68,9 @@ class AlertPanel(Widget):
         for index, line in enumerate(lines):
             size = fit_font_size(line, self.rect.width - 10, line_height - 2, start_size=max(12, int(line_height * 0.65)), bold=highlight)
             if is_active_fault_display and not flash_on:
-                text_surface = font(size, bold=highlight).render(line, True, AMBER_BG)
+                text_surface = render_text(line, size, AMBER_BG, bold=highlight)
             else:
-                text_surface = font(size, bold=highlight).render(line, True, color)
+                text_surface = render_text(line, size, color, bold=highlight)
             x = self.rect.centerx - text_surface.get_width() // 2
             y = self.rect.y + header_height + 5 + index * line_height + max(
                 0, (line_height - text_surface.get_height()) // 2
@@ -1,7 +1,7 @@
 """Base widget types for the Albatross HUD."""
 from __future__ import annotations
 
-from typing import Protocol, Tuple
+from typing import Hashable, Protocol, Tuple
 
 import pygame
 
@@ -13,3 +13,23 @@ Color = Tuple[int, int, int]
 class Widget(Protocol):
     def draw(self, surface: pygame.Surface, state: StateSnapshot) -> None:
         ...
+
+    def frame_inputs(self, state: StateSnapshot) -> Hashable | None:
+        """Everything ``draw`` output depends on besides layout and theme.
+
+        The renderer only presents ``rect`` again when this differs from the
+        previous frame; ``None`` (the default) means present it every frame.
+        """
+        return None
+
+
+class LayeredWidget(Widget, Protocol):
+    """Widget that splits out content which only changes with layout or theme.
+
+    ``draw_static`` paints into the renderer's cached static layer, which is
+    rebuilt on layout, theme and size changes; ``draw`` then only paints the
+    per-frame content on top of it.
+    """
+
+    def draw_static(self, surface: pygame.Surface) -> None:
+        ...
@@ -4,7 +4,8 @@ from __future__ import annotations
 import pygame
 
 from .base import Widget
-from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, font
+from .glyph_atlas import glyph_atlas
+from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, render_text
 from ...state.snapshot import StateSnapshot
 
 
@@ -13,6 +14,10 @@ class BoostPanel(Widget):
         self.rect = rect
         self.boost_max = boost_max
 
+    def frame_inputs(self, state: StateSnapshot) -> tuple[float, float, str]:
+        engine = state.engine
+        return engine.boost_psi, engine.target_boost_psi, f"{engine.wastegate_duty_pct:3.0f}"
+
     def draw(self, surface: pygame.Surface, state: StateSnapshot) -> None:
         pygame.draw.rect(surface, AMBER_BG, self.rect)
         engine = state.engine
@@ -40,27 +45,28 @@ class BoostPanel(Widget):
         text = f"Boost {engine.boost_psi:4.1f} psi"
         top_text_width = max(80, self.rect.width - target_column_width - 3 * bar_padding)
         top_font = fit_font_size(text, top_text_width, int(self.rect.height * 0.28), start_size=max(16, int(self.rect.height * 0.3)), bold=True)
-        text_surface = font(top_font, bold=True).render(text, True, AMBER_BRIGHT)
-        surface.blit(text_surface, (self.rect.x + bar_padding, self.rect.y + bar_padding // 2))
+        boost_digits = glyph_atlas(top_font, AMBER_BRIGHT, bold=True, units=("Boost", "psi"))
+        boost_digits.draw(surface, text, (self.rect.x + bar_padding, self.rect.y + bar_padding // 2))
 
         target_font = fit_font_size(target_text, target_column_width, int(self.rect.height * 0.18), start_size=max(12, int(self.rect.height * 0.18)), bold=True)
-        target_surface = font(target_font, bold=True).render(target_text, True, AMBER_BRIGHT)
-        surface.blit(
-            target_surface,
+        target_digits = glyph_atlas(target_font, AMBER_BRIGHT, bold=True, units=("REQ",))
+        target_digits.draw(
+            surface,
+            target_text,
             (
-                self.rect.right - bar_padding - target_surface.get_width(),
+                self.rect.right - bar_padding - target_digits.width(target_text),
                 self.rect.y + bar_padding // 2,
             ),
         )
 
         duty_text = f"WG {engine.wastegate_duty_pct:3.0f}%"
         duty_font = fit_font_size(duty_text, int(self.rect.width * 0.36), int(self.rect.height * 0.2), start_size=max(14, int(self.rect.height * 0.22)))
-        duty_surface = font(duty_font).render(duty_text, True, AMBER_GLOW)
-        surface.blit(duty_surface, (self.rect.right - bar_padding - duty_surface.get_width(), self.rect.y + bar_padding // 2 + text_surface.get_height() + 2))
+        duty_digits = glyph_atlas(duty_font, AMBER_GLOW, units=("WG",))
+        duty_digits.draw(surface, duty_text, (self.rect.right - bar_padding - duty_digits.width(duty_text), self.rect.y + bar_padding // 2 + boost_digits.height + 2))
 
         if engine.boost_psi > self.boost_max * 0.95:
             warn_font = fit_font_size("OVERBOOST", self.rect.width // 2, int(self.rect.height * 0.2), start_size=max(14, int(self.rect.height * 0.2)), bold=True)
-            warning_surface = font(warn_font, bold=True).render("OVERBOOST", True, FAULT_AMBER)
+            warning_surface = render_text("OVERBOOST", warn_font, FAULT_AMBER, bold=True)
             surface.blit(
                 warning_surface,
                 (self.rect.right - warning_surface.get_width() - bar_padding, self.rect.y + bar_padding // 2),
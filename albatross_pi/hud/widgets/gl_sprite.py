@@ -4,7 +4,7 @@ from __future__ import annotations
 import pygame
 
 from .base import Widget
-from .ui_utils import AMBER_BG, AMBER_GLOW, FAULT_AMBER, font
+from .ui_utils import AMBER_BG, AMBER_GLOW, FAULT_AMBER, render_text
 from ...state.snapshot import StateSnapshot
 
 class GLSprite(Widget):
@@ -16,7 +16,7 @@ class GLSprite(Widget):
         mood = state.gl_sprite_mood
         color = FAULT_AMBER if mood == "alert" else AMBER_GLOW
         text = ":)" if mood == "happy" else ("!" if mood == "alert" else ":|")
-        sprite_surface = font(48, bold=True).render(text, True, color)
+        sprite_surface = render_text(text, 48, color, bold=True)
         surface.blit(
             sprite_surface,
             (
@@ -0,0 +1,82 @@
+"""Pre-rendered glyph atlases for numeric readouts that change every frame."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Iterator
+
+import pygame
+
+from .ui_utils import font
+
+NUMERIC_GLYPHS = "0123456789.-+%/: "
+# One atlas per (size, color, bold, units); theme changes retire old colors through LRU eviction.
+GLYPH_ATLAS_MAX_ENTRIES = 64
+
+
+class GlyphAtlas:
+    """Digits, signs and unit suffixes for one font size and color, packed into a single surface.
+
+    Numbers are composed by blitting areas of the atlas, so steady-state
+    readouts never go through FreeType. ``units`` are whole words (``"psi"``,
+    ``"RPM"``) kept as one glyph so their kerning matches a normal render.
+    Any other character is rendered once on first use and kept.
+    """
+
+    def __init__(self, size: int, color, *, bold: bool = False, units: tuple[str, ...] = ()) -> None:
+        self._font = font(size, bold=bold)
+        self._color = tuple(color)
+        self.height = self._font.get_height()
+        tokens = tuple(NUMERIC_GLYPHS) + tuple(unit for unit in units if unit not in NUMERIC_GLYPHS)
+        renders = [self._font.render(token, True, self._color) for token in tokens]
+        width = sum(render.get_width() for render in renders)
+        self.surface = pygame.Surface((max(1, width), self.height), pygame.SRCALPHA)
+        self._glyphs: dict[str, tuple[pygame.Surface, pygame.Rect]] = {}
+        x = 0
+        for token, render in zip(tokens, renders):
+            # Copy the glyph's own alpha into the transparent atlas rather than blending it.
+            self.surface.blit(render, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self._glyphs[token] = (self.surface, pygame.Rect(x, 0, render.get_width(), render.get_height()))
+            x += render.get_width()
+        self._units = tuple(sorted((unit for unit in units if len(unit) > 1), key=len, reverse=True))
+
+    def glyphs(self, text: str) -> Iterator[tuple[pygame.Surface, pygame.Rect]]:
+        """Yield ``(source, area)`` per glyph of ``text``, left to right."""
+        index = 0
+        while index < len(text):
+            for unit in self._units:
+                if text.startswith(unit, index):
+                    token = unit
+                    break
+            else:
+                token = text[index]
+            glyph = self._glyphs.get(token)
+            if glyph is None:
+                render = self._font.render(token, True, self._color)
+                glyph = self._glyphs[token] = (render, render.get_rect())
+            yield glyph
+            index += len(token)
+
+    def width(self, text: str) -> int:
+        return sum(area.width for _, area in self.glyphs(text))
+
+    def draw(self, surface: pygame.Surface, text: str, dest: tuple[int, int]) -> pygame.Rect:
+        x, y = dest
+        for source, area in self.glyphs(text):
+            surface.blit(source, (x, y), area)
+            x += area.width
+        return pygame.Rect(dest[0], y, x - dest[0], self.height)
+
+
+_ATLASES: OrderedDict[tuple, GlyphAtlas] = OrderedDict()
+
+
+def glyph_atlas(size: int, color, *, bold: bool = False, units: tuple[str, ...] = ()) -> GlyphAtlas:
+    key = (max(8, size), tuple(color), bold, units)
+    atlas = _ATLASES.get(key)
+    if atlas is not None:
+        _ATLASES.move_to_end(key)
+        return atlas
+    atlas = _ATLASES[key] = GlyphAtlas(key[0], color, bold=bold, units=units)
+    if len(_ATLASES) > GLYPH_ATLAS_MAX_ENTRIES:
+        _ATLASES.popitem(last=False)
+    return atlas
@@ -4,7 +4,7 @@ from __future__ import annotations
 import pygame
 
 from .base import Widget
-from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, font
+from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, render_text
 from ...state.snapshot import StateSnapshot
 
 
@@ -37,17 +37,47 @@ class HeaderBar(Widget):
         for offset in (-6, -2, 2, 6):
             pygame.draw.line(surface, color, (cx + 2, cy + offset), (cx + 16, cy + offset - 3), 2)
 
-    def _draw_lighting_status(self, surface: pygame.Surface, state: StateSnapshot, y: int) -> None:
-        lighting = state.lighting
+    def _lighting_centers(self) -> tuple[tuple[int, int], tuple[int, int], tuple[int, int]]:
+        """Centers of the left indicator, high beam and right indicator."""
+        padding = max(8, int(self.rect.height * 0.15))
+        line_height = max(16, int(self.rect.height * 0.35))
         spacing = max(28, int(self.rect.height * 0.38))
         cx = self.rect.centerx
-        cy = y + max(10, int(self.rect.height * 0.15))
-        self._draw_turn_indicator(surface, (cx - spacing, cy), left=True, active=lighting.left_indicator)
-        self._draw_high_beam(surface, (cx, cy), active=lighting.high_beam)
-        self._draw_turn_indicator(surface, (cx + spacing, cy), left=False, active=lighting.right_indicator)
+        cy = self.rect.y + padding // 2 + line_height + max(10, int(self.rect.height * 0.15))
+        return (cx - spacing, cy), (cx, cy), (cx + spacing, cy)
 
-    def draw(self, surface: pygame.Surface, state: StateSnapshot) -> None:
+    def _draw_lighting_status(self, surface: pygame.Surface, state: StateSnapshot) -> None:
+        # Inactive outlines live in the static layer; only lit lamps are drawn per frame.
+        lighting = state.lighting
+        left, beam, right = self._lighting_centers()
+        if lighting.left_indicator:
+            self._draw_turn_indicator(surface, left, left=True, active=True)
+        if lighting.high_beam:
+            self._draw_high_beam(surface, beam, active=True)
+        if lighting.right_indicator:
+            self._draw_turn_indicator(surface, right, left=False, active=True)
+
+    def frame_inputs(self, state: StateSnapshot) -> tuple:
+        env = state.environment
+        return (
+            env.mode,
+            env.fuel_type,
+            f"{env.ethanol_content_pct:02.0f}",
+            env.time.strftime("%H:%M:%S"),
+            f"{env.ambient_temp_f:3.0f}",
+            env.gps_lock,
+            env.rain,
+            state.versions.lighting,
+        )
+
+    def draw_static(self, surface: pygame.Surface) -> None:
         pygame.draw.rect(surface, AMBER_BG, self.rect)
+        left, beam, right = self._lighting_centers()
+        self._draw_turn_indicator(surface, left, left=True, active=False)
+        self._draw_high_beam(surface, beam, active=False)
+        self._draw_turn_indicator(surface, right, left=False, active=False)
+
+    def draw(self, surface: pygame.Surface, state: StateSnapshot) -> None:
         env = state.environment
         padding = max(8, int(self.rect.height * 0.15))
         line_height = max(16, int(self.rect.height * 0.35))
@@ -59,7 +89,7 @@ class HeaderBar(Widget):
             active = mode == env.mode
             size = fit_font_size(mode, int(self.rect.width * 0.1), line_height, start_size=line_height + (5 if active else 0), bold=active)
             color = AMBER_BRIGHT if active else AMBER_DARK
-            mode_surface = font(size, bold=active).render(mode, True, color)
+            mode_surface = render_text(mode, size, color, bold=active)
             surface.blit(mode_surface, (mx, my + (0 if active else 3)))
             mx += mode_surface.get_width() + 8
 
@@ -67,10 +97,10 @@ class HeaderBar(Widget):
         if env.ethanol_content_pct >= 0:
             fuel_text = f"{fuel_text} E{env.ethanol_content_pct:02.0f}"
         fuel_size = fit_font_size(fuel_text, int(self.rect.width * 0.16), line_height, start_size=max(12, int(line_height * 0.7)))
-        fuel_surface = font(fuel_size).render(fuel_text, True, AMBER_GLOW)
+        fuel_surface = render_text(fuel_text, fuel_size, AMBER_GLOW)
         surface.blit(fuel_surface, (self.rect.x + padding, self.rect.y + padding // 2 + line_height))
 
-        time_surface = font(max(14, int(line_height * 0.8))).render(env.time.strftime("%H:%M:%S"), True, AMBER_GLOW)
+        time_surface = render_text(env.time.strftime("%H:%M:%S"), max(14, int(line_height * 0.8)), AMBER_GLOW)
         surface.blit(
             time_surface,
             (
@@ -78,9 +108,9 @@ class HeaderBar(Widget):
                 self.rect.y + padding // 2,
             ),
         )
-        self._draw_lighting_status(surface, state, self.rect.y + padding // 2 + line_height)
+        self._draw_lighting_status(surface, state)
 
-        ambient_surface = font(max(14, int(line_height * 0.7))).render(f"{env.ambient_temp_f:3.0f}F", True, AMBER_BRIGHT)
+        ambient_surface = render_text(f"{env.ambient_temp_f:3.0f}F", max(14, int(line_height * 0.7)), AMBER_BRIGHT)
         surface.blit(
             ambient_surface,
             (
@@ -91,7 +121,7 @@ class HeaderBar(Widget):
 
         gps_text = "GPS" if env.gps_lock else "GPS?"
         gps_color = AMBER_GLOW if env.gps_lock else FAULT_AMBER
-        gps_surface = font(max(14, int(line_height * 0.7))).render(gps_text, True, gps_color)
+        gps_surface = render_text(gps_text, max(14, int(line_height * 0.7)), gps_color)
         surface.blit(
             gps_surface,
             (
@@ -101,7 +131,7 @@ class HeaderBar(Widget):
         )
 
         if env.rain:
-            rain_surface = font(max(14, int(line_height * 0.7))).render("RAIN", True, FAULT_AMBER)
+            rain_surface = render_text("RAIN", max(14, int(line_height * 0.7)), FAULT_AMBER)
             surface.blit(
                 rain_surface,
                 (
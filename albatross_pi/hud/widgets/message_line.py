@@ -4,7 +4,7 @@ from __future__ import annotations
 import pygame
 
 from .base import Widget
-from .ui_utils import AMBER_BG, AMBER_BRIGHT, FAULT_AMBER, fit_font_size, font
+from .ui_utils import AMBER_BG, AMBER_BRIGHT, FAULT_AMBER, fit_font_size, render_text
 from ...state.snapshot import StateSnapshot
 
 
@@ -13,6 +13,9 @@ class MessageLine(Widget):
     def __init__(self, rect: pygame.Rect) -> None:
         self.rect = rect
 
+    def frame_inputs(self, state: StateSnapshot) -> tuple[int, int, str]:
+        return state.versions.faults, state.versions.system, state.environment.message_line
+
     def draw(self, surface: pygame.Surface, state: StateSnapshot) -> None:
         pygame.draw.rect(surface, AMBER_BG, self.rect)
         has_ecu = "ECU STALE" not in state.faults
@@ -33,7 +36,7 @@ class MessageLine(Widget):
             text = state.environment.message_line or " | ".join(state.faults) or comm_line
         color = FAULT_AMBER if (state.system.limp_mode_active or state.faults or "FAULT" in text) else AMBER_BRIGHT
         font_size = fit_font_size(text, self.rect.width - 16, self.rect.height - 4, start_size=max(14, int(self.rect.height * 0.6)))
-        text_surface = font(font_size).render(text, True, color)
+        text_surface = render_text(text, font_size, color)
         surface.blit(
             text_surface,
             (
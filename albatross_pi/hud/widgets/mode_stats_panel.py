@@ -7,10 +7,13 @@ import pygame
 
 from ...economy import fallback_mpg_estimate
 from .base import Widget
-from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, font
+from .glyph_atlas import glyph_atlas
+from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, render_text
 from ...state.snapshot import StateSnapshot
 
 KNOWN_MODES = {"ECO", "NORMAL", "SPORT", "RACE", "ALBATROSS"}
+# Suffixes the stat values use, kept whole in the glyph atlas.
+VALUE_UNITS = ("psi", "deg", "ccm", "mi", "LOCKED")
 
 
 def _fmt(value: float | None, suffix: str = "", precision: int = 0) -> str:
@@ -25,6 +28,10 @@ class ModeStatsPanel(Widget):
     def __init__(self, rect: pygame.Rect) -> None:
         self.rect = rect
 
+    def frame_inputs(self, state: StateSnapshot) -> tuple[str, tuple[tuple[str, str, bool], ...]]:
+        mode = state.environment.mode if state.environment.mode in KNOWN_MODES else "NORMAL"
+        return mode, tuple(self._rows_for_mode(mode, state))
+
     def draw(self, surface: pygame.Surface, state: StateSnapshot) -> None:
         previous_clip = surface.get_clip()
         surface.set_clip(self.rect)
@@ -34,7 +41,7 @@ class ModeStatsPanel(Widget):
         rows = self._rows_for_mode(mode, state)
         title = mode
         title_font = fit_font_size(title, self.rect.width - 2 * padding, max(12, int(self.rect.height * 0.18)), start_size=max(12, int(self.rect.height * 0.16)), bold=True)
-        title_surface = font(title_font, bold=True).render(title, True, AMBER_BRIGHT)
+        title_surface = render_text(title, title_font, AMBER_BRIGHT, bold=True)
         surface.blit(title_surface, (self.rect.x + padding, self.rect.y + max(3, padding // 2)))
 
         y = self.rect.y + max(4, padding // 2) + title_surface.get_height() + 2
@@ -83,10 +90,10 @@ class ModeStatsPanel(Widget):
         value_h = max(8, inner.height - label_h)
         label_size = fit_font_size(label, inner.width, label_h, start_size=max(8, min(12, label_h)), bold=True, min_size=8)
         value_size = fit_font_size(value, inner.width, value_h, start_size=max(8, min(16, value_h + 2)), bold=True, min_size=8)
-        label_surface = font(label_size, bold=True).render(label, True, label_color)
-        value_surface = font(value_size, bold=True).render(value, True, value_color)
+        label_surface = render_text(label, label_size, label_color, bold=True)
+        value_digits = glyph_atlas(value_size, value_color, bold=True, units=VALUE_UNITS)
         surface.blit(label_surface, (inner.x, inner.y))
-        surface.blit(value_surface, (inner.right - value_surface.get_width(), inner.y + label_h - 1))
+        value_digits.draw(surface, value, (inner.right - value_digits.width(value), inner.y + label_h - 1))
 
     def _rows_for_mode(self, mode: str, state: StateSnapshot) -> list[tuple[str, str, bool]]:
         instant_mpg = state.economy.instant_mpg if state.economy.instant_mpg > 0 else fallback_mpg_estimate(state)
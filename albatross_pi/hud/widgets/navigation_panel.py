@@ -9,7 +9,7 @@ import pygame
 from ...navigation import TILE_SIZE, NavigationManager, latlon_to_world_px
 from ...state.snapshot import StateSnapshot
 from .base import Widget
-from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, font
+from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, render_text
 
 
 def _distance_text(distance_m: float) -> str:
@@ -24,6 +24,7 @@ class NavigationPanel(Widget):
         self.navigation = navigation
         self.compact = compact
         self._tile_surfaces: dict[Path, pygame.Surface] = {}
+        self._tint: pygame.Surface | None = None
 
     def draw(self, surface: pygame.Surface, state: StateSnapshot) -> None:
         if self.compact:
@@ -66,7 +67,7 @@ class NavigationPanel(Widget):
             self._draw_route(surface, viewport, location[0], location[1])
             self._draw_waypoints(surface, viewport, location[0], location[1])
             self._draw_bike_marker(surface, viewport)
-            attribution = font(9, bold=True).render("(C) OPENSTREETMAP CONTRIBUTORS", True, AMBER_GLOW)
+            attribution = render_text("(C) OPENSTREETMAP CONTRIBUTORS", 9, AMBER_GLOW, bold=True)
             surface.blit(attribution, (viewport.right - attribution.get_width() - 5, viewport.bottom - attribution.get_height() - 3))
 
         self._draw_header(surface, map_rect)
@@ -96,9 +97,10 @@ class NavigationPanel(Widget):
                     pygame.draw.rect(surface, AMBER_DARK, tile_rect, 1)
                 else:
                     surface.blit(tile, tile_rect.topleft)
-        tint = pygame.Surface(viewport.size, pygame.SRCALPHA)
-        tint.fill((0, 8, 0, 96))
-        surface.blit(tint, viewport.topleft)
+        if self._tint is None or self._tint.get_size() != viewport.size:
+            self._tint = pygame.Surface(viewport.size, pygame.SRCALPHA)
+            self._tint.fill((0, 8, 0, 96))
+        surface.blit(self._tint, viewport.topleft)
         surface.set_clip(previous_clip)
 
     def _load_tile(self, path: Path) -> pygame.Surface | None:
@@ -153,7 +155,7 @@ class NavigationPanel(Widget):
             pygame.draw.circle(surface, (8, 8, 4), (x, y), 8)
             pygame.draw.circle(surface, color, (x, y), 7, 2)
             pygame.draw.line(surface, color, (x, y + 7), (x, y + 15), 2)
-            label = font(10, bold=active).render(waypoint.name[:14], True, color)
+            label = render_text(waypoint.name[:14], 10, color, bold=active)
             surface.blit(label, (x + 10, y - label.get_height() // 2))
         surface.set_clip(previous_clip)
 
@@ -179,7 +181,7 @@ class NavigationPanel(Widget):
                 max_w = max(40, header.width // 3)
                 text = road[:22]
                 sz = fit_font_size(text, max_w, 18, start_size=12, bold=True)
-                road_surface = font(sz, bold=True).render(text, True, AMBER_GLOW)
+                road_surface = render_text(text, sz, AMBER_GLOW, bold=True)
                 surface.blit(road_surface, (header.right - road_surface.get_width() - 8, header.y + 7))
 
     def _draw_safety_strip(self, surface: pygame.Surface, state: StateSnapshot, rect: pygame.Rect) -> None:
@@ -198,7 +200,7 @@ class NavigationPanel(Widget):
 
     def _draw_center_status(self, surface: pygame.Surface, rect: pygame.Rect, text: str) -> None:
         size = fit_font_size(text, rect.width - 24, 30, start_size=18, bold=True)
-        label = font(size, bold=True).render(text, True, AMBER_GLOW)
+        label = render_text(text, size, AMBER_GLOW, bold=True)
         surface.blit(label, (rect.centerx - label.get_width() // 2, rect.centery - label.get_height() // 2))
 
     @staticmethod
@@ -213,5 +215,5 @@ class NavigationPanel(Widget):
         bold: bool = False,
         center_y: bool = False,
     ) -> None:
-        label = font(size, bold=bold).render(text, True, color)
+        label = render_text(text, size, color, bold=bold)
         surface.blit(label, (x, y - label.get_height() // 2 if center_y else y))
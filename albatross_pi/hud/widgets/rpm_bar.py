@@ -4,7 +4,8 @@ from __future__ import annotations
 import pygame
 
 from .base import Widget
-from .ui_utils import AMBER_BRIGHT, AMBER_DARK, FAULT_AMBER, fit_font_size, font
+from .glyph_atlas import glyph_atlas
+from .ui_utils import AMBER_BRIGHT, AMBER_DARK, FAULT_AMBER, fit_font_size, render_text
 from ...state.snapshot import StateSnapshot
 
 
@@ -14,14 +15,39 @@ class RpmBar(Widget):
         self.gauge_max = 14000
         self.red_start = 12500
 
+    def draw_static(self, surface: pygame.Surface) -> None:
+        pygame.draw.rect(surface, AMBER_DARK, self.rect)
+        # Tick markers above bar at 1k increments and red-zone labels.
+        tick_y = self.rect.y - 10
+        for k in range(1, 15):
+            rpm = k * 1000
+            x = self.rect.x + int((rpm / self.gauge_max) * self.rect.width)
+            pygame.draw.line(surface, AMBER_BRIGHT, (x, self.rect.y - 6), (x, self.rect.y - 2), 1)
+            label = f"{k}k"
+            if rpm in (13000, 14000):
+                label = "13k" if rpm == 13000 else "14k"
+            if rpm >= self.red_start:
+                l = render_text(label, 10, FAULT_AMBER, bold=True)
+            else:
+                l = render_text(label, 10, AMBER_BRIGHT)
+            surface.blit(l, (x - l.get_width() // 2, tick_y - l.get_height()))
+        rz_label = render_text("12.5k", 10, FAULT_AMBER, bold=True)
+        rz_label_x = self.rect.x + int((self.red_start / self.gauge_max) * self.rect.width)
+        surface.blit(rz_label, (rz_label_x - rz_label.get_width() // 2, tick_y - rz_label.get_height() - 10))
+
+    def _flash_on(self, rpm: int) -> bool:
+        return rpm >= self.red_start and (pygame.time.get_ticks() // 150) % 2 == 0
+
+    def frame_inputs(self, state: StateSnapshot) -> tuple[int, bool]:
+        return state.engine.rpm, self._flash_on(state.engine.rpm)
+
     def draw(self, surface: pygame.Surface, state: StateSnapshot) -> None:
         engine = state.engine
-        pygame.draw.rect(surface, AMBER_DARK, self.rect)
         pct = min(1.0, engine.rpm / max(1, self.gauge_max))
         fill_width = int(self.rect.width * pct)
         fill_rect = pygame.Rect(self.rect.x, self.rect.y, fill_width, self.rect.height)
         over_red = engine.rpm >= self.red_start
-        color = FAULT_AMBER if over_red and (pygame.time.get_ticks() // 150) % 2 == 0 else AMBER_BRIGHT
+        color = FAULT_AMBER if self._flash_on(engine.rpm) else AMBER_BRIGHT
         pygame.draw.rect(surface, color, fill_rect)
 
         # Red zone segment overlay
@@ -31,33 +57,16 @@ class RpmBar(Widget):
 
         text_size = fit_font_size("RPM 14000", self.rect.width // 2, self.rect.height - 4, start_size=max(18, int(self.rect.height * 0.58)), bold=True)
         rpm_text = f"RPM {engine.rpm:5d}"
+        lit = glyph_atlas(text_size, AMBER_BRIGHT, bold=True)
+        shadowed = glyph_atlas(text_size, (0, 0, 0), bold=True)
         x_cursor = self.rect.x + 10
-        y_text = self.rect.centery - font(text_size, bold=True).get_height() // 2
-        for ch in rpm_text:
-            glyph = font(text_size, bold=True).render(ch, True, AMBER_BRIGHT)
-            cx = x_cursor + glyph.get_width() // 2
-            over_fill = cx <= fill_rect.right
-            glyph = font(text_size, bold=True).render(ch, True, (0, 0, 0) if over_fill else AMBER_BRIGHT)
-            surface.blit(glyph, (x_cursor, y_text))
-            x_cursor += glyph.get_width()
-
-        # Tick markers above bar at 1k increments and red-zone labels.
-        tick_y = self.rect.y - 10
-        for k in range(1, 15):
-            rpm = k * 1000
-            x = self.rect.x + int((rpm / self.gauge_max) * self.rect.width)
-            pygame.draw.line(surface, AMBER_BRIGHT, (x, self.rect.y - 6), (x, self.rect.y - 2), 1)
-            label = f"{k}k"
-            if rpm in (13000, 14000):
-                label = "13k" if rpm == 13000 else "14k"
-            if rpm >= self.red_start:
-                l = font(10, bold=True).render(label, True, FAULT_AMBER)
-            else:
-                l = font(10).render(label, True, AMBER_BRIGHT)
-            surface.blit(l, (x - l.get_width() // 2, tick_y - l.get_height()))
-        rz_label = font(10, bold=True).render("12.5k", True, FAULT_AMBER)
-        rz_label_x = self.rect.x + int((self.red_start / self.gauge_max) * self.rect.width)
-        surface.blit(rz_label, (rz_label_x - rz_label.get_width() // 2, tick_y - rz_label.get_height() - 10))
+        y_text = self.rect.centery - lit.height // 2
+        # Each glyph flips to black once its center is covered by the fill.
+        for (source, area), (shadow_source, shadow_area) in zip(lit.glyphs(rpm_text), shadowed.glyphs(rpm_text)):
+            if x_cursor + area.width // 2 <= fill_rect.right:
+                source, area = shadow_source, shadow_area
+            surface.blit(source, (x_cursor, y_text), area)
+            x_cursor += area.width
 
         if over_red:
             plate_w = min(max(int(self.rect.width * 0.13), 112), int(self.rect.width * 0.22))
@@ -79,7 +88,7 @@ class RpmBar(Widget):
             pygame.draw.rect(surface, FAULT_AMBER, plate, 2)
             label = "REDLINE"
             label_size = fit_font_size(label, plate.width - 16, plate.height - 8, start_size=max(14, int(plate.height * 0.65)), bold=True)
-            label_surface = font(label_size, bold=True).render(label, True, (255, 210, 190))
+            label_surface = render_text(label, label_size, (255, 210, 190), bold=True)
             surface.blit(
                 label_surface,
                 (
@@ -4,7 +4,7 @@ from __future__ import annotations
 import pygame
 
 from .base import Widget
-from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, fit_font_size, font
+from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, fit_font_size, render_text
 from ...state.snapshot import StateSnapshot
 
 
@@ -23,24 +23,47 @@ class TempsGrid(Widget):
             ("WMI Flow", lambda s: f"{s.wmi.actual_flow_cc_min:4.0f}/{s.wmi.commanded_flow_cc_min:4.0f}"),
             ("WMI Stat", lambda s: "FAULT" if s.wmi.fault_active else "OK"),
         ]
+        self._values: list[str] = []
+        self._values_key: tuple[int, int] | None = None
 
-    def draw(self, surface: pygame.Surface, state: StateSnapshot) -> None:
+    def frame_inputs(self, state: StateSnapshot) -> tuple[int, int]:
+        # Rows only read temps and wmi.
+        return state.versions.temps, state.versions.wmi
+
+    def _row_values(self, state: StateSnapshot) -> list[str]:
+        # Reformat only when temps or wmi change.
+        key = self.frame_inputs(state)
+        if key != self._values_key:
+            self._values = [value_fn(state) for _, value_fn in self.rows]
+            self._values_key = key
+        return self._values
+
+    def draw_static(self, surface: pygame.Surface) -> None:
         pygame.draw.rect(surface, AMBER_BG, self.rect)
         pygame.draw.rect(surface, AMBER_DARK, self.rect, 1)
         if self.split:
-            self._draw_split(surface, state)
+            self._draw_split_static(surface)
             return
         row_height = self.rect.height // len(self.rows)
-        for i, (label, value_fn) in enumerate(self.rows):
+        for i, (label, _) in enumerate(self.rows):
             y = self.rect.y + i * row_height
             if i > 0:
                 pygame.draw.line(surface, AMBER_DARK, (self.rect.x, y), (self.rect.right, y), 1)
-            value = value_fn(state)
             label_size = fit_font_size(label, int(self.rect.width * 0.38), row_height - 4, start_size=max(13, int(row_height * 0.6)))
-            value_size = fit_font_size(value, int(self.rect.width * 0.55), row_height - 4, start_size=max(13, int(row_height * 0.62)), bold=True)
-            label_surface = font(label_size).render(label, True, AMBER_GLOW)
-            value_surface = font(value_size, bold=True).render(value, True, AMBER_BRIGHT)
+            label_surface = render_text(label, label_size, AMBER_GLOW)
             surface.blit(label_surface, (self.rect.x + 8, y + max(2, (row_height - label_surface.get_height()) // 2)))
+
+    def draw(self, surface: pygame.Surface, state: StateSnapshot) -> None:
+        # Background, dividers and labels come from draw_static.
+        if self.split:
+            self._draw_split(surface, state)
+            return
+        row_height = self.rect.height // len(self.rows)
+        values = self._row_values(state)
+        for i, value in enumerate(values):
+            y = self.rect.y + i * row_height
+            value_size = fit_font_size(value, int(self.rect.width * 0.55), row_height - 4, start_size=max(13, int(row_height * 0.62)), bold=True)
+            value_surface = render_text(value, value_size, AMBER_BRIGHT, bold=True)
             surface.blit(
                 value_surface,
                 (
@@ -49,27 +72,34 @@ class TempsGrid(Widget):
                 ),
             )
 
-    def _draw_split(self, surface: pygame.Surface, state: StateSnapshot) -> None:
+    def _split_cells(self) -> list[tuple[str, int, int, int, int]]:
+        """``(label, x, y, column_w, row_h)`` per row of the two-column layout."""
+        title_h = min(19, max(15, self.rect.height // 7))
+        body_y = self.rect.y + title_h
+        column_w = self.rect.width // 2
+        row_h = max(1, (self.rect.height - title_h) // 5)
+        return [
+            (label, self.rect.x + (index // 5) * column_w, body_y + (index % 5) * row_h, column_w, row_h)
+            for index, (label, _) in enumerate(self.rows)
+        ]
+
+    def _draw_split_static(self, surface: pygame.Surface) -> None:
         title_h = min(19, max(15, self.rect.height // 7))
         body_y = self.rect.y + title_h
-        body_h = self.rect.height - title_h
         column_w = self.rect.width // 2
-        row_h = max(1, body_h // 5)
-        surface.blit(font(12, bold=True).render("SYSTEM VITALS", True, AMBER_BRIGHT), (self.rect.x + 8, self.rect.y + 2))
+        surface.blit(render_text("SYSTEM VITALS", 12, AMBER_BRIGHT, bold=True), (self.rect.x + 8, self.rect.y + 2))
         pygame.draw.line(surface, AMBER_DARK, (self.rect.x, body_y), (self.rect.right, body_y), 1)
         pygame.draw.line(surface, AMBER_DARK, (self.rect.x + column_w, body_y), (self.rect.x + column_w, self.rect.bottom), 1)
-        for index, (label, value_fn) in enumerate(self.rows):
-            column = index // 5
-            row = index % 5
-            x = self.rect.x + column * column_w
-            y = body_y + row * row_h
-            if row > 0:
+        for index, (label, x, y, column_w, row_h) in enumerate(self._split_cells()):
+            if index % 5 > 0:
                 pygame.draw.line(surface, AMBER_DARK, (x, y), (x + column_w, y), 1)
-            value = value_fn(state)
             label_size = fit_font_size(label, int(column_w * 0.48), row_h - 4, start_size=max(11, int(row_h * 0.56)))
+            label_surface = render_text(label, label_size, AMBER_GLOW)
+            surface.blit(label_surface, (x + 7, y + max(1, (row_h - label_surface.get_height()) // 2)))
+
+    def _draw_split(self, surface: pygame.Surface, state: StateSnapshot) -> None:
+        values = self._row_values(state)
+        for (_, x, y, column_w, row_h), value in zip(self._split_cells(), values):
             value_size = fit_font_size(value, int(column_w * 0.48), row_h - 4, start_size=max(11, int(row_h * 0.58)), bold=True)
-            label_surface = font(label_size).render(label, True, AMBER_GLOW)
-            value_surface = font(value_size, bold=True).render(value, True, AMBER_BRIGHT)
-            text_y = y + max(1, (row_h - max(label_surface.get_height(), value_surface.get_height())) // 2)
-            surface.blit(label_surface, (x + 7, text_y))
-            surface.blit(value_surface, (x + column_w - value_surface.get_width() - 7, text_y))
+            value_surface = render_text(value, value_size, AMBER_BRIGHT, bold=True)
+            surface.blit(value_surface, (x + column_w - value_surface.get_width() - 7, y + max(1, (row_h - value_surface.get_height()) // 2)))
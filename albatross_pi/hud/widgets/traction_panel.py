@@ -4,7 +4,7 @@ from __future__ import annotations
 import pygame
 
 from .base import Widget
-from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, font
+from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, render_text
 from ...state.snapshot import StateSnapshot
 
 
@@ -12,6 +12,9 @@ class TractionPanel(Widget):
     def __init__(self, rect: pygame.Rect) -> None:
         self.rect = rect
 
+    def frame_inputs(self, state: StateSnapshot) -> int:
+        return state.versions.traction
+
     def draw(self, surface: pygame.Surface, state: StateSnapshot) -> None:
         previous_clip = surface.get_clip()
         surface.set_clip(self.rect)
@@ -58,12 +61,12 @@ class TractionPanel(Widget):
     @staticmethod
     def _fit(text: str, max_w: int, max_h: int, start_size: int, color: tuple[int, int, int] | list[int]) -> pygame.Surface:
         size = fit_font_size(text, max_w, max_h, start_size=start_size, bold=True)
-        return font(size, bold=True).render(text, True, color)
+        return render_text(text, size, color, bold=True)
 
     @staticmethod
     def _draw_metric(surface: pygame.Surface, rect: pygame.Rect, text: str, hot: bool) -> None:
         size = fit_font_size(text, rect.width, rect.height, start_size=max(8, min(15, rect.height)), bold=True)
-        rendered = font(size, bold=True).render(text, True, FAULT_AMBER if hot else AMBER_GLOW)
+        rendered = render_text(text, size, FAULT_AMBER if hot else AMBER_GLOW, bold=True)
         surface.blit(
             rendered,
             (
@@ -1,6 +1,8 @@
 """Shared HUD theme and text fitting utilities."""
 from __future__ import annotations
 
+from collections import OrderedDict
+
 import pygame
 
 THEME_FONT_PREFERRED = (
@@ -25,6 +27,8 @@ AMBER_GLOW: Color = [255, 180, 90]
 FAULT_AMBER: Color = [255, 98, 0]
 
 _FONT_CACHE: dict[tuple[int, bool], pygame.font.Font] = {}
+# Static labels plus a few frames of changing values for every widget fit well inside this bound.
+TEXT_CACHE_MAX_ENTRIES = 1024
 
 
 def font(size: int, *, bold: bool = False) -> pygame.font.Font:
@@ -39,17 +43,96 @@ def font(size: int, *, bold: bool = False) -> pygame.font.Font:
     return cached
 
 
+class TextSurfaceCache:
+    """LRU cache of rendered text surfaces keyed by (text, size, bold, color, antialias).
+
+    Returned surfaces are shared between callers and must only be blitted,
+    never drawn on.
+    """
+
+    def __init__(self, max_entries: int = TEXT_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def render(self, text: str, size: int, color, *, bold: bool = False, antialias: bool = True) -> pygame.Surface:
+        size = max(8, size)
+        key = (text, size, bold, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = font(size, bold=bold).render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self._surfaces), "hits": self.hits, "misses": self.misses}
+
+
+_TEXT_CACHE = TextSurfaceCache()
+_ACTIVE_THEME: str | None = None
+
+
+def render_text(text: str, size: int, color, *, bold: bool = False, antialias: bool = True) -> pygame.Surface:
+    return _TEXT_CACHE.render(text, size, color, bold=bold, antialias=antialias)
+
+
+def text_cache_stats() -> dict[str, int]:
+    return _TEXT_CACHE.stats()
+
+
+_FIT_CACHE: dict[tuple[str, int, int, int, bool, int], int] = {}
+# Fitted sizes depend only on font metrics; changing values churn this, so it is simply reset when full.
+FIT_CACHE_MAX_ENTRIES = 4096
+
+
+def _text_fits(text: str, size: int, bold: bool, max_w: int, max_h: int) -> bool:
+    width, height = font(size, bold=bold).size(text)
+    return width <= max_w and height <= max_h
+
+
 def fit_font_size(text: str, max_w: int, max_h: int, *, start_size: int, bold: bool = False, min_size: int = 8) -> int:
-    size = max(min_size, start_size)
-    while size > min_size:
-        rendered = font(size, bold=bold).render(text, True, (255, 255, 255))
-        if rendered.get_width() <= max_w and rendered.get_height() <= max_h:
-            return size
-        size -= 1
-    return min_size
+    """Largest size in (min_size, start_size] whose metrics fit the box, else ``min_size``."""
+    key = (text, max_w, max_h, start_size, bold, min_size)
+    cached = _FIT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    # Most boxes are laid out for their start size, so try that before searching.
+    top = max(min_size, start_size)
+    if top > min_size and _text_fits(text, top, bold, max_w, max_h):
+        size = top
+    else:
+        # Text extent grows with point size, so binary-search the metrics instead of rasterizing each size.
+        size = min_size
+        low, high = min_size + 1, top - 1
+        while low <= high:
+            mid = (low + high) // 2
+            if _text_fits(text, mid, bold, max_w, max_h):
+                size = mid
+                low = mid + 1
+            else:
+                high = mid - 1
+    if len(_FIT_CACHE) >= FIT_CACHE_MAX_ENTRIES:
+        _FIT_CACHE.clear()
+    _FIT_CACHE[key] = size
+    return size
 
 
 def apply_theme(theme: str) -> None:
+    global _ACTIVE_THEME
+    # Called every frame; only a real palette change may flush the text cache.
+    if theme == _ACTIVE_THEME:
+        return
+    _ACTIVE_THEME = theme
     if theme == "NIGHT OPS":
         bg, dark, mid, bright, glow, fault = [1, 7, 10], [5, 26, 29], [22, 74, 72], [132, 245, 214], [58, 134, 130], [255, 92, 72]
     elif theme == "NIGHT":
@@ -64,3 +147,5 @@ def apply_theme(theme: str) -> None:
     AMBER_BRIGHT[:] = bright
     AMBER_GLOW[:] = glow
     FAULT_AMBER[:] = fault
+    # Cached surfaces carry the old palette colors.
+    _TEXT_CACHE.clear()
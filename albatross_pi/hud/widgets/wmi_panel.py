@@ -4,7 +4,7 @@ from __future__ import annotations
 import pygame
 
 from .base import Widget
-from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, font
+from .ui_utils import AMBER_BG, AMBER_BRIGHT, AMBER_DARK, AMBER_GLOW, FAULT_AMBER, fit_font_size, render_text
 from ...state.snapshot import StateSnapshot
 
 BAR_BG = AMBER_DARK
@@ -32,7 +32,7 @@ class WMIPanel(Widget):
 
         level_text = f"Tank {state.wmi.tank_level_pct:4.0f}%"
         level_font = fit_font_size(level_text, self.rect.width - (2 * padding), max(12, int(self.rect.height * 0.3)), start_size=max(14, int(self.rect.height * 0.28)))
-        level_surface = font(level_font).render(level_text, True, AMBER_GLOW)
+        level_surface = render_text(level_text, level_font, AMBER_GLOW)
         surface.blit(
             level_surface,
             (
@@ -43,7 +43,7 @@ class WMIPanel(Widget):
 
         flow_text = f"Flow {state.wmi.actual_flow_cc_min:4.0f}/{state.wmi.commanded_flow_cc_min:4.0f}"
         flow_font = fit_font_size(flow_text, self.rect.width - (2 * padding), max(12, int(self.rect.height * 0.3)), start_size=max(14, int(self.rect.height * 0.26)))
-        flow_surface = font(flow_font).render(flow_text, True, AMBER_BRIGHT)
+        flow_surface = render_text(flow_text, flow_font, AMBER_BRIGHT)
         surface.blit(
             flow_surface,
             (
@@ -54,7 +54,7 @@ class WMIPanel(Widget):
 
         if state.wmi.fault_active:
             fault_font = fit_font_size("FAULT", self.rect.width // 3, max(12, int(self.rect.height * 0.3)), start_size=max(14, int(self.rect.height * 0.28)), bold=True)
-            fault_surface = font(fault_font, bold=True).render("FAULT", True, FAULT_AMBER)
+            fault_surface = render_text("FAULT", fault_font, FAULT_AMBER, bold=True)
             surface.blit(
                 fault_surface,
                 (
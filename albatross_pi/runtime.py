@@ -45,8 +45,8 @@ class SystemdNotifier:
             LOGGER.debug("systemd notify failed: %s", exc)
             return False
 
-    def ready(self) -> None:
-        self.notify("READY=1\nSTATUS=HUD render loop started")
+    def ready(self, status: str = "HUD render loop started") -> None:
+        self.notify(f"READY=1\nSTATUS={status}")
 
     def watchdog(self) -> None:
         now = time.monotonic()
@@ -0,0 +1,18 @@
+"""Engine safety supervision, in-process or as a standalone process."""
+
+from .ipc import DEFAULT_SAFETY_ADDRESS, SafetyDecisionListener, SafetyDecisionSender
+from .rules import FAULT_RULES, FaultRule, FaultRuleEngine, Trigger
+from .supervisor import SafetyDecision, SafetyLoop, SafetySupervisor
+
+__all__ = [
+    "DEFAULT_SAFETY_ADDRESS",
+    "FAULT_RULES",
+    "FaultRule",
+    "FaultRuleEngine",
+    "SafetyDecision",
+    "SafetyDecisionListener",
+    "SafetyDecisionSender",
+    "SafetyLoop",
+    "SafetySupervisor",
+    "Trigger",
+]
@@ -0,0 +1,90 @@
+"""Standalone safety supervisor process.
+
+Opens its own SocketCAN socket, decodes the bus into a private aggregator and
+runs ``SafetySupervisor`` at a fixed rate, transmitting fail-safe frames
+itself. Decisions go to the HUD over the ``--ipc`` datagram socket and every
+tick pets the systemd watchdog, so a hung supervisor is restarted even while
+the HUD keeps rendering::
+
+    python -m albatross_pi.safety --can-interface can0 --rate-hz 50
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import signal
+import sys
+
+from ..canbus.decode import CANStateAggregator, handled_arbitration_ids
+from ..canbus.iface import RawSocketCANInterface, SocketCANInterface
+from ..canbus.tx_scheduler import CANTransmitScheduler
+from ..runtime import SystemdNotifier
+from .ipc import DEFAULT_SAFETY_ADDRESS, SafetyDecisionSender
+from .supervisor import SAFETY_RATE_HZ, SafetyLoop, SafetySupervisor
+
+LOGGER = logging.getLogger("albatross_pi.safety")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the Albatross engine safety supervisor")
+    parser.add_argument("--can-interface", default="can0", help="SocketCAN interface name (default: can0)")
+    parser.add_argument("--can-bitrate", type=int, help="Bitrate hint for SocketCAN setup")
+    parser.add_argument("--can-backend", choices=("python-can", "raw"), default="raw", help="SocketCAN receive engine")
+    parser.add_argument("--rate-hz", type=float, default=SAFETY_RATE_HZ, help="supervisor tick rate (50-100 Hz)")
+    parser.add_argument("--ipc", default=DEFAULT_SAFETY_ADDRESS, help="HUD decision socket path, or @name for an abstract socket")
+    parser.add_argument("--log-level", default="INFO", help="Python logging level")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper(), logging.INFO),
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+
+    aggregator = CANStateAggregator(bitrate=args.can_bitrate)
+    interface_cls = RawSocketCANInterface if args.can_backend == "raw" else SocketCANInterface
+    # A separate socket on the same interface also receives the HUD's transmits
+    # (mode, fuel, flame), so this aggregator tracks them without any IPC.
+    can_interface = interface_cls(
+        channel=args.can_interface,
+        bitrate=args.can_bitrate,
+        rx_batch_callback=aggregator.apply_frames,
+        rx_ids=handled_arbitration_ids(),
+    )
+    try:
+        can_interface.start()
+    except RuntimeError as exc:
+        LOGGER.error("Unable to start CAN interface: %s", exc)
+        sys.exit(1)
+    tx_scheduler = CANTransmitScheduler(can_interface.send, on_sent=aggregator.mark_sent_frame)
+    tx_scheduler.start()
+    sender = SafetyDecisionSender(args.ipc)
+    notifier = SystemdNotifier()
+    loop = SafetyLoop(
+        SafetySupervisor(tx_scheduler.submit),
+        aggregator,
+        rate_hz=args.rate_hz,
+        on_decision=sender.send,
+        heartbeat=notifier.watchdog,
+    )
+
+    def _shutdown_handler(*_: object) -> None:
+        loop.stop()
+
+    signal.signal(signal.SIGINT, _shutdown_handler)
+    signal.signal(signal.SIGTERM, _shutdown_handler)
+
+    try:
+        notifier.ready("safety supervisor running")
+        loop.run()
+    finally:
+        notifier.stopping()
+        tx_scheduler.stop()
+        can_interface.stop()
+        sender.close()
+        LOGGER.info(
+            "Safety supervisor stopped after %d ticks (%d overruns, %d failed)", loop.ticks, loop.overruns, loop.failures
+        )
+
+
+if __name__ == "__main__":
+    main()
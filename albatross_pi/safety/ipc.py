@@ -0,0 +1,154 @@
+"""Unix datagram channel carrying safety decisions from the supervisor process to the HUD."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from dataclasses import asdict
+from typing import Callable, Optional
+
+from .supervisor import SAFETY_LINK_STALE, SafetyDecision
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SAFETY_ADDRESS = "@albatross-safety"
+
+
+def _socket_address(address: str) -> str | bytes:
+    """``@name`` selects the Linux abstract namespace, as ``NOTIFY_SOCKET`` does."""
+    if address.startswith("@"):
+        return b"\0" + address[1:].encode("utf-8")
+    return address
+
+
+def encode_decision(decision: SafetyDecision) -> bytes:
+    return json.dumps(asdict(decision), separators=(",", ":")).encode("utf-8")
+
+
+def decode_decision(data: bytes) -> SafetyDecision:
+    payload = json.loads(data.decode("utf-8"))
+    payload["faults"] = tuple(str(fault) for fault in payload.get("faults", ()))
+    return SafetyDecision(**payload)
+
+
+class SafetyDecisionSender:
+    """Send decisions to the HUD when they change, and at ``heartbeat_s`` otherwise.
+
+    Sends never block; while the HUD is not listening they are dropped.
+    """
+
+    def __init__(self, address: str = DEFAULT_SAFETY_ADDRESS, heartbeat_s: float = 0.1) -> None:
+        self.address = address
+        self.heartbeat_s = heartbeat_s
+        self.sent = 0
+        self._target = _socket_address(address)
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+        self._last: Optional[SafetyDecision] = None
+        self._last_sent_s = 0.0
+
+    def send(self, decision: SafetyDecision) -> None:
+        now = time.monotonic()
+        if decision == self._last and (now - self._last_sent_s) < self.heartbeat_s:
+            return
+        try:
+            self._socket.sendto(encode_decision(decision), self._target)
+        except OSError as exc:
+            LOGGER.debug("Safety decision not delivered to %s: %s", self.address, exc)
+        else:
+            self.sent += 1
+        self._last = decision
+        self._last_sent_s = now
+
+    def close(self) -> None:
+        self._socket.close()
+
+
+class SafetyDecisionListener:
+    """HUD side of the channel: keeps the newest decision from the supervisor process.
+
+    ``current`` returns ``None`` during ``startup_grace_s`` while the
+    supervisor comes up. After that, a link silent for ``stale_after_s``
+    reports a ``SAFETY LINK STALE`` decision instead of the last one received,
+    so a dead supervisor is visible on the HUD.
+    """
+
+    def __init__(
+        self,
+        address: str = DEFAULT_SAFETY_ADDRESS,
+        *,
+        stale_after_s: float = 0.5,
+        startup_grace_s: float = 5.0,
+        on_decision: Optional[Callable[[SafetyDecision], None]] = None,
+    ) -> None:
+        self.address = address
+        self.stale_after_s = stale_after_s
+        self.startup_grace_s = startup_grace_s
+        self.on_decision = on_decision
+        self.received = 0
+        self._decision: Optional[SafetyDecision] = None
+        self._received_s = 0.0
+        self._started_s = 0.0
+        self._socket: Optional[socket.socket] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        target = _socket_address(self.address)
+        if isinstance(target, str) and os.path.exists(target):
+            os.unlink(target)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(target)
+        sock.settimeout(0.1)
+        self._socket = sock
+        self._started_s = time.monotonic()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="safety-ipc", daemon=True)
+        self._thread.start()
+        LOGGER.info("Listening for safety supervisor decisions on %s", self.address)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+            target = _socket_address(self.address)
+            if isinstance(target, str) and os.path.exists(target):
+                os.unlink(target)
+
+    def current(self) -> Optional[SafetyDecision]:
+        now = time.monotonic()
+        if self._decision is not None and (now - self._received_s) <= self.stale_after_s:
+            return self._decision
+        if now - self._started_s < self.startup_grace_s:
+            return None
+        return SafetyDecision(faults=(SAFETY_LINK_STALE,))
+
+    def _run(self) -> None:
+        assert self._socket is not None
+        while not self._stop_event.is_set():
+            try:
+                data = self._socket.recv(4096)
+            except socket.timeout:
+                continue
+            except OSError as exc:
+                LOGGER.error("Safety decision channel failed: %s", exc)
+                return
+            try:
+                decision = decode_decision(data)
+            except (ValueError, TypeError) as exc:
+                LOGGER.warning("Ignoring malformed safety decision: %s", exc)
+                continue
+            self._decision = decision
+            self._received_s = time.monotonic()
+            self.received += 1
+            if self.on_decision:
+                self.on_decision(decision)
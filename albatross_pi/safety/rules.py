@@ -0,0 +1,411 @@
+"""Declarative fault rules, compiled into a single evaluator.
+
+Every runtime fault the HUD shows and the safety supervisor acts on is one
+``FaultRule`` in ``FAULT_RULES``. A rule fires when any of its triggers has
+held for its ``hold_s``. Trigger conditions are Python expressions over the
+names bound in ``_PRELUDE`` (snapshot sections, source ages and derived
+values such as ``in_drive``). ``FaultRuleEngine`` turns the whole table into
+one generated function, so a tick costs one call with straight-line
+comparisons and no per-rule dispatch.
+
+Triggers carry the thresholds of the supervisor and the HUD checks they
+replace. Supervisor triggers are the fail-safe ones. HUD triggers are marked
+``display_only``: the HUD ORs them into what it shows, but the supervisor
+engine never compiles them, so they cannot change limp, limp reason,
+shutdown or run-switch decisions. A HUD check is dropped, with a note on its
+rule, only where the supervisor trigger always fires first.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+from ..state.snapshot import StateSnapshot
+
+SEVERE = "severe"
+WARNING = "warning"
+
+# The wastegate check compares duty/boost deltas over this interval, independent of the tick rate.
+WASTEGATE_SAMPLE_S = 0.2
+
+# Limp reasons in priority order; the first reason with an active fault wins.
+LIMP_REASON_ORDER = (
+    "ECU CAN STALE",
+    "CONTROL LINK STALE",
+    "LOW OIL PRESS",
+    "THERMAL",
+    "BATTERY VOLTAGE",
+    "KNOCK",
+    "OVERBOOST",
+    "WMI FAULT",
+    "CLUTCH SLIP",
+)
+DEFAULT_LIMP_REASON = "SAFETY SUPERVISOR"
+RETRO_ERROR_BEEP = "__retro_error_beep__"
+
+
+@dataclass(frozen=True, slots=True)
+class Trigger:
+    """One way for a fault to become active: ``when`` must hold for ``hold_s`` seconds.
+
+    ``display_only`` triggers are shown by the HUD but ignored by the supervisor.
+    """
+
+    when: str
+    hold_s: float = 0.0
+    display_only: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class FaultRule:
+    name: str
+    triggers: tuple[Trigger, ...]
+    severity: str = WARNING
+    limp_reason: str = ""
+    audio_cue: Optional[str] = None
+
+
+def _rule(name: str, *triggers: Trigger | str, **options: str) -> FaultRule:
+    return FaultRule(name, tuple(t if isinstance(t, Trigger) else Trigger(t) for t in triggers), **options)
+
+
+def _hud(when: str, hold_s: float = 0.0) -> Trigger:
+    return Trigger(when, hold_s, display_only=True)
+
+
+FAULT_RULES: tuple[FaultRule, ...] = (
+    # The HUD flagged stale sources after 1.5 s; the supervisor's 0.5 s always fires first.
+    _rule(
+        "ECU STALE",
+        "ecu_age_s > 0.5",
+        "engine.throttle_pct > 15 and engine.rpm < 300",
+        severity=SEVERE,
+        limp_reason="ECU CAN STALE",
+        audio_cue="ECU-STALE.wav",
+    ),
+    _rule("CAN STALE", "controller_age_s > 0.5", severity=SEVERE, limp_reason="CONTROL LINK STALE", audio_cue="CAN-STALE.wav"),
+    _rule(
+        "SPEED SENSOR",
+        'engine.rpm > 0 and engine.speed_mph == 0 and engine.gear not in ("N", "?")',
+        _hud("traction.sensor_fault"),
+        _hud("engine.rpm > 2800 and engine.throttle_pct > 25 and in_drive and engine.speed_mph < 2.0", 1.0),
+        audio_cue="SPEED-SENSOR.wav",
+    ),
+    _rule(
+        "GEAR SENSOR",
+        'engine.gear not in ("N", "1", "2", "3", "4", "5", "6", "?")',
+        _hud('engine.gear == "?"'),
+        audio_cue="GEAR-SENSOR.wav",
+    ),
+    # Clutch slip is computed controller-side from predicted vs observed RPM:MPH ratio.
+    # Ratios are currently placeholders until measured drivetrain ratios are provided.
+    _rule(
+        "CLUTCH SLIP",
+        'clutch.slip_pct >= 8.0 and engine.gear not in ("N", "?") and engine.speed_mph > 5.0',
+        'clutch.severity in ("MODERATE", "SEVERE") and engine.gear not in ("N", "?")',
+        _hud('clutch.slip_pct >= 25 or clutch.severity in ("MODERATE", "SEVERE")'),
+        severity=SEVERE,
+        limp_reason="CLUTCH SLIP",
+        audio_cue="CLUTCH-SLIP.wav",
+    ),
+    _rule(
+        "LOW OIL PRESS",
+        "temps.oil_pressure_psi < 12 and engine.rpm > 2000",
+        _hud("temps.oil_pressure_psi < 12 and engine.rpm > 1800"),
+        severity=SEVERE,
+        limp_reason="LOW OIL PRESS",
+        audio_cue="LOW-OIL-PRESS.wav",
+    ),
+    # The supervisor's trigger also starts the shutdown escalation; the HUD's covers 1200-2200 rpm.
+    _rule(
+        "CRITICAL OIL PRESS",
+        "temps.oil_pressure_psi < 8 and engine.rpm > 2200",
+        _hud("temps.oil_pressure_psi < 5 and engine.rpm > 1200"),
+        limp_reason="LOW OIL PRESS",
+        audio_cue="your_engine_oil_pressure_is_critical_engine_damage_may_occur.wav",
+    ),
+    _rule(
+        "COOLANT HOT",
+        "temps.coolant_temp_f > 240",
+        _hud("temps.coolant_temp_f > 235"),
+        severity=SEVERE,
+        limp_reason="THERMAL",
+        audio_cue="your_engine_is_overheating_prompt_service_is_required.wav",
+    ),
+    _rule(
+        "EGT HIGH",
+        "temps.exhaust_temp_f > 1650",
+        _hud("temps.exhaust_temp_f > 1600"),
+        severity=SEVERE,
+        limp_reason="THERMAL",
+        audio_cue="EGT-HIGH.wav",
+    ),
+    # The HUD warned above 155 F; the supervisor's 150 F always fires first.
+    _rule("INTAKE AIR HOT", "temps.intake_temp_f > 150", limp_reason="THERMAL", audio_cue="INTAKE-AIR-HOT.wav"),
+    _rule(
+        "BATTERY LOW",
+        "0.0 < temps.battery_voltage < 11.2",
+        _hud("0.0 < temps.battery_voltage < 11.8 and engine.rpm > 900"),
+        limp_reason="BATTERY VOLTAGE",
+        audio_cue="BATTERY-LOW.wav",
+    ),
+    _rule(
+        "BATTERY HIGH",
+        "temps.battery_voltage > 15.4",
+        _hud("temps.battery_voltage > 15.2"),
+        limp_reason="BATTERY VOLTAGE",
+        audio_cue="BATTERY-HIGH.wav",
+    ),
+    _rule(
+        "CYL EGT BOOST MISMATCH",
+        "engine.boost_psi > 10.0 and engine.rpm > 3000 and temps.exhaust_temp_f > 1400"
+        " and abs(engine.boost_psi - temps.exhaust_temp_f / 100.0) > 9.0",
+        _hud(
+            "high_load and engine.rpm > 4000 and temps.exhaust_temp_f > 1500"
+            " and engine.target_boost_psi > 6.0 and engine.boost_psi < 2.0",
+            1.0,
+        ),
+        audio_cue="CYL-EGT-BOOST-MISMATCH.wav",
+    ),
+    _rule(
+        "CYL BOOST MISMATCH",
+        Trigger(
+            "boost_split and engine.throttle_pct > 35 and engine.rpm > 3000"
+            " and (engine.target_boost_psi > 4.0 or engine.boost_psi > 4.0)",
+            0.6,
+        ),
+        _hud(
+            "boost_split and high_load and engine.rpm > 3000"
+            " and (engine.target_boost_psi > 4.0 or engine.boost_psi > 4.0)",
+            0.6,
+        ),
+        audio_cue="CYL-EGT-BOOST-MISMATCH.wav",
+    ),
+    _rule(
+        "CYL EGT MISMATCH",
+        Trigger("egt_split and engine.throttle_pct > 35 and engine.rpm > 3000", 0.8),
+        _hud("egt_split and high_load and engine.rpm > 3000", 0.8),
+        audio_cue="CYL-EGT-BOOST-MISMATCH.wav",
+    ),
+    _rule(
+        "CYL AFR MISMATCH",
+        Trigger("afr_split and engine.throttle_pct > 30 and engine.rpm > 2500", 0.8),
+        _hud("afr_split and high_load and engine.rpm > 2500", 0.8),
+        audio_cue="CYL-EGT-BOOST-MISMATCH.wav",
+    ),
+    # The HUD also required at least 1 psi over target; the supervisor's trigger covers it.
+    _rule("OVERBOOST", "engine.boost_psi > engine.target_boost_psi + 3.0", limp_reason="OVERBOOST", audio_cue="OVERBOOST.wav"),
+    _rule("KNOCK", "engine.knock_events >= 3", limp_reason="KNOCK", audio_cue=RETRO_ERROR_BEEP),
+    _rule("KNOCK ESCALATE", _hud("engine.knock_events >= 2"), limp_reason="KNOCK", audio_cue="KNOCK-ESCALATE.wav"),
+    _rule(
+        "LOW FUEL",
+        "env.fuel_level_pct <= 5",
+        _hud("0.0 <= env.fuel_level_pct <= 12"),
+        audio_cue="please_check_your_fuel_level.wav",
+    ),
+    _rule(
+        "AIR SHOT LOW",
+        "0.0 < air.pressure_psi < 35",
+        _hud("air.pressure_psi < 35 and (air.is_firing or engine.target_boost_psi > 6)"),
+        audio_cue="AIR-SHOT-LOW.wav",
+    ),
+    _rule("WMI PUMP FAULT", "wmi.fault_active", limp_reason="WMI FAULT", audio_cue="WMI-PUMP-FAULT.wav"),
+    _rule(
+        "WMI TANK EMPTY",
+        "0.0 <= wmi.tank_level_pct < 3",
+        _hud("wmi.tank_level_pct <= 5 and (wmi.commanded_flow_cc_min > 0 or engine.target_boost_psi > 6)"),
+        audio_cue="WMI-TANK-EMPTY.wav",
+    ),
+    # The HUD's held check only counted commands of 100 cc/min and up; the supervisor's covers it.
+    _rule(
+        "WMI FLOW LOW",
+        Trigger("wmi_flow_short", 0.25),
+        _hud("wmi.fault_active"),
+        limp_reason="WMI FAULT",
+        audio_cue="WMI-FLOW-LOW.wav",
+    ),
+    _rule("WMI PRESSURE LOW", Trigger("wmi_flow_short", 0.25), limp_reason="WMI FAULT", audio_cue="WMI-PRESSURE-LOW.wav"),
+    _rule(
+        "BOOST CONTROL ERROR",
+        Trigger("engine.target_boost_psi >= 8.0 and engine.throttle_pct > 35 and boost_error > 4.0", 0.75),
+        _hud("engine.target_boost_psi >= 4.0 and high_load and engine.rpm >= 3000 and boost_error > 4.0", 1.5),
+        limp_reason="OVERBOOST",
+        audio_cue="BOOST-CONTROL-ERROR.wav",
+    ),
+    _rule(
+        "WASTEGATE STUCK",
+        Trigger("engine.throttle_pct > 35 and engine.target_boost_psi >= 8.0 and wastegate_step >= 8.0 and boost_step < 0.4", 1.0),
+        _hud("(engine.target_boost_psi <= 2.0 or engine.throttle_pct < 20) and engine.boost_psi > 5.0", 1.0),
+        audio_cue="WASTEGATE-STUCK.wav",
+    ),
+    _rule(
+        "SLOW TURBO SPOOL",
+        _hud(
+            "engine.target_boost_psi >= 6.0 and high_load and engine.rpm >= 3500 and in_drive"
+            " and engine.wastegate_duty_pct >= 50"
+            " and engine.boost_psi < max(engine.target_boost_psi * 0.55, engine.target_boost_psi - 5.0)",
+            2.0,
+        ),
+        audio_cue="SLOW-TURBO-SPOOL.wav",
+    ),
+    _rule(
+        "SENSOR RANGE FAULT",
+        _hud(
+            "not all(isfinite(value) for value in sensor_values)"
+            " or not 0 <= engine.throttle_pct <= 100 or not 0 <= engine.engine_load_pct <= 100"
+            " or temps.battery_voltage > 18 or (temps.battery_voltage < -0.1 and temps.battery_voltage != -1)"
+            " or temps.oil_pressure_psi < -1 or not 0 <= wmi.tank_level_pct <= 100"
+            " or wmi.actual_flow_cc_min < 0 or wmi.commanded_flow_cc_min < 0"
+        ),
+        audio_cue="SENSOR-RANGE-FAULT.wav",
+    ),
+)
+
+# Names bound before the rule conditions run; conditions may use any of them.
+_PRELUDE = """\
+engine = snapshot.engine
+temps = snapshot.temps
+wmi = snapshot.wmi
+air = snapshot.air_shot
+env = snapshot.environment
+clutch = snapshot.clutch
+traction = snapshot.traction
+gear = str(engine.gear).upper()
+in_drive = gear not in ("N", "?", "")
+high_load = engine.throttle_pct > 55 or engine.engine_load_pct > 60
+boost_error = abs(engine.boost_psi - engine.target_boost_psi)
+boost_split = engine.boost_left_psi >= 0.0 and engine.boost_right_psi >= 0.0 and abs(engine.boost_left_psi - engine.boost_right_psi) >= 3.0
+egt_split = temps.exhaust_left_temp_f >= 0.0 and temps.exhaust_right_temp_f >= 0.0 and abs(temps.exhaust_left_temp_f - temps.exhaust_right_temp_f) >= 150.0
+afr_split = engine.afr_left > 0.0 and engine.afr_right > 0.0 and abs(engine.afr_left - engine.afr_right) >= 0.8
+wmi_flow_short = wmi.commanded_flow_cc_min > 0 and wmi.actual_flow_cc_min < 0.6 * wmi.commanded_flow_cc_min
+sensor_values = (
+    engine.boost_psi, engine.boost_left_psi, engine.boost_right_psi, engine.target_boost_psi,
+    engine.throttle_pct, engine.engine_load_pct, temps.coolant_temp_f, temps.oil_temp_f,
+    temps.oil_pressure_psi, temps.battery_voltage, temps.intake_temp_f, temps.exhaust_temp_f,
+    temps.exhaust_left_temp_f, temps.exhaust_right_temp_f, wmi.tank_level_pct,
+    wmi.commanded_flow_cc_min, wmi.actual_flow_cc_min,
+)
+"""
+
+# evaluate(snapshot, now_s, ecu_age_s, controller_age_s, wastegate_step, boost_step, since) -> active names
+_Evaluator = Callable[[StateSnapshot, float, float, float, float, float, list], list]
+
+
+def _compile_rules(rules: Iterable[FaultRule], display: bool) -> tuple[_Evaluator, int]:
+    """Generate one function evaluating every trigger; ``since`` holds one start time per held trigger.
+
+    ``display_only`` triggers are left out unless ``display`` is set.
+    """
+    lines = [
+        "def evaluate(snapshot, now_s, ecu_age_s, controller_age_s, wastegate_step, boost_step, since):",
+        *("    " + line for line in _PRELUDE.splitlines()),
+        "    active = []",
+    ]
+    held = 0
+    for rule in rules:
+        for trigger in rule.triggers:
+            if trigger.display_only and not display:
+                continue
+            condition = " ".join(trigger.when.split())
+            if trigger.hold_s <= 0:
+                lines.append(f"    if {condition}:")
+                lines.append(f"        active.append({rule.name!r})")
+                continue
+            lines += [
+                f"    if {condition}:",
+                f"        if since[{held}] is None:",
+                f"            since[{held}] = now_s",
+                f"        if now_s - since[{held}] >= {trigger.hold_s!r}:",
+                f"            active.append({rule.name!r})",
+                "    else:",
+                f"        since[{held}] = None",
+            ]
+            held += 1
+    lines.append("    return active")
+    namespace: dict[str, object] = {"isfinite": math.isfinite}
+    exec("\n".join(lines), namespace)  # noqa: S102 - source is built from the static rule table
+    return namespace["evaluate"], held  # type: ignore[return-value]
+
+
+_RULES_BY_NAME = {rule.name: rule for rule in FAULT_RULES}
+SEVERE_FAULTS = frozenset(rule.name for rule in FAULT_RULES if rule.severity == SEVERE)
+FAULT_AUDIO_CUES = {rule.name: rule.audio_cue for rule in FAULT_RULES if rule.audio_cue}
+
+
+def display_only_rules(rules: Iterable[FaultRule] = FAULT_RULES) -> tuple[FaultRule, ...]:
+    """``rules`` reduced to their ``display_only`` triggers, for OR-ing into a supervisor decision."""
+    reduced = []
+    for rule in rules:
+        triggers = tuple(trigger for trigger in rule.triggers if trigger.display_only)
+        if triggers:
+            reduced.append(FaultRule(rule.name, triggers, rule.severity, rule.limp_reason, rule.audio_cue))
+    return tuple(reduced)
+
+
+def limp_reason_for(faults: Iterable[str], shutdown_requested: bool = False, run_switch_cut: bool = False) -> str:
+    if shutdown_requested:
+        return "LOW OIL PRESS"
+    if run_switch_cut:
+        return "ENGINE RUN OFF"
+    reasons = {_RULES_BY_NAME[fault].limp_reason for fault in faults if fault in _RULES_BY_NAME}
+    for reason in LIMP_REASON_ORDER:
+        if reason in reasons:
+            return reason
+    return DEFAULT_LIMP_REASON
+
+
+class FaultRuleEngine:
+    """Stateful evaluator for a compiled rule table.
+
+    Holds the per-trigger hold timers and the wastegate reference sample, so
+    one engine instance must be driven by one caller with monotonic time.
+    ``display`` also compiles the ``display_only`` triggers; only the HUD sets
+    it, so they never reach the supervisor.
+    """
+
+    def __init__(self, rules: Iterable[FaultRule] = FAULT_RULES, *, display: bool = False) -> None:
+        self.rules = tuple(rules)
+        self.display = display
+        self._evaluate, held = _compile_rules(self.rules, display)
+        self._since: list[Optional[float]] = [None] * held
+        self._wastegate_sample: Optional[tuple[float, float, float]] = None
+        self._wastegate_step = 0.0
+        self._boost_step = 0.0
+
+    @property
+    def pending(self) -> bool:
+        """True while any held trigger is timing, i.e. a fault may fire without new data."""
+        return any(started is not None for started in self._since)
+
+    def reset(self) -> None:
+        self._since = [None] * len(self._since)
+        self._wastegate_sample = None
+        self._wastegate_step = self._boost_step = 0.0
+
+    def evaluate(
+        self,
+        snapshot: StateSnapshot,
+        now_s: float,
+        *,
+        ecu_age_s: float = 0.0,
+        controller_age_s: float = 0.0,
+    ) -> tuple[str, ...]:
+        """Return the sorted names of the active faults."""
+        engine = snapshot.engine
+        sample = self._wastegate_sample
+        if sample is None or now_s - sample[0] >= WASTEGATE_SAMPLE_S:
+            if sample is not None:
+                self._wastegate_step = abs(engine.wastegate_duty_pct - sample[1])
+                self._boost_step = abs(engine.boost_psi - sample[2])
+            self._wastegate_sample = (now_s, engine.wastegate_duty_pct, engine.boost_psi)
+        active = self._evaluate(
+            snapshot,
+            now_s,
+            ecu_age_s,
+            controller_age_s,
+            self._wastegate_step,
+            self._boost_step,
+            self._since,
+        )
+        return tuple(sorted(set(active)))
@@ -0,0 +1,268 @@
+"""Fault detection and fail-safe CAN actions for the engine safety path."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from ..boost_strategy import calculate_boost_target
+from ..canbus.decode import CANStateAggregator
+from ..canbus.encode import (
+    build_boost_target_frame,
+    build_ecu_rev_limiter_strategy_frame,
+    build_engine_run_switch_frame,
+    build_flame_mode_frame,
+    build_limp_mode_frame,
+    build_traction_level_frame,
+)
+from ..canbus.tx_scheduler import TxPriority
+from ..state.snapshot import StateSnapshot
+from .rules import SEVERE_FAULTS, FaultRuleEngine, limp_reason_for
+
+LOGGER = logging.getLogger(__name__)
+
+SAFETY_RATE_HZ = 50.0
+# Reported in place of a decision when the supervisor has stopped producing them.
+SAFETY_LINK_STALE = "SAFETY LINK STALE"
+# Missed periods after which ``SafetyLoop.current`` reports the supervisor stale.
+SAFETY_STALE_PERIODS = 5
+# Minimum spacing of non-safety boost target updates.
+BOOST_REQUEST_MIN_INTERVAL_S = 0.1
+
+# submit(arbitration_id, data, priority), e.g. ``CANTransmitScheduler.submit``.
+SubmitFrame = Callable[[int, bytes, TxPriority], None]
+
+
+@dataclass(frozen=True, slots=True)
+class SafetyDecision:
+    """Outcome of one supervisor tick, as reported to the HUD."""
+
+    faults: tuple[str, ...] = ()
+    severe: bool = False
+    limp_active: bool = False
+    limp_reason: str = ""
+    shutdown_requested: bool = False
+    run_switch_cut: bool = False
+
+
+class SafetySupervisor:
+    """Evaluate safety faults and submit the fail-safe frame set.
+
+    ``evaluate`` is called at a fixed rate with monotonic time, so hold timers
+    do not depend on who is driving it. ``run_authorized`` reports whether the
+    rider is NFC-authorized; when it is ``None`` (the supervisor runs in its own
+    process, away from the reader) the run switch is not re-enabled here and
+    the HUD's start-authority heartbeat restores it once the cut clears.
+    """
+
+    def __init__(self, submit: SubmitFrame, *, run_authorized: Optional[Callable[[], bool]] = None) -> None:
+        self._submit = submit
+        self._run_authorized = run_authorized
+        self._rules = FaultRuleEngine()
+        self._last_fault_state = False
+        self._critical_oil_start: float | None = None
+        self._last_engine_run_switch_enabled = True
+        self._last_escalation_ts = 0.0
+        self._last_shutdown_ts: float | None = None
+        self._last_requested_boost: float | None = None
+        self._last_requested_boost_ts = 0.0
+
+    def evaluate(self, snap: StateSnapshot, now_ts: float, ecu_age_s: float, controller_age_s: float) -> SafetyDecision:
+        # Source-specific ages cannot be hidden by unrelated traffic or local TX echoes.
+        faults = list(self._rules.evaluate(snap, now_ts, ecu_age_s=ecu_age_s, controller_age_s=controller_age_s))
+
+        severe = any(fault in SEVERE_FAULTS for fault in faults)
+        desired_boost = 0.0 if severe else calculate_boost_target(snap)
+        since_request = now_ts - self._last_requested_boost_ts
+        if (
+            self._last_requested_boost is None
+            or (abs(desired_boost - self._last_requested_boost) >= 0.1 and (severe or since_request >= BOOST_REQUEST_MIN_INTERVAL_S))
+            or since_request >= 1.0
+        ):
+            self._submit(
+                *build_boost_target_frame(desired_boost),
+                TxPriority.SAFETY if severe else TxPriority.PERIODIC,
+            )
+            self._last_requested_boost = desired_boost
+            self._last_requested_boost_ts = now_ts
+
+        # Critical oil-pressure handling with anti-false-positive protections:
+        # - ignore cranking/idle zones
+        # - require persistence
+        # - only request shutdown when neutral + near-stationary
+        critical_oil = "CRITICAL OIL PRESS" in faults
+        running_not_cranking = snap.engine.rpm > 1200
+        if critical_oil and running_not_cranking:
+            if self._critical_oil_start is None:
+                self._critical_oil_start = now_ts
+        else:
+            self._critical_oil_start = None
+
+        should_shutdown_engine = (
+            self._critical_oil_start is not None
+            and (now_ts - self._critical_oil_start) > 2.5
+            and snap.engine.gear == "N"
+            and snap.engine.speed_mph < 3.0
+            and snap.engine.throttle_pct < 8.0
+        )
+        should_cut_run_switch = (
+            should_shutdown_engine
+            or ("ECU STALE" in faults and snap.engine.rpm > 1800 and snap.engine.throttle_pct > 20)
+            or ("COOLANT HOT" in faults and snap.temps.coolant_temp_f > 250 and snap.engine.rpm > 2000)
+            or ("EGT HIGH" in faults and snap.temps.exhaust_temp_f > 1725 and snap.engine.rpm > 2200)
+        )
+        if severe and not self._last_fault_state:
+            # Fail-safe action set: cut boost command, enable limp, disable flame, max traction.
+            self._submit_fail_safe(limp_reason_for(faults))
+            LOGGER.error("Safety supervisor engaged: %s", ", ".join(faults))
+        elif not severe and self._last_fault_state:
+            # Clear limp when recovered.
+            self._submit(*build_limp_mode_frame(False), TxPriority.SAFETY)
+            LOGGER.info("Safety supervisor recovered.")
+
+        if should_shutdown_engine:
+            # Engine shutdown request includes torque-reduction stack + run-switch OFF.
+            # Re-sent every 1s (not every tick) while it persists.
+            if self._last_shutdown_ts is None or (now_ts - self._last_shutdown_ts) >= 1.0:
+                self._submit_fail_safe(limp_reason_for(faults, shutdown_requested=True))
+                if self._last_shutdown_ts is None:
+                    LOGGER.critical("Critical oil pressure persisted; shutdown request issued in neutral at low speed.")
+                self._last_shutdown_ts = now_ts
+            faults.append("ENGINE SHUTDOWN REQUEST")
+        else:
+            self._last_shutdown_ts = None
+
+        # Engine run switch "OFF" acts as ECU-level kill (ignition/fuel cut).
+        # Re-send every 1s while active for robustness against frame loss.
+        if should_cut_run_switch:
+            if self._last_engine_run_switch_enabled or (now_ts - self._last_escalation_ts) >= 1.0:
+                self._submit(*build_engine_run_switch_frame(False), TxPriority.SAFETY)
+                self._last_escalation_ts = now_ts
+            self._last_engine_run_switch_enabled = False
+            faults.append("ENGINE RUN SWITCH OFF")
+        elif not self._last_engine_run_switch_enabled:
+            if self._run_authorized is None:
+                self._last_engine_run_switch_enabled = True
+            elif self._run_authorized():
+                self._submit(*build_engine_run_switch_frame(True), TxPriority.SAFETY)
+                self._last_engine_run_switch_enabled = True
+                LOGGER.info("Safety supervisor restored authorized engine run switch to ON.")
+        self._last_fault_state = severe
+
+        active_limp = severe or should_shutdown_engine or should_cut_run_switch
+        return SafetyDecision(
+            faults=tuple(sorted(set(faults))),
+            severe=severe,
+            limp_active=active_limp,
+            limp_reason=limp_reason_for(faults, should_shutdown_engine, should_cut_run_switch) if active_limp else "",
+            shutdown_requested=should_shutdown_engine,
+            run_switch_cut=should_cut_run_switch,
+        )
+
+    def _submit_fail_safe(self, limp_reason: str) -> None:
+        for frame in (
+            build_boost_target_frame(0.0),
+            build_limp_mode_frame(True, limp_reason),
+            build_flame_mode_frame(False),
+            build_ecu_rev_limiter_strategy_frame(False),
+            build_traction_level_frame(3),
+        ):
+            self._submit(*frame, TxPriority.SAFETY)
+
+
+class SafetyLoop:
+    """Drive a ``SafetySupervisor`` from an aggregator on a fixed monotonic schedule.
+
+    Ticks are scheduled against absolute deadlines; a tick that overruns its
+    period is counted in ``overruns`` and the schedule restarts from now
+    instead of bursting to catch up. ``on_decision`` receives every decision
+    and ``heartbeat`` is called once per successful tick (e.g. the systemd
+    watchdog). A tick that raises is logged and counted in ``failures``; once
+    the last good decision is ``stale_after_periods`` periods old, ``current``
+    reports a ``SAFETY LINK STALE`` decision so the HUD falls back to its own
+    rules, as it does for a silent supervisor process.
+    """
+
+    def __init__(
+        self,
+        supervisor: SafetySupervisor,
+        aggregator: CANStateAggregator,
+        *,
+        rate_hz: float = SAFETY_RATE_HZ,
+        on_decision: Optional[Callable[[SafetyDecision], None]] = None,
+        heartbeat: Optional[Callable[[], None]] = None,
+        stale_after_periods: int = SAFETY_STALE_PERIODS,
+    ) -> None:
+        self.supervisor = supervisor
+        self.aggregator = aggregator
+        self.period_s = 1.0 / max(1.0, float(rate_hz))
+        self.on_decision = on_decision
+        self.heartbeat = heartbeat
+        self.stale_after_s = self.period_s * max(1, int(stale_after_periods))
+        self.ticks = 0
+        self.overruns = 0
+        self.failures = 0
+        self._decision: Optional[SafetyDecision] = None
+        self._decided_s = 0.0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def current(self) -> Optional[SafetyDecision]:
+        """Latest decision, ``None`` before the first tick, or a stale marker once ticks stop succeeding."""
+        decision = self._decision
+        if decision is None:
+            return None
+        if time.monotonic() - self._decided_s > self.stale_after_s:
+            return SafetyDecision(faults=(SAFETY_LINK_STALE,))
+        return decision
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, name="safety-supervisor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def run(self) -> None:
+        """Tick until ``stop``; blocks the calling thread."""
+        LOGGER.info("Safety supervisor running at %.0f Hz", 1.0 / self.period_s)
+        aggregator = self.aggregator
+        deadline = time.monotonic()
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            try:
+                decision = self.supervisor.evaluate(
+                    aggregator.current_snapshot(),
+                    now,
+                    aggregator.ecu_rx_age_s(),
+                    aggregator.controller_rx_age_s(),
+                )
+            except Exception:
+                LOGGER.exception("Safety supervisor tick failed")
+                self.failures += 1
+            else:
+                self._decision = decision
+                self._decided_s = now
+                if self.on_decision:
+                    try:
+                        self.on_decision(decision)
+                    except Exception:
+                        LOGGER.exception("Safety decision callback failed")
+                if self.heartbeat:
+                    self.heartbeat()
+            self.ticks += 1
+            deadline += self.period_s
+            delay = deadline - time.monotonic()
+            if delay <= 0:
+                self.overruns += 1
+                deadline = time.monotonic()
+                continue
+            self._stop_event.wait(delay)
@@ -1,5 +1,6 @@
 """State helpers for the Albatross HUD."""
 from .snapshot import StateSnapshot
 from .simulator import StateSimulator
+from .shared import SharedSnapshotPublisher, SharedSnapshotReader, SharedSnapshotWriter
 
-__all__ = ["StateSnapshot", "StateSimulator"]
+__all__ = ["StateSnapshot", "StateSimulator", "SharedSnapshotPublisher", "SharedSnapshotReader", "SharedSnapshotWriter"]
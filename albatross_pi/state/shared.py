@@ -0,0 +1,341 @@
+"""Fixed-layout shared-memory publication of ``StateSnapshot``.
+
+One process (the one that owns the CAN socket) publishes snapshots into a
+``multiprocessing.shared_memory`` block; any number of other processes read
+them without pickling or locks. The block is::
+
+    header   u32 layout id, 4 pad, u64 sequence, u64 snapshot version, i64 published monotonic ns
+    payload  every section field packed by type, shift_light, faults, advisories, change stamps
+    trailer  u64 sequence
+
+and is guarded by a single-writer seqlock: the writer makes the sequence odd,
+writes the payload and trailer, then makes it even again. A reader accepts a
+copy only when the header sequence was even and unchanged around the copy and
+matches the trailer. Python cannot issue memory fences, so the trailer check
+is what catches a torn copy on weakly ordered CPUs such as the Pi's. A
+heartbeat, which only refreshes the publish time, goes through the same
+sequence so readers never see a half-written timestamp.
+
+The service section (CAN frame history, pins, firmware) is not published; it
+only matters to the service overlay in the process that owns the bus.
+Strings are truncated to ``SHARED_STRING_BYTES`` and faults/advisories to
+``MAX_SHARED_ALERTS`` entries.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import struct
+import threading
+import time
+import zlib
+from dataclasses import fields
+from datetime import datetime
+from multiprocessing import shared_memory
+from operator import attrgetter
+from typing import Callable, Optional
+
+from .snapshot import ServiceStatus, SnapshotVersions, StateSnapshot
+
+LOGGER = logging.getLogger(__name__)
+
+SHARED_STRING_BYTES = 48
+MAX_SHARED_ALERTS = 32
+
+_HEADER = struct.Struct("<I4xQQq")
+_SEQUENCE = struct.Struct("<Q")
+_SEQUENCE_OFFSET = 8
+_PUBLISHED = struct.Struct("<q")
+_PUBLISHED_OFFSET = 24
+_READ_ATTEMPTS = 64
+
+# Annotation (as written in snapshot.py) -> (struct code, kind)
+_FIELD_FORMATS = {
+    "float": ("d", "plain"),
+    "int": ("q", "plain"),
+    "bool": ("?", "plain"),
+    "str": (f"{SHARED_STRING_BYTES}s", "str"),
+    "datetime": ("d", "datetime"),
+    "float | None": ("d", "optional"),
+}
+_SKIPPED_FIELDS = {"service", "shift_light", "faults", "advisories", "version", "versions"}
+
+
+class _SnapshotLayout:
+    """Struct layout and converters derived from the snapshot dataclasses."""
+
+    def __init__(self) -> None:
+        codes: list[str] = []
+        paths: list[str] = []
+        kinds: list[str] = []
+        # (field name, section class, field names, start, stop, converted (index, kind) pairs)
+        # with start/stop indexing the flat value tuple.
+        self.sections: list[tuple[str, type, tuple[str, ...], int, int, tuple[tuple[int, str], ...]]] = []
+        for section in fields(StateSnapshot):
+            if section.name in _SKIPPED_FIELDS:
+                continue
+            section_cls = section.default_factory  # every section defaults to its own class
+            start = len(paths)
+            names = []
+            for item in fields(section_cls):
+                code, kind = _FIELD_FORMATS[str(item.type)]
+                codes.append(code)
+                paths.append(f"{section.name}.{item.name}")
+                kinds.append(kind)
+                names.append(item.name)
+            stop = len(paths)
+            converted = tuple((index, kinds[index]) for index in range(start, stop) if kinds[index] != "plain")
+            self.sections.append((section.name, section_cls, tuple(names), start, stop, converted))
+        self.section_count = len(paths)
+        self.version_names = tuple(item.name for item in fields(SnapshotVersions))
+        self.format = (
+            "<"
+            + "".join(codes)
+            + "?HH"
+            + f"{SHARED_STRING_BYTES}s" * (2 * MAX_SHARED_ALERTS)
+            + "Q" * len(self.version_names)
+        )
+        self.payload = struct.Struct(self.format)
+        self.getter = attrgetter(*paths)
+        self.version_getter = attrgetter(*self.version_names)
+        self.str_indexes = tuple(index for index, kind in enumerate(kinds) if kind == "str")
+        self.datetime_indexes = tuple(index for index, kind in enumerate(kinds) if kind == "datetime")
+        self.optional_indexes = tuple(index for index, kind in enumerate(kinds) if kind == "optional")
+        signature = self.format + "|" + ",".join(paths) + "|" + ",".join(self.version_names)
+        self.layout_id = zlib.crc32(signature.encode("ascii"))
+        self.payload_offset = _HEADER.size
+        self.trailer_offset = self.payload_offset + self.payload.size
+        self.size = self.trailer_offset + _SEQUENCE.size
+
+
+_LAYOUT = _SnapshotLayout()
+
+
+def _pack_text(value: str) -> bytes:
+    return value.encode("utf-8")[:SHARED_STRING_BYTES]
+
+
+def _unpack_text(value: bytes) -> str:
+    return value.rstrip(b"\0").decode("utf-8", "ignore")
+
+
+def _alerts(values: tuple[str, ...]) -> list[bytes]:
+    packed = [_pack_text(value) for value in values[:MAX_SHARED_ALERTS]]
+    packed.extend([b""] * (MAX_SHARED_ALERTS - len(packed)))
+    return packed
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, create=False, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        # Before Python 3.13 every attaching process registers the block with
+        # its resource tracker, which would unlink it when the reader exits.
+        from multiprocessing import resource_tracker
+
+        block = shared_memory.SharedMemory(name=name, create=False)
+        resource_tracker.unregister(block._name, "shared_memory")  # type: ignore[attr-defined]
+        return block
+
+
+class SharedSnapshotWriter:
+    """Single writer side of the shared snapshot block."""
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=_LAYOUT.size)
+        self._buffer = self._shm.buf
+        self._sequence = 0
+        _HEADER.pack_into(self._buffer, 0, _LAYOUT.layout_id, 0, 0, 0)
+        _SEQUENCE.pack_into(self._buffer, _LAYOUT.trailer_offset, 0)
+        self.published = 0
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def publish(self, snapshot: StateSnapshot) -> None:
+        values = list(_LAYOUT.getter(snapshot))
+        for index in _LAYOUT.str_indexes:
+            values[index] = _pack_text(values[index])
+        for index in _LAYOUT.datetime_indexes:
+            values[index] = values[index].timestamp()
+        for index in _LAYOUT.optional_indexes:
+            if values[index] is None:
+                values[index] = math.nan
+        faults = snapshot.faults
+        advisories = snapshot.advisories
+        values.append(snapshot.shift_light)
+        values.append(min(len(faults), MAX_SHARED_ALERTS))
+        values.append(min(len(advisories), MAX_SHARED_ALERTS))
+        values.extend(_alerts(faults))
+        values.extend(_alerts(advisories))
+        values.extend(_LAYOUT.version_getter(snapshot.versions))
+
+        buffer = self._buffer
+        sequence = self._sequence + 1
+        _SEQUENCE.pack_into(buffer, _SEQUENCE_OFFSET, sequence)
+        _LAYOUT.payload.pack_into(buffer, _LAYOUT.payload_offset, *values)
+        sequence += 1
+        _SEQUENCE.pack_into(buffer, _LAYOUT.trailer_offset, sequence)
+        _HEADER.pack_into(buffer, 0, _LAYOUT.layout_id, sequence, snapshot.version, time.monotonic_ns())
+        self._sequence = sequence
+        self.published += 1
+
+    def heartbeat(self) -> None:
+        """Refresh the publish time without new data, so readers can tell a quiet bus from a dead writer."""
+        buffer = self._buffer
+        sequence = self._sequence + 1
+        _SEQUENCE.pack_into(buffer, _SEQUENCE_OFFSET, sequence)
+        _PUBLISHED.pack_into(buffer, _PUBLISHED_OFFSET, time.monotonic_ns())
+        sequence += 1
+        _SEQUENCE.pack_into(buffer, _LAYOUT.trailer_offset, sequence)
+        _SEQUENCE.pack_into(buffer, _SEQUENCE_OFFSET, sequence)
+        self._sequence = sequence
+
+    def close(self, unlink: bool = True) -> None:
+        self._buffer = None  # type: ignore[assignment]
+        self._shm.close()
+        if unlink:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class SharedSnapshotReader:
+    """Lock-free reader of a block written by ``SharedSnapshotWriter``.
+
+    ``read`` rebuilds only the sections whose change stamp moved since the
+    previous read and returns the previous snapshot object when nothing was
+    published in between. Stamps in the returned snapshots are local to the
+    reading process.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._shm = _attach(name)
+        self._buffer = self._shm.buf
+        layout_id = _HEADER.unpack_from(self._buffer, 0)[0]
+        if layout_id != _LAYOUT.layout_id:
+            self._shm.close()
+            raise RuntimeError(f"Shared snapshot block {name} has an incompatible layout")
+        self._sequence = 0
+        self._remote_version = 0
+        self._remote_versions: tuple[int, ...] = ()
+        self._snapshot: Optional[StateSnapshot] = None
+        self.published_ns = 0
+        self.torn_reads = 0
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def age_s(self) -> float:
+        """Seconds since the writer last published (infinite before the first publish)."""
+        if not self.published_ns:
+            return float("inf")
+        return max(0.0, (time.monotonic_ns() - self.published_ns) / 1e9)
+
+    def read(self) -> Optional[StateSnapshot]:
+        """Return the newest consistent snapshot, or the last good one if the writer is mid-update."""
+        buffer = self._buffer
+        for _ in range(_READ_ATTEMPTS):
+            _, sequence, remote_version, published_ns = _HEADER.unpack_from(buffer, 0)
+            if sequence & 1:
+                continue
+            if sequence == self._sequence or (self._snapshot is not None and remote_version == self._remote_version):
+                # Nothing new, or only a heartbeat: the payload is already decoded.
+                if _SEQUENCE.unpack_from(buffer, _SEQUENCE_OFFSET)[0] != sequence:
+                    self.torn_reads += 1
+                    continue
+                self._sequence = sequence
+                self.published_ns = published_ns
+                return self._snapshot
+            payload = bytes(buffer[_LAYOUT.payload_offset : _LAYOUT.trailer_offset])
+            trailer = _SEQUENCE.unpack_from(buffer, _LAYOUT.trailer_offset)[0]
+            if _SEQUENCE.unpack_from(buffer, _SEQUENCE_OFFSET)[0] != sequence or trailer != sequence:
+                self.torn_reads += 1
+                continue
+            self._sequence = sequence
+            self._remote_version = remote_version
+            self.published_ns = published_ns
+            self._snapshot = self._decode(_LAYOUT.payload.unpack(payload))
+            return self._snapshot
+        return self._snapshot
+
+    def close(self) -> None:
+        self._buffer = None  # type: ignore[assignment]
+        self._shm.close()
+
+    def _decode(self, values: tuple) -> StateSnapshot:
+        layout = _LAYOUT
+        count = layout.section_count
+        flat = list(values[:count])
+        shift_light, fault_count, advisory_count = values[count : count + 3]
+        alerts_start = count + 3
+        faults = tuple(_unpack_text(value) for value in values[alerts_start : alerts_start + fault_count])
+        advisories_start = alerts_start + MAX_SHARED_ALERTS
+        advisories = tuple(_unpack_text(value) for value in values[advisories_start : advisories_start + advisory_count])
+        remote_versions = values[advisories_start + MAX_SHARED_ALERTS :]
+        previous_versions = self._remote_versions
+        self._remote_versions = remote_versions
+
+        changes: dict[str, object] = {}
+        for position, (name, section_cls, names, start, stop, converted) in enumerate(layout.sections):
+            if previous_versions and previous_versions[position] == remote_versions[position]:
+                continue
+            for index, kind in converted:
+                value = flat[index]
+                if kind == "str":
+                    flat[index] = _unpack_text(value)
+                elif kind == "datetime":
+                    flat[index] = datetime.fromtimestamp(value)
+                elif math.isnan(value):
+                    flat[index] = None
+            changes[name] = section_cls(**dict(zip(names, flat[start:stop])))
+        changes["shift_light"] = shift_light
+        changes["faults"] = faults
+        changes["advisories"] = advisories
+        if self._snapshot is None:
+            return StateSnapshot(service=ServiceStatus(), **changes)  # type: ignore[arg-type]
+        return self._snapshot.evolve(**changes)
+
+
+class SharedSnapshotPublisher:
+    """Thread that copies ``source()`` into a shared block whenever its version moves."""
+
+    def __init__(self, source: Callable[[], StateSnapshot], name: Optional[str] = None, rate_hz: float = 100.0) -> None:
+        self._source = source
+        self._writer = SharedSnapshotWriter(name)
+        self._period_s = 1.0 / max(1.0, rate_hz)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def name(self) -> str:
+        return self._writer.name
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="state-shm", daemon=True)
+        self._thread.start()
+        LOGGER.info("Publishing HUD state to shared memory %s (%d bytes)", self.name, _LAYOUT.size)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+        self._writer.close()
+
+    def _run(self) -> None:
+        last_version = None
+        while not self._stop_event.is_set():
+            snapshot = self._source()
+            if snapshot.version != last_version:
+                self._writer.publish(snapshot)
+                last_version = snapshot.version
+            else:
+                self._writer.heartbeat()
+            self._stop_event.wait(self._period_s)
@@ -5,17 +5,14 @@ import math
 import random
 import threading
 import time
-from dataclasses import replace
 from datetime import datetime
 from typing import Callable, Iterator
 
-from albatross_pi.boost_strategy import calculate_boost_target
+from .. import boost_strategy  # module import: boost_strategy itself imports state.snapshot
 from .snapshot import (
     AirShotState,
-    ClutchState,
     EngineState,
     EnvironmentState,
-    LightingState,
     StateSnapshot,
     TemperaturesState,
     TractionState,
@@ -101,8 +98,7 @@ class StateSimulator:
         pulse_width_ms = max(1.2, 2.6 + throttle * 0.045 + max(0.0, boost) * 0.22)
         knock = 1 if rng.random() > 0.97 else 0
 
-        engine = replace(
-            engine,
+        engine = engine.evolve(
             rpm=rpm,
             speed_mph=speed,
             gear=gear,
@@ -117,8 +113,7 @@ class StateSimulator:
             engine_load_pct=min(100.0, throttle * 0.9 + 10),
         )
 
-        temps = replace(
-            snapshot.temps,
+        temps = snapshot.temps.evolve(
             coolant_temp_f=190 + 5 * math.sin(self._phase * math.tau * 0.7),
             oil_temp_f=205 + 3 * math.sin(self._phase * math.tau * 0.5),
             oil_pressure_psi=60 + 10 * math.sin(self._phase * math.tau * 1.5),
@@ -128,24 +123,21 @@ class StateSimulator:
             alternator_temp_f=140 + 10 * math.sin(self._phase * math.tau * 0.6),
         )
 
-        air_shot = replace(
-            snapshot.air_shot,
+        air_shot = snapshot.air_shot.evolve(
             pressure_psi=1800 + 200 * math.sin(self._phase * math.tau * 0.4),
             charges_remaining=3,
             is_firing=rng.random() > 0.995,
         )
 
         wmi_fault = rng.random() > 0.99
-        wmi = replace(
-            snapshot.wmi,
+        wmi = snapshot.wmi.evolve(
             tank_level_pct=max(0.0, 65 - self._phase * 10),
             commanded_flow_cc_min=250,
             actual_flow_cc_min=240 - (20 if wmi_fault else 0),
             fault_active=wmi_fault,
         )
 
-        traction = replace(
-            snapshot.traction,
+        traction = snapshot.traction.evolve(
             slip_pct=max(0.0, 5 + 3 * math.sin(self._phase * math.tau * 1.2)),
             wheelie_pitch_deg=3 * math.sin(self._phase * math.tau * 0.8),
             intervention_level=rng.choice(["LOW", "MED", "HIGH"]),
@@ -153,12 +145,12 @@ class StateSimulator:
             active=0.48 < self._phase < 0.55,
             sensor_fault=False,
         )
-        clutch = ClutchState(
+        clutch = snapshot.clutch.evolve(
             slip_pct=max(0.0, 2 + math.sin(self._phase * math.tau * 0.9) * 2),
             severity="NONE",
         )
 
-        lighting = LightingState(
+        lighting = snapshot.lighting.evolve(
             left_indicator=0.15 < self._phase < 0.22,
             right_indicator=0.65 < self._phase < 0.72,
             high_beam=0.35 < self._phase < 0.50,
@@ -180,8 +172,7 @@ class StateSimulator:
             mode = self._mode
             fuel_type = self._fuel_type
 
-        environment = replace(
-            snapshot.environment,
+        environment = snapshot.environment.evolve(
             mode=mode,
             fuel_type=fuel_type,
             flame_mode_enabled=mode in {"RACE", "ALBATROSS"} or snapshot.environment.flame_mode_enabled,
@@ -199,7 +190,7 @@ class StateSimulator:
 
         shift_light = engine.rpm > 10000
 
-        next_snapshot = StateSnapshot(
+        next_snapshot = snapshot.evolve(
             engine=engine,
             temps=temps,
             air_shot=air_shot,
@@ -208,13 +199,12 @@ class StateSimulator:
             clutch=clutch,
             lighting=lighting,
             environment=environment,
-            economy=replace(snapshot.economy, injector_pulse_width_ms=pulse_width_ms),
+            economy=snapshot.economy.evolve(injector_pulse_width_ms=pulse_width_ms),
             shift_light=shift_light,
             faults=alerts,
         )
-        return replace(
-            next_snapshot,
-            engine=replace(engine, target_boost_psi=calculate_boost_target(next_snapshot)),
+        return next_snapshot.evolve(
+            engine=engine.evolve(target_boost_psi=boost_strategy.calculate_boost_target(next_snapshot)),
         )
 
     def stream(self) -> Iterator[StateSnapshot]:
@@ -1,19 +1,71 @@
-"""State snapshot dataclasses for the HUD renderer."""
+"""State snapshot dataclasses for the HUD renderer.
+
+All snapshot types are frozen, slotted dataclasses. Besides
+``dataclasses.replace`` each one has a generated ``evolve(**changes)`` that
+copies the slots straight into a new instance without going through
+``__init__``, and returns the instance itself when every given value equals
+the current one; use it on per-frame paths.
+
+``StateSnapshot`` also carries change stamps: ``version`` and one entry per
+field in ``versions``. ``StateSnapshot.evolve`` gives every field whose value
+changes a fresh stamp from a process-wide counter, so a consumer that
+remembers ``versions.temps`` can skip work until it differs. Sections are
+compared by identity there (``evolve`` already returned the same object for
+a no-op), so code that builds a section from scratch should keep the previous
+object when the new one compares equal. Copy snapshots with ``evolve`` rather
+than ``dataclasses.replace``, which keeps the old stamps.
+"""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import itertools
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Tuple
+from typing import Any, Callable, Sequence, Tuple, TypeVar
+
+_T = TypeVar("_T")
+_MISSING = object()
+_next_stamp = itertools.count(1).__next__
+
+
+def _compile_evolve(cls: type) -> Callable[..., Any]:
+    """Build a keyword-only copy function that writes the slots of ``cls`` directly."""
+    names = tuple(item.name for item in fields(cls))
+    namespace: dict[str, object] = {"_new": object.__new__, "_cls": cls, "_MISSING": _MISSING}
+    unchanged = " and ".join(f"({name} is _MISSING or {name} == self.{name})" for name in names)
+    lines = [
+        f"def evolve(self, *, {', '.join(f'{name}=_MISSING' for name in names)}):",
+        f"    if {unchanged}:",
+        "        return self",
+        "    new = _new(_cls)",
+    ]
+    for name in names:
+        # Slot descriptors write past the frozen __setattr__.
+        namespace[f"_set_{name}"] = cls.__dict__[name].__set__
+        lines.append(f"    _set_{name}(new, self.{name} if {name} is _MISSING else {name})")
+    lines.append("    return new")
+    exec("\n".join(lines), namespace)
+    evolve = namespace["evolve"]
+    evolve.__qualname__ = f"{cls.__qualname__}.evolve"  # type: ignore[attr-defined]
+    evolve.__doc__ = f"Return a copy of this {cls.__name__} with the given fields replaced."  # type: ignore[attr-defined]
+    return evolve  # type: ignore[return-value]
 
 
-@dataclass(frozen=True)
+def _evolvable(cls: type[_T]) -> type[_T]:
+    """Attach a generated ``evolve`` to a slotted dataclass."""
+    cls.evolve = _compile_evolve(cls)  # type: ignore[attr-defined]
+    return cls
+
+
+@_evolvable
+@dataclass(frozen=True, slots=True)
 class AirShotState:
     pressure_psi: float = 0.0
     charges_remaining: int = 0
     is_firing: bool = False
 
 
-@dataclass(frozen=True)
+@_evolvable
+@dataclass(frozen=True, slots=True)
 class WMIState:
     tank_level_pct: float = 0.0
     commanded_flow_cc_min: float = 0.0
@@ -21,7 +73,8 @@ class WMIState:
     fault_active: bool = False
 
 
-@dataclass(frozen=True)
+@_evolvable
+@dataclass(frozen=True, slots=True)
 class TractionState:
     slip_pct: float = 0.0
     wheelie_pitch_deg: float = 0.0
@@ -31,13 +84,15 @@ class TractionState:
     sensor_fault: bool = False
 
 
-@dataclass(frozen=True)
+@_evolvable
+@dataclass(frozen=True, slots=True)
 class ClutchState:
     slip_pct: float = 0.0
     severity: str = "NONE"
 
 
-@dataclass(frozen=True)
+@_evolvable
+@dataclass(frozen=True, slots=True)
 class LightingState:
     left_indicator: bool = False
     right_indicator: bool = False
@@ -47,7 +102,8 @@ class LightingState:
     oil_warning: bool = False
 
 
-@dataclass(frozen=True)
+@_evolvable
+@dataclass(frozen=True, slots=True)
 class EngineState:
     rpm: int = 0
     rpm_redline: int = 12000
@@ -66,7 +122,8 @@ class EngineState:
     engine_load_pct: float = 0.0
 
 
-@dataclass(frozen=True)
+@_evolvable
+@dataclass(frozen=True, slots=True)
 class TemperaturesState:
     coolant_temp_f: float = -1.0
     oil_temp_f: float = -1.0
@@ -79,7 +136,8 @@ class TemperaturesState:
     alternator_temp_f: float = 0.0
 
 
-@dataclass(frozen=True)
+@_evolvable
+@dataclass(frozen=True, slots=True)
 class EnvironmentState:
     mode: str = "ECO"
     fuel_type: str = "93"
@@ -97,7 +155,8 @@ class EnvironmentState:
     fuel_level_pct: float = -1.0
 
 
-@dataclass(frozen=True)
+@_evolvable
+@dataclass(frozen=True, slots=True)
 class EconomyState:
     injector_pulse_width_ms: float = 0.0
     injector_duty_pct: float = 0.0
@@ -110,7 +169,8 @@ class EconomyState:
     source: str = "EST"
 
 
-@dataclass(frozen=True)
+@_evolvable
+@dataclass(frozen=True, slots=True)
 class CANFrameRecord:
     arbitration_id: int = 0
     name: str = "UNKNOWN"
@@ -119,34 +179,67 @@ class CANFrameRecord:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass(frozen=True)
+@_evolvable
+@dataclass(frozen=True, slots=True)
 class ServiceReading:
     label: str = ""
     value: str = ""
 
 
-@dataclass(frozen=True)
+@_evolvable
+@dataclass(frozen=True, slots=True)
 class ServiceFlag:
     label: str = ""
     active: bool = False
 
 
-@dataclass(frozen=True)
+@_evolvable
+@dataclass(frozen=True, slots=True)
 class ServiceStatus:
-    recent_can_frames: Tuple[CANFrameRecord, ...] = field(default_factory=tuple)
+    recent_can_frames: Sequence[CANFrameRecord] = field(default_factory=tuple)
     sensor_voltages: Tuple[ServiceReading, ...] = field(default_factory=tuple)
     pin_states: Tuple[ServiceFlag, ...] = field(default_factory=tuple)
     relay_states: Tuple[ServiceFlag, ...] = field(default_factory=tuple)
     firmware_versions: Tuple[ServiceReading, ...] = field(default_factory=tuple)
 
 
-@dataclass(frozen=True)
+@_evolvable
+@dataclass(frozen=True, slots=True)
 class SystemStatus:
     limp_mode_active: bool = False
     limp_mode_reason: str = ""
 
 
-@dataclass(frozen=True)
+@_evolvable
+@dataclass(frozen=True, slots=True)
+class SnapshotVersions:
+    """Change stamp of each ``StateSnapshot`` field; a stamp only moves when the value does."""
+
+    engine: int = 0
+    temps: int = 0
+    air_shot: int = 0
+    wmi: int = 0
+    traction: int = 0
+    clutch: int = 0
+    lighting: int = 0
+    environment: int = 0
+    economy: int = 0
+    service: int = 0
+    system: int = 0
+    shift_light: int = 0
+    faults: int = 0
+    advisories: int = 0
+
+
+_VERSIONED_FIELDS = tuple(item.name for item in fields(SnapshotVersions))
+
+
+def _fresh_versions() -> SnapshotVersions:
+    stamp = _next_stamp()
+    return SnapshotVersions(**{name: stamp for name in _VERSIONED_FIELDS})
+
+
+@dataclass(frozen=True, slots=True)
 class StateSnapshot:
     engine: EngineState = field(default_factory=EngineState)
     temps: TemperaturesState = field(default_factory=TemperaturesState)
@@ -162,3 +255,72 @@ class StateSnapshot:
     shift_light: bool = False
     faults: Tuple[str, ...] = field(default_factory=tuple)
     advisories: Tuple[str, ...] = field(default_factory=tuple)
+    version: int = field(default_factory=_next_stamp, compare=False)
+    versions: SnapshotVersions = field(default_factory=_fresh_versions, compare=False, repr=False)
+
+
+def _compile_versioned_evolve(cls: type, versions_cls: type, compared: frozenset[str]) -> Callable[..., Any]:
+    """Build ``StateSnapshot.evolve``: copy the slots and re-stamp only changed fields.
+
+    Fields in ``compared`` change when they compare unequal; the sections
+    change when they are a different object, since their own ``evolve``
+    returns the same instance for a no-op. All fields changed by one call share
+    one new stamp, which also becomes ``version``. If nothing changes ``self``
+    is returned.
+    """
+    names = tuple(item.name for item in fields(versions_cls))
+    namespace: dict[str, object] = {
+        "_new": object.__new__,
+        "_cls": cls,
+        "_versions_cls": versions_cls,
+        "_MISSING": _MISSING,
+        "_next_stamp": _next_stamp,
+        "_set_version": cls.__dict__["version"].__set__,
+        "_set_versions": cls.__dict__["versions"].__set__,
+    }
+    lines = [
+        f"def evolve(self, *, {', '.join(f'{name}=_MISSING' for name in names)}):",
+        "    stamp = 0",
+        "    versions = self.versions",
+    ]
+    for name in names:
+        same = f"{name} == self.{name}" if name in compared else f"{name} is self.{name}"
+        lines += [
+            f"    if {name} is _MISSING or {same}:",
+            f"        {name} = self.{name}",
+            f"        v_{name} = versions.{name}",
+            "    else:",
+            "        if not stamp:",
+            "            stamp = _next_stamp()",
+            f"        v_{name} = stamp",
+        ]
+    lines += [
+        "    if not stamp:",
+        "        return self",
+        "    new_versions = _new(_versions_cls)",
+    ]
+    for name in names:
+        namespace[f"_set_v_{name}"] = versions_cls.__dict__[name].__set__
+        lines.append(f"    _set_v_{name}(new_versions, v_{name})")
+    lines.append("    new = _new(_cls)")
+    for name in names:
+        namespace[f"_set_{name}"] = cls.__dict__[name].__set__
+        lines.append(f"    _set_{name}(new, {name})")
+    lines += [
+        "    _set_version(new, stamp)",
+        "    _set_versions(new, new_versions)",
+        "    return new",
+    ]
+    exec("\n".join(lines), namespace)
+    evolve = namespace["evolve"]
+    evolve.__qualname__ = f"{cls.__qualname__}.evolve"  # type: ignore[attr-defined]
+    evolve.__doc__ = "Return a copy with the given fields replaced, re-stamping only fields that changed."  # type: ignore[attr-defined]
+    return evolve  # type: ignore[return-value]
+
+
+assert set(_VERSIONED_FIELDS) == {item.name for item in fields(StateSnapshot)} - {"version", "versions"}
+StateSnapshot.evolve = _compile_versioned_evolve(  # type: ignore[attr-defined]
+    StateSnapshot,
+    SnapshotVersions,
+    compared=frozenset({"shift_light", "faults", "advisories"}),
+)
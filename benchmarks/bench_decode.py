@@ -0,0 +1,299 @@
+"""Micro-benchmark for the CAN decode path.
+
+Pushes a synthetic frame mix (every handled ID with seeded random payloads,
+plus the Pi's own TX IDs through ``mark_sent_frame``) or a recorded capture
+through ``CANStateAggregator`` and prints a JSON report:
+
+* ``throughput``: frames/s for ``apply_frame``, ``mark_sent_frame`` and
+  ``apply_frames`` batches, with per-frame latency percentiles checked
+  against the 2 ms "CAN parse + state update" budget.
+* ``handlers``: ns per frame for each arbitration ID through ``apply_frame``.
+* ``allocations``: tracemalloc transient bytes and retained blocks per frame.
+* ``lock``: hold-time percentiles of the aggregator lock for the RX writer
+  and a 60 Hz snapshot reader running alongside it.
+
+Usage::
+
+    python benchmarks/bench_decode.py --frames 200000 --output decode.json
+    python benchmarks/bench_decode.py --capture logs/can-capture/
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# The albatross_pi package imports the HUD (and pygame); keep stdout pure JSON.
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from albatross_pi.canbus.capture import capture_files, read_capture  # noqa: E402
+from albatross_pi.canbus.decode import CANStateAggregator, handled_arbitration_ids  # noqa: E402
+from albatross_pi.canbus.history import FRAME_NAMES  # noqa: E402
+from albatross_pi.canbus.ids import PiToArduinoID, PiToEcuID  # noqa: E402
+
+FRAME_BUDGET_NS = 2_000_000
+BATCH_SIZE = 64
+
+# (arbitration_id, data, direction)
+Frame = tuple[int, bytes, str]
+
+
+class _TimedLock:
+    """``threading.Lock`` stand-in that records how long each holder kept it."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._acquired_ns = 0
+        self.holds: dict[str, list[int]] = {}
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        acquired = self._lock.acquire(blocking, timeout)
+        if acquired:
+            self._acquired_ns = time.perf_counter_ns()
+        return acquired
+
+    def release(self) -> None:
+        held = time.perf_counter_ns() - self._acquired_ns
+        self.holds.setdefault(threading.current_thread().name, []).append(held)
+        self._lock.release()
+
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    __enter__ = acquire
+
+    def __exit__(self, *_: object) -> None:
+        self.release()
+
+
+def _percentiles(samples: Sequence[int]) -> dict[str, float]:
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+
+    def pick(fraction: float) -> int:
+        return ordered[min(last, int(round(fraction * last)))]
+
+    return {
+        "count": len(ordered),
+        "mean_ns": sum(ordered) / len(ordered),
+        "p50_ns": pick(0.50),
+        "p99_ns": pick(0.99),
+        "max_ns": ordered[-1],
+    }
+
+
+def synthetic_frames(count: int, seed: int, payloads_per_id: int = 8) -> list[Frame]:
+    """Uniform mix of handled RX IDs plus Pi TX IDs.
+
+    Each ID draws from a small pool of random payloads, like a real bus where
+    status frames repeat a handful of values; fully random bytes would make
+    keyed frames such as firmware versions grow without bound.
+    """
+    rng = random.Random(seed)
+    tx_ids = {int(member) for enum in (PiToArduinoID, PiToEcuID) for member in enum}
+    rx_ids = [arbitration_id for arbitration_id in handled_arbitration_ids() if arbitration_id not in tx_ids]
+    mix = [(arbitration_id, "RX") for arbitration_id in rx_ids] + [(arbitration_id, "TX") for arbitration_id in sorted(tx_ids)]
+    pools = {key: [rng.randbytes(8) for _ in range(payloads_per_id)] for key in mix}
+    frames: list[Frame] = []
+    for _ in range(count):
+        key = rng.choice(mix)
+        frames.append((key[0], rng.choice(pools[key]), key[1]))
+    return frames
+
+
+def recorded_frames(path: Path, limit: int) -> list[Frame]:
+    frames: list[Frame] = []
+    for capture in capture_files(path):
+        for _, arbitration_id, data, direction in read_capture(capture):
+            frames.append((arbitration_id, data, direction))
+            if limit and len(frames) >= limit:
+                return frames
+    return frames
+
+
+def _feed(aggregator: CANStateAggregator, frames: Sequence[Frame]) -> None:
+    apply_frame = aggregator.apply_frame
+    mark_sent = aggregator.mark_sent_frame
+    for arbitration_id, data, direction in frames:
+        if direction == "RX":
+            apply_frame(arbitration_id, data)
+        else:
+            mark_sent(arbitration_id, data)
+
+
+def bench_throughput(frames: Sequence[Frame], repeat: int) -> dict[str, object]:
+    rx = [frame for frame in frames if frame[2] == "RX"]
+    tx = [frame for frame in frames if frame[2] == "TX"]
+    results: dict[str, object] = {}
+
+    def best_rate(run, count: int) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            aggregator = CANStateAggregator()
+            start = time.perf_counter_ns()
+            run(aggregator)
+            best = min(best, time.perf_counter_ns() - start)
+        return count / (best / 1e9) if best else 0.0
+
+    results["apply_frame_fps"] = best_rate(lambda agg: _feed(agg, rx), len(rx)) if rx else 0.0
+    results["mark_sent_frame_fps"] = best_rate(lambda agg: _feed(agg, tx), len(tx)) if tx else 0.0
+
+    batches = [[(arbitration_id, data, None) for arbitration_id, data, _ in rx[index : index + BATCH_SIZE]] for index in range(0, len(rx), BATCH_SIZE)]
+
+    def run_batches(aggregator: CANStateAggregator) -> None:
+        for batch in batches:
+            aggregator.apply_frames(batch)
+
+    results["apply_frames_fps"] = best_rate(run_batches, len(rx)) if rx else 0.0
+    results["apply_frames_batch_size"] = BATCH_SIZE
+
+    aggregator = CANStateAggregator()
+    latencies: list[int] = []
+    clock = time.perf_counter_ns
+    for arbitration_id, data, direction in frames:
+        start = clock()
+        if direction == "RX":
+            aggregator.apply_frame(arbitration_id, data)
+        else:
+            aggregator.mark_sent_frame(arbitration_id, data)
+        latencies.append(clock() - start)
+    latency = _percentiles(latencies)
+    results["frame_latency"] = latency
+    results["budget_ns"] = FRAME_BUDGET_NS
+    results["within_budget"] = latency.get("max_ns", 0) <= FRAME_BUDGET_NS
+    return results
+
+
+def bench_handlers(frames: Sequence[Frame], per_id: int) -> dict[str, dict[str, object]]:
+    by_id: dict[tuple[int, str], list[bytes]] = {}
+    for arbitration_id, data, direction in frames:
+        by_id.setdefault((arbitration_id, direction), []).append(data)
+    results: dict[str, dict[str, object]] = {}
+    for (arbitration_id, direction), payloads in sorted(by_id.items()):
+        aggregator = CANStateAggregator()
+        call = aggregator.apply_frame if direction == "RX" else aggregator.mark_sent_frame
+        payloads = (payloads * (per_id // len(payloads) + 1))[:per_id]
+        start = time.perf_counter_ns()
+        for data in payloads:
+            call(arbitration_id, data)
+        elapsed = time.perf_counter_ns() - start
+        results[f"0x{arbitration_id:03X}/{direction}"] = {
+            "name": FRAME_NAMES.get(arbitration_id, "UNKNOWN"),
+            "ns_per_frame": elapsed / len(payloads),
+        }
+    return results
+
+
+def bench_allocations(frames: Sequence[Frame], sample: int) -> dict[str, float]:
+    frames = frames[:sample]
+    aggregator = CANStateAggregator()
+    _feed(aggregator, frames[: min(len(frames), 1024)])  # warm caches and the history ring
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        transient = 0
+        for frame in frames:
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            _feed(aggregator, (frame,))
+            _, peak = tracemalloc.get_traced_memory()
+            transient += peak - base
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    retained_blocks = sum(stat.count_diff for stat in stats if "tracemalloc" not in stat.traceback[0].filename)
+    retained_bytes = sum(stat.size_diff for stat in stats if "tracemalloc" not in stat.traceback[0].filename)
+    count = max(1, len(frames))
+    return {
+        "frames": len(frames),
+        "transient_bytes_per_frame": transient / count,
+        "retained_blocks_per_frame": retained_blocks / count,
+        "retained_bytes_per_frame": retained_bytes / count,
+    }
+
+
+def bench_lock(frames: Sequence[Frame], reader_hz: float) -> dict[str, object]:
+    aggregator = CANStateAggregator()
+    timed = _TimedLock()
+    aggregator._lock = timed  # type: ignore[assignment]
+    aggregator._condition = threading.Condition(timed)  # type: ignore[arg-type]
+    aggregator._can_history.lock = timed  # type: ignore[assignment]
+    stop = threading.Event()
+
+    def reader() -> None:
+        period = 1.0 / reader_hz
+        while not stop.is_set():
+            aggregator.current_snapshot()
+            aggregator.can_stats()
+            stop.wait(period)
+
+    reader_thread = threading.Thread(target=reader, name="reader", daemon=True)
+    writer_thread = threading.Thread(target=_feed, args=(aggregator, frames), name="writer", daemon=True)
+    reader_thread.start()
+    writer_thread.start()
+    writer_thread.join()
+    stop.set()
+    reader_thread.join()
+    return {
+        "reader_hz": reader_hz,
+        "writer": _percentiles(timed.holds.get("writer", [])),
+        "reader": _percentiles(timed.holds.get("reader", [])),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100_000, help="synthetic frames (or capture frame limit)")
+    parser.add_argument("--capture", type=Path, help="use a recorded CAN capture file or directory instead of synthetic frames")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3, help="throughput runs; the best is reported")
+    parser.add_argument("--per-id", type=int, default=5_000, help="frames per arbitration ID for handler timing")
+    parser.add_argument("--alloc-frames", type=int, default=20_000, help="frames traced for allocations")
+    parser.add_argument("--reader-hz", type=float, default=60.0, help="snapshot reader rate during the lock test")
+    parser.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    if args.capture:
+        frames = recorded_frames(args.capture, args.frames)
+        source = str(args.capture)
+    else:
+        frames = synthetic_frames(args.frames, args.seed)
+        source = "synthetic"
+    if not frames:
+        parser.error("no frames to benchmark")
+
+    report = {
+        "benchmark": "decode",
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "source": source,
+        "frames": len(frames),
+        "throughput": bench_throughput(frames, args.repeat),
+        "handlers": bench_handlers(frames, args.per_id),
+        "allocations": bench_allocations(frames, args.alloc_frames),
+        "lock": bench_lock(frames, args.reader_hz),
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Text fitting benchmark.
+
+Compares ``ui_utils.fit_font_size`` (memoized binary search over
+``Font.size`` metrics) with the previous linear search that rasterized the
+string at every size from ``start_size`` down:
+
+* ``calls``: ns per call for a set of HUD strings, for the linear search,
+  the binary search with an empty memo, and a memo hit.
+* ``frames``: ms per headless ``_render_frame`` for each layout, with every
+  widget using the linear search vs the memoized one, and the number of
+  ``fit_font_size`` calls a frame makes.
+
+Usage::
+
+    python benchmarks/bench_fit_font.py --output fit_font.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from albatross_pi.hud.renderer import HUDRenderer  # noqa: E402
+from albatross_pi.hud.widgets import ui_utils  # noqa: E402
+from albatross_pi.state.simulator import StateSimulator  # noqa: E402
+
+LAYOUTS = ((1280, 480), (1920, 720))
+# (text, max_w, max_h, start_size, bold) as the widgets ask for them.
+CALLS = (
+    ("ALBATROSS", 192, 38, 43, True),
+    ("Boost 13.2 psi", 520, 60, 64, True),
+    ("RPM 12345", 600, 40, 40, True),
+    ("CLT 194F", 220, 24, 22, False),
+    ("0x1A3 08 FF 00 12 7C", 260, 18, 14, False),
+)
+_fit_font_size = ui_utils.fit_font_size
+
+
+def linear_fit_font_size(text: str, max_w: int, max_h: int, *, start_size: int, bold: bool = False, min_size: int = 8) -> int:
+    """``fit_font_size`` before memoization: rasterize every size from ``start_size`` down."""
+    size = max(min_size, start_size)
+    while size > min_size:
+        rendered = ui_utils.font(size, bold=bold).render(text, True, (255, 255, 255))
+        if rendered.get_width() <= max_w and rendered.get_height() <= max_h:
+            return size
+        size -= 1
+    return min_size
+
+
+def _install(fit: Callable[..., int]) -> None:
+    """Point every HUD module that imported ``fit_font_size`` at ``fit``."""
+    for name, module in tuple(sys.modules.items()):
+        if name.startswith("albatross_pi.hud") and getattr(module, "fit_font_size", None) is not None:
+            module.fit_font_size = fit
+
+
+def _best_ns(func: Callable[[], object], number: int, repeat: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+
+def _call_all(fit: Callable[..., int]) -> None:
+    for text, max_w, max_h, start_size, bold in CALLS:
+        fit(text, max_w, max_h, start_size=start_size, bold=bold)
+
+
+def _uncached() -> None:
+    ui_utils._FIT_CACHE.clear()
+    _call_all(_fit_font_size)
+
+
+def bench_calls(number: int, repeat: int) -> dict[str, float]:
+    linear_ns = _best_ns(lambda: _call_all(linear_fit_font_size), number, repeat) / len(CALLS)
+    search_ns = _best_ns(_uncached, number, repeat) / len(CALLS)
+    _call_all(_fit_font_size)
+    memo_ns = _best_ns(lambda: _call_all(_fit_font_size), number * 20, repeat) / len(CALLS)
+    return {
+        "linear_ns_per_call": linear_ns,
+        "binary_search_ns_per_call": search_ns,
+        "memo_hit_ns_per_call": memo_ns,
+        "speedup_memo": linear_ns / memo_ns if memo_ns else 0.0,
+    }
+
+
+def _frame_ms(renderer: HUDRenderer, states: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for state in states:
+            renderer._render_frame(state, present=False)
+        best = min(best, (time.perf_counter() - started) / len(states))
+    return best * 1e3
+
+
+def bench_frames(frames: int, repeat: int) -> dict[str, dict[str, float]]:
+    simulator = StateSimulator()
+    states = [simulator.sample() for _ in range(frames)]
+    results: dict[str, dict[str, float]] = {}
+    for width, height in LAYOUTS:
+        renderer = HUDRenderer(use_display=False, screen_size=(width, height), preferences_path=None)
+        renderer._post_complete = True
+        calls = 0
+
+        def counting(*args, **kwargs) -> int:
+            nonlocal calls
+            calls += 1
+            return _fit_font_size(*args, **kwargs)
+
+        _install(counting)
+        renderer._render_frame(states[0], present=False)
+        calls = 0
+        renderer._render_frame(states[1], present=False)
+        calls_per_frame = calls
+
+        _install(linear_fit_font_size)
+        linear_ms = _frame_ms(renderer, states, repeat)
+        _install(_fit_font_size)
+        memo_ms = _frame_ms(renderer, states, repeat)
+        results[f"{width}x{height}"] = {
+            "fit_calls_per_frame": calls_per_frame,
+            "linear_ms_per_frame": linear_ms,
+            "memoized_ms_per_frame": memo_ms,
+            "saved_ms_per_frame": linear_ms - memo_ms,
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200, help="calls per timing run")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs; the best is reported")
+    parser.add_argument("--frames", type=int, default=60, help="simulator frames rendered per layout and run")
+    parser.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    pygame.init()
+    report = {
+        "benchmark": "fit_font",
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "pygame": pygame.version.ver,
+        "calls": bench_calls(args.number, args.repeat),
+        "frames": bench_frames(args.frames, args.repeat),
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
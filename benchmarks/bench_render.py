@@ -0,0 +1,251 @@
+"""Headless HUD render benchmark.
+
+Drives ``HUDRenderer(use_display=False)`` on the SDL dummy driver through
+``_render_frame`` for every ride mode and theme on the home screen, and for
+every menu overlay in each theme, with states from ``StateSimulator`` (or a
+recorded CAN capture decoded through ``CANStateAggregator``). Faults and
+advisories are evaluated once per state up front, as the fixed-rate
+evaluator would, so only rendering is timed. For each scenario it reports:
+
+* ``frames_per_s``, ``p50_ms``/``p95_ms``/``max_ms`` wall time per frame
+  and the ``over_budget`` count against the 12 ms frame budget.
+* ``cpu_ms_per_frame`` and ``cpu_pct_at_60hz``, the share of one core the
+  renderer needs to hold 60 FPS (the bench-sim target is below 40%).
+* ``alloc_peak_bytes_per_frame`` and ``retained_bytes_per_frame``: Python
+  heap growth at the frame's peak and after it, from a separate tracemalloc
+  pass. SDL pixel buffers live outside the Python heap and are not counted.
+* ``text_renders_per_frame``: text cache misses, i.e. strings rasterized
+  by FreeType.
+
+Usage::
+
+    python benchmarks/bench_render.py --output render.json
+    python benchmarks/bench_render.py --capture logs/can-capture/ --width 1280 --height 480
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from albatross_pi.canbus.capture import capture_files, read_capture  # noqa: E402
+from albatross_pi.canbus.decode import CANStateAggregator  # noqa: E402
+from albatross_pi.hud.frame_profiler import FRAME_BUDGET_MS  # noqa: E402
+from albatross_pi.hud.renderer import HUDRenderer  # noqa: E402
+from albatross_pi.hud.widgets.ui_utils import text_cache_stats  # noqa: E402
+from albatross_pi.state.simulator import StateSimulator  # noqa: E402
+from albatross_pi.state.snapshot import StateSnapshot  # noqa: E402
+
+TARGET_FRAME_MS = 1000.0 / 60.0
+OVERLAYS = (
+    "settings",
+    "media",
+    "service",
+    "sensor_confidence",
+    "fault_detail",
+    "nav_waypoints",
+    "nav_actions",
+    "nav_keyboard",
+    "nav_search_results",
+    "network",
+)
+
+
+def synthetic_states(count: int) -> list[StateSnapshot]:
+    simulator = StateSimulator()
+    return [simulator.sample() for _ in range(count)]
+
+
+def recorded_states(path: Path, count: int) -> list[StateSnapshot]:
+    """Decode a CAN capture and take ``count`` snapshots spread evenly across it."""
+    frames = [
+        (arbitration_id, data, direction)
+        for capture in capture_files(path)
+        for _, arbitration_id, data, direction in read_capture(capture)
+    ]
+    aggregator = CANStateAggregator()
+    stride = max(1, len(frames) // max(1, count))
+    states: list[StateSnapshot] = []
+    for index, (arbitration_id, data, direction) in enumerate(frames, start=1):
+        if direction == "RX":
+            aggregator.apply_frame(arbitration_id, data)
+        else:
+            aggregator.mark_sent_frame(arbitration_id, data)
+        if index % stride == 0 and len(states) < count:
+            states.append(aggregator.current_snapshot())
+    return states
+
+
+def _prepare(renderer: HUDRenderer, states: Sequence[StateSnapshot], mode: str) -> list[StateSnapshot]:
+    """Pin ``mode`` on every state and apply one fault evaluation to each."""
+    prepared = []
+    for state in states:
+        state = state.evolve(environment=state.environment.evolve(mode=mode))
+        prepared.append(renderer._fault_evaluator.tick(state=state).apply(state))
+    return prepared
+
+
+def _configure(renderer: HUDRenderer, mode_index: int, theme_index: int, menu: str) -> None:
+    renderer._apply_mode_selection(mode_index, notify=False)
+    # Settle the mode layout animation immediately.
+    renderer._mode_layout_state.clear()
+    renderer._mode_layout_anim_until = 0.0
+    renderer._create_widgets()
+    renderer._theme_index = theme_index
+    renderer._active_menu = menu
+
+
+def _time_frames(renderer: HUDRenderer, states: Sequence[StateSnapshot], repeat: int) -> dict[str, float]:
+    # One untimed pass fills the static layer, text, fit and glyph caches.
+    for state in states:
+        renderer._render_frame(state, present=False)
+    best: dict[str, float] | None = None
+    for _ in range(repeat):
+        misses = text_cache_stats()["misses"]
+        samples = []
+        cpu_started = time.process_time()
+        wall_started = time.perf_counter()
+        for state in states:
+            started = time.perf_counter()
+            renderer._render_frame(state, present=False)
+            samples.append((time.perf_counter() - started) * 1e3)
+        wall_ms = (time.perf_counter() - wall_started) * 1e3 / len(states)
+        cpu_ms = (time.process_time() - cpu_started) * 1e3 / len(states)
+        samples.sort()
+        run = {
+            "frames_per_s": 1000.0 / wall_ms if wall_ms else 0.0,
+            "p50_ms": samples[len(samples) // 2],
+            "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+            "max_ms": samples[-1],
+            "over_budget": sum(1 for sample in samples if sample > FRAME_BUDGET_MS),
+            "cpu_ms_per_frame": cpu_ms,
+            "cpu_pct_at_60hz": cpu_ms / TARGET_FRAME_MS * 100.0,
+            "text_renders_per_frame": (text_cache_stats()["misses"] - misses) / len(states),
+        }
+        if best is None or run["frames_per_s"] > best["frames_per_s"]:
+            best = run
+    assert best is not None
+    return best
+
+
+def _alloc_per_frame(renderer: HUDRenderer, states: Sequence[StateSnapshot]) -> dict[str, float]:
+    tracemalloc.start()
+    try:
+        transient = 0
+        retained = 0
+        for state in states:
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            renderer._render_frame(state, present=False)
+            current, peak = tracemalloc.get_traced_memory()
+            transient += peak - base
+            retained += current - base
+    finally:
+        tracemalloc.stop()
+    count = max(1, len(states))
+    return {"alloc_peak_bytes_per_frame": transient / count, "retained_bytes_per_frame": retained / count}
+
+
+def bench_scenario(
+    renderer: HUDRenderer,
+    states: Sequence[StateSnapshot],
+    mode_index: int,
+    theme_index: int,
+    menu: str,
+    repeat: int,
+) -> dict[str, float]:
+    _configure(renderer, mode_index, theme_index, menu)
+    result = _time_frames(renderer, states, repeat)
+    result.update(_alloc_per_frame(renderer, states))
+    return result
+
+
+def bench_render(states: Sequence[StateSnapshot], size: tuple[int, int], repeat: int) -> dict[str, dict[str, float]]:
+    renderer = HUDRenderer(use_display=False, screen_size=size, preferences_path=None)
+    renderer._post_complete = True
+    results: dict[str, dict[str, float]] = {}
+    for mode_index, mode in enumerate(renderer._modes):
+        prepared = _prepare(renderer, states, mode)
+        for theme_index, theme in enumerate(renderer._themes):
+            results[f"{mode}/{theme}/home"] = bench_scenario(renderer, prepared, mode_index, theme_index, "home", repeat)
+    mode_index = 0
+    prepared = _prepare(renderer, states, renderer._modes[mode_index])
+    for theme_index, theme in enumerate(renderer._themes):
+        for menu in OVERLAYS:
+            key = f"{renderer._modes[mode_index]}/{theme}/{menu}"
+            results[key] = bench_scenario(renderer, prepared, mode_index, theme_index, menu, repeat)
+    renderer._fault_evaluator.stop()
+    return results
+
+
+def _overall(results: dict[str, dict[str, float]]) -> dict[str, object]:
+    frames_per_s = [result["frames_per_s"] for result in results.values()]
+    slowest = max(results, key=lambda key: results[key]["p95_ms"])
+    return {
+        "scenarios": len(results),
+        "min_frames_per_s": min(frames_per_s),
+        "mean_frames_per_s": sum(frames_per_s) / len(frames_per_s),
+        "max_cpu_pct_at_60hz": max(result["cpu_pct_at_60hz"] for result in results.values()),
+        "slowest_scenario": slowest,
+        "slowest_p95_ms": results[slowest]["p95_ms"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=30, help="states rendered per scenario and run")
+    parser.add_argument("--capture", type=Path, help="take states from a recorded CAN capture file or directory")
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per scenario; the fastest is reported")
+    parser.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    if args.capture:
+        states = recorded_states(args.capture, args.frames)
+        source = str(args.capture)
+    else:
+        states = synthetic_states(args.frames)
+        source = "simulator"
+    if not states:
+        parser.error("no states to render")
+
+    pygame.init()
+    results = bench_render(states, (args.width, args.height), args.repeat)
+    report = {
+        "benchmark": "render",
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "pygame": pygame.version.ver,
+        "source": source,
+        "screen": f"{args.width}x{args.height}",
+        "frames": len(states),
+        "budget_ms": FRAME_BUDGET_MS,
+        "overall": _overall(results),
+        "scenarios": results,
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
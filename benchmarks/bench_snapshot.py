@@ -0,0 +1,231 @@
+"""Snapshot churn and retention benchmark.
+
+Compares the slotted snapshot dataclasses and their generated ``evolve``
+against an equivalent ``__dict__``-backed frozen family updated through
+``dataclasses.replace`` (the layout before snapshots were slotted):
+
+* ``per_class``: ns per single-field copy for every snapshot type.
+* ``run_loop``: ns per frame for the copies ``HUDRenderer.run`` makes on
+  every frame (HUD-owned controls, runtime faults, economy, advisories and
+  the display clock).
+* ``memory``: tracemalloc bytes per retained ``StateSnapshot`` when every
+  section is distinct, as in a black-box buffer of recent frames.
+
+Usage::
+
+    python benchmarks/bench_snapshot.py --output snapshot.json
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+# The albatross_pi package imports the HUD (and pygame); keep stdout pure JSON.
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from albatross_pi.state import snapshot as snapshot_module  # noqa: E402
+from albatross_pi.state.simulator import StateSimulator  # noqa: E402
+from albatross_pi.state.snapshot import StateSnapshot  # noqa: E402
+
+SNAPSHOT_TYPES = tuple(
+    value
+    for value in vars(snapshot_module).values()
+    if isinstance(value, type) and dataclasses.is_dataclass(value) and value.__module__ == snapshot_module.__name__
+)
+
+# A representative non-default value per annotation, used for single-field copies.
+_SAMPLE_VALUES: dict[str, Any] = {"int": 1, "float": 1.5, "bool": True, "str": "X", "datetime": datetime(2024, 1, 1)}
+
+
+def _legacy_family() -> dict[type, type]:
+    """Build ``__dict__``-backed frozen twins of every snapshot dataclass.
+
+    Change stamps (the ``compare=False`` fields) are left out, matching the
+    layout before snapshots were slotted and versioned.
+    """
+    legacy: dict[type, type] = {}
+    for cls in SNAPSHOT_TYPES:
+        specs = []
+        for item in _content_fields(cls):
+            specs.append((item.name, item.type, dataclasses.field(default=item.default, default_factory=item.default_factory)))
+        legacy[cls] = dataclasses.make_dataclass(f"Legacy{cls.__name__}", specs, frozen=True)
+    return legacy
+
+
+def _content_fields(cls: Any) -> tuple[dataclasses.Field, ...]:
+    return tuple(item for item in dataclasses.fields(cls) if item.compare)
+
+
+LEGACY = _legacy_family()
+
+
+def to_legacy(value: Any) -> Any:
+    legacy_cls = LEGACY.get(type(value))
+    if legacy_cls is None:
+        return value
+    return legacy_cls(**{item.name: to_legacy(getattr(value, item.name)) for item in _content_fields(value)})
+
+
+def _best_ns(func: Callable[[], object], number: int, repeat: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e9
+
+
+def bench_per_class(number: int, repeat: int) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    for cls in SNAPSHOT_TYPES:
+        item = dataclasses.fields(cls)[0]
+        value = _SAMPLE_VALUES.get(str(item.type), ("X",))
+        current = cls()
+        legacy = to_legacy(current)
+        changes = {item.name: value}
+        replace_ns = _best_ns(lambda: dataclasses.replace(legacy, **changes), number, repeat)
+        evolve_ns = _best_ns(lambda: current.evolve(**changes), number, repeat)
+        results[cls.__name__] = {
+            "fields": len(dataclasses.fields(cls)),
+            "legacy_replace_ns": replace_ns,
+            "slots_evolve_ns": evolve_ns,
+            "speedup": replace_ns / evolve_ns if evolve_ns else 0.0,
+        }
+    return results
+
+
+def _run_loop_replace(state: Any, now: datetime) -> Any:
+    replace = dataclasses.replace
+    # HUDRenderer._with_hud_owned_controls
+    environment = replace(
+        state.environment,
+        mode="SPORT",
+        fuel_type="E85",
+        flame_mode_enabled=False,
+        rev_limiter_strategy="FUEL CUT",
+        brightness_pct=75.0,
+    )
+    traction = replace(state.traction, intervention_level="3")
+    state = replace(state, environment=environment, traction=traction)
+    # HUDRenderer.run: runtime faults, EconomyTracker.update, advisories, display clock
+    state = replace(state, faults=("CAN STALE",))
+    economy = replace(state.economy, instant_mpg=40.0, average_mpg=38.0, miles_to_empty=120.0)
+    state = replace(state, economy=economy)
+    state = replace(state, advisories=())
+    return replace(state, environment=replace(state.environment, time=now))
+
+
+def _run_loop_evolve(state: StateSnapshot, now: datetime) -> StateSnapshot:
+    environment = state.environment.evolve(
+        mode="SPORT",
+        fuel_type="E85",
+        flame_mode_enabled=False,
+        rev_limiter_strategy="FUEL CUT",
+        brightness_pct=75.0,
+    )
+    traction = state.traction.evolve(intervention_level="3")
+    state = state.evolve(environment=environment, traction=traction)
+    state = state.evolve(faults=("CAN STALE",))
+    economy = state.economy.evolve(instant_mpg=40.0, average_mpg=38.0, miles_to_empty=120.0)
+    state = state.evolve(economy=economy)
+    state = state.evolve(advisories=())
+    return state.evolve(environment=state.environment.evolve(time=now))
+
+
+def bench_run_loop(number: int, repeat: int) -> dict[str, float]:
+    current = StateSimulator().sample()
+    legacy = to_legacy(current)
+    now = datetime.now()
+    assert to_legacy(_run_loop_evolve(current, now)) == _run_loop_replace(legacy, now)
+    replace_ns = _best_ns(lambda: _run_loop_replace(legacy, now), number, repeat)
+    evolve_ns = _best_ns(lambda: _run_loop_evolve(current, now), number, repeat)
+    return {
+        "copies_per_frame": 10,
+        "legacy_replace_ns_per_frame": replace_ns,
+        "slots_evolve_ns_per_frame": evolve_ns,
+        "speedup": replace_ns / evolve_ns if evolve_ns else 0.0,
+    }
+
+
+def _fresh_copy(state: StateSnapshot) -> StateSnapshot:
+    """Copy ``state`` so that no section object is shared with the original."""
+    sections = {}
+    for item in dataclasses.fields(state):
+        value = getattr(state, item.name)
+        sections[item.name] = dataclasses.replace(value) if dataclasses.is_dataclass(value) else value
+    return StateSnapshot(**sections)
+
+
+def _distinct_snapshots(count: int) -> list[StateSnapshot]:
+    """Snapshots that share no section objects, like a replayed drive."""
+    base = StateSimulator().sample()
+    start = base.environment.time
+    snapshots = []
+    for index in range(count):
+        state = _fresh_copy(base)
+        snapshots.append(
+            state.evolve(
+                engine=state.engine.evolve(rpm=1000 + index),
+                environment=state.environment.evolve(time=start + timedelta(milliseconds=index)),
+            )
+        )
+    return snapshots
+
+
+def _retained_bytes(build: Callable[[], list[Any]]) -> int:
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        retained = build()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del retained
+    return after - before
+
+
+def bench_memory(count: int) -> dict[str, float]:
+    snapshots = _distinct_snapshots(count)
+    legacy_bytes = _retained_bytes(lambda: [to_legacy(state) for state in snapshots])
+    slots_bytes = _retained_bytes(lambda: [_fresh_copy(state) for state in snapshots])
+    return {
+        "snapshots": count,
+        "legacy_bytes_per_snapshot": legacy_bytes / count,
+        "slots_bytes_per_snapshot": slots_bytes / count,
+        "reduction_pct": 100.0 * (1.0 - slots_bytes / legacy_bytes) if legacy_bytes else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000, help="calls per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs; the best is reported")
+    parser.add_argument("--retained", type=int, default=600, help="snapshots retained for the memory test")
+    parser.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    report = {
+        "benchmark": "snapshot",
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "per_class": bench_per_class(args.number, args.repeat),
+        "run_loop": bench_run_loop(args.number, args.repeat),
+        "memory": bench_memory(args.retained),
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,6 @@ from __future__ import annotations
 import argparse
 import json
 import socket
-import struct
 import tkinter as tk
 from tkinter import ttk
 
@@ -37,6 +36,7 @@ from albatross_pi.canbus.encode import (
 )
 from albatross_pi.canbus.ids import ArduinoToEcuID, ArduinoToHudID, ECUToHudID, LIMP_REASON_CODES
 from albatross_pi.canbus.iface import PythonCANInterface, SocketCANInterface
+from albatross_pi.canbus.signals import encode_signals
 
 
 class App:
@@ -325,16 +325,15 @@ class App:
         else:
             print(f"TX 0x{arb_id:03X} {payload.hex()}")
 
+    def _send_signals(self, arb_id: int, *values: float) -> None:
+        self._send(int(arb_id), encode_signals(arb_id, *values))
+
     def _fire_air_shot(self) -> None:
         self._send(*build_air_shot_request_frame())
         packet = json.dumps({"airshot_request": True}).encode("utf-8")
         for p in self.udp_ports:
             self.sock.sendto(packet, (self.udp_host, p))
 
-    @staticmethod
-    def _f_to_cx10(temp_f: float) -> int:
-        return int(max(0.0, (temp_f - 32.0) * 5.0 / 9.0) * 10)
-
     @staticmethod
     def _version_part(value: str, limit: int) -> int:
         try:
@@ -357,98 +356,62 @@ class App:
         trac_map = {"LOW": 1, "MED": 2, "HIGH": 3, "OFF": 4}
         slip_sev_map = {"NONE": 0, "MILD": 1, "MODERATE": 2, "SEVERE": 3}
 
-        rpm = int(self.vars["rpm"].get())
-        speed_mps100 = int(max(0.0, float(self.vars["speed"].get()) / 2.236936) * 100)
-        oil_t_c10 = self._f_to_cx10(float(self.vars["oilt"].get()))
-        clt_c10 = self._f_to_cx10(float(self.vars["clt"].get()))
-        iat_c10 = self._f_to_cx10(float(self.vars["iat"].get()))
-        egt1_c10 = self._f_to_cx10(float(self.vars["egt_b1"].get()))
-        egt2_c10 = self._f_to_cx10(float(self.vars["egt_b2"].get()))
-        lean_raw = int(float(self.vars["lean_deg"].get()) * 10)
+        speed_mph = float(self.vars["speed"].get())
         mode_code = mode_map[self.vars["mode"].get()]
         fuel_code = fuel_type_map[self.vars["fuel_type"].get()]
         traction_level_code = trac_map[self.vars["traction"].get()]
-        traction_slip_x10 = int(max(-100.0, min(100.0, float(self.vars["traction_slip"].get()))) * 10)
-        torque_cut_pct = max(0, min(100, int(self.vars["torque_cut"].get())))
-
-        self._send(int(ECUToHudID.ENGINE_RPM), struct.pack(">H", max(0, min(65535, rpm))))
-        self._send(int(ECUToHudID.THROTTLE_POSITION), bytes((max(0, min(100, int(self.vars["tps"].get()))),)))
-        self._send(int(ECUToHudID.BOOST_PRESSURE), struct.pack(">H", int(max(0.0, float(self.vars["boost"].get())) * 10)))
-        self._send(
-            int(ECUToHudID.BOOST_PRESSURE_BANKS),
-            struct.pack(
-                ">HH",
-                int(max(0.0, float(self.vars["boost_l"].get())) * 10),
-                int(max(0.0, float(self.vars["boost_r"].get())) * 10),
-            ),
-        )
-        self._send(int(ECUToHudID.AFR_BANKS), struct.pack(">HH", int(float(self.vars["afr_l"].get()) * 100), int(float(self.vars["afr_r"].get()) * 100)))
-        self._send(int(ECUToHudID.KNOCK_STATUS), struct.pack(">H", max(0, min(0xFFFF, int(self.vars["knock_mask"].get())))))
-        self._send(int(ECUToHudID.OIL_PRESSURE_TEMP), struct.pack(">HH", int(max(0.0, float(self.vars["oilp"].get())) * 10), oil_t_c10))
-        self._send(int(ECUToHudID.COOLANT_TEMP), struct.pack(">H", clt_c10))
-        self._send(int(ECUToHudID.BATTERY_VOLTAGE), struct.pack(">H", int(max(0.0, float(self.vars["batt_v"].get())) * 1000)))
-        self._send(int(ECUToHudID.FUEL_LEVEL), bytes((max(0, min(100, int(self.vars["fuel"].get()))),)))
-        self._send(int(ECUToHudID.FLEX_FUEL), bytes((max(0, min(100, int(self.vars["ethanol_pct"].get()))),)))
-        self._send(
-            int(ECUToHudID.INJECTOR_STATUS),
-            struct.pack(
-                ">HH",
-                max(0, min(65535, int(float(self.vars["inj_pw_ms"].get()) * 100))),
-                max(0, min(1000, int(float(self.vars["inj_duty_pct"].get()) * 10))),
-            ),
-        )
-        self._send(int(ECUToHudID.GEAR_POSITION), bytes((gear_map[self.vars["gear"].get()],)))
-        self._send(int(ECUToHudID.ENGINE_LOAD), bytes((max(0, min(100, int(self.vars["load"].get()))),)))
-        self._send(int(ECUToHudID.INTAKE_AIR_TEMP), struct.pack(">H", iat_c10))
-        self._send(int(ECUToHudID.EXHAUST_GAS_TEMP), struct.pack(">HH", egt1_c10, egt2_c10))
+        traction_slip_pct = max(-100.0, min(100.0, float(self.vars["traction_slip"].get())))
+        torque_cut_pct = int(self.vars["torque_cut"].get())
+
+        self._send_signals(ECUToHudID.ENGINE_RPM, self.vars["rpm"].get())
+        self._send_signals(ECUToHudID.THROTTLE_POSITION, self.vars["tps"].get())
+        self._send_signals(ECUToHudID.BOOST_PRESSURE, self.vars["boost"].get())
+        self._send_signals(ECUToHudID.BOOST_PRESSURE_BANKS, self.vars["boost_l"].get(), self.vars["boost_r"].get())
+        self._send_signals(ECUToHudID.AFR_BANKS, self.vars["afr_l"].get(), self.vars["afr_r"].get())
+        self._send_signals(ECUToHudID.KNOCK_STATUS, self.vars["knock_mask"].get())
+        self._send_signals(ECUToHudID.OIL_PRESSURE_TEMP, self.vars["oilp"].get(), self.vars["oilt"].get())
+        self._send_signals(ECUToHudID.COOLANT_TEMP, self.vars["clt"].get())
+        self._send_signals(ECUToHudID.BATTERY_VOLTAGE, self.vars["batt_v"].get())
+        self._send_signals(ECUToHudID.FUEL_LEVEL, max(0, min(100, int(self.vars["fuel"].get()))))
+        self._send_signals(ECUToHudID.FLEX_FUEL, self.vars["ethanol_pct"].get())
+        self._send_signals(ECUToHudID.INJECTOR_STATUS, self.vars["inj_pw_ms"].get(), self.vars["inj_duty_pct"].get())
+        self._send_signals(ECUToHudID.GEAR_POSITION, gear_map[self.vars["gear"].get()])
+        self._send_signals(ECUToHudID.ENGINE_LOAD, self.vars["load"].get())
+        self._send_signals(ECUToHudID.INTAKE_AIR_TEMP, self.vars["iat"].get())
+        self._send_signals(ECUToHudID.EXHAUST_GAS_TEMP, self.vars["egt_b1"].get(), self.vars["egt_b2"].get())
 
         airshot_flags = 0x01 if bool(self.vars["airshot_firing"].get()) else 0x00
-        self._send(int(ArduinoToHudID.AIR_SHOT_STATUS), bytes((max(0, min(3, int(self.vars["airshot_charges"].get()))), airshot_flags)))
-        self._send(int(ArduinoToHudID.AWC_STATE), bytes((1 if bool(self.vars["awc_enabled"].get()) else 0, max(-127, min(127, int(lean_raw / 10))) & 0xFF)))
-        self._send(int(ArduinoToHudID.TANK_PRESSURE), struct.pack(">H", int(max(0.0, float(self.vars["tank_psi"].get())) * 10)))
-        self._send(int(ArduinoToHudID.TWIN_TURBO_STATUS), struct.pack(">HH", int(max(0.0, float(self.vars["turbo1"].get())) * 10), int(max(0.0, float(self.vars["turbo2"].get())) * 10)))
-        self._send(int(ArduinoToHudID.WASTEGATE_STATUS), bytes((max(0, min(100, int(self.vars["wg1"].get()))), max(0, min(100, int(self.vars["wg2"].get()))))))
-        self._send(int(ArduinoToHudID.GEAR_POSITION), bytes((gear_map[self.vars["gear"].get()],)))
-        self._send(int(ArduinoToHudID.WHEEL_SPEED), struct.pack(">HH", speed_mps100, speed_mps100))
-        self._send(int(ArduinoToHudID.FUEL_LEVEL), bytes((max(0, min(100, int(self.vars["fuel"].get()))),)))
+        self._send_signals(ArduinoToHudID.AIR_SHOT_STATUS, max(0, min(3, int(self.vars["airshot_charges"].get()))), airshot_flags)
+        self._send_signals(ArduinoToHudID.AWC_STATE, 1 if bool(self.vars["awc_enabled"].get()) else 0, int(float(self.vars["lean_deg"].get())))
+        self._send_signals(ArduinoToHudID.TANK_PRESSURE, max(0.0, float(self.vars["tank_psi"].get())))
+        self._send_signals(ArduinoToHudID.TWIN_TURBO_STATUS, self.vars["turbo1"].get(), self.vars["turbo2"].get())
+        self._send_signals(ArduinoToHudID.WASTEGATE_STATUS, max(0, min(100, int(self.vars["wg1"].get()))), max(0, min(100, int(self.vars["wg2"].get()))))
+        self._send_signals(ArduinoToHudID.GEAR_POSITION, gear_map[self.vars["gear"].get()])
+        self._send_signals(ArduinoToHudID.WHEEL_SPEED, speed_mph, speed_mph)
+        self._send_signals(ArduinoToHudID.FUEL_LEVEL, self.vars["fuel"].get())
         if bool(self.vars["send_hud_commands"].get()):
-            self._send(int(ArduinoToHudID.FUEL_TYPE_STATUS), bytes((fuel_type_map[self.vars["fuel_type"].get()],)))
-        self._send(int(ArduinoToHudID.OIL_PRESSURE_STATUS), struct.pack(">H", int(max(0.0, float(self.vars["oilp"].get())) * 10)))
-        self._send(
-            int(ArduinoToHudID.WMI_STATUS),
-            struct.pack(
-                ">BHHB",
-                max(0, min(100, int(self.vars["wmi_tank"].get()))),
-                max(0, min(65535, int(self.vars["wmi_commanded"].get()))),
-                max(0, min(65535, int(self.vars["wmi_actual"].get()))),
-                1 if bool(self.vars["wmi_fault"].get()) else 0,
-            ),
+            self._send_signals(ArduinoToHudID.FUEL_TYPE_STATUS, fuel_type_map[self.vars["fuel_type"].get()])
+        self._send_signals(ArduinoToHudID.OIL_PRESSURE_STATUS, max(0.0, float(self.vars["oilp"].get())))
+        self._send_signals(
+            ArduinoToHudID.WMI_STATUS,
+            self.vars["wmi_tank"].get(),
+            self.vars["wmi_commanded"].get(),
+            self.vars["wmi_actual"].get(),
+            1 if bool(self.vars["wmi_fault"].get()) else 0,
         )
-        self._send(
-            int(ArduinoToHudID.CLUTCH_SLIP_STATUS),
-            bytes(
-                (
-                    max(0, min(100, int(self.vars["clutch_slip_pct"].get()))),
-                    slip_sev_map.get(self.vars["clutch_slip_severity"].get(), 0),
-                )
-            ),
+        self._send_signals(
+            ArduinoToHudID.CLUTCH_SLIP_STATUS,
+            self.vars["clutch_slip_pct"].get(),
+            slip_sev_map.get(self.vars["clutch_slip_severity"].get(), 0),
         )
         tc_flags = 0
         tc_flags |= 0x01 if bool(self.vars["traction_active"].get()) else 0
         tc_flags |= 0x02 if bool(self.vars["traction_fault"].get()) else 0
-        self._send(
-            int(ArduinoToHudID.TRACTION_STATUS),
-            struct.pack(
-                ">hBB",
-                traction_slip_x10,
-                torque_cut_pct,
-                tc_flags,
-            ),
-        )
+        self._send_signals(ArduinoToHudID.TRACTION_STATUS, traction_slip_pct, torque_cut_pct, tc_flags)
 
         if bool(self.vars["send_ecu_requests"].get()):
-            self._send(int(ArduinoToEcuID.TORQUE_CUT_REQUEST), bytes((torque_cut_pct,)))
-            self._send(int(ArduinoToEcuID.TRACTION_SLIP_REQUEST), struct.pack(">hB", traction_slip_x10, tc_flags))
+            self._send_signals(ArduinoToEcuID.TORQUE_CUT_REQUEST, torque_cut_pct)
+            self._send_signals(ArduinoToEcuID.TRACTION_SLIP_REQUEST, traction_slip_pct, tc_flags)
 
         if bool(self.vars["send_hud_commands"].get()):
             self._send(*build_boost_target_frame(float(self.vars["boost_target"].get())))
@@ -470,15 +433,15 @@ class App:
         light_flags |= 0x08 if bool(self.vars["neutral_light"].get()) else 0
         light_flags |= 0x10 if bool(self.vars["brake_light"].get()) else 0
         light_flags |= 0x20 if bool(self.vars["oil_warning"].get()) else 0
-        self._send(int(ArduinoToHudID.LIGHT_STATUS), bytes((light_flags,)))
-
-        sensor_mv = (
-            max(0, min(65535, int(float(self.vars["oil_sensor_v"].get()) * 1000))),
-            max(0, min(65535, int(float(self.vars["wmi_tank_v"].get()) * 1000))),
-            max(0, min(65535, int(float(self.vars["arduino_5v"].get()) * 1000))),
-            max(0, min(65535, int(float(self.vars["air_tank_v"].get()) * 1000))),
+        self._send_signals(ArduinoToHudID.LIGHT_STATUS, light_flags)
+
+        self._send_signals(
+            ArduinoToHudID.SERVICE_SENSOR_VOLTAGES,
+            self.vars["oil_sensor_v"].get(),
+            self.vars["wmi_tank_v"].get(),
+            self.vars["arduino_5v"].get(),
+            self.vars["air_tank_v"].get(),
         )
-        self._send(int(ArduinoToHudID.SERVICE_SENSOR_VOLTAGES), struct.pack(">HHHH", *sensor_mv))
         input_bits = light_flags
         input_bits |= 0x40 if bool(self.vars["wmi_pressure_ok"].get()) else 0
         output_bits = 0
@@ -499,25 +462,20 @@ class App:
         fault_bits = 0
         fault_bits |= 0x04 if bool(self.vars["wmi_fault"].get()) else 0
         fault_bits |= 0x08 if bool(self.vars["traction_fault"].get()) else 0
-        self._send(int(ArduinoToHudID.SERVICE_DIGITAL_STATES), bytes((input_bits, output_bits, command_bits, fault_bits)))
+        self._send_signals(ArduinoToHudID.SERVICE_DIGITAL_STATES, input_bits, output_bits, command_bits, fault_bits)
         limp_active = bool(self.vars["limp_mode"].get())
         limp_reason_code = LIMP_REASON_CODES.get(str(self.vars["limp_reason"].get()).upper(), LIMP_REASON_CODES["PI REQUEST"])
-        self._send(int(ArduinoToHudID.LIMP_STATUS), bytes((1 if limp_active else 0, limp_reason_code if limp_active else 0)))
+        self._send_signals(ArduinoToHudID.LIMP_STATUS, 1 if limp_active else 0, limp_reason_code if limp_active else 0)
         fw = str(self.vars["arduino_fw"].get()).replace("+", ".").split(".")
         major, minor, patch, build = (fw + ["0", "0", "0", "0"])[:4]
         build_no = self._version_part(build, 65535)
-        self._send(
-            int(ArduinoToHudID.SERVICE_FIRMWARE_VERSION),
-            bytes(
-                (
-                    0x04,
-                    self._version_part(major, 255),
-                    self._version_part(minor, 255),
-                    self._version_part(patch, 255),
-                    (build_no >> 8) & 0xFF,
-                    build_no & 0xFF,
-                )
-            ),
+        self._send_signals(
+            ArduinoToHudID.SERVICE_FIRMWARE_VERSION,
+            0x04,
+            self._version_part(major, 255),
+            self._version_part(minor, 255),
+            self._version_part(patch, 255),
+            build_no,
         )
 
         payload = {k: (v.get() if hasattr(v, "get") else v) for k, v in self.vars.items()}
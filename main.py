@@ -7,11 +7,8 @@ import logging
 import os
 import socket
 import signal
-import struct
 import sys
 import threading
-import time
-from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from typing import Iterable, Iterator
@@ -19,7 +16,7 @@ from typing import Iterable, Iterator
 import pygame
 
 from albatross_pi.boost_strategy import calculate_boost_target
-from albatross_pi.canbus import ArduinoToHudID, CANStateAggregator, ECUToHudID, PiToArduinoID, PiToEcuID, SocketCANInterface, build_mode_selection_frame, build_traction_level_frame, python_can_available
+from albatross_pi.canbus import ArduinoToHudID, CANStateAggregator, ECUToHudID, PiToArduinoID, PiToEcuID, RawSocketCANInterface, SocketCANInterface, build_mode_selection_frame, build_traction_level_frame, python_can_available
 from albatross_pi.canbus.encode import (
     build_air_shot_request_frame,
     build_boost_target_frame,
@@ -29,19 +26,26 @@ from albatross_pi.canbus.encode import (
     build_engine_run_switch_frame,
     build_fuel_type_frame,
     build_flame_mode_frame,
-    build_limp_mode_frame,
     build_media_control_frame,
     build_nfc_auth_frame,
     build_phone_link_frame,
 )
+from albatross_pi.canbus.capture import CANCaptureRecorder
+from albatross_pi.canbus.decode import handled_arbitration_ids
+from albatross_pi.canbus.replay import CANReplayInterface
+from albatross_pi.canbus.tx_scheduler import CANTransmitScheduler, TxPriority
 from albatross_pi.canbus.ids import LIMP_REASON_CODES
+from albatross_pi.canbus.signals import encode_signals
 from albatross_pi.diagnostics import FaultLogger
+from albatross_pi.hud.frame_profiler import FrameProfiler
 from albatross_pi.hud.renderer import HUDRenderer
 from albatross_pi.phone import PhoneBridge, PhoneStatus
 from albatross_pi.runtime import PiPowerSupervisor, SystemdNotifier
+from albatross_pi.safety import SafetyDecision, SafetyDecisionListener, SafetyLoop, SafetySupervisor
 from albatross_pi.security import NfcAuthorizer
+from albatross_pi.state.shared import SharedSnapshotPublisher
 from albatross_pi.state.simulator import StateSimulator
-from albatross_pi.state.snapshot import CANFrameRecord, ClutchState, LightingState, ServiceFlag, ServiceReading, ServiceStatus, StateSnapshot, SystemStatus, WMIState
+from albatross_pi.state.snapshot import CANFrameRecord, ServiceFlag, ServiceReading, StateSnapshot
 from albatross_pi.updater import confirm_pending_update_health, install_update_from_repository, install_update_from_usb, request_reboot_if_raspberry_pi
 
 
@@ -97,7 +101,6 @@ def _demo_recent_can_frames(obj: dict[str, object]) -> tuple[CANFrameRecord, ...
     limp_active = bool(obj.get("limp_mode", False))
     limp_reason = str(obj.get("limp_reason", "PI REQUEST" if limp_active else "NONE")).upper()
     limp_reason_code = LIMP_REASON_CODES.get(limp_reason, LIMP_REASON_CODES["PI REQUEST"] if limp_active else 0)
-    speed_mps100 = _clamp_int(float(obj.get("speed", 0.0)) / 2.236936 * 100, 0, 65535)
     light_flags = 0
     light_flags |= 0x01 if bool(obj.get("left_indicator", False)) else 0
     light_flags |= 0x02 if bool(obj.get("right_indicator", False)) else 0
@@ -106,19 +109,17 @@ def _demo_recent_can_frames(obj: dict[str, object]) -> tuple[CANFrameRecord, ...
     light_flags |= 0x10 if bool(obj.get("brake_light", False)) else 0
     light_flags |= 0x20 if bool(obj.get("oil_warning", False)) else 0
 
-    def f_to_cx10(key: str, default_f: float) -> int:
-        temp_f = float(obj.get(key, default_f))
-        return _clamp_int((temp_f - 32.0) * 5.0 / 9.0 * 10, 0, 65535)
-
+    wg1 = _clamp_int(obj.get("wg1", 0), 0, 100)
+    wg2 = _clamp_int(obj.get("wg2", 0), 0, 100)
     output_bits = 0
-    output_bits |= 0x01 if _clamp_int(obj.get("wg1", 0), 0, 100) > 0 else 0
-    output_bits |= 0x02 if _clamp_int(obj.get("wg2", 0), 0, 100) > 0 else 0
+    output_bits |= 0x01 if wg1 > 0 else 0
+    output_bits |= 0x02 if wg2 > 0 else 0
     output_bits |= 0x04 if bool(obj.get("wmi_arm", False)) else 0
     output_bits |= 0x08 if bool(obj.get("flame_mode", False)) else 0
     output_bits |= 0x10 if bool(obj.get("airshot_firing", False)) else 0
     output_bits |= 0x20 if bool(obj.get("air_compressor", False)) else 0
-    output_bits |= 0x40 if _clamp_int(obj.get("wg1", 0), 0, 100) > 0 else 0
-    output_bits |= 0x80 if _clamp_int(obj.get("wg2", 0), 0, 100) > 0 else 0
+    output_bits |= 0x40 if wg1 > 0 else 0
+    output_bits |= 0x80 if wg2 > 0 else 0
     command_bits = 0
     command_bits |= 0x01 if bool(obj.get("nfc_ok", True)) else 0
     command_bits |= 0x02 if bool(obj.get("flame_mode", False)) else 0
@@ -130,54 +131,49 @@ def _demo_recent_can_frames(obj: dict[str, object]) -> tuple[CANFrameRecord, ...
     fault_bits |= 0x04 if bool(obj.get("wmi_fault", False)) else 0
     fault_bits |= 0x08 if bool(obj.get("traction_fault", False)) else 0
 
+    def num(key: str, default: float = 0.0) -> float:
+        return _optional_float(obj.get(key, default), default)
+
     records = [
-        (ECUToHudID.ENGINE_RPM, struct.pack(">H", _clamp_int(obj.get("rpm", 0), 0, 65535)), "RX"),
-        (ECUToHudID.THROTTLE_POSITION, bytes((_clamp_int(obj.get("tps", 0), 0, 100),)), "RX"),
-        (ECUToHudID.BOOST_PRESSURE, struct.pack(">H", _clamp_int(float(obj.get("boost", 0.0)) * 10, 0, 65535)), "RX"),
+        (ECUToHudID.ENGINE_RPM, (num("rpm"),), "RX"),
+        (ECUToHudID.THROTTLE_POSITION, (num("tps"),), "RX"),
+        (ECUToHudID.BOOST_PRESSURE, (num("boost"),), "RX"),
+        (ECUToHudID.BOOST_PRESSURE_BANKS, (num("boost_l", num("boost")), num("boost_r", num("boost"))), "RX"),
+        (ECUToHudID.AFR_BANKS, (num("afr_l"), num("afr_r")), "RX"),
+        (ECUToHudID.EXHAUST_GAS_TEMP, (num("egt_b1", 1450.0), num("egt_b2", 1470.0)), "RX"),
+        (ECUToHudID.OIL_PRESSURE_TEMP, (num("oilp"), num("oilt", 205.0)), "RX"),
+        (ECUToHudID.COOLANT_TEMP, (num("clt", 190.0),), "RX"),
+        (ECUToHudID.BATTERY_VOLTAGE, (num("batt_v"),), "RX"),
+        (ECUToHudID.FLEX_FUEL, (num("ethanol_pct"),), "RX"),
+        (ArduinoToHudID.WHEEL_SPEED, (num("speed"), num("speed")), "RX"),
         (
-            ECUToHudID.BOOST_PRESSURE_BANKS,
-            struct.pack(
-                ">HH",
-                _clamp_int(float(obj.get("boost_l", obj.get("boost", 0.0))) * 10, 0, 65535),
-                _clamp_int(float(obj.get("boost_r", obj.get("boost", 0.0))) * 10, 0, 65535),
-            ),
+            ArduinoToHudID.WMI_STATUS,
+            (num("wmi_tank"), num("wmi_commanded"), num("wmi_actual"), 1 if bool(obj.get("wmi_fault", False)) else 0),
             "RX",
         ),
+        (ArduinoToHudID.LIGHT_STATUS, (light_flags,), "RX"),
+        (ArduinoToHudID.WASTEGATE_STATUS, (wg1, wg2), "RX"),
         (
-            ECUToHudID.AFR_BANKS,
-            struct.pack(
-                ">HH",
-                _clamp_int(float(obj.get("afr_l", 0.0)) * 100, 0, 65535),
-                _clamp_int(float(obj.get("afr_r", 0.0)) * 100, 0, 65535),
-            ),
+            ArduinoToHudID.SERVICE_SENSOR_VOLTAGES,
+            (num("oil_sensor_v"), num("wmi_tank_v"), num("arduino_5v", 3.3), num("air_tank_v", 2.95)),
             "RX",
         ),
         (
-            ECUToHudID.EXHAUST_GAS_TEMP,
-            struct.pack(">HH", f_to_cx10("egt_b1", 1450.0), f_to_cx10("egt_b2", 1470.0)),
+            ArduinoToHudID.SERVICE_DIGITAL_STATES,
+            (light_flags | (0x40 if bool(obj.get("wmi_pressure_ok", True)) else 0), output_bits, command_bits, fault_bits),
             "RX",
         ),
-        (ECUToHudID.OIL_PRESSURE_TEMP, struct.pack(">HH", _clamp_int(float(obj.get("oilp", 0.0)) * 10, 0, 65535), f_to_cx10("oilt", 205.0)), "RX"),
-        (ECUToHudID.COOLANT_TEMP, struct.pack(">H", f_to_cx10("clt", 190.0)), "RX"),
-        (ECUToHudID.BATTERY_VOLTAGE, struct.pack(">H", _clamp_int(float(obj.get("batt_v", 0.0)) * 1000, 0, 65535)), "RX"),
-        (ECUToHudID.FLEX_FUEL, bytes((_clamp_int(obj.get("ethanol_pct", 0), 0, 100),)), "RX"),
-        (ArduinoToHudID.WHEEL_SPEED, struct.pack(">HH", speed_mps100, speed_mps100), "RX"),
-        (ArduinoToHudID.WMI_STATUS, struct.pack(">BHHB", _clamp_int(obj.get("wmi_tank", 0), 0, 100), _clamp_int(obj.get("wmi_commanded", 0), 0, 65535), _clamp_int(obj.get("wmi_actual", 0), 0, 65535), 1 if bool(obj.get("wmi_fault", False)) else 0), "RX"),
-        (ArduinoToHudID.LIGHT_STATUS, bytes((light_flags,)), "RX"),
-        (ArduinoToHudID.WASTEGATE_STATUS, bytes((_clamp_int(obj.get("wg1", 0), 0, 100), _clamp_int(obj.get("wg2", 0), 0, 100))), "RX"),
-        (ArduinoToHudID.SERVICE_SENSOR_VOLTAGES, struct.pack(">HHHH", _clamp_int(float(obj.get("oil_sensor_v", 0.0)) * 1000, 0, 65535), _clamp_int(float(obj.get("wmi_tank_v", 0.0)) * 1000, 0, 65535), _clamp_int(float(obj.get("arduino_5v", 3.3)) * 1000, 0, 65535), _clamp_int(float(obj.get("air_tank_v", 2.95)) * 1000, 0, 65535)), "RX"),
-        (ArduinoToHudID.SERVICE_DIGITAL_STATES, bytes((light_flags | (0x40 if bool(obj.get("wmi_pressure_ok", True)) else 0), output_bits, command_bits, fault_bits)), "RX"),
-        (ArduinoToHudID.LIMP_STATUS, bytes((1 if limp_active else 0, limp_reason_code & 0xFF)), "RX"),
-        (PiToArduinoID.AIR_SHOT_REQUEST, bytes((1,)), "TX") if bool(obj.get("airshot_request", False)) else None,
-        (PiToArduinoID.MODE_SELECTION, bytes((mode_map.get(mode, 2),)), "TX"),
-        (PiToArduinoID.FUEL_TYPE_SELECT, bytes((fuel_type_map.get(fuel_type, 2),)), "TX"),
-        (PiToArduinoID.FLAME_MODE, bytes((1 if bool(obj.get("flame_mode", False)) else 0,)), "TX"),
-        (PiToEcuID.REV_LIMITER_STRATEGY, bytes((1 if bool(obj.get("flame_mode", False)) else 0,)), "TX"),
-        (ArduinoToHudID.GEAR_POSITION, bytes((gear_map.get(gear, 0),)), "RX"),
+        (ArduinoToHudID.LIMP_STATUS, (1 if limp_active else 0, limp_reason_code & 0xFF), "RX"),
+        (PiToArduinoID.AIR_SHOT_REQUEST, (1,), "TX") if bool(obj.get("airshot_request", False)) else None,
+        (PiToArduinoID.MODE_SELECTION, (mode_map.get(mode, 2),), "TX"),
+        (PiToArduinoID.FUEL_TYPE_SELECT, (fuel_type_map.get(fuel_type, 2),), "TX"),
+        (PiToArduinoID.FLAME_MODE, (1 if bool(obj.get("flame_mode", False)) else 0,), "TX"),
+        (PiToEcuID.REV_LIMITER_STRATEGY, (1 if bool(obj.get("flame_mode", False)) else 0,), "TX"),
+        (ArduinoToHudID.GEAR_POSITION, (gear_map.get(gear, 0),), "RX"),
     ]
     return tuple(
-        _demo_frame_record(int(frame_id), f"{frame_id.__class__.__name__}.{frame_id.name}", payload, now, direction)
-        for frame_id, payload, direction in reversed([record for record in records if record is not None])
+        _demo_frame_record(int(frame_id), f"{frame_id.__class__.__name__}.{frame_id.name}", encode_signals(frame_id, *values), now, direction)
+        for frame_id, values, direction in reversed([record for record in records if record is not None])
     )
 
 
@@ -190,8 +186,28 @@ def main() -> None:
     parser.add_argument("--simulator", action="store_true", help="Use built-in simulator when CAN is not provided")
     parser.add_argument("--demo-udp-listen", default="127.0.0.1:5005", help="listen host:port for demo control UDP")
     parser.add_argument("--can-bitrate", type=int, help="Bitrate hint for SocketCAN setup")
+    parser.add_argument(
+        "--can-backend",
+        choices=("python-can", "raw"),
+        default="python-can",
+        help="SocketCAN receive engine: python-can bus or bare AF_CAN raw socket with kernel timestamps",
+    )
     parser.add_argument("--can-rate", type=float, default=60.0, help="HUD update rate when using CAN")
+    parser.add_argument("--can-history-depth", type=int, default=4096, help="recent CAN frames kept for the service screen")
+    parser.add_argument("--can-capture-dir", type=Path, help="record every CAN frame (RX and TX) to binary capture files here; disables the kernel RX ID filters so frames the HUD does not decode are kept")
+    parser.add_argument("--can-capture-max-mb", type=float, default=64.0, help="rotate CAN capture files at this size")
+    parser.add_argument("--can-capture-max-files", type=int, help="delete the oldest CAN capture files beyond this count")
+    parser.add_argument("--can-replay", type=Path, help="replay a CAN capture file or directory instead of opening SocketCAN")
+    parser.add_argument("--can-replay-speed", type=float, default=1.0, help="replay speed multiplier (0 = as fast as possible)")
+    parser.add_argument("--can-replay-loop", action="store_true", help="restart the CAN replay when it reaches the end")
+    parser.add_argument("--safety-rate-hz", type=float, default=50.0, help="in-process safety supervisor tick rate")
+    parser.add_argument(
+        "--safety-ipc",
+        help="take safety decisions from a separate `python -m albatross_pi.safety` process on this socket (@name = abstract)",
+    )
+    parser.add_argument("--state-shm", help="publish decoded CAN state to this shared-memory block for other processes")
     parser.add_argument("--log-level", default="INFO", help="Python logging level")
+    parser.add_argument("--profile-frames", type=Path, help="time each HUD frame stage (F3 shows the summary) and write it as JSON here on exit")
     parser.add_argument("--fault-log-dir", type=Path, default=Path("logs"), help="directory for fault event logs")
     parser.add_argument("--settings-file", type=Path, default=Path("settings/hud_settings.json"), help="persistent HUD settings file")
     parser.add_argument("--phone-bt-mac", help="Paired phone Bluetooth MAC for media/weather/GPS bridge")
@@ -239,17 +255,18 @@ def main() -> None:
             airshot_key = pygame.K_f
         renderer.configure_input_bindings(ack_key, airshot_key)
 
-    if args.can_interface and not python_can_available():
+    if args.can_replay:
+        args.can_interface = None
+    if args.can_interface and args.can_backend == "python-can" and not python_can_available():
         message = "python-can is missing; SocketCAN disabled and HUD will run with stale/default telemetry"
         if args.require_can:
             logging.error("%s. Install python3-can or python-can on the Pi runtime.", message)
             sys.exit(1)
         logging.error("%s. Install python3-can or python-can on the Pi runtime.", message)
         renderer.update_state(
-            replace(
-                renderer.state,
+            renderer.state.evolve(
                 faults=tuple(sorted(set(renderer.state.faults + ("CAN STALE",)))),
-                environment=replace(renderer.state.environment, message_line="PYTHON-CAN MISSING"),
+                environment=renderer.state.environment.evolve(message_line="PYTHON-CAN MISSING"),
             )
         )
         args.can_interface = None
@@ -264,6 +281,8 @@ def main() -> None:
 
     renderer.configure_fault_log_callback(_record_faults)
     renderer.configure_snapshot_log_callback(_observe_snapshot)
+    if args.profile_frames:
+        renderer.configure_frame_profiler(FrameProfiler(dump_path=args.profile_frames))
     renderer.configure_runtime_heartbeat_callback(systemd_notifier.watchdog)
     renderer.configure_runtime_health_callback(confirm_pending_update_health)
     renderer.configure_log_export_callback(fault_logger.export_to_usb)
@@ -281,8 +300,7 @@ def main() -> None:
 
     def _apply_phone_status(status: PhoneStatus) -> None:
         snap = renderer.state
-        env = replace(
-            snap.environment,
+        env = snap.environment.evolve(
             ambient_temp_f=status.ambient_temp_f if status.ambient_temp_f is not None else snap.environment.ambient_temp_f,
             gps_lock=status.gps_lock if status.gps_lock is not None else snap.environment.gps_lock,
             gps_latitude=status.gps_lat if status.gps_lat is not None else snap.environment.gps_latitude,
@@ -298,87 +316,110 @@ def main() -> None:
             length_s=status.length_s,
             devices=status.devices,
         )
-        renderer.update_state(replace(snap, environment=env))
+        renderer.update_state(snap.evolve(environment=env))
 
     if args.phone_bt_mac:
         phone_bridge = PhoneBridge(args.phone_bt_mac, _apply_phone_status, telemetry_udp=args.phone_telemetry_udp)
         phone_bridge.start()
 
-    can_interface: SocketCANInterface | None = None
+    can_interface: SocketCANInterface | RawSocketCANInterface | CANReplayInterface | None = None
     aggregator: CANStateAggregator | None = None
     simulator: StateSimulator | None = None
     stream: Iterable[StateSnapshot] | None = None
     nfc_authorizer: NfcAuthorizer | None = None
-    authority_stop_event = threading.Event()
+    tx_scheduler: CANTransmitScheduler | None = None
+    can_capture: CANCaptureRecorder | None = None
+    state_publisher: SharedSnapshotPublisher | None = None
+    safety_loop: SafetyLoop | None = None
+    safety_listener: SafetyDecisionListener | None = None
     engine_run_inhibit = threading.Event()
 
-    if args.can_interface:
-        aggregator = CANStateAggregator()
-        can_interface = SocketCANInterface(
-            channel=args.can_interface,
-            bitrate=args.can_bitrate,
-            rx_callback=aggregator.apply_frame,
-        )
+    if args.can_interface or args.can_replay:
+        aggregator = CANStateAggregator(history_depth=args.can_history_depth, bitrate=args.can_bitrate)
+        if args.can_capture_dir:
+            can_capture = CANCaptureRecorder(
+                args.can_capture_dir,
+                max_file_bytes=int(args.can_capture_max_mb * 1024 * 1024),
+                max_files=args.can_capture_max_files,
+            )
+            can_capture.start()
+        # Kernel filters would hide undecoded IDs from the capture, so record unfiltered.
+        rx_ids = None if can_capture else handled_arbitration_ids()
+        if args.can_replay:
+            can_interface = CANReplayInterface(
+                args.can_replay,
+                speed=args.can_replay_speed,
+                loop=args.can_replay_loop,
+                rx_batch_callback=aggregator.apply_frames,
+                rx_ids=rx_ids,
+                capture=can_capture,
+            )
+        else:
+            interface_cls = RawSocketCANInterface if args.can_backend == "raw" else SocketCANInterface
+            can_interface = interface_cls(
+                channel=args.can_interface,
+                bitrate=args.can_bitrate,
+                rx_batch_callback=aggregator.apply_frames,
+                rx_ids=rx_ids,
+                capture=can_capture,
+            )
         try:
             can_interface.start()
         except RuntimeError as exc:
             logging.error("Unable to start CAN interface: %s", exc)
             sys.exit(1)
+        tx_scheduler = CANTransmitScheduler(can_interface.send, on_sent=aggregator.mark_sent_frame)
+        tx_scheduler.start()
+        if args.state_shm:
+            try:
+                state_publisher = SharedSnapshotPublisher(aggregator.current_snapshot, args.state_shm)
+            except OSError as exc:
+                logging.error("Unable to create shared state block %s: %s", args.state_shm, exc)
+            else:
+                state_publisher.start()
         if not args.snapshot:
             stream = _iter_can_snapshots(aggregator, args.can_rate)
 
         def _send_traction_level(level_code: int) -> None:
-            frame_id, payload = build_traction_level_frame(level_code)
-            assert can_interface is not None
-            can_interface.send(frame_id, payload)
-            aggregator.mark_sent_frame(frame_id, payload)
+            assert tx_scheduler is not None
+            tx_scheduler.submit(*build_traction_level_frame(level_code), priority=TxPriority.UI)
 
         renderer.configure_traction_callback(_send_traction_level)
 
         def _send_boost_request() -> None:
-            assert can_interface is not None and aggregator is not None
+            assert tx_scheduler is not None and aggregator is not None
             snapshot = aggregator.current_snapshot()
-            boost_frame = build_boost_target_frame(calculate_boost_target(snapshot))
-            can_interface.send(*boost_frame)
-            aggregator.mark_sent_frame(*boost_frame)
+            tx_scheduler.submit(*build_boost_target_frame(calculate_boost_target(snapshot)), priority=TxPriority.UI)
 
         def _send_mode_selection(mode_code: int) -> None:
-            assert can_interface is not None
-            for frame in (
-                build_mode_selection_frame(mode_code),
-                build_ecu_spark_table_frame(mode_code),
-            ):
-                can_interface.send(*frame)
-                aggregator.mark_sent_frame(*frame)
+            assert tx_scheduler is not None
+            tx_scheduler.submit_frames(
+                (build_mode_selection_frame(mode_code), build_ecu_spark_table_frame(mode_code)),
+                priority=TxPriority.UI,
+            )
             _send_boost_request()
 
         def _send_flame_mode(enabled: bool) -> None:
-            assert can_interface is not None
-            for frame in (
-                build_flame_mode_frame(enabled),
-                build_ecu_rev_limiter_strategy_frame(enabled),
-            ):
-                can_interface.send(*frame)
-                aggregator.mark_sent_frame(*frame)
+            assert tx_scheduler is not None
+            tx_scheduler.submit_frames(
+                (build_flame_mode_frame(enabled), build_ecu_rev_limiter_strategy_frame(enabled)),
+                priority=TxPriority.UI,
+            )
 
         def _send_fuel_type(fuel_code: int) -> None:
-            assert can_interface is not None
-            for frame in (
-                build_fuel_type_frame(fuel_code),
-                build_ecu_fuel_profile_frame(fuel_code),
-            ):
-                can_interface.send(*frame)
-                aggregator.mark_sent_frame(*frame)
+            assert tx_scheduler is not None
+            tx_scheduler.submit_frames(
+                (build_fuel_type_frame(fuel_code), build_ecu_fuel_profile_frame(fuel_code)),
+                priority=TxPriority.UI,
+            )
             _send_boost_request()
 
         def _send_air_shot_request() -> None:
-            assert can_interface is not None and aggregator is not None
-            frame = build_air_shot_request_frame()
-            can_interface.send(*frame)
-            aggregator.mark_sent_frame(*frame)
+            assert tx_scheduler is not None
+            tx_scheduler.submit(*build_air_shot_request_frame(), priority=TxPriority.UI)
 
         def _send_media_control(command: str, value: int) -> None:
-            assert can_interface is not None
+            assert tx_scheduler is not None
             if command == "phone_link":
                 enabled = bool(value)
                 if phone_bridge is not None:
@@ -392,14 +433,16 @@ def main() -> None:
                         phone_bridge.media_command(command)
                 command_map = {"prev": 0x10, "play_pause": 0x11, "next": 0x12}
                 frame = build_media_control_frame(command_map.get(command, 0x00), value)
-            can_interface.send(*frame)
-            aggregator.mark_sent_frame(*frame)
+            tx_scheduler.submit(*frame, priority=TxPriority.UI)
 
         renderer.configure_mode_callback(_send_mode_selection)
         renderer.configure_media_callback(_send_media_control)
         renderer.configure_fuel_type_callback(_send_fuel_type)
         renderer.configure_flame_callback(_send_flame_mode)
         renderer.configure_air_shot_callback(_send_air_shot_request)
+        renderer.configure_service_mode_callback(can_interface.set_service_mode)
+        renderer.configure_can_stats_callback(aggregator.can_stats)
+        renderer.configure_fault_source(aggregator.current_snapshot)
         renderer.configure_can_freshness_callback(
             aggregator.rx_age_s,
             ecu_callback=aggregator.ecu_rx_age_s,
@@ -410,317 +453,38 @@ def main() -> None:
         nfc_authorizer = NfcAuthorizer.from_config(args.nfc_config, bypass=args.nfc_bypass)
         nfc_authorizer.start()
 
-        def _send_start_authority() -> None:
-            assert can_interface is not None and aggregator is not None and nfc_authorizer is not None
-            while not authority_stop_event.is_set():
-                authorized = nfc_authorizer.authorized
-                engine_run_enabled = authorized and not engine_run_inhibit.is_set()
-                try:
-                    for frame in (
-                        build_nfc_auth_frame(authorized),
-                        build_engine_run_switch_frame(engine_run_enabled),
-                    ):
-                        can_interface.send(*frame)
-                        aggregator.mark_sent_frame(*frame)
-                except Exception:
-                    logging.exception("Unable to publish NFC/start authority heartbeat")
-                authority_stop_event.wait(0.25)
-
-        threading.Thread(target=_send_start_authority, name="start-authority", daemon=True).start()
-
-        def _safety_supervisor() -> None:
-            assert aggregator is not None and can_interface is not None
-            last_fault_state = False
-            critical_oil_start: float | None = None
-            last_engine_run_switch_enabled = True
-            last_escalation_ts = 0.0
-            boost_ctrl_error_start: float | None = None
-            wmi_flow_low_start: float | None = None
-            boost_mismatch_start: float | None = None
-            egt_mismatch_start: float | None = None
-            afr_mismatch_start: float | None = None
-            prev_boost_psi = 0.0
-            prev_wg_duty = 0.0
-            wg_stuck_start: float | None = None
-            last_requested_boost: float | None = None
-            last_requested_boost_ts = 0.0
-
-            def limp_reason_for(faults_now: list[str], shutdown_requested: bool = False, run_switch_cut: bool = False) -> str:
-                if shutdown_requested:
-                    return "LOW OIL PRESS"
-                if run_switch_cut:
-                    return "ENGINE RUN OFF"
-                if "ECU STALE" in faults_now:
-                    return "ECU CAN STALE"
-                if "CAN STALE" in faults_now:
-                    return "CONTROL LINK STALE"
-                if "LOW OIL PRESS" in faults_now or "CRITICAL OIL PRESS" in faults_now:
-                    return "LOW OIL PRESS"
-                if "COOLANT HOT" in faults_now or "EGT HIGH" in faults_now or "INTAKE AIR HOT" in faults_now:
-                    return "THERMAL"
-                if "BATTERY LOW" in faults_now or "BATTERY HIGH" in faults_now:
-                    return "BATTERY VOLTAGE"
-                if "KNOCK" in faults_now or "KNOCK ESCALATE" in faults_now:
-                    return "KNOCK"
-                if "OVERBOOST" in faults_now or "BOOST CONTROL ERROR" in faults_now:
-                    return "OVERBOOST"
-                if "WMI FLOW LOW" in faults_now or "WMI PRESSURE LOW" in faults_now or "WMI PUMP FAULT" in faults_now:
-                    return "WMI FAULT"
-                if "CLUTCH SLIP" in faults_now:
-                    return "CLUTCH SLIP"
-                return "SAFETY SUPERVISOR"
+        def _start_authority_frames() -> tuple[tuple[int, bytes], ...]:
+            assert nfc_authorizer is not None
+            authorized = nfc_authorizer.authorized
+            engine_run_enabled = authorized and not engine_run_inhibit.is_set()
+            return (
+                build_nfc_auth_frame(authorized),
+                build_engine_run_switch_frame(engine_run_enabled),
+            )
 
-            while True:
-                snap = aggregator.current_snapshot()
-                faults: list[str] = []
-                now_ts = time.time()
-
-                # Source-specific ages cannot be hidden by unrelated traffic or local TX echoes.
-                if aggregator.ecu_rx_age_s() > 0.5:
-                    faults.append("ECU STALE")
-                if aggregator.controller_rx_age_s() > 0.5:
-                    faults.append("CAN STALE")
-                if snap.engine.throttle_pct > 15 and snap.engine.rpm < 300:
-                    faults.append("ECU STALE")
-                if snap.engine.rpm > 0 and snap.engine.speed_mph == 0 and snap.engine.gear not in ("N", "?"):
-                    faults.append("SPEED SENSOR")
-                if snap.engine.gear not in ("N", "1", "2", "3", "4", "5", "6", "?"):
-                    faults.append("GEAR SENSOR")
-                # Clutch slip is computed controller-side from predicted vs observed RPM:MPH ratio.
-                # Ratios are currently placeholders until measured drivetrain ratios are provided.
-                if (
-                    snap.clutch.slip_pct >= 8.0
-                    and snap.engine.gear not in ("N", "?")
-                    and snap.engine.speed_mph > 5.0
-                ) or (
-                    snap.clutch.severity in ("MODERATE", "SEVERE")
-                    and snap.engine.gear not in ("N", "?")
-                ):
-                    faults.append("CLUTCH SLIP")
-                if snap.temps.oil_pressure_psi < 12 and snap.engine.rpm > 2000:
-                    faults.append("LOW OIL PRESS")
-                if snap.temps.oil_pressure_psi < 8 and snap.engine.rpm > 2200:
-                    faults.append("CRITICAL OIL PRESS")
-                if snap.temps.coolant_temp_f > 240:
-                    faults.append("COOLANT HOT")
-                if snap.temps.exhaust_temp_f > 1650:
-                    faults.append("EGT HIGH")
-                if snap.temps.intake_temp_f > 150:
-                    faults.append("INTAKE AIR HOT")
-                if snap.temps.battery_voltage > 0 and snap.temps.battery_voltage < 11.2:
-                    faults.append("BATTERY LOW")
-                if snap.temps.battery_voltage > 15.4:
-                    faults.append("BATTERY HIGH")
-                if (
-                    snap.engine.boost_psi > 10.0
-                    and snap.engine.rpm > 3000
-                    and snap.temps.exhaust_temp_f > 1400
-                    and abs(snap.engine.boost_psi - (snap.temps.exhaust_temp_f / 100.0)) > 9.0
-                ):
-                    faults.append("CYL EGT BOOST MISMATCH")
-                boost_mismatch = (
-                    snap.engine.boost_left_psi >= 0.0
-                    and snap.engine.boost_right_psi >= 0.0
-                    and snap.engine.rpm > 3000
-                    and snap.engine.throttle_pct > 35
-                    and (snap.engine.target_boost_psi > 4.0 or snap.engine.boost_psi > 4.0)
-                    and abs(snap.engine.boost_left_psi - snap.engine.boost_right_psi) >= 3.0
-                )
-                if boost_mismatch:
-                    if boost_mismatch_start is None:
-                        boost_mismatch_start = now_ts
-                    elif (now_ts - boost_mismatch_start) >= 0.6:
-                        faults.append("CYL BOOST MISMATCH")
-                else:
-                    boost_mismatch_start = None
-                egt_mismatch = (
-                    snap.temps.exhaust_left_temp_f >= 0.0
-                    and snap.temps.exhaust_right_temp_f >= 0.0
-                    and snap.engine.rpm > 3000
-                    and snap.engine.throttle_pct > 35
-                    and abs(snap.temps.exhaust_left_temp_f - snap.temps.exhaust_right_temp_f) >= 150.0
-                )
-                if egt_mismatch:
-                    if egt_mismatch_start is None:
-                        egt_mismatch_start = now_ts
-                    elif (now_ts - egt_mismatch_start) >= 0.8:
-                        faults.append("CYL EGT MISMATCH")
-                else:
-                    egt_mismatch_start = None
-                afr_mismatch = (
-                    snap.engine.afr_left > 0.0
-                    and snap.engine.afr_right > 0.0
-                    and snap.engine.rpm > 2500
-                    and snap.engine.throttle_pct > 30
-                    and abs(snap.engine.afr_left - snap.engine.afr_right) >= 0.8
-                )
-                if afr_mismatch:
-                    if afr_mismatch_start is None:
-                        afr_mismatch_start = now_ts
-                    elif (now_ts - afr_mismatch_start) >= 0.8:
-                        faults.append("CYL AFR MISMATCH")
-                else:
-                    afr_mismatch_start = None
-                if snap.engine.boost_psi > (snap.engine.target_boost_psi + 3.0):
-                    faults.append("OVERBOOST")
-                if snap.engine.knock_events >= 3:
-                    faults.append("KNOCK")
-                if snap.environment.fuel_level_pct <= 5:
-                    faults.append("LOW FUEL")
-                if snap.air_shot.pressure_psi > 0 and snap.air_shot.pressure_psi < 35:
-                    faults.append("AIR SHOT LOW")
-                if snap.wmi.fault_active:
-                    faults.append("WMI PUMP FAULT")
-                if snap.wmi.tank_level_pct >= 0 and snap.wmi.tank_level_pct < 3:
-                    faults.append("WMI TANK EMPTY")
-                if snap.wmi.commanded_flow_cc_min > 0:
-                    if snap.wmi.actual_flow_cc_min < (0.6 * snap.wmi.commanded_flow_cc_min):
-                        if wmi_flow_low_start is None:
-                            wmi_flow_low_start = now_ts
-                        elif (now_ts - wmi_flow_low_start) >= 0.25:
-                            faults.append("WMI FLOW LOW")
-                            faults.append("WMI PRESSURE LOW")
-                    else:
-                        wmi_flow_low_start = None
-                else:
-                    wmi_flow_low_start = None
-
-                boost_error = abs(snap.engine.boost_psi - snap.engine.target_boost_psi)
-                if snap.engine.target_boost_psi >= 8.0 and snap.engine.throttle_pct > 35 and boost_error > 4.0:
-                    if boost_ctrl_error_start is None:
-                        boost_ctrl_error_start = now_ts
-                    elif (now_ts - boost_ctrl_error_start) >= 0.75:
-                        faults.append("BOOST CONTROL ERROR")
-                else:
-                    boost_ctrl_error_start = None
-
-                if snap.engine.throttle_pct > 35 and snap.engine.target_boost_psi >= 8.0:
-                    wg_delta = abs(snap.engine.wastegate_duty_pct - prev_wg_duty)
-                    boost_delta = abs(snap.engine.boost_psi - prev_boost_psi)
-                    if wg_delta >= 8.0 and boost_delta < 0.4:
-                        if wg_stuck_start is None:
-                            wg_stuck_start = now_ts
-                        elif (now_ts - wg_stuck_start) >= 1.0:
-                            faults.append("WASTEGATE STUCK")
-                    else:
-                        wg_stuck_start = None
-                else:
-                    wg_stuck_start = None
-                prev_boost_psi = snap.engine.boost_psi
-                prev_wg_duty = snap.engine.wastegate_duty_pct
-
-                severe = any(f in faults for f in ("CAN STALE", "ECU STALE", "LOW OIL PRESS", "COOLANT HOT", "EGT HIGH", "CLUTCH SLIP"))
-                desired_boost = 0.0 if severe else calculate_boost_target(snap)
-                if (
-                    last_requested_boost is None
-                    or abs(desired_boost - last_requested_boost) >= 0.1
-                    or (now_ts - last_requested_boost_ts) >= 1.0
-                ):
-                    frame = build_boost_target_frame(desired_boost)
-                    can_interface.send(*frame)
-                    aggregator.mark_sent_frame(*frame)
-                    last_requested_boost = desired_boost
-                    last_requested_boost_ts = now_ts
-
-                # Critical oil-pressure handling with anti-false-positive protections:
-                # - ignore cranking/idle zones
-                # - require persistence
-                # - only request shutdown when neutral + near-stationary
-                critical_oil = "CRITICAL OIL PRESS" in faults
-                running_not_cranking = snap.engine.rpm > 1200
-                if critical_oil and running_not_cranking:
-                    if critical_oil_start is None:
-                        critical_oil_start = now_ts
-                else:
-                    critical_oil_start = None
-
-                should_shutdown_engine = (
-                    critical_oil_start is not None
-                    and (now_ts - critical_oil_start) > 2.5
-                    and snap.engine.gear == "N"
-                    and snap.engine.speed_mph < 3.0
-                    and snap.engine.throttle_pct < 8.0
-                )
-                should_cut_run_switch = (
-                    should_shutdown_engine
-                    or ("ECU STALE" in faults and snap.engine.rpm > 1800 and snap.engine.throttle_pct > 20)
-                    or ("COOLANT HOT" in faults and snap.temps.coolant_temp_f > 250 and snap.engine.rpm > 2000)
-                    or ("EGT HIGH" in faults and snap.temps.exhaust_temp_f > 1725 and snap.engine.rpm > 2200)
-                )
-                if severe and not last_fault_state:
-                    # Fail-safe action set: cut boost command, enable limp, disable flame, max traction.
-                    limp_reason = limp_reason_for(faults)
-                    for frame in (
-                        build_boost_target_frame(0.0),
-                        build_limp_mode_frame(True, limp_reason),
-                        build_flame_mode_frame(False),
-                        build_ecu_rev_limiter_strategy_frame(False),
-                        build_traction_level_frame(3),
-                    ):
-                        can_interface.send(*frame)
-                        aggregator.mark_sent_frame(*frame)
-                    logging.error("Safety supervisor engaged: %s", ", ".join(faults))
-                elif not severe and last_fault_state:
-                    # Clear limp when recovered.
-                    frame = build_limp_mode_frame(False)
-                    can_interface.send(*frame)
-                    aggregator.mark_sent_frame(*frame)
-                    logging.info("Safety supervisor recovered.")
-
-                if should_shutdown_engine:
-                    # Engine shutdown request includes torque-reduction stack + run-switch OFF.
-                    limp_reason = limp_reason_for(faults, shutdown_requested=True)
-                    for frame in (
-                        build_boost_target_frame(0.0),
-                        build_limp_mode_frame(True, limp_reason),
-                        build_flame_mode_frame(False),
-                        build_ecu_rev_limiter_strategy_frame(False),
-                        build_traction_level_frame(3),
-                    ):
-                        can_interface.send(*frame)
-                        aggregator.mark_sent_frame(*frame)
-                    faults.append("ENGINE SHUTDOWN REQUEST")
-                    logging.critical("Critical oil pressure persisted; shutdown request issued in neutral at low speed.")
-
-                # Engine run switch "OFF" acts as ECU-level kill (ignition/fuel cut).
-                # Re-send every 1s while active for robustness against frame loss.
-                if should_cut_run_switch:
-                    engine_run_inhibit.set()
-                    if last_engine_run_switch_enabled or (now_ts - last_escalation_ts) >= 1.0:
-                        frame = build_engine_run_switch_frame(False)
-                        can_interface.send(*frame)
-                        aggregator.mark_sent_frame(*frame)
-                        last_escalation_ts = now_ts
-                    last_engine_run_switch_enabled = False
-                    faults.append("ENGINE RUN SWITCH OFF")
-                elif not last_engine_run_switch_enabled:
-                    engine_run_inhibit.clear()
-                    if nfc_authorizer is not None and nfc_authorizer.authorized:
-                        frame = build_engine_run_switch_frame(True)
-                        can_interface.send(*frame)
-                        aggregator.mark_sent_frame(*frame)
-                        last_engine_run_switch_enabled = True
-                        logging.info("Safety supervisor restored authorized engine run switch to ON.")
-                else:
-                    engine_run_inhibit.clear()
-
-                if faults:
-                    active_limp = severe or should_shutdown_engine or should_cut_run_switch
-                    renderer.update_state(
-                        replace(
-                            snap,
-                            faults=tuple(sorted(set(faults))),
-                            system=replace(
-                                snap.system,
-                                limp_mode_active=active_limp,
-                                limp_mode_reason=limp_reason_for(faults, should_shutdown_engine, should_cut_run_switch) if active_limp else "",
-                            ),
-                        )
-                    )
-                last_fault_state = severe
-                time.sleep(0.2)
+        # 4 Hz NFC/run-switch heartbeat, paced by the TX scheduler.
+        tx_scheduler.set_periodic("start-authority", 0.25, _start_authority_frames)
 
-        threading.Thread(target=_safety_supervisor, name="safety-supervisor", daemon=True).start()
+        def _apply_safety_decision(decision: SafetyDecision) -> None:
+            # The 4 Hz start-authority heartbeat keeps the run switch off while the supervisor cuts it.
+            if decision.run_switch_cut:
+                engine_run_inhibit.set()
+            else:
+                engine_run_inhibit.clear()
+
+        if args.safety_ipc:
+            safety_listener = SafetyDecisionListener(args.safety_ipc, on_decision=_apply_safety_decision)
+            safety_listener.start()
+            renderer.configure_safety_callback(safety_listener.current)
+        else:
+            safety_loop = SafetyLoop(
+                SafetySupervisor(tx_scheduler.submit, run_authorized=lambda: nfc_authorizer is not None and nfc_authorizer.authorized),
+                aggregator,
+                rate_hz=args.safety_rate_hz,
+                on_decision=_apply_safety_decision,
+            )
+            safety_loop.start()
+            renderer.configure_safety_callback(safety_loop.current)
     elif args.simulator:
         simulator = StateSimulator()
         renderer.configure_mode_callback(simulator.set_mode)
@@ -768,8 +532,7 @@ def main() -> None:
                 except Exception:
                     continue
                 snap = renderer.state
-                eng = replace(
-                    snap.engine,
+                eng = snap.engine.evolve(
                     rpm=int(obj.get("rpm", snap.engine.rpm)),
                     speed_mph=float(obj.get("speed_mph", obj.get("speed", snap.engine.speed_mph))),
                     boost_psi=(
@@ -786,13 +549,11 @@ def main() -> None:
                     engine_load_pct=float(obj.get("load", snap.engine.engine_load_pct)),
                     wastegate_duty_pct=(float(obj.get("wg1", snap.engine.wastegate_duty_pct)) + float(obj.get("wg2", snap.engine.wastegate_duty_pct))) / 2.0,
                 )
-                economy = replace(
-                    snap.economy,
+                economy = snap.economy.evolve(
                     injector_pulse_width_ms=float(obj.get("inj_pw_ms", snap.economy.injector_pulse_width_ms)),
                     injector_duty_pct=float(obj.get("inj_duty_pct", snap.economy.injector_duty_pct)),
                 )
-                temps = replace(
-                    snap.temps,
+                temps = snap.temps.evolve(
                     coolant_temp_f=float(obj.get("clt_f", obj.get("clt", snap.temps.coolant_temp_f))),
                     oil_temp_f=float(obj.get("oilt_f", obj.get("oilt", snap.temps.oil_temp_f))),
                     oil_pressure_psi=float(obj.get("oilp", snap.temps.oil_pressure_psi)),
@@ -802,8 +563,7 @@ def main() -> None:
                     exhaust_right_temp_f=float(obj.get("egt_b2", snap.temps.exhaust_right_temp_f)),
                     battery_voltage=float(obj.get("batt_v", snap.temps.battery_voltage)),
                 )
-                env = replace(
-                    snap.environment,
+                env = snap.environment.evolve(
                     mode=str(obj.get("mode", snap.environment.mode)),
                     fuel_type=str(obj.get("fuel_type", snap.environment.fuel_type)),
                     ethanol_content_pct=float(obj.get("ethanol_pct", snap.environment.ethanol_content_pct)),
@@ -815,20 +575,18 @@ def main() -> None:
                     flame_mode_enabled=bool(obj.get("flame_mode", snap.environment.flame_mode_enabled)),
                     rev_limiter_strategy="IGNITION CUT" if bool(obj.get("flame_mode", snap.environment.flame_mode_enabled)) else "FUEL CUT",
                 )
-                air = replace(
-                    snap.air_shot,
+                air = snap.air_shot.evolve(
                     pressure_psi=float(obj.get("tank_psi", snap.air_shot.pressure_psi)),
                     charges_remaining=max(0, min(3, int(obj.get("airshot_charges", snap.air_shot.charges_remaining)))),
                     is_firing=bool(obj.get("airshot_firing", snap.air_shot.is_firing)),
                 )
-                wmi = WMIState(
+                wmi = snap.wmi.evolve(
                     tank_level_pct=float(obj.get("wmi_tank", snap.wmi.tank_level_pct)),
                     commanded_flow_cc_min=float(obj.get("wmi_commanded", snap.wmi.commanded_flow_cc_min)),
                     actual_flow_cc_min=float(obj.get("wmi_actual", snap.wmi.actual_flow_cc_min)),
                     fault_active=bool(obj.get("wmi_fault", snap.wmi.fault_active)),
                 )
-                trac = replace(
-                    snap.traction,
+                trac = snap.traction.evolve(
                     intervention_level=str(obj.get("traction", snap.traction.intervention_level)),
                     slip_pct=float(obj.get("traction_slip", snap.traction.slip_pct)),
                     torque_cut_pct=float(obj.get("torque_cut", snap.traction.torque_cut_pct)),
@@ -836,11 +594,11 @@ def main() -> None:
                     sensor_fault=bool(obj.get("traction_fault", snap.traction.sensor_fault)),
                     wheelie_pitch_deg=float(obj.get("lean_deg", snap.traction.wheelie_pitch_deg)),
                 )
-                clutch = ClutchState(
+                clutch = snap.clutch.evolve(
                     slip_pct=float(obj.get("clutch_slip_pct", snap.clutch.slip_pct)),
                     severity=str(obj.get("clutch_slip_severity", snap.clutch.severity)),
                 )
-                lighting = LightingState(
+                lighting = snap.lighting.evolve(
                     left_indicator=bool(obj.get("left_indicator", obj.get("turn_left", snap.lighting.left_indicator))),
                     right_indicator=bool(obj.get("right_indicator", obj.get("turn_right", snap.lighting.right_indicator))),
                     high_beam=bool(obj.get("high_beam", snap.lighting.high_beam)),
@@ -848,7 +606,7 @@ def main() -> None:
                     brake=bool(obj.get("brake_light", obj.get("brake", snap.lighting.brake))),
                     oil_warning=bool(obj.get("oil_warning", snap.lighting.oil_warning)),
                 )
-                service = ServiceStatus(
+                service = snap.service.evolve(
                     recent_can_frames=_demo_recent_can_frames(obj),
                     sensor_voltages=(
                         ServiceReading("Oil pressure sensor", f"{float(obj.get('oil_sensor_v', 2.75)):.2f} V"),
@@ -880,8 +638,7 @@ def main() -> None:
                 )
                 limp_active = bool(obj.get("limp_mode", snap.system.limp_mode_active))
                 limp_reason = str(obj.get("limp_reason", snap.system.limp_mode_reason or ("PI REQUEST" if limp_active else ""))).upper()
-                updated = replace(
-                    snap,
+                updated = snap.evolve(
                     engine=eng,
                     temps=temps,
                     environment=env,
@@ -892,31 +649,26 @@ def main() -> None:
                     air_shot=air,
                     wmi=wmi,
                     service=service,
-                    system=SystemStatus(limp_mode_active=limp_active, limp_mode_reason=limp_reason if limp_active else ""),
+                    system=snap.system.evolve(limp_mode_active=limp_active, limp_mode_reason=limp_reason if limp_active else ""),
                 )
                 renderer.update_state(
-                    replace(
-                        updated,
-                        engine=replace(updated.engine, target_boost_psi=calculate_boost_target(updated)),
+                    updated.evolve(
+                        engine=updated.engine.evolve(target_boost_psi=calculate_boost_target(updated)),
                     )
                 )
 
         threading.Thread(target=loop, name="demo-udp", daemon=True).start()
 
-    if not args.can_interface and not args.simulator and not args.snapshot:
+    if not can_interface and not args.simulator and not args.snapshot:
         _start_demo_udp_listener(args.demo_udp_listen)
 
     def _shutdown_handler(*_: object) -> None:
-        authority_stop_event.set()
-        if nfc_authorizer:
-            nfc_authorizer.stop()
-        systemd_notifier.stopping()
-        if can_interface:
-            can_interface.stop()
-        pygame.quit()
+        # SystemExit unwinds through renderer.run (evaluator stop, profile
+        # dump, pygame.quit) and the finally below, which stops the rest.
         sys.exit(0)
 
     signal.signal(signal.SIGINT, _shutdown_handler)
+    signal.signal(signal.SIGTERM, _shutdown_handler)
 
     try:
         if args.snapshot:
@@ -937,12 +689,21 @@ def main() -> None:
         logging.exception("HUD runtime error")
         raise
     finally:
-        authority_stop_event.set()
+        if tx_scheduler:
+            tx_scheduler.stop()
         if nfc_authorizer:
             nfc_authorizer.stop()
         systemd_notifier.stopping()
         if can_interface:
             can_interface.stop()
+        if can_capture:
+            can_capture.stop()
+        if state_publisher:
+            state_publisher.stop()
+        if safety_loop:
+            safety_loop.stop()
+        if safety_listener:
+            safety_listener.stop()
 
 
 if __name__ == "__main__":
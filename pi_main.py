@@ -23,11 +23,16 @@ def main() -> None:
     parser.add_argument("--width", type=int, default=1280)
     parser.add_argument("--height", type=int, default=480)
     parser.add_argument("--can-bitrate", type=int, help="Bitrate hint for SocketCAN setup")
+    parser.add_argument("--can-backend", choices=("python-can", "raw"), default="python-can", help="SocketCAN receive engine")
     parser.add_argument("--can-rate", type=float, default=60.0, help="HUD update rate when using CAN")
     parser.add_argument("--log-level", default="INFO", help="Python logging level")
     parser.add_argument("--bind-inputs", action="store_true", help="Prompt keyboard bindings for demo controls")
     parser.add_argument("--nfc-config", type=Path, default=Path("settings/nfc_auth.json"), help="USB NFC authorization configuration")
     parser.add_argument("--nfc-bypass", action="store_true", help="bench-only: permit engine run without an NFC scan")
+    parser.add_argument(
+        "--safety-ipc",
+        help="use the separate albatross-safety service, reporting on this socket (e.g. @albatross-safety)",
+    )
     parser.add_argument("--disable-low-voltage-shutdown", action="store_true", help="disable orderly Pi halt after sustained engine-off undervoltage")
     args = parser.parse_args()
 
@@ -44,6 +49,8 @@ def main() -> None:
         str(args.height),
         "--can-rate",
         str(args.can_rate),
+        "--can-backend",
+        args.can_backend,
         "--log-level",
         args.log_level,
         "--nfc-config",
@@ -51,6 +58,8 @@ def main() -> None:
     ]
     if args.can_bitrate is not None:
         cmd.extend(["--can-bitrate", str(args.can_bitrate)])
+    if args.safety_ipc:
+        cmd.extend(["--safety-ipc", args.safety_ipc])
     if args.bind_inputs:
         cmd.append("--bind-inputs")
     if args.nfc_bypass:
@@ -0,0 +1,57 @@
+"""Print HUD state read from a ``main.py --state-shm`` shared-memory block."""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from albatross_pi.state import SharedSnapshotReader
+
+
+def _describe(reader: SharedSnapshotReader) -> str:
+    snapshot = reader.read()
+    age_s = reader.age_s()
+    if snapshot is None:
+        return f"waiting for first publish (age {age_s:.2f} s)"
+    engine = snapshot.engine
+    temps = snapshot.temps
+    faults = ", ".join(snapshot.faults) or "none"
+    return (
+        f"age {age_s:5.2f} s  rpm {engine.rpm:5d}  gear {engine.gear:>2}  "
+        f"boost {engine.boost_psi:5.1f} psi  oil {temps.oil_pressure_psi:5.1f} psi  "
+        f"clt {temps.coolant_temp_f:5.1f} F  limp {'ON' if snapshot.system.limp_mode_active else 'off'}  "
+        f"faults {faults}  torn {reader.torn_reads}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Watch the HUD state published to shared memory")
+    parser.add_argument("name", nargs="?", default="albatross-state", help="shared-memory block passed to --state-shm")
+    parser.add_argument("--rate-hz", type=float, default=5.0, help="lines printed per second")
+    parser.add_argument("--once", action="store_true", help="print one line and exit")
+    args = parser.parse_args()
+    try:
+        reader = SharedSnapshotReader(args.name)
+    except FileNotFoundError:
+        parser.exit(1, f"No shared state block named {args.name}; is main.py running with --state-shm?\n")
+    except RuntimeError as exc:
+        parser.exit(1, f"{exc}\n")
+    period_s = 1.0 / max(0.1, args.rate_hz)
+    try:
+        while True:
+            print(_describe(reader), flush=True)
+            if args.once:
+                break
+            time.sleep(period_s)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+
+
+if __name__ == "__main__":
+    main()